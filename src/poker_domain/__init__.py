@@ -1,5 +1,9 @@
+from poker_domain.agents import Agent, CallingAgent, RandomAgent
+from poker_domain.async_table import AsyncPokerTable, AsyncTableManager, EventStream
+from poker_domain.columnar import ColumnarHandStore
 from poker_domain.exceptions import (
     DeckEmptyError,
+    DuplicateTableError,
     GameAlreadyStartedError,
     InsufficientChipsError,
     InvalidActionError,
@@ -8,25 +12,55 @@ from poker_domain.exceptions import (
     NotEnoughPlayersError,
     PokerError,
     RebuyNotAllowedError,
+    ReplayError,
     TableClosedError,
     TableFullError,
+    TableNotFoundError,
 )
 from poker_domain.game_state import (
     ActionLogEntry,
     ActionResult,
+    CommunityDealtEvent,
     EventType,
     GameEvent,
     GamePhase,
+    GameStartedEvent,
     GameState,
+    HandDealtEvent,
+    HandSetup,
+    LevelUpEvent,
+    PlayerActedEvent,
+    PlayerJoinedEvent,
+    PlayerLeftEvent,
     PlayerState,
+    PlayerStateDelta,
     Pot,
+    RoundEndedEvent,
+    ShowdownEvent,
+    StateDelta,
+    TableClosedEvent,
     TableStatus,
+    TurnChangedEvent,
     WaitingFor,
 )
 from poker_domain.hand_evaluator import HandEvaluator
-from poker_domain.interfaces import PokerTableInterface
+from poker_domain.history import HandHistoryWriter, HandRecord, HandRecorder, read_hand_records
+from poker_domain.instrumentation import HandTracer, Histogram, Instrumentation
+from poker_domain.interfaces import EvaluatorHook, PokerTableInterface, TableHook
+from poker_domain.journal import JournaledTableManager
+from poker_domain.level_clock import LevelClock
+from poker_domain.manager import TableManager
 from poker_domain.player import Player
+from poker_domain.replay import iter_replay, replay_hand
+from poker_domain.replication import ReplicationFollower, ReplicationPublisher
+from poker_domain.selfplay import AgentStats, SelfPlayReport, SelfPlayRunner
+from poker_domain.sharding import HashRing, RemoteTable, ShardedTableHost
+from poker_domain.simulation import SimulationTable
+from poker_domain.sqlite_store import SQLiteHandStore
+from poker_domain.state_delta import apply_delta, diff_states
+from poker_domain.stats import PlayerStats, PlayerStatsAggregator
 from poker_domain.table import PokerTable
+from poker_domain.timers import ActionTimeouts, TimerHandle, TimerWheel
 from poker_domain.value_objects import (
     Action,
     Bet,
@@ -43,12 +77,32 @@ from poker_domain.value_objects import (
     Rank,
     Suit,
 )
+from poker_domain.verification import HandDivergence, verify_hand_records
 
 __all__ = [
     # テーブル
     "PokerTable",
     "PokerTableInterface",
+    "SimulationTable",
+    "TableManager", "JournaledTableManager",
+    "ReplicationPublisher", "ReplicationFollower",
+    "ShardedTableHost", "RemoteTable", "HashRing",
+    "AsyncPokerTable", "AsyncTableManager", "EventStream",
     "HandEvaluator",
+    # 持ち時間
+    "TimerWheel", "TimerHandle", "ActionTimeouts",
+    "LevelClock",
+    # ハンド履歴
+    "HandHistoryWriter", "HandRecord", "HandRecorder", "read_hand_records",
+    "ColumnarHandStore", "SQLiteHandStore",
+    # プレイヤー統計
+    "PlayerStats", "PlayerStatsAggregator",
+    "HandDivergence", "verify_hand_records",
+    # 計測
+    "TableHook", "EvaluatorHook", "Instrumentation", "Histogram", "HandTracer",
+    # セルフプレイ
+    "Agent", "RandomAgent", "CallingAgent",
+    "SelfPlayRunner", "SelfPlayReport", "AgentStats",
     # 値オブジェクト
     "Action", "Fold", "Check", "Call", "Bet", "Raise",
     "Card", "Suit", "Rank",
@@ -59,6 +113,9 @@ __all__ = [
     # ゲーム状態
     "GamePhase",
     "GameEvent", "EventType",
+    "PlayerJoinedEvent", "PlayerLeftEvent", "GameStartedEvent", "HandDealtEvent",
+    "PlayerActedEvent", "RoundEndedEvent", "CommunityDealtEvent", "TurnChangedEvent",
+    "ShowdownEvent", "LevelUpEvent", "TableClosedEvent",
     "GameState",
     "ActionResult",
     "WaitingFor",
@@ -66,6 +123,12 @@ __all__ = [
     "TableStatus",
     "Pot",
     "ActionLogEntry",
+    # 差分
+    "StateDelta", "PlayerStateDelta",
+    "apply_delta", "diff_states",
+    # リプレイ
+    "HandSetup",
+    "replay_hand", "iter_replay",
     # エンティティ
     "Player",
     # 例外
@@ -80,4 +143,7 @@ __all__ = [
     "TableClosedError",
     "RebuyNotAllowedError",
     "InvalidBuyInError",
+    "ReplayError",
+    "TableNotFoundError",
+    "DuplicateTableError",
 ]
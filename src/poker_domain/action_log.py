@@ -0,0 +1,195 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from typing import Any, overload
+
+from poker_domain.game_state import ActionLogEntry, GamePhase
+from poker_domain.value_objects.action import Action, Bet, Call, Check, Fold, Raise
+
+# ActionLogEntry.action の文字列とフェーズの整数コード (配列での保持・バイナリ形式で共通に使う)
+ACTION_NAMES: tuple[str, ...] = ("fold", "check", "call", "bet", "raise")
+ACTION_CODES: dict[str, int] = {name: code for code, name in enumerate(ACTION_NAMES)}
+PHASES: tuple[GamePhase, ...] = tuple(GamePhase)
+PHASE_CODES: dict[GamePhase, int] = {phase: code for code, phase in enumerate(PHASES)}
+
+_NO_AMOUNT = -1  # amount=None を表す値
+
+
+def entry_to_action(entry: ActionLogEntry) -> Action:
+    """履歴1件を、それを記録したときの `Action` に戻す (リプレイ用)。
+
+    Raises:
+        ValueError: `action` が未知の文字列、または bet/raise に金額がない場合。
+    """
+    match entry.action, entry.amount:
+        case "fold", _:
+            return Fold()
+        case "check", _:
+            return Check()
+        case "call", _:
+            return Call()
+        case "bet", int(amount):
+            return Bet(amount)
+        case "raise", int(amount):
+            return Raise(amount)
+    raise ValueError(f"履歴を Action に戻せません: {entry.action} (amount={entry.amount})")
+
+
+def entry_rows(entries: Iterable[ActionLogEntry]) -> list[tuple[str, GamePhase, str, int | None]]:
+    """履歴を `(player_id, phase, action, amount)` の列にする (ビューならエントリを作らない)"""
+    if isinstance(entries, ActionLogView):
+        return entries.rows()
+    return [(e.player_id, e.phase, e.action, e.amount) for e in entries]
+
+
+@lru_cache(maxsize=4096)
+def shared_entry(
+    player_id: str, phase: GamePhase, action: str, amount: int | None
+) -> ActionLogEntry:
+    """同じ内容の `ActionLogEntry` を使い回して返す (保存した履歴を大量に読み込む用)"""
+    return ActionLogEntry(player_id, phase, action, amount)
+
+
+class ActionLog:
+    """1ハンド分のアクション履歴。追記専用で、1件を int 2つに詰めて配列で持つ。
+
+    1つ目の int は `座席 << 8 | フェーズコード << 4 | アクションコード`、2つ目は金額
+    (金額なしは -1)。座席インデックスはハンド開始時の着席順 (`player_ids`) で解決する。
+    スナップショットには `view()` で記憶領域を共有する読み取り専用ビューを渡すため、
+    スナップショットのたびに履歴全体をコピーすることはない。
+    """
+
+    __slots__ = ("_player_ids", "_data")
+
+    def __init__(self, player_ids: tuple[str, ...] = ()) -> None:
+        self._player_ids = player_ids
+        self._data = array("q")
+
+    def append(self, seat: int, phase: GamePhase, action: str, amount: int | None) -> None:
+        """1件追記する"""
+        self._data.append(seat << 8 | PHASE_CODES[phase] << 4 | ACTION_CODES[action])
+        self._data.append(_NO_AMOUNT if amount is None else amount)
+
+    @classmethod
+    def from_codes(cls, player_ids: tuple[str, ...], codes: array) -> "ActionLog":
+        """`codes()` で取り出した整数列から復元する"""
+        log = cls(player_ids)
+        log._data = array("q", codes)
+        return log
+
+    @property
+    def player_ids(self) -> tuple[str, ...]:
+        """座席インデックスを解決するための、ハンド開始時の着席順のプレイヤーID"""
+        return self._player_ids
+
+    def codes(self) -> array:
+        """1件あたり (コード, 金額) の2要素を並べた整数列のコピー"""
+        return array("q", self._data)
+
+    def __len__(self) -> int:
+        return len(self._data) // 2
+
+    def view(self) -> "ActionLogView":
+        """現時点までの履歴を表す読み取り専用ビュー (以後の追記はビューに影響しない)"""
+        return ActionLogView(self._player_ids, self._data, len(self._data) // 2)
+
+
+class ActionLogView(Sequence[ActionLogEntry]):
+    """`ActionLog` の先頭 `length` 件を `ActionLogEntry` の列として見せる不変ビュー。
+
+    従来の `tuple[ActionLogEntry, ...]` と同じように添字・スライス・反復・比較 (tuple とも
+    比較可能)・ハッシュができる。`ActionLogEntry` は最初に反復したときにまとめて作られる。
+    """
+
+    __slots__ = ("_player_ids", "_data", "_length", "_entries")
+
+    def __init__(self, player_ids: tuple[str, ...], data: array, length: int) -> None:
+        self._player_ids = player_ids
+        self._data = data
+        self._length = length
+        self._entries: tuple[ActionLogEntry, ...] | None = None
+
+    def _decode(self, index: int) -> ActionLogEntry:
+        code = self._data[2 * index]
+        amount = self._data[2 * index + 1]
+        return ActionLogEntry(
+            player_id=self._player_ids[code >> 8],
+            phase=PHASES[code >> 4 & 0xF],
+            action=ACTION_NAMES[code & 0xF],
+            amount=None if amount == _NO_AMOUNT else amount,
+        )
+
+    def rows(self) -> list[tuple[str, GamePhase, str, int | None]]:
+        """`ActionLogEntry` を作らずに `(player_id, phase, action, amount)` の列を返す"""
+        data, player_ids = self._data, self._player_ids
+        rows = []
+        for i in range(0, 2 * self._length, 2):
+            code, amount = data[i], data[i + 1]
+            rows.append((
+                player_ids[code >> 8],
+                PHASES[code >> 4 & 0xF],
+                ACTION_NAMES[code & 0xF],
+                None if amount == _NO_AMOUNT else amount,
+            ))
+        return rows
+
+    def _materialize(self) -> tuple[ActionLogEntry, ...]:
+        if self._entries is None:
+            self._entries = tuple(self._decode(i) for i in range(self._length))
+        return self._entries
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> ActionLogEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[ActionLogEntry, ...]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> ActionLogEntry | tuple[ActionLogEntry, ...]:
+        if isinstance(index, slice):
+            return self._materialize()[index]
+        if self._entries is not None:
+            return self._entries[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("action log index out of range")
+        return self._decode(index)
+
+    def __iter__(self) -> Iterator[ActionLogEntry]:
+        return iter(self._materialize())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ActionLogView):
+            if other._data is self._data and other._length == self._length:
+                return True
+            return self._materialize() == other._materialize()
+        if isinstance(other, tuple):
+            return self._materialize() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._materialize())
+
+    def __add__(self, other: tuple[ActionLogEntry, ...]) -> tuple[ActionLogEntry, ...]:
+        return self._materialize() + tuple(other)
+
+    def __radd__(self, other: tuple[ActionLogEntry, ...]) -> tuple[ActionLogEntry, ...]:
+        return tuple(other) + self._materialize()
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # 共有している配列のうち、このビューが指す範囲だけをコピーして pickle する
+        return (ActionLogView, (self._player_ids, self._data[: 2 * self._length], self._length))
+
+    def extends(self, other: Sequence[ActionLogEntry]) -> bool:
+        """`other` がこのビューの先頭部分と一致するか (同じ履歴の以前のビューなら O(1))"""
+        if isinstance(other, ActionLogView) and other._data is self._data:
+            return other._length <= self._length
+        return tuple(self[: len(other)]) == tuple(other)
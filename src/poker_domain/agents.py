@@ -0,0 +1,47 @@
+import random
+from typing import Protocol, runtime_checkable
+
+from poker_domain.game_state import GameState, WaitingFor
+from poker_domain.value_objects.action import Action, Bet, Call, Check, Fold, Raise
+
+
+@runtime_checkable
+class Agent(Protocol):
+    """手番で `GameState` と `WaitingFor` を受け取り、取る `Action` を返すボット。
+
+    `state` は手番のプレイヤー視点のスナップショット (自分のホールカードだけが見える)。
+    """
+
+    def act(self, state: GameState, waiting_for: WaitingFor) -> Action:
+        ...
+
+
+class RandomAgent:
+    """合法手から一様に選ぶエージェント (ベットは BB、レイズは現在のベットの2倍まで)"""
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self._rng = rng if rng is not None else random.Random()
+
+    def act(self, state: GameState, waiting_for: WaitingFor) -> Action:
+        me = next(p for p in state.players if p.player_id == waiting_for.player_id)
+        stack = me.chips.amount
+        choice = self._rng.choice(waiting_for.valid_actions)
+        if choice is Bet:
+            return Bet(min(stack, state.big_blind.amount))
+        if choice is Raise:
+            max_raise = me.current_bet.amount + stack
+            if max_raise <= state.current_bet.amount:
+                return Fold()
+            return Raise(min(state.current_bet.amount * 2, max_raise))
+        action: Action = choice()
+        return action
+
+
+class CallingAgent:
+    """常にチェックかコールをするエージェント (ベット・レイズはしない)"""
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        pass
+
+    def act(self, state: GameState, waiting_for: WaitingFor) -> Action:
+        return Check() if Check in waiting_for.valid_actions else Call()
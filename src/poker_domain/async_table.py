@@ -0,0 +1,288 @@
+import asyncio
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from poker_domain.exceptions import TableNotFoundError
+from poker_domain.game_state import ActionResult, GameEvent, GameState, TableStatus
+from poker_domain.interfaces import PokerTableInterface
+from poker_domain.manager import TableManager
+from poker_domain.value_objects.action import Action
+from poker_domain.value_objects.chips import Chips
+
+
+class EventStream:
+    """`AsyncPokerTable` のイベント購読。`async for` で `GameEvent` を発生順に受け取る。
+
+    受け取り待ちのイベントは最大 `maxsize` 件で、満杯の間はテーブル側のコマンド処理が
+    待たされる (読み手が遅いほど書き手も遅くなる)。不要になったら `close()` すること。
+    """
+
+    __slots__ = ("_queue", "_owner", "_closed")
+
+    def __init__(self, owner: "AsyncPokerTable", maxsize: int) -> None:
+        self._queue: asyncio.Queue[GameEvent | None] = asyncio.Queue(maxsize)
+        self._owner = owner
+        self._closed = False
+
+    def __aiter__(self) -> "EventStream":
+        return self
+
+    async def __anext__(self) -> GameEvent:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def close(self) -> None:
+        """購読をやめる。未受信のイベントは捨て、待っている `async for` は終了する"""
+        if self._closed:
+            return
+        self._closed = True
+        self._owner._unsubscribe(self)
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def _publish(self, event: GameEvent) -> None:
+        if not self._closed:
+            await self._queue.put(event)
+
+    async def _finish(self) -> None:
+        """テーブル側からの終端。未受信のイベントを受け取り終えたところで `async for` が終わる"""
+        if self._closed:
+            return
+        self._closed = True
+        await self._queue.put(None)
+
+
+class AsyncPokerTable:
+    """`PokerTableInterface` の実装を asyncio から使うためのラッパー。
+
+    コマンドはテーブルごとの待ち行列に積まれ、そのテーブル専用の処理タスクが1件ずつ
+    順に実行するため、同じテーブルへの同時呼び出しはロックなしで直列化される
+    (テーブル間に共有のロックはない)。処理タスクは待ち行列が空になると終了するので、
+    アイドルなテーブルはタスクを持たない。
+
+    待ち行列が `max_pending` 件に達している間は、新たなコマンドの投入が空きを待つ (背圧)。
+    各コマンドはイベントループ上で同期的に実行される (1件あたり数十〜数百µs) が、
+    1件ごとに制御をループへ返すため、1つのテーブルがループを占有することはない。
+    """
+
+    __slots__ = (
+        "_table", "_max_pending", "_on_change", "_pending", "_space_waiters",
+        "_drain_task", "_streams",
+    )
+
+    def __init__(
+        self,
+        table: PokerTableInterface,
+        *,
+        max_pending: int = 64,
+        on_change: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            table: 実際に操作するテーブル (`PokerTable` など)。
+            max_pending: 待ち行列に積めるコマンド数の上限。
+            on_change: 状態を変えるコマンドの実行後に呼ぶ関数 (マネージャーの索引更新用)。
+        """
+        self._table = table
+        self._max_pending = max_pending
+        self._on_change = on_change
+        # 待ち行列は最大 max_pending 件と短いので、空のときに小さい list を使う
+        # (deque は空でも数百バイトあり、数万卓では無視できない)
+        self._pending: list[tuple[Callable[[], Any], bool, asyncio.Future[Any]]] = []
+        self._space_waiters: list[asyncio.Future[None]] = []
+        self._drain_task: asyncio.Task[None] | None = None
+        self._streams: list[EventStream] = []
+
+    @property
+    def table(self) -> PokerTableInterface:
+        """ラップしているテーブル (同期的に直接操作するとコマンドの直列化を迂回する点に注意)"""
+        return self._table
+
+    # ─── コマンド ───
+
+    async def add_player(self, player_id: str, chips: Chips) -> GameEvent:
+        event: GameEvent = await self._submit(lambda: self._table.add_player(player_id, chips))
+        return event
+
+    async def remove_player(self, player_id: str) -> GameEvent:
+        event: GameEvent = await self._submit(lambda: self._table.remove_player(player_id))
+        return event
+
+    async def start_game(self) -> ActionResult:
+        result: ActionResult = await self._submit(self._table.start_game)
+        return result
+
+    async def action(self, player_id: str, action: Action) -> ActionResult:
+        result: ActionResult = await self._submit(lambda: self._table.action(player_id, action))
+        return result
+
+    async def level_up(self) -> GameEvent:
+        event: GameEvent = await self._submit(self._table.level_up)
+        return event
+
+    async def get_state(self, viewer_player_id: str | None = None) -> GameState:
+        state: GameState = await self._submit(
+            lambda: self._table.get_state(viewer_player_id), changes=False
+        )
+        return state
+
+    async def get_states_for_viewers(
+        self, viewer_ids: Iterable[str | None]
+    ) -> dict[str | None, GameState]:
+        viewers = tuple(viewer_ids)
+        states: dict[str | None, GameState] = await self._submit(
+            lambda: self._table.get_states_for_viewers(viewers), changes=False
+        )
+        return states
+
+    async def get_table_status(self) -> TableStatus:
+        status: TableStatus = await self._submit(self._table.get_table_status, changes=False)
+        return status
+
+    # ─── イベント購読 ───
+
+    def events(self, maxsize: int = 256) -> EventStream:
+        """以後に発生する `GameEvent` の購読を開始する"""
+        stream = EventStream(self, maxsize)
+        self._streams.append(stream)
+        return stream
+
+    async def close(self) -> None:
+        """積まれているコマンドの完了を待ち、全ての購読を終端する。
+
+        購読側は受け取り待ちのイベントを全て受け取ってから `async for` を抜ける。
+        """
+        if self._drain_task is not None:
+            await asyncio.shield(self._drain_task)
+        streams, self._streams = self._streams, []
+        for stream in streams:
+            await stream._finish()
+
+    def _unsubscribe(self, stream: EventStream) -> None:
+        if stream in self._streams:
+            self._streams.remove(stream)
+
+    # ─── 待ち行列 ───
+
+    async def _submit(self, command: Callable[[], Any], *, changes: bool = True) -> Any:
+        loop = asyncio.get_running_loop()
+        while len(self._pending) >= self._max_pending:
+            waiter: asyncio.Future[None] = loop.create_future()
+            self._space_waiters.append(waiter)
+            await waiter
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append((command, changes, future))
+        if self._drain_task is None:
+            self._drain_task = loop.create_task(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        try:
+            while self._pending:
+                command, changes, future = self._pending.pop(0)
+                self._wake_one_submitter()
+                error: Exception | None = None
+                try:
+                    value = command()
+                except Exception as e:
+                    value, error = None, e
+                # 失敗したコマンドでも状態が変わっていることがある (start_game の後片付けなど)
+                if changes and self._on_change is not None:
+                    self._on_change()
+                if future.cancelled():
+                    pass
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(value)
+                if error is None:
+                    await self._publish(value)
+                await asyncio.sleep(0)  # 他のテーブルの処理に制御を譲る
+        finally:
+            self._drain_task = None
+
+    def _wake_one_submitter(self) -> None:
+        """空きを待っている投入側を1つ起こす (キャンセル済みの待ちは飛ばす)"""
+        while self._space_waiters:
+            waiter = self._space_waiters.pop(0)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _publish(self, value: Any) -> None:
+        if not self._streams:
+            return
+        if isinstance(value, ActionResult):
+            events: tuple[GameEvent, ...] = value.events
+        elif isinstance(value, GameEvent):
+            events = (value,)
+        else:
+            return
+        for event in events:
+            for stream in list(self._streams):
+                await stream._publish(event)
+
+
+class AsyncTableManager:
+    """`TableManager` の asyncio 版。テーブルごとに `AsyncPokerTable` を持つ。
+
+    各テーブルへのコマンドはそのテーブルの待ち行列で直列化され、実行のたびに
+    `TableManager` の副索引が更新されるため、ロビー向けの検索も同じように使える。
+    """
+
+    def __init__(self, manager: TableManager | None = None, *, max_pending: int = 64) -> None:
+        """
+        Args:
+            manager: テーブルを保持する `TableManager` (未指定時は新規に作る)。
+            max_pending: 各テーブルの待ち行列に積めるコマンド数の上限。
+        """
+        self._manager = manager if manager is not None else TableManager()
+        self._max_pending = max_pending
+        self._tables: dict[str, AsyncPokerTable] = {}
+
+    @property
+    def manager(self) -> TableManager:
+        """副索引による検索 (`tables_by_status` など) に使う同期の `TableManager`"""
+        return self._manager
+
+    def create_table(self, table_id: str, **options: Any) -> AsyncPokerTable:
+        """
+        Raises:
+            DuplicateTableError: 同じ `table_id` のテーブルが既にある場合。
+        """
+        table = self._manager.create_table(table_id, **options)
+        wrapped = AsyncPokerTable(
+            table,
+            max_pending=self._max_pending,
+            on_change=lambda: self._manager.refresh(table_id),
+        )
+        self._tables[table_id] = wrapped
+        return wrapped
+
+    def get_table(self, table_id: str) -> AsyncPokerTable:
+        """
+        Raises:
+            TableNotFoundError: `table_id` のテーブルがない場合。
+        """
+        wrapped = self._tables.get(table_id)
+        if wrapped is None:
+            raise TableNotFoundError(f"テーブル {table_id} は存在しません")
+        return wrapped
+
+    async def remove_table(self, table_id: str) -> None:
+        """積まれているコマンドの完了を待ってからテーブルを登録解除する"""
+        wrapped = self.get_table(table_id)
+        await wrapped.close()
+        self._manager.remove_table(table_id)
+        del self._tables[table_id]
+
+    def __contains__(self, table_id: object) -> bool:
+        return table_id in self._tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
@@ -0,0 +1,107 @@
+import struct
+
+from poker_domain.value_objects.card import Card
+
+_FLOAT64 = struct.Struct("<d")
+
+
+class BinaryWriter:
+    """コンパクトなバイナリ形式の書き込み。整数は可変長 (LEB128)、文字列は長さ付き UTF-8"""
+
+    __slots__ = ("_buf",)
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def raw(self, data: bytes) -> None:
+        self._buf += data
+
+    def uint(self, value: int) -> None:
+        """非負整数を可変長で書く"""
+        buf = self._buf
+        while value >= 0x80:
+            buf.append(value & 0x7F | 0x80)
+            value >>= 7
+        buf.append(value)
+
+    def sint(self, value: int) -> None:
+        """符号付き整数を zigzag 変換して可変長で書く"""
+        self.uint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def optional_uint(self, value: int | None) -> None:
+        """`None` を 0、それ以外を value + 1 として書く"""
+        self.uint(0 if value is None else value + 1)
+
+    def float64(self, value: float) -> None:
+        self._buf += _FLOAT64.pack(value)
+
+    def string(self, value: str) -> None:
+        data = value.encode("utf-8")
+        self.uint(len(data))
+        self._buf += data
+
+    def cards(self, cards: tuple[Card, ...]) -> None:
+        """カード列を枚数 + 1枚1バイトのカード番号で書く"""
+        self.uint(len(cards))
+        self._buf += bytes(card.to_index() for card in cards)
+
+    def getvalue(self) -> bytes:
+        return bytes(self._buf)
+
+
+class BinaryReader:
+    """`BinaryWriter` で書いたデータの読み込み。データが途中で切れていれば `ValueError`"""
+
+    __slots__ = ("_data", "_pos")
+
+    def __init__(self, data: bytes, pos: int = 0) -> None:
+        self._data = data
+        self._pos = pos
+
+    @property
+    def pos(self) -> int:
+        return self._pos
+
+    def at_end(self) -> bool:
+        return self._pos >= len(self._data)
+
+    def raw(self, size: int) -> bytes:
+        end = self._pos + size
+        if end > len(self._data):
+            raise ValueError("データが途中で切れています")
+        chunk = self._data[self._pos:end]
+        self._pos = end
+        return bytes(chunk)
+
+    def uint(self) -> int:
+        data, pos = self._data, self._pos
+        result = shift = 0
+        while True:
+            if pos >= len(data):
+                raise ValueError("データが途中で切れています")
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        self._pos = pos
+        return result
+
+    def sint(self) -> int:
+        value = self.uint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def optional_uint(self) -> int | None:
+        value = self.uint()
+        return None if value == 0 else value - 1
+
+    def float64(self) -> float:
+        value: float = _FLOAT64.unpack(self.raw(8))[0]
+        return value
+
+    def string(self) -> str:
+        return self.raw(self.uint()).decode("utf-8")
+
+    def cards(self) -> tuple[Card, ...]:
+        return tuple(Card.from_index(i) for i in self.raw(self.uint()))
@@ -0,0 +1,612 @@
+import io
+import json
+import mmap
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, BinaryIO, Literal
+
+from poker_domain.action_log import (
+    ACTION_CODES,
+    ACTION_NAMES,
+    PHASE_CODES,
+    PHASES,
+    shared_entry,
+)
+from poker_domain.game_state import GamePhase
+from poker_domain.history import HandRecord
+from poker_domain.value_objects.card import Card
+
+FORMAT_VERSION = 1
+MAX_SEATS = 10
+NO_CARD = 255          # カード番号の列で「カードなし・非公開」を表す値
+ALL_IN = 0x80          # action_code の最上位ビット: このアクションでオールインになった
+
+_BOARD_WIDTH = 5
+_NO_AMOUNT = -1        # action_amount で amount=None を表す値
+
+# flags 列のビット (None を取り得る項目)
+_HAS_SEED = 1
+_HAS_RAKE_CAP = 2
+_HAS_RAKE_MIN_POT = 4
+_NEGATIVE_SEED = 8     # seed 列は絶対値で持ち、負のシードはこのビットを立てる
+_SEED_LIMIT = 1 << 64  # seed 列 (符号なし64ビット) に入るシードの絶対値の上限 (未満)
+
+# 行の単位。hand は1ハンド1行、seat は1ハンド max_seats 行 (空席も埋める)、
+# action・pot はハンドごとに可変長 (hand の action_offset・pot_offset から始まる)
+_HAND, _SEAT, _ACTION, _POT = "hand", "seat", "action", "pot"
+
+_Typecode = Literal["B", "i", "q", "Q", "d"]
+
+# 列名 → (行の単位, array の型コード, 1行あたりの要素数)
+COLUMNS: dict[str, tuple[str, _Typecode, int]] = {
+    "table": (_HAND, "i", 1),              # テーブルID の辞書番号
+    "hand_number": (_HAND, "q", 1),
+    "started_at": (_HAND, "d", 1),
+    "seed": (_HAND, "Q", 1),               # シードの絶対値 (符号は flags の _NEGATIVE_SEED)
+    "flags": (_HAND, "B", 1),
+    "level": (_HAND, "i", 1),
+    "small_blind": (_HAND, "q", 1),
+    "big_blind": (_HAND, "q", 1),
+    "ante": (_HAND, "q", 1),
+    "rake_percent": (_HAND, "d", 1),
+    "rake_cap": (_HAND, "q", 1),
+    "rake_min_pot": (_HAND, "q", 1),
+    "dealer": (_HAND, "B", 1),             # ディーラーの座席番号
+    "seat_count": (_HAND, "B", 1),
+    "board": (_HAND, "B", _BOARD_WIDTH),   # カード番号 (`Card.to_index()`)、未配布は NO_CARD
+    "pot": (_HAND, "q", 1),                # レーキ控除前のポット合計
+    "rake": (_HAND, "q", 1),
+    "action_offset": (_HAND, "q", 1),
+    "pot_offset": (_HAND, "q", 1),
+    "seat_player": (_SEAT, "i", 1),        # プレイヤーID の辞書番号、空席は -1
+    "seat_stack": (_SEAT, "q", 1),         # 開始時のチップ
+    "seat_cards": (_SEAT, "B", 2),         # ショーダウンで公開したホールカード
+    "seat_payout": (_SEAT, "q", 1),
+    "action_player": (_ACTION, "i", 1),
+    "action_code": (_ACTION, "B", 1),      # ALL_IN | フェーズコード << 4 | アクションコード
+    "action_amount": (_ACTION, "q", 1),    # bet/raise の金額、それ以外は -1
+    "pot_amount": (_POT, "q", 1),          # レーキ控除後のメイン・サイドポット
+}
+
+_META = "meta.json"
+_PLAYERS = "players.txt"
+_TABLES = "tables.txt"
+
+
+class _Dictionary:
+    """文字列 → 連番の辞書。1行1件 (JSON 文字列) の追記専用ファイルに保存する"""
+
+    __slots__ = ("path", "values", "index", "committed")
+
+    def __init__(self, path: str, count: int, readonly: bool) -> None:
+        self.path = path
+        self.values: list[str] = []
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.values = [json.loads(line) for line in islice(f, count)]
+        if not readonly:
+            # 確定していない (meta.json に反映される前の) 行は捨てる
+            with open(path, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(value) + "\n" for value in self.values)
+        self.index = {value: i for i, value in enumerate(self.values)}
+        self.committed = len(self.values)
+
+    def code(self, value: str) -> int:
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def flush(self) -> None:
+        if self.committed < len(self.values):
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(value) + "\n" for value in self.values[self.committed:])
+            self.committed = len(self.values)
+
+    def truncate(self, count: int) -> None:
+        """`count` 件目より後に追加した値を取り消す"""
+        for value in self.values[count:]:
+            del self.index[value]
+        del self.values[count:]
+
+
+class ColumnarHandStore:
+    """ハンド履歴を列ごとの固定長バイナリファイルに追記し、メモリマップで読む分析用ストア。
+
+    1つのディレクトリに列 (`COLUMNS`) ごとのファイルを置き、`array` の機械表現のまま
+    追記する。読み出しは各ファイルを `mmap` して `memoryview` として見せるため、ハンドごとに
+    JSON を解釈することなく列を走査できる。検索 (`hands_with_action()` など) はバイト列の
+    検索 (`bytes.find`・正規表現) で候補位置を求め、一致した位置だけを Python で調べる。
+
+    追記 (`append()`) は `batch_size` ハンドごとにまとめてファイルへ書き、最後に
+    `meta.json` の件数を書き換えた時点で確定する。確定前に異常終了した分は次に開いたとき
+    切り捨てる。書き込むのは1つのプロセスの1つのインスタンスだけとすること (他のプロセスからは
+    `readonly=True` で開き、`refresh()` で追記に追従できる)。スレッドセーフではない。
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_seats: int | None = None,
+        batch_size: int = 1024,
+        readonly: bool = False,
+    ) -> None:
+        """
+        Args:
+            directory: 保存先のディレクトリ (なければ作る)。
+            max_seats: 1ハンドあたりの座席数 (新規作成時のみ。既定 10)。
+            batch_size: まとめて書き出すハンド数。
+            readonly: 読むだけのために開く (ファイルを変更しない)。
+
+        Raises:
+            ValueError: 既存のストアと `max_seats` や形式のバージョンが異なる場合。
+            FileNotFoundError: `readonly=True` でストアが存在しない場合。
+        """
+        self._directory = os.fspath(directory)
+        self._readonly = readonly
+        if not readonly:
+            os.makedirs(self._directory, exist_ok=True)
+        meta = self._read_meta()
+        if meta is None and readonly:
+            raise FileNotFoundError(f"ストアがありません: {self._directory}")
+        if meta is None:
+            meta = {
+                "version": FORMAT_VERSION, "byteorder": sys.byteorder,
+                "max_seats": max_seats or MAX_SEATS,
+                _HAND: 0, _SEAT: 0, _ACTION: 0, _POT: 0, "players": 0, "tables": 0,
+            }
+        if meta["version"] != FORMAT_VERSION or meta["byteorder"] != sys.byteorder:
+            raise ValueError("このストアの形式には対応していません")
+        if max_seats is not None and max_seats != meta["max_seats"]:
+            raise ValueError(f"このストアの座席数は {meta['max_seats']} です")
+        if not 2 <= meta["max_seats"] <= MAX_SEATS:
+            raise ValueError(f"座席数は2〜{MAX_SEATS}です")
+        self._max_seats: int = meta["max_seats"]
+        self._rows = {group: meta[group] for group in (_HAND, _SEAT, _ACTION, _POT)}
+        self._players = _Dictionary(self._path(_PLAYERS), meta["players"], readonly)
+        self._tables = _Dictionary(self._path(_TABLES), meta["tables"], readonly)
+        self._batch_size = batch_size
+
+        self._files: dict[str, BinaryIO] = {}
+        self._pending: dict[str, array] = {}
+        for name, (group, typecode, width) in COLUMNS.items():
+            self._pending[name] = array(typecode)
+            if readonly:
+                continue
+            # 確定していない末尾を切り捨ててから追記用に開く
+            size = self._rows[group] * width * array(typecode).itemsize
+            file = open(self._path(name + ".col"), "ab")
+            file.truncate(size)
+            self._files[name] = file
+        self._pending_hands = 0
+        self._pending_actions = 0
+        self._pending_pots = 0
+        self._views: dict[str, Any] = {}
+        self._maps: dict[str, mmap.mmap] = {}
+        self._closed = False
+        if not readonly and not os.path.exists(self._path(_META)):
+            self._write_meta()
+
+    # ── 追記 ──
+
+    def append(self, record: HandRecord) -> int:
+        """1ハンドを追記し、そのハンドの番号 (0始まりの行番号) を返す。
+
+        列に入らない値を含むハンドは、途中まで積んだ分を取り消してから例外を送出する
+        (追記待ちの各列はハンドの途中で食い違わない)。
+
+        Raises:
+            ValueError: 着席人数が `max_seats` を超える場合、シードの絶対値が 2**64 以上の場合。
+            OverflowError: 金額などが列の型に収まらない場合。
+            io.UnsupportedOperation: 読み取り専用で開いた場合。
+        """
+        if self._readonly:
+            raise io.UnsupportedOperation("読み取り専用のストアには追記できません")
+        seat_count = len(record.stacks)
+        if seat_count > self._max_seats:
+            raise ValueError(f"座席数 {self._max_seats} を超えるハンドは保存できません")
+        if record.seed is not None and not -_SEED_LIMIT < record.seed < _SEED_LIMIT:
+            raise ValueError("シードの絶対値が 2**64 以上のハンドは保存できません")
+        lengths = {name: len(values) for name, values in self._pending.items()}
+        player_count = len(self._players.values)
+        table_count = len(self._tables.values)
+        try:
+            self._stage(record)
+        except BaseException:
+            for name, values in self._pending.items():
+                del values[lengths[name]:]
+            self._players.truncate(player_count)
+            self._tables.truncate(table_count)
+            raise
+        self._pending_actions += len(record.actions)
+        self._pending_pots += len(record.pots)
+        self._pending_hands += 1
+        index = self._rows[_HAND] + self._pending_hands - 1
+        if self._pending_hands >= self._batch_size:
+            self.flush()
+        return index
+
+    def _stage(self, record: HandRecord) -> None:
+        """1ハンド分の値を追記待ちの各列に積む (件数は `append()` が進める)"""
+        seat_count = len(record.stacks)
+        pending = self._pending
+        players = self._players
+        seats = {player_id: seat for seat, (player_id, _) in enumerate(record.stacks)}
+        seed = record.seed or 0
+        flags = (
+            (_HAS_SEED if record.seed is not None else 0)
+            | (_NEGATIVE_SEED if seed < 0 else 0)
+            | (_HAS_RAKE_CAP if record.rake_cap is not None else 0)
+            | (_HAS_RAKE_MIN_POT if record.rake_min_pot is not None else 0)
+        )
+        board = [card.to_index() for card in record.board]
+        board += [NO_CARD] * (_BOARD_WIDTH - len(board))
+
+        pending["table"].append(self._tables.code(record.table_id))
+        pending["hand_number"].append(record.hand_number)
+        pending["started_at"].append(record.started_at)
+        pending["seed"].append(abs(seed))
+        pending["flags"].append(flags)
+        pending["level"].append(record.level)
+        pending["small_blind"].append(record.small_blind)
+        pending["big_blind"].append(record.big_blind)
+        pending["ante"].append(record.ante)
+        pending["rake_percent"].append(record.rake_percent)
+        pending["rake_cap"].append(record.rake_cap or 0)
+        pending["rake_min_pot"].append(record.rake_min_pot or 0)
+        pending["dealer"].append(seats[record.dealer_id])
+        pending["seat_count"].append(seat_count)
+        pending["board"].extend(board)
+        pending["pot"].append(sum(amount for _, amount in record.payouts) + record.rake)
+        pending["rake"].append(record.rake)
+        pending["action_offset"].append(self._rows[_ACTION] + self._pending_actions)
+        pending["pot_offset"].append(self._rows[_POT] + self._pending_pots)
+
+        shown = dict(record.shown_cards)
+        payouts = dict(record.payouts)
+        empty = self._max_seats - seat_count
+        for player_id, stack in record.stacks:
+            pending["seat_player"].append(players.code(player_id))
+            pending["seat_stack"].append(stack)
+            cards = shown.get(player_id)
+            pending["seat_cards"].extend(
+                (cards[0].to_index(), cards[1].to_index()) if cards else (NO_CARD, NO_CARD)
+            )
+            pending["seat_payout"].append(payouts.get(player_id, 0))
+        pending["seat_player"].extend([-1] * empty)
+        pending["seat_stack"].extend([0] * empty)
+        pending["seat_cards"].extend([NO_CARD] * (2 * empty))
+        pending["seat_payout"].extend([0] * empty)
+
+        for player_id, code, amount in _encode_actions(record, seats):
+            pending["action_player"].append(players.code(player_id))
+            pending["action_code"].append(code)
+            pending["action_amount"].append(amount)
+        pending["pot_amount"].extend(record.pots)
+
+    def extend(self, records: Iterable[HandRecord]) -> None:
+        """複数のハンドを追記する"""
+        for record in records:
+            self.append(record)
+
+    def flush(self) -> None:
+        """追記待ちのハンドを書き出して確定する"""
+        if not self._pending_hands:
+            return
+        # 列ファイル → 辞書 → meta.json の順に書く (meta.json の件数が確定の印)
+        for name, values in self._pending.items():
+            values.tofile(self._files[name])
+            self._files[name].flush()
+            del values[:]
+        self._players.flush()
+        self._tables.flush()
+        self._rows[_HAND] += self._pending_hands
+        self._rows[_SEAT] += self._pending_hands * self._max_seats
+        self._rows[_ACTION] += self._pending_actions
+        self._rows[_POT] += self._pending_pots
+        self._pending_hands = self._pending_actions = self._pending_pots = 0
+        self._write_meta()
+        self._views.clear()
+
+    def close(self) -> None:
+        """残りを書き出してファイルを閉じる"""
+        if self._closed:
+            return
+        self.flush()
+        for file in self._files.values():
+            file.close()
+        self._views.clear()
+        self._maps.clear()
+        self._closed = True
+
+    def __enter__(self) -> "ColumnarHandStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ── 読み出し ──
+
+    def __len__(self) -> int:
+        """確定済みのハンド数 (`flush()` 前の追記分は含まない)"""
+        return self._rows[_HAND]
+
+    @property
+    def max_seats(self) -> int:
+        return self._max_seats
+
+    @property
+    def player_ids(self) -> tuple[str, ...]:
+        """プレイヤーID の辞書 (`seat_player`・`action_player` 列の値が添字)"""
+        return tuple(self._players.values[: self._players.committed])
+
+    @property
+    def table_ids(self) -> tuple[str, ...]:
+        """テーブルID の辞書 (`table` 列の値が添字)"""
+        return tuple(self._tables.values[: self._tables.committed])
+
+    def refresh(self) -> None:
+        """別のプロセスが追記して確定した分を読めるようにする (`readonly=True` で開いたストア用)"""
+        meta = self._read_meta()
+        if meta is None or self._pending_hands:
+            return
+        self._rows = {group: meta[group] for group in (_HAND, _SEAT, _ACTION, _POT)}
+        for dictionary, count in ((self._players, meta["players"]), (self._tables, meta["tables"])):
+            with open(dictionary.path, encoding="utf-8") as f:
+                lines = islice(f, dictionary.committed, count)
+                for line in lines:
+                    dictionary.code(json.loads(line))
+            dictionary.committed = len(dictionary.values)
+        self._views.clear()
+
+    def column(self, name: str) -> Any:
+        """確定済みの列全体を、ファイルをメモリマップした読み取り専用の `memoryview` で返す。
+
+        要素の型は `COLUMNS` の型コード。1行に複数の要素を持つ列 (`board` など) は
+        行ごとに要素を並べた1次元の列になる。
+        """
+        view = self._views.get(name)
+        if view is None:
+            group, typecode, width = COLUMNS[name]
+            count = self._rows[group] * width
+            nbytes = count * array(typecode).itemsize
+            if nbytes == 0:
+                view = memoryview(array(typecode))
+            else:
+                mapped = self._maps.get(name)
+                if mapped is None or len(mapped) < nbytes:
+                    with open(self._path(name + ".col"), "rb") as f:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._maps[name] = mapped
+                view = memoryview(mapped)[:nbytes].cast(typecode)
+            self._views[name] = view
+        return view
+
+    def hands_with_player(self, player_id: str) -> array:
+        """プレイヤーが着席していたハンドの番号 (昇順)"""
+        code = self._players.index.get(player_id)
+        if code is None or code >= self._players.committed:
+            return array("q")
+        seats = self._positions("seat_player", code)
+        return array("q", sorted({seat // self._max_seats for seat in seats}))
+
+    def hands_with_action(
+        self,
+        *,
+        player_id: str | None = None,
+        phase: GamePhase | None = None,
+        action: str | None = None,
+        all_in: bool | None = None,
+    ) -> array:
+        """条件に合うアクションを1つ以上含むハンドの番号 (昇順)。
+
+        例えば「プレイヤー X がプリフロップでオールインしたハンド」は
+        `hands_with_action(player_id="X", phase=GamePhase.PRE_FLOP, all_in=True)`。
+
+        Args:
+            player_id: アクションしたプレイヤー。
+            phase: アクションしたフェーズ。
+            action: `"fold"` / `"check"` / `"call"` / `"bet"` / `"raise"`。
+            all_in: そのアクションでオールインになったか (ブラインド・アンティでの
+                オールインは含まない)。
+        """
+        codes = {
+            flag | PHASE_CODES[p] << 4 | ACTION_CODES[a]
+            for flag in ((ALL_IN,) if all_in else (0,) if all_in is False else (0, ALL_IN))
+            for p in ((phase,) if phase is not None else PHASES)
+            for a in ((action,) if action is not None else ACTION_NAMES)
+        }
+        player = -1
+        if player_id is not None:
+            player = self._players.index.get(player_id, -1)
+            if not 0 <= player < self._players.committed:
+                return array("q")
+        positions: Iterable[int]
+        if player >= 0 and len(codes) == 2 * len(PHASES) * len(ACTION_NAMES):
+            positions = self._positions("action_player", player)
+        else:
+            # アクションの種類で絞れる場合は action_code 列 (1要素1バイト) を正規表現で走査する
+            pattern = re.compile(b"[" + b"".join(re.escape(bytes((c,))) for c in codes) + b"]")
+            positions = (m.start() for m in pattern.finditer(self.column("action_code")))
+            if player >= 0:
+                action_players = self.column("action_player")
+                positions = (i for i in positions if action_players[i] == player)
+        return self._hands_of_actions(positions)
+
+    def record(self, index: int) -> HandRecord:
+        """`index` 番目のハンドを `HandRecord` に戻す (`payouts` は着席順になる)"""
+        if not 0 <= index < len(self):
+            raise IndexError("hand index out of range")
+        col = self.column
+        players = self._players.values
+        flags = col("flags")[index]
+        seat_base = index * self._max_seats
+        seat_count = col("seat_count")[index]
+        stacks = tuple(
+            (players[col("seat_player")[seat_base + i]], col("seat_stack")[seat_base + i])
+            for i in range(seat_count)
+        )
+        seat_cards = col("seat_cards")
+        shown = tuple(
+            (player_id, (Card.from_index(seat_cards[2 * (seat_base + i)]),
+                         Card.from_index(seat_cards[2 * (seat_base + i) + 1])))
+            for i, (player_id, _) in enumerate(stacks)
+            if seat_cards[2 * (seat_base + i)] != NO_CARD
+        )
+        payouts = tuple(
+            (player_id, col("seat_payout")[seat_base + i])
+            for i, (player_id, _) in enumerate(stacks)
+            if col("seat_payout")[seat_base + i]
+        )
+        start, end = self._range("action_offset", _ACTION, index)
+        action_players, action_codes = col("action_player"), col("action_code")
+        action_amounts = col("action_amount")
+        actions = tuple(
+            shared_entry(
+                players[action_players[i]],
+                PHASES[action_codes[i] >> 4 & 0x7],
+                ACTION_NAMES[action_codes[i] & 0xF],
+                None if action_amounts[i] == _NO_AMOUNT else action_amounts[i],
+            )
+            for i in range(start, end)
+        )
+        pot_start, pot_end = self._range("pot_offset", _POT, index)
+        board = col("board")[_BOARD_WIDTH * index:_BOARD_WIDTH * (index + 1)]
+        return HandRecord(
+            table_id=self._tables.values[col("table")[index]],
+            hand_number=col("hand_number")[index],
+            started_at=col("started_at")[index],
+            seed=_seed(col("seed")[index], flags),
+            dealer_id=stacks[col("dealer")[index]][0],
+            level=col("level")[index],
+            small_blind=col("small_blind")[index],
+            big_blind=col("big_blind")[index],
+            ante=col("ante")[index],
+            rake_percent=col("rake_percent")[index],
+            rake_cap=col("rake_cap")[index] if flags & _HAS_RAKE_CAP else None,
+            rake_min_pot=col("rake_min_pot")[index] if flags & _HAS_RAKE_MIN_POT else None,
+            stacks=stacks,
+            actions=actions,
+            board=tuple(Card.from_index(c) for c in board if c != NO_CARD),
+            shown_cards=shown,
+            payouts=payouts,
+            pots=tuple(col("pot_amount")[pot_start:pot_end]),
+            rake=col("rake")[index],
+        )
+
+    def records(self, indices: Iterable[int]) -> Iterator[HandRecord]:
+        """`indices` の各ハンドを `HandRecord` に戻す"""
+        for index in indices:
+            yield self.record(index)
+
+    # ── 内部 ──
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self._directory, name)
+
+    def _read_meta(self) -> dict[str, Any] | None:
+        try:
+            with open(self._path(_META), encoding="utf-8") as f:
+                meta: dict[str, Any] = json.load(f)
+        except FileNotFoundError:
+            return None
+        return meta
+
+    def _write_meta(self) -> None:
+        meta = {
+            "version": FORMAT_VERSION, "byteorder": sys.byteorder, "max_seats": self._max_seats,
+            **self._rows, "players": self._players.committed, "tables": self._tables.committed,
+        }
+        temp = self._path(_META + ".tmp")
+        with open(temp, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(temp, self._path(_META))
+
+    def _positions(self, name: str, value: int) -> Iterator[int]:
+        """列の中で `value` に等しい要素の添字を、バイト列の検索で順に求める"""
+        view = self.column(name)
+        data = view.cast("B")
+        itemsize = view.itemsize
+        pattern = array(view.format, (value,)).tobytes()
+        mapped = self._maps.get(name)
+        # mmap・bytes の find は C で走査するため、一致しない大部分は Python に戻らない
+        haystack: Any = mapped if mapped is not None else data.tobytes()
+        end = len(data)
+        position = haystack.find(pattern, 0, end)
+        while position >= 0:
+            if position % itemsize == 0:
+                yield position // itemsize
+                position = haystack.find(pattern, position + itemsize, end)
+            else:
+                position = haystack.find(pattern, position + 1, end)
+
+    def _range(self, offset_column: str, group: str, index: int) -> tuple[int, int]:
+        offsets = self.column(offset_column)
+        end = offsets[index + 1] if index + 1 < len(offsets) else self._rows[group]
+        return offsets[index], end
+
+    def _hands_of_actions(self, positions: Iterable[int]) -> array:
+        """アクションの添字 (昇順) を、それを含むハンドの番号 (重複なし) に変換する"""
+        offsets = self.column("action_offset")
+        hands = array("q")
+        last_end = -1  # 直前に見つけたハンドのアクション範囲の終端
+        for position in positions:
+            if position < last_end:
+                continue
+            hand = bisect_right(offsets, position, max(hands[-1] if hands else 0, 0)) - 1
+            hands.append(hand)
+            last_end = offsets[hand + 1] if hand + 1 < len(offsets) else self._rows[_ACTION]
+        return hands
+
+
+def _seed(value: int, flags: int) -> int | None:
+    """seed 列の値と flags からハンドのシードを戻す"""
+    if not flags & _HAS_SEED:
+        return None
+    return -value if flags & _NEGATIVE_SEED else value
+
+
+def _encode_actions(
+    record: HandRecord, seats: dict[str, int]
+) -> Iterator[tuple[str, int, int]]:
+    """アクションを (player_id, action_code, action_amount) にする。
+
+    オールインの判定のため、アンティ・ブラインドから順にチップの出入りをたどる。
+    """
+    stacks = [stack for _, stack in record.stacks]
+    bets = [0] * len(stacks)
+    for seat in range(len(stacks)):
+        stacks[seat] -= min(record.ante, stacks[seat])
+    n = len(stacks)
+    dealer = seats[record.dealer_id]
+    blind_seats = (dealer, (dealer + 1) % n) if n == 2 else ((dealer + 1) % n, (dealer + 2) % n)
+    for seat, blind in zip(blind_seats, (record.small_blind, record.big_blind)):
+        paid = min(blind, stacks[seat])
+        stacks[seat] -= paid
+        bets[seat] = paid
+    current_bet = record.big_blind
+    phase = GamePhase.PRE_FLOP
+    for entry in record.actions:
+        seat = seats[entry.player_id]
+        if entry.phase != phase:
+            phase = entry.phase
+            bets = [0] * n
+            current_bet = 0
+        amount = entry.amount
+        if entry.action == "call":
+            paid = min(current_bet - bets[seat], stacks[seat])
+            stacks[seat] -= paid
+            bets[seat] += paid
+        elif entry.action in ("bet", "raise") and amount is not None:
+            stacks[seat] -= amount - bets[seat]
+            bets[seat] = current_bet = amount
+        all_in = ALL_IN if entry.action not in ("fold", "check") and stacks[seat] == 0 else 0
+        code = all_in | PHASE_CODES[entry.phase] << 4 | ACTION_CODES[entry.action]
+        yield entry.player_id, code, _NO_AMOUNT if amount is None else amount
@@ -3,22 +3,45 @@ import random
 from poker_domain.exceptions import DeckEmptyError
 from poker_domain.value_objects.card import Card, Rank, Suit
 
+# Card は不変なので、デッキを作るたびに52枚を生成せず同じインスタンスを並べ直す
+_FULL_DECK: tuple[Card, ...] = tuple(Card(suit=suit, rank=rank) for suit in Suit for rank in Rank)
+
 
 class Deck:
     """52枚のカードデック"""
 
+    __slots__ = ("_rng", "_cards")
+
     def __init__(self, rng: random.Random | None = None) -> None:
         # rng 未指定時は random モジュールをそのまま使う (従来通り random.shuffle を差し替えて
         # テストできる)。random.Random インスタンスを渡せばデッキごとに独立した乱数系列にできる
         self._rng = rng if rng is not None else random
-        self._cards: list[Card] = [
-            Card(suit=suit, rank=rank)
-            for suit in Suit
-            for rank in Rank
-        ]
+        self._cards: list[Card] = list(_FULL_DECK)
+
+    @classmethod
+    def from_cards(cls, cards: tuple[Card, ...], rng: random.Random | None = None) -> "Deck":
+        """残りカードを指定した順序で持つデッキを作る (先頭から配られる)"""
+        deck = cls(rng)
+        deck._cards = list(cards)
+        return deck
 
     def shuffle(self) -> None:
-        self._rng.shuffle(self._cards)
+        rng = self._rng
+        if type(rng) is not random.Random:
+            rng.shuffle(self._cards)
+            return
+        # random.Random.shuffle と同じ Fisher-Yates (同じシードなら同じ並び) を、
+        # 1枚ごとのメソッド呼び出しを省いて展開したもの。シード付きのハンドでは
+        # シャッフルがハンド開始の処理時間の大半を占めるため
+        cards = self._cards
+        getrandbits = rng.getrandbits
+        for i in range(len(cards) - 1, 0, -1):
+            n = i + 1
+            k = n.bit_length()
+            j = getrandbits(k)
+            while j >= n:
+                j = getrandbits(k)
+            cards[i], cards[j] = cards[j], cards[i]
 
     def deal(self, count: int = 1) -> tuple[Card, ...]:
         if len(self._cards) < count:
@@ -30,3 +53,8 @@ class Deck:
     @property
     def remaining(self) -> int:
         return len(self._cards)
+
+    @property
+    def remaining_cards(self) -> tuple[Card, ...]:
+        """まだ配られていないカード (配られる順)"""
+        return tuple(self._cards)
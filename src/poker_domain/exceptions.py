@@ -51,3 +51,18 @@ class RebuyNotAllowedError(PokerError):
 class InvalidBuyInError(PokerError):
     """固定バイイン額が設定されたテーブルで、額が一致しないバイインを試みた"""
     pass
+
+
+class ReplayError(PokerError):
+    """記録されたハンドを記録どおりに再現できない (シードがない・履歴が不正など)"""
+    pass
+
+
+class TableNotFoundError(PokerError):
+    """指定した table_id のテーブルが存在しない"""
+    pass
+
+
+class DuplicateTableError(PokerError):
+    """同じ table_id のテーブルが既に存在する"""
+    pass
@@ -1,9 +1,12 @@
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
 
+from poker_domain.value_objects.card import Card
 from poker_domain.value_objects.chips import Chips
 from poker_domain.value_objects.community_cards import CommunityCards
+from poker_domain.value_objects.hand import Hand
 from poker_domain.value_objects.hole_cards import HoleCards
 
 
@@ -38,12 +41,6 @@ class EventType(Enum):
     TABLE_CLOSED = "table_closed"
 
 
-@dataclass(frozen=True)
-class GameEvent:
-    event_type: EventType
-    payload: dict[str, Any]
-
-
 @dataclass(frozen=True)
 class Pot:
     """メインポット/サイドポットの1枠。参加権があるプレイヤーだけが対象になる"""
@@ -51,6 +48,116 @@ class Pot:
     eligible_player_ids: tuple[str, ...]
 
 
+class GameEvent:
+    """テーブルで起きた出来事。`EventType` ごとのサブクラス (`PlayerActedEvent` など) で表す。
+
+    種類ごとの情報はサブクラスの属性で持ち、`isinstance()` や `match` で振り分けられる。
+    `payload` は同じ情報を従来の dict 形式で返す互換用のビュー (アクセスのたびに dict を作る)。
+    """
+
+    __slots__ = ()
+    event_type: ClassVar[EventType]
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        names: tuple[str, ...] = type(self).__slots__
+        return {name: getattr(self, name) for name in names}
+
+    @staticmethod
+    def from_payload(event_type: EventType, payload: dict[str, Any]) -> "GameEvent":
+        """`event_type` と dict 形式の `payload` から対応するサブクラスのイベントを作る"""
+        return _EVENT_CLASSES[event_type](**payload)
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerJoinedEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.PLAYER_JOINED
+    player_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerLeftEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.PLAYER_LEFT
+    player_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class GameStartedEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.GAME_STARTED
+
+
+@dataclass(frozen=True, slots=True)
+class HandDealtEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.HAND_DEALT
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerActedEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.PLAYER_ACTED
+    player_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class RoundEndedEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.ROUND_ENDED
+
+
+@dataclass(frozen=True, slots=True)
+class CommunityDealtEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.COMMUNITY_DEALT
+    community_cards: CommunityCards
+
+
+@dataclass(frozen=True, slots=True)
+class TurnChangedEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.TURN_CHANGED
+    player_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class ShowdownEvent(GameEvent):
+    """ハンドの決着。全員フォールドで決着した場合は `hands` が空で `pots` が `None`"""
+    event_type: ClassVar[EventType] = EventType.SHOWDOWN
+    winner_id: str | None
+    hands: dict[str, Hand]       # ショーダウンしたプレイヤーID → 役
+    payouts: dict[str, int]      # プレイヤーID → 獲得額 (レーキ控除後)
+    rake: int
+    pots: tuple[Pot, ...] | None = None
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {"winner_id": self.winner_id, "hands": self.hands}
+        if self.pots is not None:
+            payload["pots"] = self.pots
+        payload["payouts"] = self.payouts
+        payload["rake"] = self.rake
+        return payload
+
+
+@dataclass(frozen=True, slots=True)
+class LevelUpEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.LEVEL_UP
+    level: int
+    small_blind: int
+    big_blind: int
+    ante: int
+
+
+@dataclass(frozen=True, slots=True)
+class TableClosedEvent(GameEvent):
+    event_type: ClassVar[EventType] = EventType.TABLE_CLOSED
+
+
+_EVENT_CLASSES: dict[EventType, Callable[..., GameEvent]] = {
+    cls.event_type: cls
+    for cls in (
+        PlayerJoinedEvent, PlayerLeftEvent, GameStartedEvent, HandDealtEvent,
+        PlayerActedEvent, RoundEndedEvent, CommunityDealtEvent, TurnChangedEvent,
+        ShowdownEvent, LevelUpEvent, TableClosedEvent,
+    )
+}
+
+
 @dataclass(frozen=True)
 class WaitingFor:
     """poker_domain が次に誰のアクションを待っているか"""
@@ -68,6 +175,26 @@ class ActionLogEntry:
     amount: int | None    # bet/raise の場合のみ金額、それ以外は None
 
 
+@dataclass(frozen=True)
+class HandSetup:
+    """ハンド開始時点のテーブルの記録 (リプレイの起点)。
+
+    アンティ・ブラインド徴収前のチップ量とシャッフルのシードを持つ。シードから未配布の
+    カードが分かるため `GameState` には含めず、サーバー側でのみ保存する。
+    """
+    table_id: str
+    seed: int | None                      # None → シード未指定でシャッフルしたため再現不可
+    stacks: tuple[tuple[str, int], ...]   # 着席順の (player_id, チップ量)
+    dealer_id: str
+    level: int
+    small_blind: int
+    big_blind: int
+    ante: int
+    rake_percent: float
+    rake_cap: int | None
+    rake_min_pot: int | None
+
+
 @dataclass(frozen=True)
 class PlayerState:
     """スナップショット用のプレイヤー状態 (不変)"""
@@ -99,7 +226,23 @@ class GameState:
     rake_percent: float
     rake_cap: int | None
     rake_min_pot: int | None
-    action_log: tuple[ActionLogEntry, ...]
+    action_log: Sequence[ActionLogEntry]  # tuple 互換の不変シーケンス (ActionLogView)
+
+
+@dataclass(frozen=True)
+class PlayerStateDelta:
+    """1プレイヤー分の差分。前回から変化した `PlayerState` のフィールドのみを持つ"""
+    player_id: str
+    changes: dict[str, Any]  # フィールド名 → 新しい値
+
+
+@dataclass(frozen=True)
+class StateDelta:
+    """直前の `ActionResult.state` からの差分 (変化したフィールドのみ)"""
+    changes: dict[str, Any]                    # 置き換えるべき GameState のフィールド
+    players: tuple[PlayerStateDelta, ...]      # 変化があったプレイヤーのみ
+    community_cards: tuple[Card, ...]          # 新たに配られたコミュニティカード
+    action_log: tuple[ActionLogEntry, ...]     # 新たに追記されたアクション履歴
 
 
 @dataclass(frozen=True)
@@ -108,3 +251,4 @@ class ActionResult:
     state: GameState
     events: tuple[GameEvent, ...]
     waiting_for: WaitingFor | None  # None → ゲーム終了
+    delta: StateDelta | None = None  # emit_deltas=True のテーブルのみ。直前の state からの差分
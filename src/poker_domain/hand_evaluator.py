@@ -1,6 +1,11 @@
+import functools
 from collections import Counter
+from collections.abc import Callable
 from itertools import combinations
+from time import perf_counter_ns
+from typing import Any, ClassVar
 
+from poker_domain.interfaces import EvaluatorHook
 from poker_domain.value_objects.card import Card, Rank, Suit
 from poker_domain.value_objects.community_cards import CommunityCards
 from poker_domain.value_objects.hand import Hand, HandRank
@@ -10,6 +15,32 @@ from poker_domain.value_objects.hole_cards import HoleCards
 class HandEvaluator:
     """7枚のカードから最も強い5枚の手を評価する"""
 
+    # add_hook() で登録したフック (なければ空)
+    _hooks: ClassVar[tuple[EvaluatorHook, ...]] = ()
+
+    @staticmethod
+    def add_hook(hook: EvaluatorHook) -> None:
+        """`evaluate()` / `river_probabilities()` の呼び出しごとに通知を受けるフックを登録する。
+
+        プロセス全体に効く (計測用)。フックが1つもない間はメソッドを包まないため、
+        コストはかからない。
+
+        Args:
+            hook: 登録するフック (登録した順に呼ぶ)。
+        """
+        if not HandEvaluator._hooks:
+            for name, method in _UNHOOKED.items():
+                setattr(HandEvaluator, name, staticmethod(_notifying(name, method)))
+        HandEvaluator._hooks = (*HandEvaluator._hooks, hook)
+
+    @staticmethod
+    def remove_hook(hook: EvaluatorHook) -> None:
+        """`add_hook()` で登録したフックを外す (登録していなければ何もしない)"""
+        HandEvaluator._hooks = tuple(h for h in HandEvaluator._hooks if h is not hook)
+        if not HandEvaluator._hooks:
+            for name, method in _UNHOOKED.items():
+                setattr(HandEvaluator, name, staticmethod(method))
+
     @staticmethod
     def evaluate(cards: tuple[Card, ...]) -> Hand:
         """5枚以上のカードから最も強い5枚の組み合わせを `Hand` として返す。
@@ -255,3 +286,33 @@ class HandEvaluator:
         if set(ranks) == {14, 2, 3, 4, 5}:
             return True, 5
         return False, 0
+
+
+# フックを登録したときに包む処理 (名前 → 元の関数)
+_UNHOOKED: dict[str, Callable[..., Any]] = {
+    name: getattr(HandEvaluator, name) for name in ("evaluate", "river_probabilities")
+}
+
+
+def _notifying(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+    """関数の呼び出しを、`HandEvaluator` に登録したフックに `name` として通知する関数で包む"""
+
+    @functools.wraps(function)
+    def hooked(*args: Any, **kwargs: Any) -> Any:
+        hooks = HandEvaluator._hooks
+        if not hooks:
+            return function(*args, **kwargs)
+        start = perf_counter_ns()
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            end = perf_counter_ns()
+            for hook in hooks:
+                hook.after_evaluate(name, e, start, end)
+            raise
+        end = perf_counter_ns()
+        for hook in hooks:
+            hook.after_evaluate(name, None, start, end)
+        return result
+
+    return hooked
@@ -0,0 +1,642 @@
+import calendar
+import gzip
+import json
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import TextIO
+
+from poker_domain.action_log import entry_rows, shared_entry
+from poker_domain.game_state import (
+    ActionLogEntry,
+    ActionResult,
+    GamePhase,
+    GameStartedEvent,
+    GameState,
+    HandSetup,
+    ShowdownEvent,
+)
+from poker_domain.value_objects.card import Card
+
+FORMATS = ("jsonl", "text")
+
+# テキスト形式で各ストリートの見出しに使う名前
+_STREET_HEADERS: dict[GamePhase, str] = {
+    GamePhase.FLOP: "FLOP",
+    GamePhase.TURN: "TURN",
+    GamePhase.RIVER: "RIVER",
+}
+_BOARD_SIZES: dict[GamePhase, int] = {GamePhase.FLOP: 3, GamePhase.TURN: 4, GamePhase.RIVER: 5}
+_STREETS_BY_HEADER: dict[str, GamePhase] = {
+    f"*** {name} ***": phase for phase, name in _STREET_HEADERS.items()
+}
+_TEXT_HEADER = "PokerDomain Hand #"
+_TIME_FORMAT = "%Y/%m/%d %H:%M:%S"
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+@dataclass(frozen=True)
+class HandRecord:
+    """ハンド履歴1件 (決着した1ハンド分の記録)"""
+    table_id: str
+    hand_number: int                # 書き出し器ごと・テーブルごとの通し番号 (1始まり)
+    started_at: float               # ハンド開始時刻 (UNIX 時刻)
+    seed: int | None                # `HandSetup` を渡して記録した場合のみ
+    dealer_id: str
+    level: int
+    small_blind: int
+    big_blind: int
+    ante: int
+    rake_percent: float
+    rake_cap: int | None
+    rake_min_pot: int | None
+    stacks: tuple[tuple[str, int], ...]                 # 着席順の (player_id, 開始時のチップ)
+    actions: Sequence[ActionLogEntry]   # tuple 互換の不変シーケンス
+    board: tuple[Card, ...]
+    shown_cards: tuple[tuple[str, tuple[Card, ...]], ...]   # ショーダウンで公開したホールカード
+    payouts: tuple[tuple[str, int], ...]
+    pots: tuple[int, ...]           # レーキ控除後のメインポット・サイドポット (不戦勝なら空)
+    rake: int
+
+    def to_hand_setup(self) -> HandSetup:
+        """このハンドを `replay_hand()` で再生するための `HandSetup`"""
+        return HandSetup(
+            table_id=self.table_id,
+            seed=self.seed,
+            stacks=self.stacks,
+            dealer_id=self.dealer_id,
+            level=self.level,
+            small_blind=self.small_blind,
+            big_blind=self.big_blind,
+            ante=self.ante,
+            rake_percent=self.rake_percent,
+            rake_cap=self.rake_cap,
+            rake_min_pot=self.rake_min_pot,
+        )
+
+
+class _OpenHand:
+    """進行中のハンドについて、開始時点でしか分からない情報だけを持つ"""
+
+    __slots__ = ("hand_number", "started_at", "seed", "state", "stacks")
+
+    def __init__(
+        self,
+        hand_number: int,
+        started_at: float,
+        seed: int | None,
+        state: GameState,
+        stacks: tuple[tuple[str, int], ...],
+    ) -> None:
+        self.hand_number = hand_number
+        self.started_at = started_at
+        self.seed = seed
+        self.state = state
+        self.stacks = stacks
+
+
+def _starting_stacks(state: GameState) -> tuple[tuple[str, int], ...]:
+    """ハンド開始直後の状態から、アンティ・ブラインドを払う前のチップを求める。
+
+    アンティ自体でオールインになったプレイヤーの開始時のチップは、ポットの残りから
+    求める (そのようなプレイヤーが複数いる場合は等分した近似値になる)。
+    """
+    ante = state.ante.amount
+    stacks: dict[str, int] = {}
+    unknown: list[str] = []
+    paid = 0  # 開始時のチップが分かっているプレイヤーの拠出額の合計
+    for player in state.players:
+        chips, bet = player.chips.amount, player.current_bet.amount
+        if chips > 0 or bet > 0:
+            stacks[player.player_id] = chips + bet + ante
+            paid += bet + ante
+        else:
+            unknown.append(player.player_id)
+    if unknown:
+        share = (state.pot.amount - paid) // len(unknown)
+        for player_id in unknown:
+            stacks[player_id] = share
+    return tuple((p.player_id, stacks[p.player_id]) for p in state.players)
+
+
+def _optional(value: object) -> str:
+    return "-" if value is None else str(value)
+
+
+def _parse_optional(text: str) -> int | None:
+    return None if text == "-" else int(text)
+
+
+def hand_record_to_json(record: HandRecord) -> str:
+    """JSON Lines 形式の1行 (改行を含まない) にする"""
+    return json.dumps({
+        "table_id": record.table_id,
+        "hand": record.hand_number,
+        "started_at": record.started_at,
+        "seed": record.seed,
+        "dealer": record.dealer_id,
+        "level": record.level,
+        "blinds": [record.small_blind, record.big_blind, record.ante],
+        "rake_settings": [record.rake_percent, record.rake_cap, record.rake_min_pot],
+        "stacks": [list(stack) for stack in record.stacks],
+        "actions": [
+            [player_id, phase.name, action, amount]
+            for player_id, phase, action, amount in entry_rows(record.actions)
+        ],
+        "board": [card.code for card in record.board],
+        "shown": {player_id: [c.code for c in cards] for player_id, cards in record.shown_cards},
+        "payouts": dict(record.payouts),
+        "pots": list(record.pots),
+        "rake": record.rake,
+    }, separators=(",", ":"))
+
+
+def hand_record_to_text(record: HandRecord) -> str:
+    """一般的なテキスト形式のハンド履歴 (末尾に空行を含む) にする"""
+    started = time.strftime(_TIME_FORMAT, time.gmtime(record.started_at))
+    lines = [
+        f"PokerDomain Hand #{record.table_id}-{record.hand_number}: Hold'em No Limit "
+        f"({record.small_blind}/{record.big_blind}) - {started} UTC",
+    ]
+    player_ids = [player_id for player_id, _ in record.stacks]
+    dealer_seat = player_ids.index(record.dealer_id)
+    lines.append(
+        f"Table '{record.table_id}' {len(player_ids)}-max Seat #{dealer_seat + 1} is the button"
+    )
+    lines.append(
+        f"Level {record.level} | Ante {record.ante} | Seed {_optional(record.seed)} | "
+        f"Rake {record.rake_percent!r} cap {_optional(record.rake_cap)} "
+        f"min pot {_optional(record.rake_min_pot)}"
+    )
+    for seat, (player_id, stack) in enumerate(record.stacks, start=1):
+        lines.append(f"Seat {seat}: {player_id} ({stack} in chips)")
+
+    # 拠出額をたどりながら、コールの額・レイズの上乗せ額を求める
+    stacks = dict(record.stacks)
+    bets = dict.fromkeys(player_ids, 0)
+    if record.ante > 0:
+        for player_id in player_ids:
+            paid = min(record.ante, stacks[player_id])
+            stacks[player_id] -= paid
+            lines.append(f"{player_id}: posts the ante {paid}")
+    n = len(player_ids)
+    sb_seat, bb_seat = (
+        (dealer_seat, (dealer_seat + 1) % n) if n == 2
+        else ((dealer_seat + 1) % n, (dealer_seat + 2) % n)
+    )
+    for seat, label, blind in ((sb_seat, "small", record.small_blind),
+                               (bb_seat, "big", record.big_blind)):
+        player_id = player_ids[seat]
+        paid = min(blind, stacks[player_id])
+        stacks[player_id] -= paid
+        bets[player_id] = paid
+        lines.append(f"{player_id}: posts {label} blind {paid}")
+    current_bet = record.big_blind
+
+    lines.append("*** HOLE CARDS ***")
+    phase = GamePhase.PRE_FLOP
+    for player_id, entry_phase, action, entry_amount in entry_rows(record.actions):
+        if entry_phase != phase:
+            phase = entry_phase
+            bets = dict.fromkeys(player_ids, 0)
+            current_bet = 0
+            board = " ".join(c.code for c in record.board[:_BOARD_SIZES[phase]])
+            lines.append(f"*** {_STREET_HEADERS[phase]} *** [{board}]")
+        match action:
+            case "fold":
+                lines.append(f"{player_id}: folds")
+            case "check":
+                lines.append(f"{player_id}: checks")
+            case "call":
+                paid = min(current_bet - bets[player_id], stacks[player_id])
+                stacks[player_id] -= paid
+                bets[player_id] += paid
+                lines.append(f"{player_id}: calls {paid}")
+            case "bet":
+                amount = entry_amount or 0
+                stacks[player_id] -= amount
+                bets[player_id] = current_bet = amount
+                lines.append(f"{player_id}: bets {amount}")
+            case "raise":
+                amount = entry_amount or 0
+                stacks[player_id] -= amount - bets[player_id]
+                lines.append(f"{player_id}: raises {amount - current_bet} to {amount}")
+                bets[player_id] = current_bet = amount
+    # 全員オールインで配り切った残りのストリート
+    while len(record.board) > _BOARD_SIZES.get(phase, 0):
+        phase = {GamePhase.PRE_FLOP: GamePhase.FLOP, GamePhase.FLOP: GamePhase.TURN,
+                 GamePhase.TURN: GamePhase.RIVER}[phase]
+        board = " ".join(c.code for c in record.board[:_BOARD_SIZES[phase]])
+        lines.append(f"*** {_STREET_HEADERS[phase]} *** [{board}]")
+
+    if record.shown_cards:
+        lines.append("*** SHOW DOWN ***")
+        for player_id, cards in record.shown_cards:
+            lines.append(f"{player_id}: shows [{' '.join(c.code for c in cards)}]")
+    for player_id, amount in record.payouts:
+        lines.append(f"{player_id} collected {amount} from pot")
+
+    lines.append("*** SUMMARY ***")
+    total = sum(amount for _, amount in record.payouts) + record.rake
+    side_pots = ""
+    if len(record.pots) > 1:
+        side_pots = f" Main pot {record.pots[0]}." + "".join(
+            f" Side pot-{i} {amount}." for i, amount in enumerate(record.pots[1:], start=1)
+        )
+    lines.append(f"Total pot {total}{side_pots} | Rake {record.rake}")
+    if record.board:
+        lines.append(f"Board [{' '.join(c.code for c in record.board)}]")
+    return "\n".join(lines) + "\n\n"
+
+
+class HandRecorder:
+    """`start_game()` / `action()` の結果から1ハンドずつ `HandRecord` を組み立てる。
+
+    `record(table_id, result)` に各テーブルの `ActionResult` を順に渡すと、`GAME_STARTED` で
+    ハンドを開き、`SHOWDOWN` で `ActionLogEntry` (`state.action_log`)・ボード・公開された
+    ホールカード・獲得額をまとめた `HandRecord` を返す。テーブルごとに開いておくハンドは
+    1つだけで、持つのは開始時点の情報のみ (アクションは決着時に最後のスナップショットの
+    履歴から読む)。書き出し先 (`HandHistoryWriter` など) はこれを使って記録を受け取る。
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.time) -> None:
+        """
+        Args:
+            clock: ハンド開始時刻に使う関数 (UNIX 時刻)。
+        """
+        self._clock = clock
+        self._open: dict[str, _OpenHand] = {}
+        self._hand_numbers: dict[str, int] = {}
+
+    @property
+    def open_hands(self) -> int:
+        """進行中として保持しているハンド数 (テーブルごとに高々1)"""
+        return len(self._open)
+
+    def record(
+        self, table_id: str, result: ActionResult, *, setup: HandSetup | None = None
+    ) -> HandRecord | None:
+        """テーブルの `ActionResult` を1件取り込む。
+
+        Args:
+            table_id: テーブルID。
+            result: `start_game()` / `action()` の戻り値 (テーブルごとに発生順に渡す)。
+            setup: `start_game()` の結果と一緒に `table.last_hand_setup` を渡すと、
+                開始時のチップとシードを正確に記録する (リプレイによる検証に使える)。
+
+        Returns:
+            このアクションでハンドが決着した場合はその `HandRecord`、それ以外は `None`。
+        """
+        completed: HandRecord | None = None
+        for event in result.events:
+            if isinstance(event, GameStartedEvent):
+                # 決着しないまま次のハンドが始まった場合、古いハンドは捨てる
+                number = self._hand_numbers.get(table_id, 0) + 1
+                self._hand_numbers[table_id] = number
+                stacks = setup.stacks if setup is not None else _starting_stacks(result.state)
+                seed = setup.seed if setup is not None else None
+                self._open[table_id] = _OpenHand(
+                    number, self._clock(), seed, result.state, stacks
+                )
+            elif isinstance(event, ShowdownEvent):
+                hand = self._open.pop(table_id, None)
+                if hand is not None:
+                    completed = self._complete(table_id, hand, result.state, event)
+        return completed
+
+    def discard(self, table_id: str) -> None:
+        """テーブルの進行中のハンドを記録せずに捨てる (テーブルを削除したときなど)"""
+        self._open.pop(table_id, None)
+
+    @staticmethod
+    def _complete(
+        table_id: str, hand: _OpenHand, state: GameState, showdown: ShowdownEvent
+    ) -> HandRecord:
+        start = hand.state
+        shown = showdown.hands
+        return HandRecord(
+            table_id=table_id,
+            hand_number=hand.hand_number,
+            started_at=hand.started_at,
+            seed=hand.seed,
+            dealer_id=start.dealer_id,
+            level=start.level,
+            small_blind=start.small_blind.amount,
+            big_blind=start.big_blind.amount,
+            ante=start.ante.amount,
+            rake_percent=start.rake_percent,
+            rake_cap=start.rake_cap,
+            rake_min_pot=start.rake_min_pot,
+            stacks=hand.stacks,
+            actions=state.action_log,
+            board=tuple(state.community_cards),
+            shown_cards=tuple(
+                (p.player_id, tuple(p.hole_cards or ()))
+                for p in state.players
+                if p.player_id in shown
+            ),
+            payouts=tuple(showdown.payouts.items()),
+            pots=tuple(pot.amount.amount for pot in showdown.pots or ()),
+            rake=showdown.rake,
+        )
+
+
+class HandHistoryWriter:
+    """`start_game()` / `action()` の結果から1ハンドずつ記録を組み立てて書き出す。
+
+    `record(table_id, result)` に各テーブルの `ActionResult` を順に渡すと、`HandRecorder` で
+    組み立てた決着済みの `HandRecord` を書き出し待ちに積む。
+
+    書き出しは `batch_size` ハンド分をまとめて1回の `write()` で行う。`close()` (または
+    `with` 文の終了) で残りを書き出す。スレッドセーフではない。
+    """
+
+    def __init__(
+        self,
+        target: str | os.PathLike[str] | TextIO,
+        *,
+        format: str = "jsonl",
+        compress: bool | None = None,
+        batch_size: int = 256,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            target: 書き出し先のパス、またはテキストストリーム (ストリームは閉じない)。
+            format: `"jsonl"` (1ハンド1行の JSON) または `"text"` (テキスト形式のハンド履歴)。
+            compress: gzip で圧縮するか。未指定時はパスが `.gz` で終わる場合に圧縮する
+                (ストリームを渡した場合は無視する)。
+            batch_size: まとめて書き出すハンド数。
+            clock: ハンド開始時刻に使う関数 (UNIX 時刻)。
+        """
+        if format not in FORMATS:
+            raise ValueError(f"未対応の形式です: {format}")
+        self._format = hand_record_to_json if format == "jsonl" else hand_record_to_text
+        self._separator = "\n" if format == "jsonl" else ""
+        if isinstance(target, (str, os.PathLike)):
+            path = os.fspath(target)
+            if compress is None:
+                compress = path.endswith(".gz")
+            self._file: TextIO = (
+                gzip.open(path, "at", encoding="utf-8") if compress
+                else open(path, "a", encoding="utf-8")
+            )
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+        self._batch_size = batch_size
+        self._recorder = HandRecorder(clock=clock)
+        self._pending: list[str] = []
+        self._closed = False
+
+    @property
+    def open_hands(self) -> int:
+        """進行中として保持しているハンド数 (テーブルごとに高々1)"""
+        return self._recorder.open_hands
+
+    def record(
+        self, table_id: str, result: ActionResult, *, setup: HandSetup | None = None
+    ) -> HandRecord | None:
+        """`ActionResult` を1件取り込む (引数・戻り値は `HandRecorder.record()` と同じ)"""
+        completed = self._recorder.record(table_id, result, setup=setup)
+        if completed is not None:
+            self._pending.append(self._format(completed) + self._separator)
+            if len(self._pending) >= self._batch_size:
+                self.flush()
+        return completed
+
+    def discard(self, table_id: str) -> None:
+        """テーブルの進行中のハンドを記録せずに捨てる (テーブルを削除したときなど)"""
+        self._recorder.discard(table_id)
+
+    def flush(self) -> None:
+        """書き出し待ちのハンドを書き出す"""
+        if self._pending:
+            self._file.write("".join(self._pending))
+            self._pending = []
+        self._file.flush()
+
+    def close(self) -> None:
+        """残りを書き出し、自分で開いたファイルを閉じる (進行中のハンドは書き出さない)"""
+        if self._closed:
+            return
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+        self._closed = True
+
+    def __enter__(self) -> "HandHistoryWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+# ── 読み込み ──
+
+def hand_record_from_json(line: str) -> HandRecord:
+    """`hand_record_to_json()` の1行を `HandRecord` に戻す。
+
+    Raises:
+        ValueError: JSON として読めない、または項目が欠けている・不正な場合。
+    """
+    try:
+        data = json.loads(line)
+        small_blind, big_blind, ante = data["blinds"]
+        rake_percent, rake_cap, rake_min_pot = data["rake_settings"]
+        return HandRecord(
+            table_id=data["table_id"],
+            hand_number=data["hand"],
+            started_at=data["started_at"],
+            seed=data["seed"],
+            dealer_id=data["dealer"],
+            level=data["level"],
+            small_blind=small_blind,
+            big_blind=big_blind,
+            ante=ante,
+            rake_percent=rake_percent,
+            rake_cap=rake_cap,
+            rake_min_pot=rake_min_pot,
+            stacks=tuple((player_id, stack) for player_id, stack in data["stacks"]),
+            actions=tuple(
+                shared_entry(player_id, GamePhase[phase], action, amount)
+                for player_id, phase, action, amount in data["actions"]
+            ),
+            board=tuple(Card.from_code(code) for code in data["board"]),
+            shown_cards=tuple(
+                (player_id, tuple(Card.from_code(code) for code in codes))
+                for player_id, codes in data["shown"].items()
+            ),
+            payouts=tuple(data["payouts"].items()),
+            pots=tuple(data["pots"]),
+            rake=data["rake"],
+        )
+    except (KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"ハンド履歴の行を読めません: {e!r}") from e
+
+
+def hand_record_from_text(lines: Sequence[str]) -> HandRecord:
+    """`hand_record_to_text()` の1ハンド分 (区切りの空行を除く行の列) を `HandRecord` に戻す。
+
+    Raises:
+        ValueError: 見出しや必須の行が欠けている・形式が不正な場合。
+    """
+    try:
+        return _parse_text(lines)
+    except (IndexError, KeyError) as e:
+        raise ValueError(f"ハンド履歴を読めません: {e!r}") from e
+
+
+def _parse_text(lines: Sequence[str]) -> HandRecord:
+    # 1行目: PokerDomain Hand #<table_id>-<n>: Hold'em No Limit (<sb>/<bb>) - <時刻> UTC
+    header = lines[0]
+    if not header.startswith(_TEXT_HEADER) or not header.endswith(" UTC"):
+        raise ValueError(f"ハンド履歴の見出しではありません: {header!r}")
+    hand_id, _, rest = header[len(_TEXT_HEADER):].partition(": Hold'em No Limit (")
+    table_id, _, hand_number = hand_id.rpartition("-")
+    blinds, _, started = rest[: -len(" UTC")].partition(") - ")
+    small_blind, _, big_blind = blinds.partition("/")
+    # 2行目: Table '<table_id>' N-max Seat #k is the button
+    dealer_seat = int(lines[1].rpartition(" Seat #")[2].partition(" ")[0])
+    # 3行目: Level L | Ante A | Seed S | Rake R cap C min pot M
+    level, ante, seed, rake = (field.split(" ", 1)[1] for field in lines[2].split(" | "))
+    rake_percent, _, rake_limits = rake.partition(" cap ")
+    rake_cap, _, rake_min_pot = rake_limits.partition(" min pot ")
+
+    stacks: list[tuple[str, int]] = []
+    actions: list[ActionLogEntry] = []
+    shown: list[tuple[str, tuple[Card, ...]]] = []
+    payouts: list[tuple[str, int]] = []
+    pots: tuple[int, ...] = ()
+    board: tuple[Card, ...] = ()
+    total = rake_amount = 0
+    phase: GamePhase | None = None  # HOLE CARDS より前は None
+    for line in lines[3:]:
+        if line.startswith("*** "):
+            # ストリートの見出し (SHOW DOWN・SUMMARY の後にアクションは現れない)
+            if line == "*** HOLE CARDS ***":
+                phase = GamePhase.PRE_FLOP
+            else:
+                phase = _STREETS_BY_HEADER.get(line.partition(" [")[0], phase)
+        elif line.endswith(" from pot") and " collected " in line:
+            player_id, _, amount = line[: -len(" from pot")].rpartition(" collected ")
+            payouts.append((player_id, int(amount)))
+        elif line.startswith("Total pot "):
+            summary, _, rake_text = line.rpartition(" | Rake ")
+            rake_amount = int(rake_text)
+            total_text, _, side_pots = summary[len("Total pot "):].partition(" Main pot ")
+            total = int(total_text)
+            if side_pots:
+                pots = tuple(
+                    int(part.rstrip(".").rpartition(" ")[2])
+                    for part in side_pots.split(". ")
+                )
+        elif line.startswith("Board ["):
+            board = tuple(Card.from_code(code) for code in line[len("Board ["):-1].split())
+        elif phase is None:
+            if line.startswith("Seat "):
+                seat_player, _, chips = line.rpartition(" (")
+                stacks.append((seat_player.partition(": ")[2], int(chips.partition(" ")[0])))
+        else:
+            player_id, _, text = line.rpartition(": ")
+            verb, _, amount = text.partition(" ")
+            match verb:
+                case "folds":
+                    actions.append(shared_entry(player_id, phase, "fold", None))
+                case "checks":
+                    actions.append(shared_entry(player_id, phase, "check", None))
+                case "calls":
+                    actions.append(shared_entry(player_id, phase, "call", None))
+                case "bets":
+                    actions.append(shared_entry(player_id, phase, "bet", int(amount)))
+                case "raises":
+                    actions.append(
+                        shared_entry(player_id, phase, "raise", int(amount.rpartition(" to ")[2]))
+                    )
+                case "shows":
+                    cards = tuple(Card.from_code(code) for code in amount.strip("[]").split())
+                    shown.append((player_id, cards))
+    if not pots and shown:
+        pots = (total - rake_amount,)  # サイドポットがなければメインポットだけ
+
+    return HandRecord(
+        table_id=table_id,
+        hand_number=int(hand_number),
+        started_at=float(calendar.timegm(time.strptime(started, _TIME_FORMAT))),
+        seed=_parse_optional(seed),
+        dealer_id=stacks[dealer_seat - 1][0],
+        level=int(level),
+        small_blind=int(small_blind),
+        big_blind=int(big_blind),
+        ante=int(ante),
+        rake_percent=float(rake_percent),
+        rake_cap=_parse_optional(rake_cap),
+        rake_min_pot=_parse_optional(rake_min_pot),
+        stacks=tuple(stacks),
+        actions=tuple(actions),
+        board=board,
+        shown_cards=tuple(shown),
+        payouts=tuple(payouts),
+        pots=pots,
+        rake=rake_amount,
+    )
+
+
+def _open_for_reading(path: str) -> TextIO:
+    """gzip かどうかを拡張子でなく先頭のマジックナンバーで判定して開く"""
+    with open(path, "rb") as f:
+        magic = f.read(2)
+    if magic == _GZIP_MAGIC:
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def read_hand_records(
+    source: str | os.PathLike[str] | Iterable[str], *, format: str | None = None
+) -> Iterator[HandRecord]:
+    """`HandHistoryWriter` が書き出したハンド履歴を先頭から1ハンドずつ読む。
+
+    ファイルを行単位で読み進めるジェネレータで、一度に持つのは1ハンド分の行だけ
+    (数 GB のファイルでもメモリ使用量は増えない)。gzip で圧縮したファイル (追記で
+    複数のメンバーになったものを含む) はそのまま読める。
+
+    Args:
+        source: 読み込むファイルのパス、またはテキストの行の反復可能オブジェクト
+            (開いたテキストストリームなど。閉じない)。
+        format: `"jsonl"` または `"text"`。未指定時は最初の空でない行から判定する。
+
+    Yields:
+        書き出された順の `HandRecord`。
+
+    Raises:
+        ValueError: 未対応の形式、または読めない行・ハンドがある場合。
+    """
+    if format is not None and format not in FORMATS:
+        raise ValueError(f"未対応の形式です: {format}")
+    if isinstance(source, (str, os.PathLike)):
+        with _open_for_reading(os.fspath(source)) as f:
+            yield from _read_lines(f, format)
+    else:
+        yield from _read_lines(source, format)
+
+
+def _read_lines(lines: Iterable[str], format: str | None) -> Iterator[HandRecord]:
+    block: list[str] = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if format is None:
+            if not line.strip():
+                continue
+            format = "jsonl" if line.startswith("{") else "text"
+        if format == "jsonl":
+            if line:
+                yield hand_record_from_json(line)
+        elif line:
+            block.append(line)
+        elif block:
+            yield hand_record_from_text(block)
+            block = []
+    if block:
+        yield hand_record_from_text(block)
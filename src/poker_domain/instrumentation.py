@@ -0,0 +1,435 @@
+import json
+import os
+import queue
+import random
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections.abc import Sequence
+from time import perf_counter_ns
+from typing import Any
+from urllib.parse import quote
+
+from poker_domain.game_state import ActionResult, GamePhase
+from poker_domain.interfaces import EvaluatorHook, TableHook
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Bet, Raise
+
+# 処理時間 (秒) のバケット上限。これを超えたものは +Inf のバケットに入る
+LATENCY_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 0.1, 1.0,
+)
+# 1ハンドあたりのイベント数のバケット上限
+EVENT_COUNT_BUCKETS = (5, 10, 15, 20, 30, 40, 60, 100)
+# `dump()` のバイト数のバケット上限
+SIZE_BUCKETS = (128, 256, 512, 1024, 2048, 4096, 8192, 16384, 65536)
+
+# 処理時間を計測する処理 (`PokerTable.add_hook()` / `HandEvaluator.add_hook()` の通知名)。
+# "<名前>_seconds" に記録する
+_TIMED_NAMES = ("start_game", "action", "showdown", "snapshot", "pots", "dump")
+_EVALUATOR_TIMED_NAMES = ("evaluate", "river_probabilities")
+
+
+class Histogram:
+    """固定バケットのヒストグラム (バケットごとの件数と合計値を持つ)"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        """
+        Args:
+            bounds: 昇順のバケット上限 (上限ちょうどの値はそのバケットに入る)。
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)   # 末尾は +Inf のバケット
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """`(上限, 上限以下の件数)` の列 (最後の上限は `inf`)"""
+        total = 0
+        rows = []
+        for bound, count in zip((*self.bounds, float("inf")), self.counts):
+            total += count
+            rows.append((bound, total))
+        return rows
+
+
+class Instrumentation(TableHook, EvaluatorHook):
+    """`PokerTable` と `HandEvaluator` の主要な処理の呼び出し回数・処理時間を集計する。
+
+    計測したいテーブルに `table.add_hook(instrumentation)` で登録して使う (1つの
+    `Instrumentation` を複数のテーブルに登録すれば合算する)。登録したテーブルでだけ計測し、
+    フックのないテーブルの処理は包まれないのでコストはかからない。外すには `table.remove_hook()`。
+    役の判定は `HandEvaluator.add_hook(instrumentation)` で登録するとプロセス全体で計測する
+    (テーブルを経由しない直接の呼び出しも含む)。
+
+    記録するもの:
+
+    - ヒストグラム `<名前>_seconds`: `start_game` / `action` / `showdown` / `snapshot`
+      (`GameState` の生成) / `pots` (サイドポットの参照。スナップショットとショーダウンのたびに
+      呼ばれる) / `dump` の処理時間。`HandEvaluator` に登録した場合は `evaluate` /
+      `river_probabilities` の処理時間
+    - ヒストグラム `events_per_hand`: 1ハンド (開始からショーダウンまで) で発生したイベント数
+    - ヒストグラム `snapshot_bytes`: `dump()` が返したバイト数
+    - カウンタ `<名前>_errors`: その処理が例外を送出した回数、`hands`: 終わったハンド数
+
+    集計はロックを取って行うので、別々のスレッドで操作するテーブルに登録してもよい。
+    """
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        # 処理の名前 → 処理時間のヒストグラム
+        self._timers = {name: self.histogram(f"{name}_seconds") for name in _TIMED_NAMES}
+        self._evaluator_timers = {
+            name: self.histogram(f"{name}_seconds") for name in _EVALUATOR_TIMED_NAMES
+        }
+        # ハンド進行中のテーブル → そのハンドでここまでに発生したイベント数
+        # (捨てられたテーブルの分は自動的に消える)
+        self._hand_events: weakref.WeakKeyDictionary[PokerTable, int] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    # ─── 記録 ───
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def histogram(self, name: str, bounds: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        """名前のヒストグラムを返す (なければ `bounds` で作る)"""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(bounds)
+        return histogram
+
+    def reset(self) -> None:
+        """集計をすべて捨てる (登録したテーブルはそのまま)"""
+        with self._lock:
+            for histogram in self.histograms.values():
+                histogram.counts = [0] * len(histogram.counts)
+                histogram.sum = 0.0
+                histogram.count = 0
+            self.counters.clear()
+            self._hand_events.clear()
+
+    def after_call(
+        self,
+        table: PokerTable,
+        name: str,
+        args: tuple[Any, ...],
+        result: Any,
+        error: BaseException | None,
+        start_ns: int,
+        end_ns: int,
+    ) -> None:
+        timer = self._timers.get(name)
+        if timer is None:
+            return
+        with self._lock:
+            timer.observe((end_ns - start_ns) / 1e9)
+            if error is not None:
+                self.increment(f"{name}_errors")
+            elif name == "dump":
+                self.histogram("snapshot_bytes", SIZE_BUCKETS).observe(len(result))
+            elif name in ("start_game", "action"):
+                self._count_events(table, result)
+
+    def after_evaluate(
+        self,
+        name: str,
+        error: BaseException | None,
+        start_ns: int,
+        end_ns: int,
+    ) -> None:
+        timer = self._evaluator_timers.get(name)
+        if timer is None:
+            return
+        with self._lock:
+            timer.observe((end_ns - start_ns) / 1e9)
+            if error is not None:
+                self.increment(f"{name}_errors")
+
+    def _count_events(self, table: PokerTable, result: ActionResult) -> None:
+        events = self._hand_events.get(table, 0) + len(result.events)
+        if result.state.phase == GamePhase.SHOWDOWN:
+            self._hand_events.pop(table, None)
+            self.histogram("events_per_hand", EVENT_COUNT_BUCKETS).observe(events)
+            self.increment("hands")
+        else:
+            self._hand_events[table] = events
+
+    # ─── 出力 ───
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON にそのまま書ける dict にする。
+
+        Returns:
+            `{"counters": {名前: 値}, "histograms": {名前: {"buckets": [[上限, 累計件数], ...],
+            "sum": 合計, "count": 件数}}}`。最後のバケットの上限は `"+Inf"`。
+        """
+        return {
+            "counters": dict(self.counters),
+            "histograms": {
+                name: {
+                    "buckets": [
+                        ["+Inf" if bound == float("inf") else bound, count]
+                        for bound, count in histogram.cumulative()
+                    ],
+                    "sum": histogram.sum,
+                    "count": histogram.count,
+                }
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "poker_") -> str:
+        """Prometheus のテキスト形式 (exposition format 0.0.4) にする。
+
+        カウンタは `<prefix><名前>_total`、ヒストグラムは `<prefix><名前>_bucket` / `_sum` /
+        `_count` として出力する。
+        """
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = f"{prefix}{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        for name, histogram in sorted(self.histograms.items()):
+            metric = f"{prefix}{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, count in histogram.cumulative():
+                lines.append(f'{metric}_bucket{{le="{_format_bound(bound)}"}} {count}')
+            lines.append(f"{metric}_sum {histogram.sum!r}")
+            lines.append(f"{metric}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    if bound == float("inf"):
+        return "+Inf"
+    return repr(float(bound))
+
+
+# トレースでハンドの操作として記録する処理 (中の処理はこれらのスパンの内側にだけ記録する)
+_HAND_OPERATIONS = ("start_game", "action")
+# 書き込みスレッドを止める合図
+_STOP = object()
+
+
+class _HandTrace:
+    """サンプリングされた1ハンド分のスパン"""
+
+    __slots__ = ("table_id", "seed", "origin", "depth", "events")
+
+    def __init__(self, table_id: str) -> None:
+        self.table_id = table_id
+        self.seed: int | None = None
+        self.origin = perf_counter_ns()
+        self.depth = 0   # 実行中の start_game / action の数 (0 ならその外の処理)
+        self.events: list[dict[str, Any]] = []
+
+    def add(self, name: str, start: int, end: int, args: dict[str, Any] | None = None) -> None:
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": "poker",
+            "ph": "X",
+            "ts": (start - self.origin) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": 1,
+            "tid": 1,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+
+class HandTracer(TableHook):
+    """サンプリングしたハンドの処理の内訳を Chrome / Perfetto のトレース形式 (JSON) で書き出す。
+
+    トレースしたいテーブルに `table.add_hook(tracer)` で登録して使う。`start_game()` のたびに
+    `sample_rate` の確率でそのハンドをトレースするか決め、トレースするハンドでは開始から
+    ショーダウンまでの `start_game` / `action` と、その中のアンティ・ブラインドの徴収、配札、
+    アクションの検証・適用・記録、フェーズの進行、ポットの参照、レーキ、役の判定などを
+    スパンとして記録する。ハンドが終わると `<directory>/<テーブルID>/<開始時刻 (ns)>.json` に
+    書き出す (chrome://tracing や https://ui.perfetto.dev でそのまま開ける)。
+
+    ファイルの書き出しはバックグラウンドのスレッドが行い、`action()` の中では待たない。
+    `flush()` で書き出し終わるまで待ち、`close()` (または `with` 文の終わり) で書き込み
+    スレッドを止める。トレース中のハンドはテーブルへの弱参照で持つため、ハンドの途中で
+    捨てたテーブルの分は残らない (`discard()` で明示的に捨てることもできる)。
+    1つのテーブルは1スレッドから操作することを前提とする。
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        sample_rate: float = 0.001,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Args:
+            directory: トレースを書き出すディレクトリ (なければ作る)。
+            sample_rate: ハンドをトレースする確率 (1.0 なら全ハンド)。
+            seed: サンプリングに使う乱数のシード。
+        """
+        self._directory = os.fspath(directory)
+        self._sample_rate = sample_rate
+        self._random = random.Random(seed)
+        # トレース中のハンド (テーブル → スパン)
+        self._traces: weakref.WeakKeyDictionary[PokerTable, _HandTrace] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._written = 0
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="HandTracer", daemon=True)
+        self._thread.start()
+
+    @property
+    def hands_traced(self) -> int:
+        """書き出し終えたハンド数"""
+        return self._written
+
+    def discard(self, table: PokerTable) -> None:
+        """テーブルのトレース中のハンドを書き出さずに捨てる"""
+        self._traces.pop(table, None)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """終わったハンドのトレースをすべて書き出すまで待つ。
+
+        Raises:
+            ValueError: `close()` 後に呼んだ場合。
+            OSError: 書き込みスレッドが書き出しに失敗していた場合。
+            TimeoutError: `timeout` 秒以内に書き出し終わらなかった場合。
+        """
+        if self._closed:
+            raise ValueError("トレーサーはクローズしています")
+        done = threading.Event()
+        self._queue.put(done)
+        if not done.wait(timeout):
+            raise TimeoutError("トレースを書き出し終わりませんでした")
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """残りを書き出し、書き込みスレッドを止める (以後に終わったハンドは書き出さない)"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._traces.clear()
+        self._raise_if_failed()
+
+    def __enter__(self) -> "HandTracer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    # ── フック (テーブルを操作するスレッド) ──
+
+    def before_call(self, table: PokerTable, name: str) -> None:
+        if name == "start_game":
+            if self._closed or self._random.random() >= self._sample_rate:
+                self._traces.pop(table, None)
+                return
+            trace = self._traces[table] = _HandTrace(table.table_id)
+        elif name == "action":
+            found = self._traces.get(table)
+            if found is None:
+                return
+            trace = found
+        else:
+            return
+        trace.depth += 1
+
+    def after_call(
+        self,
+        table: PokerTable,
+        name: str,
+        args: tuple[Any, ...],
+        result: Any,
+        error: BaseException | None,
+        start_ns: int,
+        end_ns: int,
+    ) -> None:
+        trace = self._traces.get(table)
+        if trace is None:
+            return
+        if name not in _HAND_OPERATIONS:
+            if trace.depth:
+                trace.add(name, start_ns, end_ns)
+            return
+
+        trace.depth -= 1
+        starts_hand = name == "start_game"
+        if error is not None:
+            trace.add(name, start_ns, end_ns, {"error": type(error).__name__})
+            if starts_hand:
+                self._traces.pop(table, None)
+            return
+        trace.add(name, start_ns, end_ns, self._span_args(table, args, starts_hand))
+        if starts_hand:
+            setup = table.last_hand_setup
+            trace.seed = setup.seed if setup is not None else None
+        if result.state.phase == GamePhase.SHOWDOWN:
+            self._traces.pop(table, None)
+            self._queue.put(trace)
+
+    @staticmethod
+    def _span_args(table: PokerTable, args: tuple[Any, ...], starts_hand: bool) -> dict[str, Any]:
+        if starts_hand:
+            return {"players": len(table.player_ids)}
+        player_id, action = args[0], args[1]
+        span_args = {"player_id": player_id, "action": type(action).__name__}
+        if isinstance(action, (Bet, Raise)):
+            span_args["amount"] = action.amount
+        return span_args
+
+    # ── 書き込みスレッド ──
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if isinstance(item, _HandTrace):
+                if self._error is None:
+                    try:
+                        self._write(item)
+                    except BaseException as e:  # 以後の flush() / close() で呼び出し元に伝える
+                        self._error = e
+                    else:
+                        self._written += 1
+            elif isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+    def _write(self, trace: _HandTrace) -> None:
+        directory = os.path.join(self._directory, quote(trace.table_id, safe=""))
+        os.makedirs(directory, exist_ok=True)
+        document = {
+            "traceEvents": [
+                {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": trace.table_id}},
+                *trace.events,
+            ],
+            "displayTimeUnit": "ns",
+            # リプレイでハンドを再現するための手がかり
+            "otherData": {"table_id": trace.table_id, "seed": trace.seed},
+        }
+        path = os.path.join(directory, f"{time.time_ns()}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False)
@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 from poker_domain.game_state import ActionResult, GameEvent, GameState, TableStatus
 from poker_domain.value_objects.action import Action
 from poker_domain.value_objects.chips import Chips
 
+if TYPE_CHECKING:
+    from poker_domain.table import PokerTable
+
 
 class PokerTableInterface(ABC):
     """`PokerTable` の公開インターフェース。
@@ -11,6 +16,8 @@ class PokerTableInterface(ABC):
     service レイヤーからの呼び出し窓口はこれだけ。
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def add_player(self, player_id: str, chips: Chips) -> GameEvent:
         """プレイヤーを追加する。
@@ -20,7 +27,7 @@ class PokerTableInterface(ABC):
             chips: 持ち込みチップ額。
 
         Returns:
-            `EventType.PLAYER_JOINED` の `GameEvent`。
+            `PlayerJoinedEvent`。
         """
         ...
 
@@ -32,7 +39,7 @@ class PokerTableInterface(ABC):
             player_id: 離席させるプレイヤーのID。
 
         Returns:
-            `EventType.PLAYER_LEFT` の `GameEvent`。
+            `PlayerLeftEvent`。
         """
         ...
 
@@ -70,12 +77,29 @@ class PokerTableInterface(ABC):
         """
         ...
 
+    def get_states_for_viewers(
+        self, viewer_ids: Iterable[str | None]
+    ) -> dict[str | None, GameState]:
+        """複数の閲覧者向けスナップショットをまとめて返す。
+
+        既定の実装は `get_state()` を閲覧者ごとに呼び出すだけなので、
+        実装クラス側で公開部分を共有する効率的な実装に差し替えてよい。
+
+        Args:
+            viewer_ids: 閲覧者のプレイヤーID (観戦者などホールカードを見せない場合は
+                着席していないIDや `None`)。
+
+        Returns:
+            閲覧者IDごとの `GameState`。
+        """
+        return {viewer_id: self.get_state(viewer_id) for viewer_id in viewer_ids}
+
     @abstractmethod
     def level_up(self) -> GameEvent:
         """ブラインド/アンティのレベルを1段階上昇させる (最終レベルの場合は据え置き)。
 
         Returns:
-            `EventType.LEVEL_UP` の `GameEvent`。
+            `LevelUpEvent`。
         """
         ...
 
@@ -87,3 +111,74 @@ class PokerTableInterface(ABC):
             `TableStatus`。
         """
         ...
+
+
+class TableHook(ABC):
+    """`PokerTable.add_hook()` で登録し、テーブルの主要な処理の呼び出しごとに通知を受ける。
+
+    計測・トレース用。登録したテーブルでだけ呼ばれるので、テーブルごとに別々のフックを
+    付けられる。通知を受ける処理の名前は `PokerTable.add_hook()` を参照。
+    """
+
+    __slots__ = ()
+
+    def before_call(self, table: "PokerTable", name: str) -> None:
+        """処理を始める直前に呼ばれる (既定では何もしない)。
+
+        Args:
+            table: 処理を行うテーブル。
+            name: 処理の名前。
+        """
+
+    @abstractmethod
+    def after_call(
+        self,
+        table: "PokerTable",
+        name: str,
+        args: tuple[Any, ...],
+        result: Any,
+        error: BaseException | None,
+        start_ns: int,
+        end_ns: int,
+    ) -> None:
+        """処理が終わった (または例外を送出した) 直後に呼ばれる。
+
+        Args:
+            table: 処理を行ったテーブル。
+            name: 処理の名前。
+            args: 処理に渡した位置引数。
+            result: 処理の戻り値 (例外を送出した場合は `None`)。
+            error: 送出した例外 (正常に終わった場合は `None`)。
+            start_ns: 処理の開始時刻 (`time.perf_counter_ns()`)。
+            end_ns: 処理の終了時刻 (`time.perf_counter_ns()`)。
+        """
+        ...
+
+
+class EvaluatorHook(ABC):
+    """`HandEvaluator.add_hook()` で登録し、役の判定の呼び出しごとに通知を受ける。
+
+    計測用。`HandEvaluator` の処理は静的メソッドなので、登録するとプロセス全体
+    (テーブル経由の呼び出しも、直接の呼び出しも) の `evaluate` / `river_probabilities` が
+    通知の対象になる。
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def after_evaluate(
+        self,
+        name: str,
+        error: BaseException | None,
+        start_ns: int,
+        end_ns: int,
+    ) -> None:
+        """処理が終わった (または例外を送出した) 直後に呼ばれる。
+
+        Args:
+            name: 処理の名前 (`"evaluate"` / `"river_probabilities"`)。
+            error: 送出した例外 (正常に終わった場合は `None`)。
+            start_ns: 処理の開始時刻 (`time.perf_counter_ns()`)。
+            end_ns: 処理の終了時刻 (`time.perf_counter_ns()`)。
+        """
+        ...
@@ -0,0 +1,532 @@
+import json
+import os
+import random
+import struct
+import threading
+import zlib
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from typing import Any
+
+from poker_domain.action_log import ACTION_CODES, ACTION_NAMES, PHASE_CODES, PHASES, shared_entry
+from poker_domain.binary import BinaryReader, BinaryWriter
+from poker_domain.exceptions import NotEnoughPlayersError, PokerError, ReplayError
+from poker_domain.game_state import ActionResult, GameEvent
+from poker_domain.manager import TableManager
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Action
+from poker_domain.value_objects.chips import Chips
+
+# 1レコードの先頭: 連番以降の長さ, CRC32 (連番以降) / 続けて連番 (1 始まり)
+_FRAME = struct.Struct("<II")
+_SEQ = struct.Struct("<Q")
+
+# チェックポイントのバイナリ形式の識別子とバージョン (形式を変えたらバージョンを上げる)
+_CHECKPOINT_MAGIC = b"PKJC"
+_CHECKPOINT_VERSION = 1
+_CHECKPOINT = "checkpoint.bin"
+_SEGMENT_PREFIX = "journal-"
+_SEGMENT_SUFFIX = ".log"
+
+# レコードの種類 (本体の先頭の整数)
+_CREATE_TABLE = 1
+_REMOVE_TABLE = 2
+_ADD_PLAYER = 3
+_REMOVE_PLAYER = 4
+_START_GAME = 5
+_START_FAILED = 6
+_ACTION = 7
+_LEVEL_UP = 8
+
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+@lru_cache(maxsize=65536)
+def _text(value: str) -> bytes:
+    """長さ付き UTF-8 (`BinaryWriter.string()` と同じ形式)。テーブルID・プレイヤーID用に使い回す"""
+    w = BinaryWriter()
+    w.string(value)
+    return w.getvalue()
+
+
+def _uint(value: int) -> bytes:
+    """可変長の非負整数 (`BinaryWriter.uint()` と同じ形式)"""
+    if value < 0x80:
+        return bytes((value,))
+    w = BinaryWriter()
+    w.uint(value)
+    return w.getvalue()
+
+
+def _sint(value: int) -> bytes:
+    """可変長の符号付き整数 (`BinaryWriter.sint()` と同じ形式)。シード用"""
+    w = BinaryWriter()
+    w.sint(value)
+    return w.getvalue()
+
+
+def _segment_name(first_seq: int) -> str:
+    return f"{_SEGMENT_PREFIX}{first_seq:020d}{_SEGMENT_SUFFIX}"
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _fsync_directory(directory: str) -> None:
+    """ファイルの作成・置き換え・削除を確定させる (ディレクトリを開けない OS では何もしない)"""
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _read_frames(data: bytes) -> Iterator[tuple[int, int, bytes]]:
+    """セグメントの中身から、壊れていないレコードを先頭から順に `(終端位置, 連番, 本体)` で返す。
+
+    長さが足りない・CRC が合わないレコードに当たったところで止まる (そこから先は読まない)。
+    """
+    view = memoryview(data)
+    pos = 0
+    while pos + _FRAME.size <= len(view):
+        length, crc = _FRAME.unpack_from(view, pos)
+        start = pos + _FRAME.size
+        end = start + length
+        if length < _SEQ.size or end > len(view) or zlib.crc32(view[start:end]) != crc:
+            return
+        yield end, _SEQ.unpack_from(view, start)[0], bytes(view[start + _SEQ.size:end])
+        pos = end
+
+
+def _load_snapshot(data: bytes) -> tuple[int, dict[str, PokerTable], set[str]]:
+    """`snapshot()` の形式から、最後に適用したレコードの連番・テーブル・シード付きのテーブルIDを
+    読み込む"""
+    r = BinaryReader(data)
+    if r.raw(len(_CHECKPOINT_MAGIC)) != _CHECKPOINT_MAGIC:
+        raise ValueError("ジャーナルのチェックポイント形式ではありません")
+    version = r.uint()
+    if version != _CHECKPOINT_VERSION:
+        raise ValueError(f"未対応のチェックポイント形式バージョンです: {version}")
+    seq = r.uint()
+    tables: dict[str, PokerTable] = {}
+    seeded: set[str] = set()
+    for _ in range(r.uint()):
+        table = PokerTable.load(r.raw(r.uint()))
+        tables[table.table_id] = table
+        if r.uint():
+            seeded.add(table.table_id)
+    return seq, tables, seeded
+
+
+class JournaledTableManager(TableManager):
+    """受け付けた操作を追記専用のジャーナルに書きながらテーブルを管理する `TableManager`。
+
+    `create_table` / `remove_table` / `add_player` / `remove_player` / `start_game` / `action` /
+    `level_up` が成功するたびに、その操作を1レコードとしてジャーナルに追記する。レコードは
+    長さ・CRC32・連番を先頭に付けたバイナリで、追記は `os.write()` 1回 (プロセスが落ちても
+    失われない)。`fdatasync` はバックグラウンドのスレッドが `sync_interval` 秒ごとにまとめて
+    行うため、OS ごと落ちた場合に失われうるのは直近 `sync_interval` 秒分だけになる。
+
+    `checkpoint()` は全テーブルの `dump()` を1ファイルに書き出し、それより前のジャーナルを
+    消す。同じディレクトリで作り直すと、最後のチェックポイントを読み込んでから以降の
+    ジャーナルを再生し、落ちる直前のテーブルを復元する (末尾の書きかけのレコードは捨てる)。
+
+    シードを指定せずに作ったテーブルのハンドは、マネージャーがシードを決めて記録する。
+    `get_table()` で取り出したテーブルを直接操作した分はジャーナルに残らない。
+    チェックポイントから復元したテーブルは `PokerTable.load()` で作る。
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        table_factory: Callable[..., PokerTable] = PokerTable,
+        *,
+        sync_interval: float = 0.005,
+    ) -> None:
+        """
+        Args:
+            directory: ジャーナルとチェックポイントを置くディレクトリ (なければ作る)。
+                既にあればその内容からテーブルを復元する。
+            table_factory: `create_table()` がテーブルを作るのに使う呼び出し可能オブジェクト。
+            sync_interval: `fdatasync` をまとめて行う間隔 (秒)。0 なら追記のたびに行う。
+
+        Raises:
+            ValueError: チェックポイントやジャーナルの途中 (末尾以外) が壊れている場合。
+            ReplayError: ジャーナルの操作を記録どおりに再生できない場合。
+        """
+        super().__init__(table_factory)
+        self._directory = os.fspath(directory)
+        self._sync_interval = sync_interval
+        # シードを指定して作ったテーブル (ハンドのシードはテーブル自身の乱数列で決まる)
+        self._seeded: set[str] = set()
+        self._seeds = random.Random()
+        self._seq = 0
+        self._synced_seq = 0
+        self._error: BaseException | None = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._closed = False
+        self._listeners: list[Callable[[int, bytes], None]] = []
+
+        os.makedirs(self._directory, exist_ok=True)
+        self._fd = self._recover()
+        self._thread: threading.Thread | None = None
+        if sync_interval > 0:
+            self._thread = threading.Thread(target=self._run, name="JournalSync", daemon=True)
+            self._thread.start()
+
+    # ── 復元 ──
+
+    def _segments(self) -> list[str]:
+        return sorted(
+            name for name in os.listdir(self._directory)
+            if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX)
+        )
+
+    def _recover(self) -> int:
+        """チェックポイントとジャーナルからテーブルを復元し、追記先のファイルを開く"""
+        path = os.path.join(self._directory, _CHECKPOINT)
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                self._seq, self._tables, self._seeded = _load_snapshot(f.read())
+
+        segments = self._segments()
+        for i, name in enumerate(segments):
+            segment = os.path.join(self._directory, name)
+            with open(segment, "rb") as f:
+                data = f.read()
+            end = 0
+            for end, seq, body in _read_frames(data):
+                if seq <= self._seq:
+                    continue  # チェックポイントに含まれている
+                if seq != self._seq + 1:
+                    raise ValueError(f"ジャーナルの連番が飛んでいます: {self._seq} の次が {seq}")
+                self._replay(seq, body)
+                self._seq = seq
+            if end < len(data):
+                if i < len(segments) - 1:
+                    raise ValueError(f"ジャーナル {name} の途中が壊れています")
+                # 末尾は書き込み途中で落ちたレコード: 捨てて続きから追記する
+                with open(segment, "r+b") as f:
+                    f.truncate(end)
+                    os.fsync(f.fileno())
+        self._synced_seq = self._seq
+
+        for table_id, table in self._tables.items():
+            self._index(table_id, table)
+        name = segments[-1] if segments else _segment_name(self._seq + 1)
+        fd = os.open(
+            os.path.join(self._directory, name), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+        _fsync_directory(self._directory)
+        return fd
+
+    def _replay(self, seq: int, body: bytes) -> str:
+        """ジャーナルの1レコードをテーブルに適用する (イベント・索引は作らない)。
+
+        Returns:
+            レコードの対象のテーブルID。
+        """
+        r = BinaryReader(body)
+        kind = r.uint()
+        table_id = r.string()
+        try:
+            if kind == _CREATE_TABLE:
+                options = json.loads(r.string())
+                self._tables[table_id] = self._table_factory(table_id=table_id, **options)
+                if options.get("seed") is not None:
+                    self._seeded.add(table_id)
+                return table_id
+            table = self._tables[table_id]
+            if kind == _REMOVE_TABLE:
+                del self._tables[table_id]
+                self._seeded.discard(table_id)
+            elif kind == _ADD_PLAYER:
+                table.add_player(r.string(), Chips(r.uint()))
+            elif kind == _REMOVE_PLAYER:
+                table.remove_player(r.string())
+            elif kind == _START_GAME:
+                seed = r.sint()
+                if r.uint() and table_id in self._seeded:
+                    # テーブルの乱数列も記録時と同じだけ進める
+                    table.start_game()
+                    setup = table.last_hand_setup
+                    if setup is None or setup.seed != seed:
+                        raise ReplayError("ハンドのシードが記録と一致しません")
+                else:
+                    table.start_game(seed=seed)
+            elif kind == _START_FAILED:
+                try:
+                    table.start_game(seed=0)
+                except NotEnoughPlayersError:
+                    pass
+                else:
+                    raise ReplayError("記録では失敗したハンドの開始が成功しました")
+            elif kind == _ACTION:
+                player_id = r.string()
+                code = r.uint()
+                amount = r.optional_uint()
+                entry = shared_entry(player_id, PHASES[code >> 4], ACTION_NAMES[code & 0xF], amount)
+                table.fast_forward((entry,))
+            elif kind == _LEVEL_UP:
+                table.level_up()
+            else:
+                raise ValueError(f"未知のジャーナルレコードです: {kind}")
+        except (PokerError, KeyError) as e:
+            raise ReplayError(f"ジャーナルの {seq} 件目 ({table_id}) を再生できません: {e}") from e
+        return table_id
+
+    # ── 追記 ──
+
+    @property
+    def last_seq(self) -> int:
+        """最後に追記したレコードの連番 (まだなければ 0)"""
+        return self._seq
+
+    @property
+    def synced_seq(self) -> int:
+        """ディスクへの書き込みを確定させ終えたレコードの連番"""
+        return self._synced_seq
+
+    def _append(self, kind: int, table_id: str, body: bytes = b"") -> None:
+        """レコードを1件追記する (本体は種類・テーブルID・`body` の順)"""
+        if self._error is not None:
+            raise self._error
+        seq = self._seq + 1
+        payload = _SEQ.pack(seq) + _uint(kind) + _text(table_id) + body
+        frame = _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+        _write_all(self._fd, frame)
+        self._seq = seq
+        if self._sync_interval <= 0:
+            self.sync()
+        for listener in self._listeners:
+            listener(seq, frame)
+
+    def sync(self) -> None:
+        """追記済みのレコードをディスクに書き込み終えるまで待つ"""
+        with self._lock:
+            seq = self._seq
+            if seq != self._synced_seq:
+                _fdatasync(self._fd)
+                self._synced_seq = seq
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._sync_interval):
+            try:
+                self.sync()
+            except BaseException as e:  # 以後の追記で呼び出し元に伝える
+                self._error = e
+                return
+
+    # ─── ジャーナルに残す操作 ───
+
+    def create_table(self, table_id: str, **options: Any) -> PokerTable:
+        """テーブルを作成して登録する (`options` は JSON で表せる値に限る)"""
+        w = BinaryWriter()
+        w.string(json.dumps(options))
+        table = super().create_table(table_id, **options)
+        self._append(_CREATE_TABLE, table_id, w.getvalue())
+        if options.get("seed") is not None:
+            self._seeded.add(table_id)
+        return table
+
+    def remove_table(self, table_id: str) -> None:
+        super().remove_table(table_id)
+        self._seeded.discard(table_id)
+        self._append(_REMOVE_TABLE, table_id)
+
+    def add_player(self, table_id: str, player_id: str, chips: Chips) -> GameEvent:
+        event = super().add_player(table_id, player_id, chips)
+        self._append(_ADD_PLAYER, table_id, _text(player_id) + _uint(chips.amount))
+        return event
+
+    def remove_player(self, table_id: str, player_id: str) -> GameEvent:
+        event = super().remove_player(table_id, player_id)
+        self._append(_REMOVE_PLAYER, table_id, _text(player_id))
+        return event
+
+    def start_game(self, table_id: str, *, seed: int | None = None) -> ActionResult:
+        table = self.get_table(table_id)
+        # シードをテーブル自身の乱数列で決めたか (再生でも乱数列を同じだけ進める)
+        drawn_by_table = seed is None and table_id in self._seeded
+        if seed is None and not drawn_by_table:
+            seed = self._seeds.getrandbits(64)
+        try:
+            result = super().start_game(table_id, seed=seed)
+        except NotEnoughPlayersError:
+            # 失敗しても前ハンドの後片付けは済んでいることがあるため、再生でも同じ失敗を起こす
+            self._append(_START_FAILED, table_id)
+            raise
+        setup = table.last_hand_setup
+        assert setup is not None and setup.seed is not None
+        self._append(_START_GAME, table_id, _sint(setup.seed) + _uint(drawn_by_table))
+        return result
+
+    def action(self, table_id: str, player_id: str, action: Action) -> ActionResult:
+        result = super().action(table_id, player_id, action)
+        entry = result.state.action_log[-1]
+        code = PHASE_CODES[entry.phase] << 4 | ACTION_CODES[entry.action]
+        amount = 0 if entry.amount is None else entry.amount + 1  # optional_uint と同じ形式
+        self._append(_ACTION, table_id, _text(player_id) + _uint(code) + _uint(amount))
+        return result
+
+    def level_up(self, table_id: str) -> GameEvent:
+        event = super().level_up(table_id)
+        self._append(_LEVEL_UP, table_id)
+        return event
+
+    # ─── チェックポイント ───
+
+    def checkpoint(self) -> None:
+        """全テーブルの状態をチェックポイントに書き出し、それより前のジャーナルを消す。
+
+        新しいジャーナルファイルに切り替えてからチェックポイントを置き換えるため、途中で
+        落ちても直前のチェックポイントとジャーナルから復元できる。書き出しの間は操作を
+        受け付けない (呼び出し元のスレッドで全テーブルを `dump()` する)。
+        """
+        if self._error is not None:
+            raise self._error
+        self._install_checkpoint(self.snapshot)
+
+    def snapshot(self) -> bytes:
+        """全テーブルの `dump()` と最後に追記したレコードの連番 (チェックポイントと同じ形式)"""
+        w = BinaryWriter()
+        w.raw(_CHECKPOINT_MAGIC)
+        w.uint(_CHECKPOINT_VERSION)
+        w.uint(self._seq)
+        w.uint(len(self._tables))
+        for table_id, table in self._tables.items():
+            data = table.dump()
+            w.uint(len(data))
+            w.raw(data)
+            w.uint(table_id in self._seeded)
+        return w.getvalue()
+
+    def _install_checkpoint(self, snapshot: Callable[[], bytes]) -> None:
+        """新しいジャーナルファイルに切り替えてから `snapshot()` をチェックポイントとして書き出す"""
+        with self._lock:
+            _fdatasync(self._fd)
+            os.close(self._fd)
+            self._synced_seq = self._seq
+            current = _segment_name(self._seq + 1)
+            # この連番以降のレコードはまだないため、同名のファイルがあっても空にしてよい
+            self._fd = os.open(
+                os.path.join(self._directory, current),
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_TRUNC, 0o644,
+            )
+        # restore() で連番を戻した場合、より新しい連番のファイルは新しい状態と矛盾するので先に消す
+        for name in self._segments():
+            if name > current:
+                os.remove(os.path.join(self._directory, name))
+        path = os.path.join(self._directory, _CHECKPOINT)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(snapshot())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        for name in self._segments():
+            if name < current:
+                os.remove(os.path.join(self._directory, name))
+        _fsync_directory(self._directory)
+
+    # ─── レプリケーション ───
+
+    def add_listener(self, listener: Callable[[int, bytes], None]) -> None:
+        """追記したレコードを `(連番, レコードのバイト列)` で受け取る関数を登録する。
+
+        追記のたびに、操作を呼び出したスレッドでそのまま呼ばれる (レプリケーション用)。
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[int, bytes], None]) -> None:
+        self._listeners.remove(listener)
+
+    def apply_records(self, data: bytes) -> int:
+        """別のマネージャーが追記したレコード列を適用し、このジャーナルにも同じ連番で追記する。
+
+        既に適用済みの連番のレコードは読み飛ばす。登録済みのリスナーにも渡す。
+
+        Args:
+            data: リスナーが受け取ったレコードのバイト列を連結したもの。
+
+        Returns:
+            適用したレコード数。
+
+        Raises:
+            ValueError: レコードが壊れている、または連番が連続していない場合
+                (それより前のレコードは適用済み)。
+            ReplayError: レコードの操作を記録どおりに再生できない場合。
+        """
+        if self._error is not None:
+            raise self._error
+        applied = 0
+        start = end = 0
+        try:
+            for frame_end, seq, body in _read_frames(data):
+                if seq <= self._seq and not applied:
+                    start = end = frame_end
+                    continue
+                if seq != self._seq + 1:
+                    raise ValueError(f"レコードの連番が連続していません: {self._seq} の次が {seq}")
+                table_id = self._replay(seq, body)
+                table = self._tables.get(table_id)
+                if table is None:
+                    self._unindex(table_id)
+                elif table_id in self._entries:
+                    self._reindex(table_id, table)
+                else:
+                    self._index(table_id, table)
+                frame = data[end:frame_end]
+                self._seq = seq
+                applied += 1
+                end = frame_end
+                for listener in self._listeners:
+                    listener(seq, frame)
+            if end < len(data):
+                raise ValueError("レコードが途中で切れているか壊れています")
+        finally:
+            _write_all(self._fd, data[start:end])
+            if self._sync_interval <= 0:
+                self.sync()
+        return applied
+
+    def restore(self, snapshot: bytes) -> None:
+        """全テーブルを `snapshot()` の内容に置き換え、チェックポイントとして書き出す。
+
+        Raises:
+            ValueError: 形式・バージョンが不正な場合。
+        """
+        seq, tables, seeded = _load_snapshot(snapshot)
+        for table_id in list(self._entries):
+            self._unindex(table_id)
+        self._tables = tables
+        self._seeded = seeded
+        for table_id, table in tables.items():
+            self._index(table_id, table)
+        self._seq = seq
+        self._install_checkpoint(lambda: snapshot)
+
+    def close(self) -> None:
+        """ジャーナルをディスクに書き込み終えてファイルを閉じる"""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.sync()
+        os.close(self._fd)
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self) -> "JournaledTableManager":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,173 @@
+import heapq
+import time
+from collections.abc import Callable, Iterable, Sequence
+
+from poker_domain.exceptions import TableNotFoundError
+from poker_domain.game_state import GameEvent
+from poker_domain.interfaces import PokerTableInterface
+
+
+class _Event:
+    """1つのトーナメント (同じレベル進行を共有するテーブル群) の時計の状態"""
+
+    __slots__ = ("durations", "tables", "level", "deadline", "remaining", "generation")
+
+    def __init__(self, durations: tuple[float, ...]) -> None:
+        self.durations = durations
+        self.tables: dict[str, PokerTableInterface] = {}
+        self.level = 0
+        self.deadline: float | None = None  # 次にレベルが上がる時刻 (一時停止中・最終レベルは None)
+        self.remaining: float | None = None  # 一時停止中の、次のレベルまでの残り秒数
+        self.generation = 0  # 有効な予約の追加順 (0 は有効な予約なし)
+
+
+class LevelClock:
+    """トーナメントのブラインドレベルを時刻に従って上げる時計。
+
+    トーナメント (`event_id`) ごとに各レベルの長さ (`durations`) を持ち、期限を迎えると
+    そのトーナメントの全テーブルの `level_up()` を同じ `advance()` の中でまとめて呼ぶ。
+    期限はトーナメントごとに1件だけ次の期限をキーにしたヒープに積むため、テーブル数が
+    数千あってもテーブルごとのタイマーは持たない。
+
+    `level_up()` の既存の意味のとおり、上がったレベルは各テーブルの次の `start_game()` から
+    適用される。時刻は `clock` (既定は `time.monotonic`) から取る。スレッドセーフではない。
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._events: dict[str, _Event] = {}
+        # (期限, 追加順, event_id)。追加順がトーナメントの有効な予約と異なるもの
+        # (一時停止・停止で無効になった予約) は取り出した時点で読み捨てる
+        self._heap: list[tuple[float, int, str]] = []
+        self._sequence = 0
+
+    # ─── トーナメント ───
+
+    def start(
+        self,
+        event_id: str,
+        durations: Sequence[float],
+        tables: Iterable[tuple[str, PokerTableInterface]] = (),
+    ) -> None:
+        """トーナメントの時計を開始する (現在をレベル0の開始時刻とする)。
+
+        Args:
+            event_id: トーナメントの識別子。
+            durations: 各レベルの長さ (秒)。`durations[i]` 経過でレベル i から i+1 に上がり、
+                使い切ったらそれ以上は上げない。
+            tables: 最初から参加する `(table_id, テーブル)` の列。
+
+        Raises:
+            ValueError: 同じ `event_id` の時計が既にある場合、または長さが正でない場合。
+        """
+        if event_id in self._events:
+            raise ValueError(f"トーナメント {event_id} の時計は既に開始しています")
+        if any(duration <= 0 for duration in durations):
+            raise ValueError("レベルの長さは正の値が必要です")
+        event = _Event(tuple(durations))
+        self._events[event_id] = event
+        for table_id, table in tables:
+            event.tables[table_id] = table
+        if event.durations:
+            self._schedule(event_id, event, self._clock() + event.durations[0])
+
+    def stop(self, event_id: str) -> None:
+        """トーナメントの時計を破棄する"""
+        self._event(event_id)
+        del self._events[event_id]
+
+    def pause(self, event_id: str) -> None:
+        """時計を止める (次のレベルまでの残り時間を保持する)。一時停止中なら何もしない"""
+        event = self._event(event_id)
+        if event.deadline is None:
+            return
+        event.remaining = max(event.deadline - self._clock(), 0.0)
+        event.deadline = None
+        event.generation = 0
+
+    def resume(self, event_id: str) -> None:
+        """止めた時計を、残っていた時間から再開する。動いていれば何もしない"""
+        event = self._event(event_id)
+        if event.remaining is None:
+            return
+        remaining, event.remaining = event.remaining, None
+        self._schedule(event_id, event, self._clock() + remaining)
+
+    def is_paused(self, event_id: str) -> bool:
+        return self._event(event_id).remaining is not None
+
+    def level(self, event_id: str) -> int:
+        """トーナメントの現在のレベル (0始まり)"""
+        return self._event(event_id).level
+
+    def seconds_to_next_level(self, event_id: str) -> float | None:
+        """次のレベルまでの残り秒数 (最終レベルに達していれば `None`)"""
+        event = self._event(event_id)
+        if event.remaining is not None:
+            return event.remaining
+        if event.deadline is None:
+            return None
+        return max(event.deadline - self._clock(), 0.0)
+
+    # ─── テーブル ───
+
+    def add_table(self, event_id: str, table_id: str, table: PokerTableInterface) -> None:
+        """途中から加わるテーブルを登録し、現在のレベルまで `level_up()` で追いつかせる"""
+        event = self._event(event_id)
+        for _ in range(event.level):
+            table.level_up()
+        event.tables[table_id] = table
+
+    def remove_table(self, event_id: str, table_id: str) -> None:
+        """
+        Raises:
+            TableNotFoundError: トーナメントにそのテーブルがない場合。
+        """
+        if self._event(event_id).tables.pop(table_id, None) is None:
+            raise TableNotFoundError(f"テーブル {table_id} は {event_id} に登録されていません")
+
+    # ─── 時計を進める ───
+
+    def advance(self, now: float | None = None) -> list[tuple[str, str, GameEvent]]:
+        """期限を迎えたトーナメントの全テーブルのレベルを上げる (定期的に呼ぶ)。
+
+        期限から次のレベルの長さを足して次の期限とするため、呼び出しが遅れても時計はずれない
+        (遅れが1レベル以上なら、その分まとめて上げる)。
+
+        Args:
+            now: 現在時刻 (未指定時は `clock()`)。
+
+        Returns:
+            `(event_id, table_id, LEVEL_UP イベント)` の列 (期限順)。
+        """
+        now = self._clock() if now is None else now
+        fired: list[tuple[str, str, GameEvent]] = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, sequence, event_id = heapq.heappop(heap)
+            event = self._events.get(event_id)
+            if event is None or event.generation != sequence:
+                continue  # 停止・一時停止で無効になった予約
+            event.level += 1
+            event.deadline = None
+            for table_id, table in event.tables.items():
+                fired.append((event_id, table_id, table.level_up()))
+            if event.level < len(event.durations):
+                self._schedule(event_id, event, deadline + event.durations[event.level])
+        return fired
+
+    def __len__(self) -> int:
+        """動いている (一時停止中を含む) トーナメントの数"""
+        return len(self._events)
+
+    def _event(self, event_id: str) -> _Event:
+        event = self._events.get(event_id)
+        if event is None:
+            raise ValueError(f"トーナメント {event_id} の時計はありません")
+        return event
+
+    def _schedule(self, event_id: str, event: _Event, deadline: float) -> None:
+        self._sequence += 1
+        event.generation = self._sequence
+        event.deadline = deadline
+        heapq.heappush(self._heap, (deadline, self._sequence, event_id))
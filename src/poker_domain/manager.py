@@ -0,0 +1,225 @@
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from poker_domain.exceptions import DuplicateTableError, PokerError, TableNotFoundError
+from poker_domain.game_state import ActionResult, GameEvent, TableStatus
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Action
+from poker_domain.value_objects.chips import Chips
+
+
+class _IndexEntry:
+    """テーブル1つ分の、索引に登録済みの値 (差分更新で古い登録を外すために持つ)"""
+
+    __slots__ = ("status", "player_ids", "open_seats")
+
+    def __init__(self, status: TableStatus, player_ids: tuple[str, ...], open_seats: int) -> None:
+        self.status = status
+        self.player_ids = player_ids
+        self.open_seats = open_seats
+
+
+class TableManager:
+    """1プロセス内の多数の `PokerTable` の作成・検索・操作の振り分けを担う。
+
+    テーブルを `table_id` で引けるほか、`TableStatus` 別・着席プレイヤー別・空席数別の
+    副索引を持ち、ロビー向けの検索は全テーブルを走査せず結果の件数に比例する時間で返す。
+    索引はマネージャー経由の操作 (`add_player` / `action` など) のたびに差分更新するため、
+    `get_table()` で取り出したテーブルを直接操作した場合は `refresh()` を呼ぶこと。
+
+    操作で発生した `GameEvent` は `(table_id, event)` の組として溜め、`drain_events()` で
+    まとめて取り出す。
+    """
+
+    def __init__(self, table_factory: Callable[..., PokerTable] = PokerTable) -> None:
+        """
+        Args:
+            table_factory: `create_table()` がテーブルを作るのに使う呼び出し可能オブジェクト
+                (`PokerTable` と同じ引数を受け取る)。
+        """
+        self._table_factory = table_factory
+        self._tables: dict[str, PokerTable] = {}
+        self._entries: dict[str, _IndexEntry] = {}
+        self._by_status: dict[TableStatus, set[str]] = {status: set() for status in TableStatus}
+        self._by_player: dict[str, set[str]] = {}
+        # 空席数 → テーブルID (クローズ済みのテーブルは登録しない)
+        self._by_open_seats: dict[int, set[str]] = {}
+        self._events: list[tuple[str, GameEvent]] = []
+
+    # ─── テーブルの作成・検索 ───
+
+    def create_table(self, table_id: str, **options: Any) -> PokerTable:
+        """テーブルを作成して登録する。
+
+        Args:
+            table_id: テーブルID。
+            **options: `PokerTable` のその他のコンストラクタ引数。
+
+        Returns:
+            作成した `PokerTable`。
+
+        Raises:
+            DuplicateTableError: 同じ `table_id` のテーブルが既にある場合。
+        """
+        if table_id in self._tables:
+            raise DuplicateTableError(f"テーブル {table_id} は既に存在します")
+        table = self._table_factory(table_id=table_id, **options)
+        self._tables[table_id] = table
+        self._index(table_id, table)
+        return table
+
+    def get_table(self, table_id: str) -> PokerTable:
+        """
+        Raises:
+            TableNotFoundError: `table_id` のテーブルがない場合。
+        """
+        table = self._tables.get(table_id)
+        if table is None:
+            raise TableNotFoundError(f"テーブル {table_id} は存在しません")
+        return table
+
+    def remove_table(self, table_id: str) -> None:
+        """テーブルを登録解除し、索引からも外す"""
+        self.get_table(table_id)
+        self._unindex(table_id)
+        del self._tables[table_id]
+
+    def refresh(self, table_id: str) -> None:
+        """マネージャーを介さずに操作したテーブルの索引を更新する"""
+        self._reindex(table_id, self.get_table(table_id))
+
+    def __contains__(self, table_id: object) -> bool:
+        return table_id in self._tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    # ─── ロビー向けの検索 (いずれも結果の件数に比例する時間) ───
+
+    def tables_by_status(self, status: TableStatus) -> list[str]:
+        """指定したライフサイクル状態のテーブルID"""
+        return list(self._by_status[status])
+
+    def tables_of_player(self, player_id: str) -> list[str]:
+        """プレイヤーが着席しているテーブルID"""
+        return list(self._by_player.get(player_id, ()))
+
+    def tables_with_open_seats(self, min_open_seats: int = 1) -> list[str]:
+        """空席が `min_open_seats` 以上あるクローズしていないテーブルID"""
+        return [
+            table_id
+            for open_seats, table_ids in self._by_open_seats.items()
+            if open_seats >= min_open_seats
+            for table_id in table_ids
+        ]
+
+    # ─── 操作の振り分け ───
+    # いずれも対象テーブルの同名メソッドを呼び、索引を更新して発生したイベントを溜める。
+    # 存在しない table_id は `TableNotFoundError`、テーブル側の例外はそのまま送出する
+
+    def add_player(self, table_id: str, player_id: str, chips: Chips) -> GameEvent:
+        table = self.get_table(table_id)
+        try:
+            event = table.add_player(player_id, chips)
+        finally:
+            self._reindex(table_id, table)
+        self._events.append((table_id, event))
+        return event
+
+    def remove_player(self, table_id: str, player_id: str) -> GameEvent:
+        table = self.get_table(table_id)
+        try:
+            event = table.remove_player(player_id)
+        finally:
+            self._reindex(table_id, table)
+        self._events.append((table_id, event))
+        return event
+
+    def start_game(self, table_id: str, *, seed: int | None = None) -> ActionResult:
+        table = self.get_table(table_id)
+        try:
+            # 失敗しても前ハンドの後片付け (バストしたプレイヤーの除外) は済んでいることがある
+            result = table.start_game(seed=seed)
+        finally:
+            self._reindex(table_id, table)
+        self._collect(table_id, result)
+        return result
+
+    def action(self, table_id: str, player_id: str, action: Action) -> ActionResult:
+        table = self.get_table(table_id)
+        result = table.action(player_id, action)
+        self._reindex(table_id, table)
+        self._collect(table_id, result)
+        return result
+
+    def level_up(self, table_id: str) -> GameEvent:
+        event = self.get_table(table_id).level_up()
+        self._events.append((table_id, event))
+        return event
+
+    def apply_actions(
+        self, commands: Iterable[tuple[str, str, Action]]
+    ) -> list[ActionResult | PokerError]:
+        """`(table_id, player_id, action)` の列をまとめて振り分ける。
+
+        1件が失敗しても残りは続けて適用し、失敗した位置には送出された例外を入れて返す。
+
+        Returns:
+            コマンドと同じ順の `ActionResult` または `PokerError`。
+        """
+        results: list[ActionResult | PokerError] = []
+        for table_id, player_id, action in commands:
+            try:
+                results.append(self.action(table_id, player_id, action))
+            except PokerError as e:
+                results.append(e)
+        return results
+
+    def drain_events(self) -> list[tuple[str, GameEvent]]:
+        """溜まっている `(table_id, event)` を発生順に取り出して空にする"""
+        events, self._events = self._events, []
+        return events
+
+    # ─── 索引の差分更新 ───
+
+    def _collect(self, table_id: str, result: ActionResult) -> None:
+        self._events.extend((table_id, event) for event in result.events)
+
+    def _index(self, table_id: str, table: PokerTable) -> None:
+        status = table.get_table_status()
+        player_ids = table.player_ids
+        open_seats = table.max_players - len(player_ids)
+        self._entries[table_id] = _IndexEntry(status, player_ids, open_seats)
+        self._by_status[status].add(table_id)
+        for player_id in player_ids:
+            self._by_player.setdefault(player_id, set()).add(table_id)
+        if status != TableStatus.CLOSED:
+            self._by_open_seats.setdefault(open_seats, set()).add(table_id)
+
+    def _unindex(self, table_id: str) -> None:
+        entry = self._entries.pop(table_id)
+        self._by_status[entry.status].discard(table_id)
+        for player_id in entry.player_ids:
+            self._discard(self._by_player, player_id, table_id)
+        if entry.status != TableStatus.CLOSED:
+            self._discard(self._by_open_seats, entry.open_seats, table_id)
+
+    def _reindex(self, table_id: str, table: PokerTable) -> None:
+        entry = self._entries[table_id]
+        if (
+            entry.status == table.get_table_status()
+            and entry.player_ids == table.player_ids
+        ):
+            return
+        self._unindex(table_id)
+        self._index(table_id, table)
+
+    @staticmethod
+    def _discard(index: dict[Any, set[str]], key: Any, table_id: str) -> None:
+        """索引から外し、空になったキーは消す (プレイヤー数に比例して索引が膨らまないように)"""
+        table_ids = index.get(key)
+        if table_ids is None:
+            return
+        table_ids.discard(table_id)
+        if not table_ids:
+            del index[key]
@@ -1,28 +1,77 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from poker_domain.value_objects.chips import Chips
 from poker_domain.value_objects.hole_cards import HoleCards
 
 
-@dataclass
+@dataclass(init=False)
 class Player:
-    """テーブルプレイヤー。エンティティなので変動状態を持つ。"""
+    """テーブルプレイヤー。エンティティなので変動状態を持つ。
+
+    チップ量はアクションのたびに値オブジェクトを作らないよう内部では `int` で持ち
+    (`*_amount` 属性)、`chips` / `current_bet` / `total_contributed` プロパティで
+    `Chips` として読み書きできる。
+    """
 
     player_id: str
-    chips: Chips
-    hole_cards: HoleCards = field(default_factory=HoleCards)
-    current_bet: Chips = field(default_factory=lambda: Chips(0))
-    folded: bool = False
-    is_all_in: bool = False
-    total_contributed: Chips = field(default_factory=lambda: Chips(0))
+    chips_amount: int
+    current_bet_amount: int
+    total_contributed_amount: int
+    hole_cards: HoleCards
+    folded: bool
+    is_all_in: bool
+
+    def __init__(
+        self,
+        player_id: str,
+        chips: Chips,
+        hole_cards: HoleCards | None = None,
+        current_bet: Chips | None = None,
+        folded: bool = False,
+        is_all_in: bool = False,
+        total_contributed: Chips | None = None,
+    ) -> None:
+        self.player_id = player_id
+        self.chips_amount = chips.amount
+        self.current_bet_amount = current_bet.amount if current_bet is not None else 0
+        self.total_contributed_amount = (
+            total_contributed.amount if total_contributed is not None else 0
+        )
+        self.hole_cards = hole_cards if hole_cards is not None else HoleCards()
+        self.folded = folded
+        self.is_all_in = is_all_in
+
+    @property
+    def chips(self) -> Chips:
+        return Chips.of(self.chips_amount)
+
+    @chips.setter
+    def chips(self, value: Chips) -> None:
+        self.chips_amount = value.amount
+
+    @property
+    def current_bet(self) -> Chips:
+        return Chips.of(self.current_bet_amount)
+
+    @current_bet.setter
+    def current_bet(self, value: Chips) -> None:
+        self.current_bet_amount = value.amount
+
+    @property
+    def total_contributed(self) -> Chips:
+        return Chips.of(self.total_contributed_amount)
+
+    @total_contributed.setter
+    def total_contributed(self, value: Chips) -> None:
+        self.total_contributed_amount = value.amount
 
     def reset_for_new_hand(self) -> None:
         """次のハンド開始時のリセット"""
         self.hole_cards = HoleCards()
-        self.current_bet = Chips(0)
+        self.current_bet_amount = 0
         self.folded = False
         self.is_all_in = False
-        self.total_contributed = Chips(0)
+        self.total_contributed_amount = 0
 
     def _contribute(self, amount: int, *, affects_current_bet: bool = True) -> int:
         """
@@ -34,12 +83,14 @@ class Player:
         ブラインド/コール/ベット/レイズでは加算するが、アンティは対抗額ではない
         ので `affects_current_bet=False` で呼び出し current_bet を変化させない。
         """
-        paid = min(amount, self.chips.amount)
-        self.chips = Chips(self.chips.amount - paid)
+        if amount < 0:
+            raise ValueError("チップは負にはなれません")
+        paid = min(amount, self.chips_amount)
+        self.chips_amount -= paid
         if affects_current_bet:
-            self.current_bet = self.current_bet + Chips(paid)
-        self.total_contributed = self.total_contributed + Chips(paid)
-        if self.chips.amount == 0:
+            self.current_bet_amount += paid
+        self.total_contributed_amount += paid
+        if self.chips_amount == 0:
             self.is_all_in = True
         return paid
 
@@ -0,0 +1,78 @@
+from bisect import bisect_left, bisect_right
+
+from poker_domain.game_state import Pot
+from poker_domain.value_objects.chips import Chips
+
+
+class SidePotLedger:
+    """メインポット/サイドポットの階層を、拠出とフォールドのたびに差分更新する。
+
+    各階層は「累計拠出額の上限」と「その上限まで拠出した座席のビットマスク」の組で持つ。
+    結果は全プレイヤーの累計拠出額から毎回計算し直した場合 (`PokerTable._compute_pots`)
+    と常に一致する。
+    """
+
+    def __init__(self) -> None:
+        self._player_ids: tuple[str, ...] = ()
+        self._caps: list[int] = []           # 各階層の累計拠出額の上限 (昇順)
+        self._contributors: list[int] = []   # 各階層の上限まで拠出した座席のビットマスク
+        self._folded: int = 0                # フォールド済み座席のビットマスク
+        self._pots: tuple[Pot, ...] | None = ()
+
+    def reset(self, player_ids: tuple[str, ...] = ()) -> None:
+        """新しいハンドの座席 (インデックス順のプレイヤーID) で空の状態に戻す"""
+        self._player_ids = player_ids
+        self._caps = []
+        self._contributors = []
+        self._folded = 0
+        self._pots = ()
+
+    def contribute(self, seat: int, before: int, after: int) -> None:
+        """座席 `seat` の累計拠出額が `before` から `after` に増えたことを反映する"""
+        if after <= before:
+            return
+        caps, contributors = self._caps, self._contributors
+        bit = 1 << seat
+
+        # after の位置に階層の境界が無ければ、その上の階層を分割して作る
+        i = bisect_left(caps, after)
+        if i == len(caps) or caps[i] != after:
+            caps.insert(i, after)
+            contributors.insert(i, contributors[i] if i < len(contributors) else 0)
+
+        # (before, after] の範囲の階層に拠出者として加わる
+        for j in range(bisect_right(caps, before), i + 1):
+            contributors[j] |= bit
+
+        # before ちょうどを拠出額とするプレイヤーがいなくなった場合は、上の階層と統合する
+        if before > 0:
+            j = bisect_left(caps, before)
+            if j + 1 < len(caps) and contributors[j] == contributors[j + 1]:
+                del caps[j]
+                del contributors[j]
+
+        self._pots = None
+
+    def fold(self, seat: int) -> None:
+        """座席 `seat` のフォールドを反映する (拠出分はポットに残り、獲得資格だけ失う)"""
+        self._folded |= 1 << seat
+        self._pots = None
+
+    def pots(self) -> tuple[Pot, ...]:
+        """現在のメインポット/サイドポット (前回から変化が無ければ同じタプルを返す)"""
+        if self._pots is None:
+            pots: list[Pot] = []
+            prev_cap = 0
+            for cap, mask in zip(self._caps, self._contributors):
+                eligible_mask = mask & ~self._folded
+                eligible = tuple(
+                    pid for seat, pid in enumerate(self._player_ids)
+                    if eligible_mask >> seat & 1
+                )
+                pots.append(Pot(
+                    amount=Chips((cap - prev_cap) * mask.bit_count()),
+                    eligible_player_ids=eligible,
+                ))
+                prev_cap = cap
+            self._pots = tuple(pots)
+        return self._pots
@@ -0,0 +1,83 @@
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from poker_domain.action_log import entry_to_action
+from poker_domain.exceptions import PokerError, ReplayError
+from poker_domain.game_state import ActionLogEntry, ActionResult, HandSetup
+from poker_domain.table import PokerTable
+
+
+def replay_hand(
+    setup: HandSetup, entries: Iterable[ActionLogEntry], **options: Any
+) -> PokerTable:
+    """記録したハンドを実際の `PokerTable` で再生し、全アクション適用後のテーブルを返す。
+
+    イベントやスナップショットを作らずに早送りするため、結果は返したテーブルの
+    `get_state()` で取り出す。途中のアクションまで再生すれば、その時点の状態を確認したり
+    そこから `action()` で続きを進めたりできる。
+
+    Args:
+        setup: `PokerTable.last_hand_setup` で記録したハンドの開始時点。
+        entries: 再生するアクション履歴 (`GameState.action_log` の先頭から任意の件数)。
+        **options: `PokerTable` のその他のコンストラクタ引数 (`debug_checks` など)。
+
+    Returns:
+        `entries` を適用し終えたテーブル。
+
+    Raises:
+        ReplayError: シードが記録されていない、または履歴どおりに進められない場合。
+    """
+    table = _start(setup, options)
+    for index, entry in enumerate(entries):
+        _fast_forward(table, index, entry)
+    return table
+
+
+def iter_replay(
+    setup: HandSetup,
+    entries: Sequence[ActionLogEntry],
+    *,
+    start: int = 0,
+    **options: Any,
+) -> Iterator[ActionResult]:
+    """記録したハンドを再生し、`start` 件目以降のアクションごとの `ActionResult` を返す。
+
+    先頭 `start` 件はイベントやスナップショットを作らずに早送りし、それ以降は
+    `action()` で1件ずつ適用する (争いのあるアクション前後だけを詳しく見る用途)。
+
+    Args:
+        setup: `PokerTable.last_hand_setup` で記録したハンドの開始時点。
+        entries: 再生するアクション履歴。
+        start: 早送りする件数。
+        **options: `PokerTable` のその他のコンストラクタ引数。
+
+    Yields:
+        `entries[start:]` の各アクションを適用した `ActionResult` (元のハンドで
+        `action()` が返した値と等しい)。
+
+    Raises:
+        ReplayError: シードが記録されていない、または履歴どおりに進められない場合。
+    """
+    table = _start(setup, options)
+    for index, entry in enumerate(entries[:start]):
+        _fast_forward(table, index, entry)
+    for index, entry in enumerate(entries[start:], start):
+        try:
+            yield table.action(entry.player_id, entry_to_action(entry))
+        except (PokerError, ValueError) as e:
+            raise ReplayError(f"{index} 件目のアクション {entry} を再現できません: {e}") from e
+
+
+def _start(setup: HandSetup, options: dict[str, Any]) -> PokerTable:
+    if setup.seed is None:
+        raise ReplayError("シードが記録されていないハンドは再現できません")
+    table = PokerTable.from_hand_setup(setup, **options)
+    table.fast_start(seed=setup.seed)
+    return table
+
+
+def _fast_forward(table: PokerTable, index: int, entry: ActionLogEntry) -> None:
+    try:
+        table.fast_forward((entry,))
+    except (PokerError, ValueError) as e:
+        raise ReplayError(f"{index} 件目のアクション {entry} を再現できません: {e}") from e
@@ -0,0 +1,218 @@
+import struct
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import Connection
+
+from poker_domain.journal import JournaledTableManager
+
+# プライマリ → フォロワーのメッセージは先頭1バイトで種類を表す
+_RECORDS = b"R"    # 続けてジャーナルのレコード (連番の昇順に連結)
+_SNAPSHOT = b"S"   # 続けて `JournaledTableManager.snapshot()`
+# フォロワー → プライマリは接続直後に1回だけ、適用済みの最後の連番を送る
+_HELLO = struct.Struct("<Q")
+
+
+class _Link:
+    """1フォロワー分の送信待ちのレコードと送信スレッド"""
+
+    __slots__ = ("connection", "pending", "wakeup", "closed", "stopping", "thread")
+
+    def __init__(self, connection: Connection, first: bytes | None, interval: float) -> None:
+        self.connection = connection
+        # 送信待ちのレコード (操作を呼び出したスレッドが積み、送信スレッドが取り出す)
+        self.pending: deque[bytes] = deque()
+        self.wakeup = threading.Event()
+        self.closed = False      # 遅れすぎた・切断した: 送信をやめる
+        self.stopping = False    # close(): 送信待ちを送り終えたらやめる
+        self.thread = threading.Thread(
+            target=self._run, args=(first, interval), name="ReplicationSender", daemon=True
+        )
+
+    def _run(self, first: bytes | None, interval: float) -> None:
+        pending = self.pending
+        try:
+            if first is not None:
+                self.connection.send_bytes(first)
+            while True:
+                self.wakeup.wait()
+                if self.closed:
+                    break
+                self.wakeup.clear()
+                if pending:
+                    chunks = [_RECORDS]
+                    while pending:
+                        chunks.append(pending.popleft())
+                    self.connection.send_bytes(b"".join(chunks))
+                if self.stopping and not pending:
+                    break
+                # 間隔を空け、その間に積まれたレコードを次の1メッセージにまとめる
+                time.sleep(interval)
+        except OSError:
+            pass  # フォロワーが切断した
+        finally:
+            self.closed = True
+            self.connection.close()
+
+
+class ReplicationPublisher:
+    """プライマリ側。`JournaledTableManager` が追記したレコードを、接続したフォロワーへ順に送る。
+
+    送信はフォロワーごとの送信スレッドが `send_interval` 秒ごとにまとめて行い、操作を呼び出した
+    スレッドは送信待ちに積むだけでフォロワーの受信を待たない (非同期レプリケーション)。
+    送信待ちが `max_lag` 件を超えたフォロワーは切断する。フォロワーが再接続すると、直近
+    `backlog` 件に続きが残っていればそこから、なければ全テーブルのスナップショットから送り直す。
+
+    `attach()` はマネージャーを操作するのと同じスレッドから呼ぶこと。
+    """
+
+    def __init__(
+        self,
+        manager: JournaledTableManager,
+        *,
+        backlog: int = 100_000,
+        max_lag: int = 100_000,
+        send_interval: float = 0.001,
+    ) -> None:
+        """
+        Args:
+            manager: レコードを送るマネージャー。
+            backlog: 再接続したフォロワーに続きから送るために手元に残すレコード数。
+            max_lag: フォロワーごとに送信待ちにできるレコード数。超えたフォロワーは切断する。
+            send_interval: 送信スレッドが送信の間に空ける秒数 (その間のレコードをまとめて送る)。
+        """
+        self._manager = manager
+        self._backlog: deque[tuple[int, bytes]] = deque(maxlen=backlog)
+        self._max_lag = max_lag
+        self._send_interval = send_interval
+        self._links: list[_Link] = []
+        manager.add_listener(self._publish)
+
+    @property
+    def follower_count(self) -> int:
+        """送信中のフォロワー数"""
+        return sum(not link.closed for link in self._links)
+
+    def attach(self, connection: Connection) -> None:
+        """接続してきたフォロワーへの送信を始める。
+
+        フォロワーが送る適用済みの連番を受け取り、続きのレコード (手元になければスナップショット)
+        を送ってから、以後のレコードも送る。
+
+        Args:
+            connection: フォロワーとの接続 (`multiprocessing.Pipe()` や
+                `multiprocessing.connection.Listener.accept()` の戻り値)。
+        """
+        (last_seq,) = _HELLO.unpack(connection.recv_bytes())
+        current = self._manager.last_seq
+        backlog = self._backlog
+        first = None
+        frames: list[bytes] = []
+        if last_seq <= current and (
+            last_seq == current or (backlog and backlog[0][0] <= last_seq + 1)
+        ):
+            frames = [frame for seq, frame in backlog if seq > last_seq]
+        else:
+            first = _SNAPSHOT + self._manager.snapshot()
+        link = _Link(connection, first, self._send_interval)
+        link.pending.extend(frames)
+        link.wakeup.set()
+        self._links.append(link)
+        link.thread.start()
+
+    def _publish(self, seq: int, frame: bytes) -> None:
+        self._backlog.append((seq, frame))
+        if not self._links:
+            return
+        dropped = False
+        for link in self._links:
+            if link.closed:
+                dropped = True
+                continue
+            link.pending.append(frame)
+            if len(link.pending) > self._max_lag:
+                # 遅れすぎたフォロワー: 送信スレッドが今のメッセージを送り終えたら切断する
+                link.closed = True
+                link.wakeup.set()
+                dropped = True
+            elif not link.wakeup.is_set():
+                link.wakeup.set()
+        if dropped:
+            self._links = [link for link in self._links if not link.closed]
+
+    def close(self, timeout: float | None = None) -> None:
+        """送信待ちのレコードを送り終えてからフォロワーとの接続を閉じる。
+
+        Args:
+            timeout: フォロワーごとに送り終わるのを待つ最大秒数 (未指定なら送り終わるまで待つ)。
+        """
+        self._manager.remove_listener(self._publish)
+        for link in self._links:
+            link.stopping = True
+            link.wakeup.set()
+        for link in self._links:
+            link.thread.join(timeout)
+        self._links = []
+
+
+class ReplicationFollower:
+    """スタンバイ側。プライマリから受け取ったレコードを `JournaledTableManager` に適用し続ける。
+
+    適用したレコードはスタンバイ自身のジャーナルにも同じ連番で追記するため、スタンバイが落ちても
+    自分のディレクトリから復元し、適用済みの連番から続きを受け取れる。`promote()` で追従をやめれば、
+    同じマネージャーをそのままプライマリとして使える (受け取ったハンドも続きから進められる)。
+    """
+
+    def __init__(self, manager: JournaledTableManager) -> None:
+        self._manager = manager
+        self._lock = threading.Lock()
+        self._promoted = False
+
+    @property
+    def manager(self) -> JournaledTableManager:
+        return self._manager
+
+    @property
+    def promoted(self) -> bool:
+        return self._promoted
+
+    def follow(self, connection: Connection) -> None:
+        """プライマリに適用済みの連番を送り、接続が切れるか `promote()` されるまで受信・適用する。
+
+        別スレッドで実行してよい (受け取ったメッセージの適用と `promote()` は排他にする)。
+        適用中はマネージャーを他のスレッドから操作しないこと。
+
+        Raises:
+            ValueError: 受け取ったレコードの連番が連続していない・壊れている場合。
+            ReplayError: レコードの操作を記録どおりに再生できない場合。
+        """
+        try:
+            with self._lock:
+                if self._promoted:
+                    return
+                connection.send_bytes(_HELLO.pack(self._manager.last_seq))
+            while True:
+                try:
+                    message = connection.recv_bytes()
+                except (EOFError, OSError):
+                    return  # プライマリが切断した
+                with self._lock:
+                    if self._promoted:
+                        return
+                    kind, data = message[:1], message[1:]
+                    if kind == _SNAPSHOT:
+                        self._manager.restore(data)
+                    else:
+                        self._manager.apply_records(data)
+        finally:
+            connection.close()
+
+    def promote(self) -> JournaledTableManager:
+        """追従をやめ、以後の操作を受け付けるマネージャーを返す (フェイルオーバー)。
+
+        適用中のメッセージがあれば適用し終えるのを待つ。`follow()` はプライマリが切断するか、
+        次のメッセージを受け取った時点で (それを適用せずに) 戻る。
+        """
+        with self._lock:
+            self._promoted = True
+        return self._manager
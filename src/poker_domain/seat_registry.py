@@ -0,0 +1,64 @@
+from collections.abc import Sequence
+
+from poker_domain.player import Player
+
+
+def lowest_seat(mask: int) -> int:
+    """ビットマスクで立っている最も小さい座席インデックス (mask は0以外であること)"""
+    return (mask & -mask).bit_length() - 1
+
+
+def iter_seats(mask: int) -> list[int]:
+    """ビットマスクで立っている座席インデックスを昇順に並べる"""
+    seats = []
+    while mask:
+        low = mask & -mask
+        seats.append(low.bit_length() - 1)
+        mask ^= low
+    return seats
+
+
+class SeatRegistry:
+    """`PokerTable._players` の座席インデックスを引くための索引。
+
+    プレイヤーID → 座席インデックスの辞書と、アクティブ/ハンド参加中/オールインの
+    座席ビットマスク (ビット i が座席 i に対応) を持つ。着席者の並びが変わったら
+    `rebuild()`、プレイヤーのフォールド/オールインなど状態が変わったら `update()` で追従させる。
+    """
+
+    def __init__(self) -> None:
+        self._seat_by_id: dict[str, int] = {}
+        self.active: int = 0    # フォールドもオールインもしていない座席
+        self.in_hand: int = 0   # フォールドしていない座席 (オールインも含む)
+        self.all_in: int = 0    # オールインの座席
+
+    def rebuild(self, players: Sequence[Player]) -> None:
+        """着席者の並びから索引とビットマスクを作り直す"""
+        self._seat_by_id = {p.player_id: seat for seat, p in enumerate(players)}
+        self.active = self.in_hand = self.all_in = 0
+        for seat, player in enumerate(players):
+            self.update(seat, player)
+
+    def update(self, seat: int, player: Player) -> None:
+        """座席 `seat` のビットをプレイヤーの現在の状態に合わせる"""
+        bit = 1 << seat
+        self.in_hand = self.in_hand | bit if not player.folded else self.in_hand & ~bit
+        self.all_in = self.all_in | bit if player.is_all_in else self.all_in & ~bit
+        self.active = self.active | bit if player.is_active else self.active & ~bit
+
+    def seat_of(self, player_id: str) -> int | None:
+        """プレイヤーIDの座席インデックス (着席していなければ None)"""
+        return self._seat_by_id.get(player_id)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._seat_by_id
+
+    def next_active(self, from_seat: int) -> int:
+        """from_seat の次 (時計回り) のアクティブな座席。自分以外にいなければ from_seat"""
+        others = self.active & ~(1 << from_seat)
+        after = others >> (from_seat + 1)
+        if after:
+            return from_seat + 1 + lowest_seat(after)
+        if others:
+            return lowest_seat(others)
+        return from_seat
@@ -0,0 +1,315 @@
+import math
+import os
+import random
+import time
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+
+from poker_domain.agents import Agent
+from poker_domain.exceptions import PokerError
+from poker_domain.game_state import GamePhase, ShowdownEvent
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Fold
+from poker_domain.value_objects.chips import Chips
+
+# エージェントを作る呼び出し可能オブジェクト。ワーカープロセス内でセッションごとに
+# そのセッション用の乱数生成器を渡して呼ぶ (pickle 可能であること。クラスそのものでよい)
+AgentFactory = Callable[[random.Random], Agent]
+
+_Z_95 = 1.959963984540054  # 標準正規分布の 97.5% 点
+
+
+@dataclass(frozen=True)
+class AgentStats:
+    """1エージェント分の集計結果"""
+    name: str
+    hands: int
+    bb_per_100: float               # 100ハンドあたりの獲得 BB
+    bb_per_100_ci95: float          # bb/100 の95%信頼区間の半幅 (±)
+    showdowns: int                  # ショーダウンまで残ったハンド数
+    showdown_wins: int              # ショーダウンでポットを獲得したハンド数
+    decisions: int                  # act() を呼んだ回数
+    decision_seconds: float         # act() に掛かった時間の合計
+    max_decision_seconds: float     # act() 1回の最大時間
+    invalid_actions: int            # 無効なアクションを返した回数 (代わりにフォールドを適用)
+
+    @property
+    def mean_decision_seconds(self) -> float:
+        return self.decision_seconds / self.decisions if self.decisions else 0.0
+
+
+@dataclass(frozen=True)
+class SelfPlayReport:
+    """`SelfPlayRunner.run()` が完了したセッションごとに返す途中経過 (それまでの累計)"""
+    hands: int
+    sessions: int                   # 完了したセッション数
+    total_sessions: int
+    showdown_hands: int             # ショーダウンまで進んだハンド数
+    aborted_hands: int              # 決着せずに進行が止まり集計から外したハンド数
+    elapsed_seconds: float
+    agents: dict[str, AgentStats]
+
+    @property
+    def done(self) -> bool:
+        return self.sessions == self.total_sessions
+
+    @property
+    def showdown_frequency(self) -> float:
+        return self.showdown_hands / self.hands if self.hands else 0.0
+
+
+class _Tally:
+    """1エージェント分の合算値 (セッション間・ワーカー間で足し合わせる)"""
+
+    __slots__ = (
+        "hands", "bb_sum", "bb_sq_sum", "showdowns", "showdown_wins",
+        "decisions", "decision_seconds", "max_decision_seconds", "invalid_actions",
+    )
+
+    def __init__(self) -> None:
+        self.hands = 0
+        self.bb_sum = 0.0
+        self.bb_sq_sum = 0.0
+        self.showdowns = 0
+        self.showdown_wins = 0
+        self.decisions = 0
+        self.decision_seconds = 0.0
+        self.max_decision_seconds = 0.0
+        self.invalid_actions = 0
+
+    def merge(self, other: "_Tally") -> None:
+        self.hands += other.hands
+        self.bb_sum += other.bb_sum
+        self.bb_sq_sum += other.bb_sq_sum
+        self.showdowns += other.showdowns
+        self.showdown_wins += other.showdown_wins
+        self.decisions += other.decisions
+        self.decision_seconds += other.decision_seconds
+        self.max_decision_seconds = max(self.max_decision_seconds, other.max_decision_seconds)
+        self.invalid_actions += other.invalid_actions
+
+    def stats(self, name: str) -> AgentStats:
+        n = self.hands
+        mean = self.bb_sum / n if n else 0.0
+        ci = 0.0
+        if n > 1:
+            variance = max(self.bb_sq_sum - n * mean * mean, 0.0) / (n - 1)
+            ci = _Z_95 * math.sqrt(variance / n) * 100
+        return AgentStats(
+            name=name,
+            hands=n,
+            bb_per_100=mean * 100,
+            bb_per_100_ci95=ci,
+            showdowns=self.showdowns,
+            showdown_wins=self.showdown_wins,
+            decisions=self.decisions,
+            decision_seconds=self.decision_seconds,
+            max_decision_seconds=self.max_decision_seconds,
+            invalid_actions=self.invalid_actions,
+        )
+
+
+@dataclass(frozen=True)
+class _Session:
+    """ワーカーに渡す1セッション分の指示"""
+    index: int
+    seed: str
+    seat_order: tuple[str, ...]
+    hands: int
+    factories: tuple[tuple[str, AgentFactory], ...]
+    starting_stack: int
+    small_blind: int
+    big_blind: int
+    ante: int
+
+
+@dataclass(frozen=True)
+class _SessionResult:
+    hands: int
+    showdown_hands: int
+    aborted_hands: int
+    tallies: dict[str, _Tally]
+
+
+def _play_session(session: _Session) -> _SessionResult:
+    """1セッション (新しいテーブルで最大 `hands` ハンド) を対戦させて集計する"""
+    rng = random.Random(session.seed)
+    table = PokerTable(
+        table_id=f"selfplay-{session.index}",
+        max_players=len(session.seat_order),
+        small_blind=session.small_blind,
+        big_blind=session.big_blind,
+        ante=session.ante,
+        seed=rng.getrandbits(64),
+    )
+    for name in session.seat_order:
+        table.add_player(name, Chips(session.starting_stack))
+    factories = dict(session.factories)
+    agents = {name: factories[name](random.Random(rng.getrandbits(64))) for name in factories}
+    tallies = {name: _Tally() for name in factories}
+    big_blind = session.big_blind
+
+    hands = showdown_hands = aborted_hands = 0
+    stacks = {name: session.starting_stack for name in session.seat_order}
+    for _ in range(session.hands):
+        if 0 in stacks.values():
+            break  # バストしたプレイヤーが出たらセッションを終える (次のセッションで初期化される)
+        result = table.start_game()
+        while result.waiting_for is not None:
+            waiting = result.waiting_for
+            tally = tallies[waiting.player_id]
+            view = table.get_state(waiting.player_id)
+            started = time.perf_counter()
+            action = agents[waiting.player_id].act(view, waiting)
+            elapsed = time.perf_counter() - started
+            tally.decisions += 1
+            tally.decision_seconds += elapsed
+            if elapsed > tally.max_decision_seconds:
+                tally.max_decision_seconds = elapsed
+            try:
+                result = table.action(waiting.player_id, action)
+            except (PokerError, ValueError):
+                tally.invalid_actions += 1
+                result = table.action(waiting.player_id, Fold())
+
+        if result.state.phase != GamePhase.SHOWDOWN:
+            aborted_hands += 1  # 誰の手番でもないまま決着しなかったハンドは集計できない
+            break
+        hands += 1
+        after = {p.player_id: p.chips.amount for p in result.state.players}
+        for name, before in stacks.items():
+            bb = (after[name] - before) / big_blind
+            tally = tallies[name]
+            tally.hands += 1
+            tally.bb_sum += bb
+            tally.bb_sq_sum += bb * bb
+        stacks = after
+        for event in result.events:
+            if isinstance(event, ShowdownEvent) and event.hands:
+                showdown_hands += 1
+                payouts = event.payouts
+                for name in event.hands:
+                    tallies[name].showdowns += 1
+                    if payouts.get(name, 0) > 0:
+                        tallies[name].showdown_wins += 1
+    return _SessionResult(hands, showdown_hands, aborted_hands, tallies)
+
+
+class SelfPlayRunner:
+    """エージェント同士を `PokerTable` で対戦させ、結果を集計するセルフプレイ実行器。
+
+    対戦は「新しいテーブルに全エージェントを着席させて最大 `hands_per_session` ハンド」を
+    単位 (セッション) とし、セッションをプロセスプールに配って並列に進める。各セッションの
+    シードは `seed` とセッション番号から決めるため、結果はワーカー数や完了順によらず同じになる。
+    座席順はセッションごとに1つずつずらす。
+
+    `run()` は完了したセッションごとにそれまでの累計を `SelfPlayReport` として返す。
+    """
+
+    def __init__(
+        self,
+        agents: Mapping[str, AgentFactory],
+        *,
+        hands: int,
+        hands_per_session: int = 100,
+        workers: int | None = None,
+        seed: int = 0,
+        starting_stack: int = 10_000,
+        small_blind: int = 5,
+        big_blind: int = 10,
+        ante: int = 0,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """
+        Args:
+            agents: エージェント名 (プレイヤーID) → エージェントを作る呼び出し可能オブジェクト。
+                2〜10 エージェント。
+            hands: 対戦させるハンド数の上限 (バストでセッションが早く終わると少なくなる)。
+            hands_per_session: 1セッションあたりのハンド数。
+            workers: ワーカープロセス数。未指定時は CPU コア数、0 ならこのプロセス内で順に実行する。
+            seed: 全体のシード。
+            starting_stack: セッション開始時の各エージェントのチップ数。
+            small_blind: スモールブラインド額。
+            big_blind: ビッグブラインド額 (bb/100 の単位)。
+            ante: アンティ額。
+            mp_context: `multiprocessing` のコンテキスト (未指定時は既定の開始方式)。
+        """
+        if not 2 <= len(agents) <= 10:
+            raise ValueError("エージェントは2〜10必要です")
+        if hands < 1 or hands_per_session < 1:
+            raise ValueError("ハンド数は1以上が必要です")
+        self._factories = tuple(agents.items())
+        self._hands = hands
+        self._hands_per_session = hands_per_session
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        self._seed = seed
+        self._table_options = (starting_stack, small_blind, big_blind, ante)
+        self._mp_context = mp_context
+
+    def _sessions(self) -> list[_Session]:
+        names = tuple(name for name, _ in self._factories)
+        sessions = []
+        remaining = self._hands
+        index = 0
+        while remaining > 0:
+            hands = min(remaining, self._hands_per_session)
+            shift = index % len(names)
+            sessions.append(_Session(
+                index, f"{self._seed}:{index}", names[shift:] + names[:shift], hands,
+                self._factories, *self._table_options,
+            ))
+            remaining -= hands
+            index += 1
+        return sessions
+
+    def run(self) -> Iterator[SelfPlayReport]:
+        """セッションを実行し、完了するたびに累計の `SelfPlayReport` を返す"""
+        started = time.perf_counter()
+        sessions = self._sessions()
+        tallies = {name: _Tally() for name, _ in self._factories}
+        totals = [0, 0, 0]  # hands, showdown_hands, aborted_hands
+        done = 0
+
+        def report(result: _SessionResult) -> SelfPlayReport:
+            nonlocal done
+            done += 1
+            totals[0] += result.hands
+            totals[1] += result.showdown_hands
+            totals[2] += result.aborted_hands
+            for name, tally in result.tallies.items():
+                tallies[name].merge(tally)
+            return SelfPlayReport(
+                hands=totals[0],
+                sessions=done,
+                total_sessions=len(sessions),
+                showdown_hands=totals[1],
+                aborted_hands=totals[2],
+                elapsed_seconds=time.perf_counter() - started,
+                agents={name: tally.stats(name) for name, tally in tallies.items()},
+            )
+
+        if self._workers == 0:
+            for session in sessions:
+                yield report(_play_session(session))
+            return
+
+        with ProcessPoolExecutor(self._workers, mp_context=self._mp_context) as pool:
+            futures: list[Future[_SessionResult]] = [
+                pool.submit(_play_session, session) for session in sessions
+            ]
+            try:
+                for future in as_completed(futures):
+                    yield report(future.result())
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def run_all(self) -> SelfPlayReport:
+        """全セッションを実行し、最終結果だけを返す"""
+        final: SelfPlayReport | None = None
+        for final in self.run():
+            pass
+        assert final is not None
+        return final
@@ -0,0 +1,443 @@
+import bisect
+import hashlib
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from poker_domain.binary import BinaryReader, BinaryWriter
+from poker_domain.exceptions import PokerError
+from poker_domain.game_state import ActionResult, GameEvent, GameState, TableStatus
+from poker_domain.interfaces import PokerTableInterface
+from poker_domain.manager import TableManager
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Action
+from poker_domain.value_objects.chips import Chips
+from poker_domain.wire import (
+    read_action,
+    read_event,
+    read_optional_string,
+    read_result,
+    read_state,
+    read_status,
+    read_value,
+    write_action,
+    write_event,
+    write_optional_string,
+    write_result,
+    write_state,
+    write_status,
+    write_value,
+)
+
+# ワーカーへの要求は (操作コード, table_id, 引数) の列を1メッセージにまとめ、`poker_domain.wire` の
+# バイナリ形式で送る。応答は要求と同じ順の (成功したか, 戻り値または例外の型名とメッセージ) の列。
+# 空のメッセージはワーカーを止める合図
+_CREATE_TABLE = 0
+_REMOVE_TABLE = 1
+_ADD_PLAYER = 2
+_REMOVE_PLAYER = 3
+_START_GAME = 4
+_ACTION = 5
+_GET_STATE = 6
+_GET_STATES = 7
+_LEVEL_UP = 8
+_GET_STATUS = 9
+
+_Request = tuple[int, str, tuple[Any, ...]]
+
+
+def _write_nothing(w: BinaryWriter, *args: Any) -> None:
+    pass
+
+
+def _read_nothing(r: BinaryReader) -> tuple[Any, ...]:
+    return ()
+
+
+def _write_options(w: BinaryWriter, options: dict[str, Any]) -> None:
+    w.uint(len(options))
+    for name, value in options.items():
+        w.string(name)
+        write_value(w, value)
+
+
+def _read_options(r: BinaryReader) -> tuple[dict[str, Any]]:
+    return ({r.string(): read_value(r) for _ in range(r.uint())},)
+
+
+def _write_seat(w: BinaryWriter, player_id: str, chips: int) -> None:
+    w.string(player_id)
+    w.uint(chips)
+
+
+def _write_player_action(w: BinaryWriter, player_id: str, action: Action) -> None:
+    w.string(player_id)
+    write_action(w, action)
+
+
+def _write_viewers(w: BinaryWriter, viewers: tuple[str | None, ...]) -> None:
+    w.uint(len(viewers))
+    for viewer in viewers:
+        write_optional_string(w, viewer)
+
+
+def _write_states(w: BinaryWriter, states: dict[str | None, GameState]) -> None:
+    w.uint(len(states))
+    for viewer, state in states.items():
+        write_optional_string(w, viewer)
+        write_state(w, state)
+
+
+def _read_states(r: BinaryReader) -> dict[str | None, GameState]:
+    states = {}
+    for _ in range(r.uint()):
+        viewer = read_optional_string(r)
+        states[viewer] = read_state(r)
+    return states
+
+
+# 操作コード → (引数の書き方, 引数の読み方, 戻り値の書き方, 戻り値の読み方)
+_Write = Callable[..., None]
+_Read = Callable[[BinaryReader], Any]
+_CODECS: dict[int, tuple[_Write, _Read, _Write, _Read]] = {
+    _CREATE_TABLE: (_write_options, _read_options, _write_nothing, lambda r: None),
+    _REMOVE_TABLE: (_write_nothing, _read_nothing, _write_nothing, lambda r: None),
+    _ADD_PLAYER: (_write_seat, lambda r: (r.string(), r.uint()), write_event, read_event),
+    _REMOVE_PLAYER: (BinaryWriter.string, lambda r: (r.string(),), write_event, read_event),
+    _START_GAME: (_write_nothing, _read_nothing, write_result, read_result),
+    _ACTION: (
+        _write_player_action, lambda r: (r.string(), read_action(r)), write_result, read_result
+    ),
+    _GET_STATE: (
+        write_optional_string, lambda r: (read_optional_string(r),), write_state, read_state
+    ),
+    _GET_STATES: (
+        _write_viewers,
+        lambda r: (tuple(read_optional_string(r) for _ in range(r.uint())),),
+        _write_states,
+        _read_states,
+    ),
+    _LEVEL_UP: (_write_nothing, _read_nothing, write_event, read_event),
+    _GET_STATUS: (_write_nothing, _read_nothing, write_status, read_status),
+}
+
+
+def _error_types() -> dict[str, type[Exception]]:
+    """応答で送り返せる例外の型 (型名 → 型)。`PokerError` の派生はすべて含む"""
+    types: dict[str, type[Exception]] = {
+        cls.__name__: cls for cls in (ValueError, TypeError, KeyError)
+    }
+    pending: list[type[Exception]] = [PokerError]
+    while pending:
+        cls = pending.pop()
+        types[cls.__name__] = cls
+        pending.extend(cls.__subclasses__())
+    return types
+
+
+_ERROR_TYPES = _error_types()
+
+
+def _write_error(w: BinaryWriter, error: Exception) -> None:
+    w.string(type(error).__name__)
+    args = error.args
+    w.string(args[0] if len(args) == 1 and isinstance(args[0], str) else str(error))
+
+
+def _read_error(r: BinaryReader) -> Exception:
+    name = r.string()
+    message = r.string()
+    cls = _ERROR_TYPES.get(name)
+    if cls is None:
+        return RuntimeError(f"ワーカーで {name} が発生しました: {message}")
+    return cls(message)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """`table_id` をシャードに割り当てるコンシステントハッシュ。
+
+    各シャードを `replicas` 個の仮想ノードとして環上に置き、`table_id` のハッシュ値から
+    時計回りに最初の仮想ノードのシャードを選ぶ。シャード数を変えても移動するテーブルは
+    おおよそ 1 / シャード数 に収まる。
+    """
+
+    __slots__ = ("_points", "_shards")
+
+    def __init__(self, shard_count: int, replicas: int = 64) -> None:
+        if shard_count < 1:
+            raise ValueError("シャード数は1以上が必要です")
+        ring = sorted(
+            (_hash(f"shard-{shard}#{replica}"), shard)
+            for shard in range(shard_count)
+            for replica in range(replicas)
+        )
+        self._points = [point for point, _ in ring]
+        self._shards = [shard for _, shard in ring]
+
+    def shard_for(self, table_id: str) -> int:
+        index = bisect.bisect(self._points, _hash(table_id))
+        return self._shards[index % len(self._shards)]
+
+
+def _serve(conn: Connection, table_factory: Callable[..., PokerTable]) -> None:
+    """ワーカープロセスの本体。自シャードのテーブルを `TableManager` で持ち、要求を順に処理する"""
+    manager = TableManager(table_factory)
+
+    def create_table(table_id: str, options: dict[str, Any]) -> None:
+        manager.create_table(table_id, **options)
+
+    def add_player(table_id: str, player_id: str, chips: int) -> GameEvent:
+        return manager.add_player(table_id, player_id, Chips.of(chips))
+
+    def get_state(table_id: str, viewer: str | None) -> GameState:
+        return manager.get_table(table_id).get_state(viewer)
+
+    def get_states(table_id: str, viewers: tuple[str | None, ...]) -> dict[str | None, GameState]:
+        return manager.get_table(table_id).get_states_for_viewers(viewers)
+
+    def get_status(table_id: str) -> TableStatus:
+        return manager.get_table(table_id).get_table_status()
+
+    handlers: dict[int, Callable[..., Any]] = {
+        _CREATE_TABLE: create_table,
+        _REMOVE_TABLE: manager.remove_table,
+        _ADD_PLAYER: add_player,
+        _REMOVE_PLAYER: manager.remove_player,
+        _START_GAME: manager.start_game,
+        _ACTION: manager.action,
+        _GET_STATE: get_state,
+        _GET_STATES: get_states,
+        _LEVEL_UP: manager.level_up,
+        _GET_STATUS: get_status,
+    }
+    while True:
+        try:
+            data = conn.recv_bytes()
+        except EOFError:
+            return
+        if not data:
+            return
+        r = BinaryReader(data)
+        w = BinaryWriter()
+        for _ in range(r.uint()):
+            op = r.uint()
+            table_id = r.string()
+            _, read_args, write_reply, _ = _CODECS[op]
+            try:
+                value = handlers[op](table_id, *read_args(r))
+            except Exception as e:  # 例外もクライアント側で送出し直すために返す
+                w.uint(0)
+                _write_error(w, e)
+            else:
+                w.uint(1)
+                write_reply(w, value)
+        manager.drain_events()  # イベントは各 ActionResult で返しているので溜めない
+        conn.send_bytes(w.getvalue())
+
+
+class ShardedTableHost:
+    """テーブルを複数のワーカープロセスに分散して持つホスト。
+
+    `table_id` はコンシステントハッシュ (`HashRing`) でワーカーに割り当てられ、各ワーカーは
+    自分のテーブルを `TableManager` で保持する。呼び出し側は `table()` で得る
+    `RemoteTable` (`PokerTableInterface` の実装) を通常の `PokerTable` と同じように使える。
+
+    `apply_actions()` などの一括操作は要求をワーカーごとに1メッセージへまとめ、全ワーカーへ
+    送ってから応答を待つため、プロセス間通信の往復がまとめられワーカー数に応じて並列に処理される。
+    スレッドセーフではない (1つのホストを複数スレッドから同時に使わないこと)。
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        replicas: int = 64,
+        table_factory: Callable[..., PokerTable] = PokerTable,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """
+        Args:
+            workers: ワーカープロセス数。未指定時は CPU コア数。
+            replicas: コンシステントハッシュでの1ワーカーあたりの仮想ノード数。
+            table_factory: ワーカー内でテーブルを作る呼び出し可能オブジェクト (pickle 可能なもの)。
+            mp_context: `multiprocessing` のコンテキスト (未指定時は既定の開始方式)。
+        """
+        count = workers if workers is not None else os.cpu_count() or 1
+        ctx: Any = mp_context if mp_context is not None else multiprocessing.get_context()
+        self._ring = HashRing(count, replicas)
+        self._conns: list[Connection] = []
+        self._processes: list[Any] = []
+        for _ in range(count):
+            parent, child = ctx.Pipe()
+            process = ctx.Process(target=_serve, args=(child, table_factory), daemon=True)
+            process.start()
+            child.close()
+            self._conns.append(parent)
+            self._processes.append(process)
+
+    @property
+    def worker_count(self) -> int:
+        return len(self._conns)
+
+    def shard_for(self, table_id: str) -> int:
+        """`table_id` を持つワーカーの番号"""
+        return self._ring.shard_for(table_id)
+
+    # ─── テーブル ───
+
+    def create_table(self, table_id: str, **options: Any) -> "RemoteTable":
+        """担当ワーカーにテーブルを作成し、その代理オブジェクトを返す。
+
+        Raises:
+            DuplicateTableError: 同じ `table_id` のテーブルが既にある場合。
+        """
+        self._call(_CREATE_TABLE, table_id, options)
+        return RemoteTable(self, table_id)
+
+    def table(self, table_id: str) -> "RemoteTable":
+        """既存のテーブルの代理オブジェクト。
+
+        通信はしないため、テーブルが存在しなければ操作時に `TableNotFoundError` になる。
+        """
+        return RemoteTable(self, table_id)
+
+    def remove_table(self, table_id: str) -> None:
+        self._call(_REMOVE_TABLE, table_id)
+
+    # ─── 一括操作 ───
+
+    def apply_actions(
+        self, commands: Iterable[tuple[str, str, Action]]
+    ) -> list[ActionResult | Exception]:
+        """`(table_id, player_id, action)` の列をワーカーごとにまとめて並列に適用する。
+
+        Returns:
+            コマンドと同じ順の `ActionResult`、または失敗したコマンドの位置には送出された例外。
+        """
+        return self._call_many(
+            [(_ACTION, table_id, (player_id, action)) for table_id, player_id, action in commands]
+        )
+
+    def get_states(
+        self, table_ids: Iterable[str], viewer_player_id: str | None = None
+    ) -> list[GameState | Exception]:
+        """複数テーブルのスナップショットをワーカーごとにまとめて取得する"""
+        return self._call_many(
+            [(_GET_STATE, table_id, (viewer_player_id,)) for table_id in table_ids]
+        )
+
+    # ─── 終了 ───
+
+    def close(self) -> None:
+        """全ワーカーを停止する"""
+        for conn in self._conns:
+            try:
+                conn.send_bytes(b"")
+            except OSError:
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+        for conn in self._conns:
+            conn.close()
+        self._conns = []
+        self._processes = []
+
+    def __enter__(self) -> "ShardedTableHost":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    # ─── 通信 ───
+
+    def _call(self, op: int, table_id: str, *args: Any) -> Any:
+        reply = self._call_many([(op, table_id, args)])[0]
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def _call_many(self, requests: list[_Request]) -> list[Any]:
+        """要求をワーカーごとに1メッセージにまとめ、全ワーカーに送ってから応答を集める"""
+        positions: dict[int, list[int]] = {}
+        batches: dict[int, list[_Request]] = {}
+        for i, request in enumerate(requests):
+            shard = self._ring.shard_for(request[1])
+            positions.setdefault(shard, []).append(i)
+            batches.setdefault(shard, []).append(request)
+
+        for shard, batch in batches.items():
+            w = BinaryWriter()
+            w.uint(len(batch))
+            for op, table_id, args in batch:
+                w.uint(op)
+                w.string(table_id)
+                _CODECS[op][0](w, *args)
+            self._conns[shard].send_bytes(w.getvalue())
+
+        results: list[Any] = [None] * len(requests)
+        for shard, indexes in positions.items():
+            r = BinaryReader(self._conns[shard].recv_bytes())
+            for i in indexes:
+                results[i] = _CODECS[requests[i][0]][3](r) if r.uint() else _read_error(r)
+        return results
+
+
+class RemoteTable(PokerTableInterface):
+    """ワーカープロセス上のテーブルを操作する代理オブジェクト。
+
+    各メソッドは担当ワーカーと1往復し、`PokerTable` と同じ値を返す (例外は `PokerError` の派生と
+    `ValueError` / `TypeError` / `KeyError` なら同じ型、それ以外は `RuntimeError` で送出する)。
+    """
+
+    __slots__ = ("_host", "_table_id")
+
+    def __init__(self, host: ShardedTableHost, table_id: str) -> None:
+        self._host = host
+        self._table_id = table_id
+
+    @property
+    def table_id(self) -> str:
+        return self._table_id
+
+    def add_player(self, player_id: str, chips: Chips) -> GameEvent:
+        event: GameEvent = self._host._call(_ADD_PLAYER, self._table_id, player_id, chips.amount)
+        return event
+
+    def remove_player(self, player_id: str) -> GameEvent:
+        event: GameEvent = self._host._call(_REMOVE_PLAYER, self._table_id, player_id)
+        return event
+
+    def start_game(self) -> ActionResult:
+        result: ActionResult = self._host._call(_START_GAME, self._table_id)
+        return result
+
+    def action(self, player_id: str, action: Action) -> ActionResult:
+        result: ActionResult = self._host._call(_ACTION, self._table_id, player_id, action)
+        return result
+
+    def get_state(self, viewer_player_id: str | None = None) -> GameState:
+        state: GameState = self._host._call(_GET_STATE, self._table_id, viewer_player_id)
+        return state
+
+    def get_states_for_viewers(
+        self, viewer_ids: Iterable[str | None]
+    ) -> dict[str | None, GameState]:
+        states: dict[str | None, GameState] = self._host._call(
+            _GET_STATES, self._table_id, tuple(viewer_ids)
+        )
+        return states
+
+    def level_up(self) -> GameEvent:
+        event: GameEvent = self._host._call(_LEVEL_UP, self._table_id)
+        return event
+
+    def get_table_status(self) -> TableStatus:
+        status: TableStatus = self._host._call(_GET_STATUS, self._table_id)
+        return status
@@ -0,0 +1,97 @@
+from poker_domain.exceptions import InvalidActionError, InvalidPlayerError
+from poker_domain.game_state import GamePhase
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Action
+
+
+class SimulationTable(PokerTable):
+    """戦略研究などで大量のハンドを回すための、結果だけを返す `PokerTable`。
+
+    ルール (検証・ベット・ポット・ショーダウン・レーキ) は `PokerTable` と同じコードで処理し、
+    `GameEvent` / `GameState` / `WaitingFor` / `ActionResult` を作らない。
+    `deal()` / `act()` は次の手番のプレイヤーIDだけを返し、合法手・獲得額・スタックは
+    必要なときに `legal_actions()` / `payouts` / `stack()` で参照する。
+
+    同じシード・同じアクション列なら `start_game()` / `action()` と全く同じ進行になる
+    (スナップショットが必要になれば `get_state()` もそのまま使える)。
+
+    速くなるのは1アクションごとの結果の組み立ての分だけで、ルールの処理と役の判定は
+    `PokerTable` と共通。目安 (CPython 3.11・6人卓) では、ランダムなアクションで多くのハンドが
+    途中で決着する場合に `start_game()` / `action()` の約 2.7 倍、全員がチェック・コールで
+    ショーダウンまで進む場合は処理時間の約 8 割が役の判定になるため約 1.5 倍にとどまる。
+    """
+
+    __slots__ = ()
+
+    def deal(self, *, seed: int | None = None) -> str | None:
+        """`start_game()` と同じくハンドを開始し、最初の手番のプレイヤーIDを返す。
+
+        Raises:
+            TableClosedError: テーブルがクローズしている場合。
+            GameAlreadyStartedError: 既にハンドが進行中の場合。
+            NotEnoughPlayersError: 参加人数が2人未満の場合。
+        """
+        self.fast_start(seed=seed)
+        return self.next_player_id
+
+    def act(self, player_id: str, action: Action) -> str | None:
+        """`action()` と同じ検証・適用を行い、次の手番のプレイヤーIDを返す。
+
+        Returns:
+            次の手番のプレイヤーID。ハンドが決着した (または誰も手番を持たない) 場合は `None`。
+
+        Raises:
+            InvalidActionError / InvalidPlayerError / InsufficientChipsError: `action()` と同じ。
+        """
+        self._take_turn(self._check_action(player_id, action), action, None)
+        return self.next_player_id
+
+    @property
+    def next_player_id(self) -> str | None:
+        """次の手番のプレイヤーID (`action()` の `waiting_for.player_id` に相当)"""
+        if self._phase == GamePhase.SHOWDOWN or not self._players_to_act:
+            return None
+        return self._players[self._current_player_index].player_id
+
+    def legal_actions(self) -> tuple[type, ...]:
+        """次の手番のプレイヤーの合法手 (`waiting_for.valid_actions` に相当)
+
+        Raises:
+            InvalidActionError: 手番を待っていない場合。
+        """
+        if self._phase == GamePhase.SHOWDOWN or not self._players_to_act:
+            raise InvalidActionError("手番を待っていません")
+        return self._get_valid_actions(self._players[self._current_player_index])
+
+    @property
+    def payouts(self) -> dict[str, int] | None:
+        """決着したハンドの獲得額 (`SHOWDOWN` イベントの `payouts` と同じ)。進行中は `None`"""
+        return self._payouts if self._phase == GamePhase.SHOWDOWN else None
+
+    @property
+    def current_bet(self) -> int:
+        """現在のラウンドのベット額"""
+        return self._current_bet
+
+    @property
+    def pot(self) -> int:
+        """ポット合計"""
+        return self._pot
+
+    def stack(self, player_id: str) -> int:
+        """プレイヤーの手元のチップ数
+
+        Raises:
+            InvalidPlayerError: 着席していないプレイヤーの場合 (`bet_of()` も同じ)。
+        """
+        return self._players[self._seat(player_id)].chips_amount
+
+    def bet_of(self, player_id: str) -> int:
+        """プレイヤーの現在のラウンドのベット額"""
+        return self._players[self._seat(player_id)].current_bet_amount
+
+    def _seat(self, player_id: str) -> int:
+        seat = self._seats.seat_of(player_id)
+        if seat is None:
+            raise InvalidPlayerError(f"{player_id} は着席していません")
+        return seat
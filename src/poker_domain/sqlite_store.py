@@ -0,0 +1,382 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from poker_domain.action_log import entry_rows, shared_entry
+from poker_domain.game_state import ActionResult, GamePhase, HandSetup
+from poker_domain.history import HandRecord, HandRecorder
+from poker_domain.value_objects.card import Card
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hands (
+    id INTEGER PRIMARY KEY,
+    table_id TEXT NOT NULL,
+    hand_number INTEGER NOT NULL,
+    started_at REAL NOT NULL,
+    seed INTEGER,
+    seed_wrapped INTEGER NOT NULL,
+    dealer_id TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    small_blind INTEGER NOT NULL,
+    big_blind INTEGER NOT NULL,
+    ante INTEGER NOT NULL,
+    rake_percent REAL NOT NULL,
+    rake_cap INTEGER,
+    rake_min_pot INTEGER,
+    board TEXT NOT NULL,
+    pots TEXT NOT NULL,
+    rake INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS hand_players (
+    hand_id INTEGER NOT NULL REFERENCES hands (id),
+    seat INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    stack INTEGER NOT NULL,
+    shown_cards TEXT,
+    payout INTEGER NOT NULL,
+    PRIMARY KEY (hand_id, seat)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS actions (
+    hand_id INTEGER NOT NULL REFERENCES hands (id),
+    seq INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    action TEXT NOT NULL,
+    amount INTEGER,
+    PRIMARY KEY (hand_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS hands_by_table ON hands (table_id, started_at);
+CREATE INDEX IF NOT EXISTS hands_by_time ON hands (started_at);
+CREATE INDEX IF NOT EXISTS hand_players_by_player ON hand_players (player_id, hand_id);
+"""
+
+# 書き込みのたびに同じ文字列を使い、sqlite3 の文キャッシュで準備済みの文を使い回す
+_INSERT_HAND = "INSERT INTO hands VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_PLAYER = "INSERT INTO hand_players VALUES (?, ?, ?, ?, ?, ?)"
+_INSERT_ACTION = "INSERT INTO actions VALUES (?, ?, ?, ?, ?, ?)"
+
+# SQLite の INTEGER は符号付き 64 ビット。テーブルが選ぶシード (符号なし 64 ビット) のうち
+# 2**63 以上のものは 2**64 を引いて保存し、seed_wrapped を立てる
+_SEED_RANGE = 1 << 64
+_STOP = object()
+
+
+def _check_seed(seed: int | None) -> None:
+    if seed is not None and not -(_SEED_RANGE >> 1) <= seed < _SEED_RANGE:
+        raise ValueError(f"保存できないシードです: {seed}")
+
+
+def _store_seed(seed: int | None) -> tuple[int | None, bool]:
+    """シードを (seed 列の値, seed_wrapped 列の値) にする"""
+    if seed is not None and seed >= _SEED_RANGE >> 1:
+        return seed - _SEED_RANGE, True
+    return seed, False
+
+
+def _load_seed(seed: int | None, wrapped: int) -> int | None:
+    return seed + _SEED_RANGE if seed is not None and wrapped else seed
+
+
+class SQLiteHandStore:
+    """決着したハンド・アクション・獲得額を SQLite に保存する書き出し先。
+
+    `record()` / `add()` は記録を上限付きのキューに積むだけで、SQLite への書き込みは
+    バックグラウンドのスレッドが行う。書き込みは `batch_size` ハンドたまるか、最初の1件から
+    `flush_interval` 秒経つまでまとめ、1回のトランザクションで `executemany()` する。
+    データベースは WAL モードで開くため、書き込み中も他の接続から読める。
+
+    テーブルは `hands` (1ハンド1行)・`hand_players` (1ハンド・1座席1行)・`actions`
+    (1アクション1行) で、プレイヤー・テーブル・時刻で引くための索引を持つ。
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        queue_size: int = 10_000,
+        block: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            path: データベースファイルのパス (なければ作る)。
+            batch_size: 1回のトランザクションで書き込むハンド数の上限。
+            flush_interval: 最初の1件をキューから受け取ってから書き込むまでの最大秒数。
+            queue_size: 書き込み待ちにできるハンド数の上限。
+            block: キューが一杯のとき空くまで待つか。False (既定) なら待たずにその記録を
+                捨てて `dropped_hands` に数える (テーブルの処理を止めない)。
+            clock: ハンド開始時刻に使う関数 (UNIX 時刻)。
+        """
+        self._path = os.fspath(path)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._block = block
+        self._recorder = HandRecorder(clock=clock)
+        self._queue: queue.Queue[Any] = queue.Queue(queue_size)
+        self._dropped = 0
+        self._written = 0
+        self._error: BaseException | None = None
+        self._closed = False
+        # スキーマはここで作り、書き込みスレッドを起動する前に失敗を呼び出し元へ返す
+        connection = self._connect()
+        connection.close()
+        self._thread = threading.Thread(target=self._run, name="SQLiteHandStore", daemon=True)
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path, timeout=30.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    # ── 書き込み側 (呼び出し元のスレッド) ──
+
+    @property
+    def dropped_hands(self) -> int:
+        """キューが一杯で捨てたハンド数"""
+        return self._dropped
+
+    @property
+    def written_hands(self) -> int:
+        """データベースに書き込み終えたハンド数"""
+        return self._written
+
+    def record(
+        self, table_id: str, result: ActionResult, *, setup: HandSetup | None = None
+    ) -> HandRecord | None:
+        """テーブルの `ActionResult` を1件取り込み、ハンドが決着したら書き込み待ちに積む。
+
+        引数・戻り値は `HandRecorder.record()` と同じ。同じテーブルの結果は1つのスレッドから
+        発生順に渡すこと。
+
+        Raises:
+            ValueError: 決着したハンドを `add()` に積めない場合 (`add()` と同じ)。
+            sqlite3.Error: 書き込みスレッドが失敗していた場合。
+        """
+        completed = self._recorder.record(table_id, result, setup=setup)
+        if completed is not None:
+            self.add(completed)
+        return completed
+
+    def discard(self, table_id: str) -> None:
+        """テーブルの進行中のハンドを記録せずに捨てる"""
+        self._recorder.discard(table_id)
+
+    def add(self, record: HandRecord) -> bool:
+        """決着したハンドを書き込み待ちに積む (スレッドセーフ)。
+
+        Returns:
+            積めた場合は True、キューが一杯で捨てた場合は False。
+
+        Raises:
+            ValueError: シードが -2**63 以上 2**64 未満でない場合、`close()` 後に呼んだ場合。
+            sqlite3.Error: 書き込みスレッドが失敗していた場合。
+        """
+        if self._closed:
+            raise ValueError("ストアはクローズしています")
+        _check_seed(record.seed)
+        self._raise_if_failed()
+        try:
+            self._queue.put(record, block=self._block)
+        except queue.Full:
+            self._dropped += 1
+            return False
+        return True
+
+    def flush(self, timeout: float | None = None) -> None:
+        """書き込み待ちのハンドをすべて書き込むまで待つ。
+
+        Raises:
+            ValueError: `close()` 後に呼んだ場合。
+            sqlite3.Error: 書き込みスレッドが失敗していた場合。
+            TimeoutError: `timeout` 秒以内に書き込み終わらなかった場合。
+        """
+        if self._closed:
+            raise ValueError("ストアはクローズしています")
+        done = threading.Event()
+        self._queue.put(done)
+        if not done.wait(timeout):
+            raise TimeoutError("書き込み待ちのハンドを書き込み終わりませんでした")
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """残りを書き込み、書き込みスレッドを止める"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._raise_if_failed()
+
+    def __enter__(self) -> "SQLiteHandStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    # ── 書き込みスレッド ──
+
+    def _run(self) -> None:
+        connection = self._connect()
+        next_id = connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM hands").fetchone()[0]
+        pending: list[HandRecord] = []
+        deadline = 0.0
+        try:
+            while True:
+                timeout = max(deadline - time.monotonic(), 0.0) if pending else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None  # 期限切れ: たまっている分を書き込む
+                if isinstance(item, HandRecord):
+                    if not pending:
+                        deadline = time.monotonic() + self._flush_interval
+                    pending.append(item)
+                    if len(pending) < self._batch_size:
+                        continue
+                if pending and self._error is None:
+                    try:
+                        self._write(connection, next_id, pending)
+                    except BaseException as e:  # 以後の呼び出しで呼び出し元に伝える
+                        self._error = e
+                    else:
+                        next_id += len(pending)
+                        self._written += len(pending)
+                    pending = []
+                if isinstance(item, threading.Event):
+                    item.set()
+                elif item is _STOP:
+                    return
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _write(connection: sqlite3.Connection, first_id: int, records: list[HandRecord]) -> None:
+        hands = []
+        players = []
+        actions = []
+        for hand_id, record in enumerate(records, start=first_id):
+            hands.append((
+                hand_id, record.table_id, record.hand_number, record.started_at,
+                *_store_seed(record.seed), record.dealer_id, record.level,
+                record.small_blind, record.big_blind, record.ante,
+                record.rake_percent, record.rake_cap, record.rake_min_pot,
+                " ".join(card.code for card in record.board),
+                json.dumps(record.pots), record.rake,
+            ))
+            shown = dict(record.shown_cards)
+            payouts = dict(record.payouts)
+            for seat, (player_id, stack) in enumerate(record.stacks):
+                cards = shown.get(player_id)
+                players.append((
+                    hand_id, seat, player_id, stack,
+                    " ".join(card.code for card in cards) if cards else None,
+                    payouts.get(player_id, 0),
+                ))
+            for seq, (player_id, phase, action, amount) in enumerate(entry_rows(record.actions)):
+                actions.append((hand_id, seq, player_id, phase.name, action, amount))
+        with connection:
+            connection.executemany(_INSERT_HAND, hands)
+            connection.executemany(_INSERT_PLAYER, players)
+            connection.executemany(_INSERT_ACTION, actions)
+
+    # ── 読み出し (呼び出し元のスレッドで別の接続を使う) ──
+
+    def records(
+        self,
+        *,
+        player_id: str | None = None,
+        table_id: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> Iterator[HandRecord]:
+        """書き込み済みのハンドを開始時刻順に `HandRecord` に戻して返す。
+
+        Args:
+            player_id: このプレイヤーが参加したハンドに絞る。
+            table_id: このテーブルのハンドに絞る。
+            since: 開始時刻 (UNIX 時刻) がこれ以降のハンドに絞る。
+            until: 開始時刻がこれより前のハンドに絞る。
+        """
+        conditions = []
+        params: list[Any] = []
+        if player_id is not None:
+            conditions.append("id IN (SELECT hand_id FROM hand_players WHERE player_id = ?)")
+            params.append(player_id)
+        if table_id is not None:
+            conditions.append("table_id = ?")
+            params.append(table_id)
+        if since is not None:
+            conditions.append("started_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("started_at < ?")
+            params.append(until)
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        connection = sqlite3.connect(self._path, timeout=30.0)
+        try:
+            hands = connection.execute(
+                f"SELECT * FROM hands{where} ORDER BY started_at, id", params
+            )
+            for row in hands:
+                yield _load(connection, row)
+        finally:
+            connection.close()
+
+
+def _cards(text: str | None) -> tuple[Card, ...]:
+    return tuple(Card.from_code(code) for code in text.split()) if text else ()
+
+
+def _load(connection: sqlite3.Connection, row: tuple[Any, ...]) -> HandRecord:
+    (hand_id, table_id, hand_number, started_at, seed, seed_wrapped, dealer_id, level, small_blind,
+     big_blind, ante, rake_percent, rake_cap, rake_min_pot, board, pots, rake) = row
+    players = connection.execute(
+        "SELECT player_id, stack, shown_cards, payout FROM hand_players"
+        " WHERE hand_id = ? ORDER BY seat",
+        (hand_id,),
+    ).fetchall()
+    actions = connection.execute(
+        "SELECT player_id, phase, action, amount FROM actions WHERE hand_id = ? ORDER BY seq",
+        (hand_id,),
+    ).fetchall()
+    return HandRecord(
+        table_id=table_id,
+        hand_number=hand_number,
+        started_at=started_at,
+        seed=_load_seed(seed, seed_wrapped),
+        dealer_id=dealer_id,
+        level=level,
+        small_blind=small_blind,
+        big_blind=big_blind,
+        ante=ante,
+        rake_percent=rake_percent,
+        rake_cap=rake_cap,
+        rake_min_pot=rake_min_pot,
+        stacks=tuple((player_id, stack) for player_id, stack, _, _ in players),
+        actions=tuple(
+            shared_entry(player_id, GamePhase[phase], action, amount)
+            for player_id, phase, action, amount in actions
+        ),
+        board=_cards(board),
+        shown_cards=tuple(
+            (player_id, _cards(shown)) for player_id, _, shown, _ in players if shown
+        ),
+        payouts=tuple(
+            (player_id, payout) for player_id, _, _, payout in players if payout
+        ),
+        pots=tuple(json.loads(pots)),
+        rake=rake,
+    )
@@ -0,0 +1,114 @@
+from collections.abc import Sequence
+from dataclasses import fields, replace
+from typing import Any
+
+from poker_domain.action_log import ActionLogView
+from poker_domain.game_state import (
+    ActionLogEntry,
+    GameState,
+    PlayerState,
+    PlayerStateDelta,
+    StateDelta,
+)
+from poker_domain.value_objects.community_cards import CommunityCards
+
+# 追記型として差分を取るフィールド (それ以外は値ごと置き換える)
+_APPEND_ONLY_FIELDS = ("players", "community_cards", "action_log")
+
+_SCALAR_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(GameState) if f.name not in _APPEND_ONLY_FIELDS
+)
+_PLAYER_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(PlayerState) if f.name != "player_id"
+)
+
+
+def diff_states(old: GameState, new: GameState) -> StateDelta:
+    """2つのスナップショットの差分を求める。
+
+    `apply_delta(old, diff_states(old, new)) == new` が常に成り立つ。
+
+    Args:
+        old: 差分の基準となるスナップショット。
+        new: 最新のスナップショット。
+
+    Returns:
+        `old` から `new` への `StateDelta`。
+    """
+    changes: dict[str, Any] = {}
+    for name in _SCALAR_FIELDS:
+        value = getattr(new, name)
+        if getattr(old, name) != value:
+            changes[name] = value
+
+    # 着席者の並びが同じなら変化したプレイヤーだけを送り、変わっていれば全員分を置き換える
+    player_deltas: list[PlayerStateDelta] = []
+    if tuple(p.player_id for p in old.players) == tuple(p.player_id for p in new.players):
+        for old_p, new_p in zip(old.players, new.players):
+            if old_p == new_p:
+                continue
+            player_changes = {
+                name: getattr(new_p, name)
+                for name in _PLAYER_FIELDS
+                if getattr(old_p, name) != getattr(new_p, name)
+            }
+            player_deltas.append(
+                PlayerStateDelta(player_id=new_p.player_id, changes=player_changes)
+            )
+    else:
+        changes["players"] = new.players
+
+    # コミュニティカード/アクション履歴はハンド中は追記のみ。ハンドが変わった場合は置き換える
+    old_cards, new_cards = old.community_cards, new.community_cards
+    appended_cards = new_cards[len(old_cards):]
+    if new_cards[:len(old_cards)] != old_cards:
+        changes["community_cards"] = new_cards
+        appended_cards = ()
+
+    old_log, new_log = old.action_log, new.action_log
+    appended_log = tuple(new_log[len(old_log):])
+    if not _extends(new_log, old_log):
+        changes["action_log"] = new_log
+        appended_log = ()
+
+    return StateDelta(
+        changes=changes,
+        players=tuple(player_deltas),
+        community_cards=tuple(appended_cards),
+        action_log=appended_log,
+    )
+
+
+def _extends(log: Sequence[ActionLogEntry], prefix: Sequence[ActionLogEntry]) -> bool:
+    if isinstance(log, ActionLogView):
+        return log.extends(prefix)
+    return tuple(log[:len(prefix)]) == tuple(prefix)
+
+
+def apply_delta(state: GameState, delta: StateDelta) -> GameState:
+    """スナップショットに差分を適用し、最新の `GameState` を復元する。
+
+    Args:
+        state: 差分の基準となるスナップショット (直前の `ActionResult.state`)。
+        delta: `ActionResult.delta` で受け取った差分。
+
+    Returns:
+        差分適用後の `GameState`。
+    """
+    updated = replace(state, **delta.changes) if delta.changes else state
+
+    if delta.players:
+        player_changes = {d.player_id: d.changes for d in delta.players}
+        updated = replace(updated, players=tuple(
+            replace(p, **player_changes[p.player_id]) if p.player_id in player_changes else p
+            for p in updated.players
+        ))
+
+    if delta.community_cards:
+        updated = replace(
+            updated,
+            community_cards=CommunityCards(updated.community_cards + delta.community_cards),
+        )
+    if delta.action_log:
+        updated = replace(updated, action_log=tuple(updated.action_log) + delta.action_log)
+    return updated
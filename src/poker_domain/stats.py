@@ -0,0 +1,235 @@
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from poker_domain.action_log import entry_rows
+from poker_domain.game_state import ActionLogEntry, ActionResult, GamePhase, ShowdownEvent
+from poker_domain.history import HandRecord
+
+# プレイヤーごとのカウンタの並び (配列上では1プレイヤー _WIDTH 要素を連続して持つ)
+_FIELDS = (
+    "hands",                    # 配られたハンド数
+    "vpip_hands",               # プリフロップで自発的にチップを入れた (コール・ベット・レイズ)
+    "pfr_hands",                # プリフロップでレイズした
+    "three_bets",               # プリフロップでレイズ1回に対してリレイズした
+    "three_bet_opportunities",  # プリフロップでレイズ1回に直面して手番が来た
+    "aggressive_actions",       # フロップ以降のベット・レイズの回数
+    "calls",                    # フロップ以降のコールの回数
+    "saw_flop",                 # フロップまで残った
+    "showdowns",                # ショーダウンまで残った
+    "showdown_wins",            # ショーダウンでポットを獲得した
+)
+_WIDTH = len(_FIELDS)
+(
+    _HANDS, _VPIP, _PFR, _THREE_BET, _THREE_BET_OPP,
+    _AGGRESSIVE, _CALLS, _SAW_FLOP, _SHOWDOWNS, _SHOWDOWN_WINS,
+) = range(_WIDTH)
+
+
+def _ratio(numerator: int, denominator: int) -> float:
+    return numerator / denominator if denominator else 0.0
+
+
+@dataclass(frozen=True)
+class PlayerStats:
+    """1プレイヤー分の累計カウンタと、そこから求める指標 (割合は 0.0〜1.0)"""
+    player_id: str
+    hands: int
+    vpip_hands: int
+    pfr_hands: int
+    three_bets: int
+    three_bet_opportunities: int
+    aggressive_actions: int
+    calls: int
+    saw_flop: int
+    showdowns: int
+    showdown_wins: int
+
+    @property
+    def vpip(self) -> float:
+        return _ratio(self.vpip_hands, self.hands)
+
+    @property
+    def pfr(self) -> float:
+        return _ratio(self.pfr_hands, self.hands)
+
+    @property
+    def three_bet(self) -> float:
+        return _ratio(self.three_bets, self.three_bet_opportunities)
+
+    @property
+    def aggression_factor(self) -> float:
+        """フロップ以降の (ベット + レイズ) / コール。コールがなくベット・レイズがあれば inf"""
+        if self.calls == 0:
+            return float("inf") if self.aggressive_actions else 0.0
+        return self.aggressive_actions / self.calls
+
+    @property
+    def wtsd(self) -> float:
+        """フロップまで残ったハンドのうちショーダウンまで残った割合"""
+        return _ratio(self.showdowns, self.saw_flop)
+
+    @property
+    def won_at_showdown(self) -> float:
+        """ショーダウンまで残ったハンドのうちポットを獲得した割合"""
+        return _ratio(self.showdown_wins, self.showdowns)
+
+
+class PlayerStatsAggregator:
+    """ハンドごとのアクション履歴とショーダウンの結果から、プレイヤー別の統計を積み上げる。
+
+    カウンタは全プレイヤー分を1本の `array("q")` に並べて持つ (1プレイヤー 80 バイト)。
+    ハンドを追加するたびに参加者の分だけ加算するため、指標の取得は履歴の量によらず O(1)。
+    ワーカープロセスごとに集計したものは `merge()` で合算できる (pickle 可能)。
+    """
+
+    __slots__ = ("_index", "_player_ids", "_counts")
+
+    def __init__(self) -> None:
+        self._index: dict[str, int] = {}
+        self._player_ids: list[str] = []
+        self._counts = array("q")
+
+    def _slot(self, player_id: str) -> int:
+        """プレイヤーのカウンタの先頭位置 (未登録なら追加する)"""
+        index = self._index.get(player_id)
+        if index is None:
+            index = self._index[player_id] = len(self._player_ids)
+            self._player_ids.append(player_id)
+            self._counts.extend([0] * _WIDTH)
+        return index * _WIDTH
+
+    # ── 取り込み ──
+
+    def add_hand(
+        self,
+        player_ids: Iterable[str],
+        actions: Iterable[ActionLogEntry],
+        showdown_player_ids: Iterable[str] = (),
+        payouts: Mapping[str, int] | None = None,
+    ) -> None:
+        """決着した1ハンドを取り込む。
+
+        Args:
+            player_ids: ハンドに参加した (カードを配られた) プレイヤー。
+            actions: ハンドのアクション履歴 (`GameState.action_log` など)。
+            showdown_player_ids: ショーダウンまで残ったプレイヤー (全員フォールドで
+                決着した場合は空。`SHOWDOWN` イベントの `hands` のキー)。
+            payouts: プレイヤーごとの獲得額 (`SHOWDOWN` イベントの `payouts`)。
+        """
+        counts = self._counts
+        slots = {player_id: self._slot(player_id) for player_id in player_ids}
+        vpip: set[str] = set()
+        pfr: set[str] = set()
+        folded_preflop: set[str] = set()
+        faced_one_raise: set[str] = set()
+        raises = 0  # プリフロップのレイズ回数 (BB はベットとして数えない)
+        reached_flop = False
+        for player_id, phase, action, _ in entry_rows(actions):
+            slot = slots.get(player_id)
+            if slot is None:
+                slot = slots[player_id] = self._slot(player_id)
+            if phase == GamePhase.PRE_FLOP:
+                if raises == 1 and player_id not in faced_one_raise:
+                    faced_one_raise.add(player_id)
+                    counts[slot + _THREE_BET_OPP] += 1
+                    if action == "raise":
+                        counts[slot + _THREE_BET] += 1
+                if action == "fold":
+                    folded_preflop.add(player_id)
+                elif action != "check":
+                    vpip.add(player_id)
+                    if action != "call":
+                        pfr.add(player_id)
+                        raises += 1
+            else:
+                reached_flop = True
+                if action == "call":
+                    counts[slot + _CALLS] += 1
+                elif action in ("bet", "raise"):
+                    counts[slot + _AGGRESSIVE] += 1
+
+        showdown = set(showdown_player_ids)
+        reached_flop = reached_flop or bool(showdown)
+        payouts = payouts or {}
+        for player_id, slot in slots.items():
+            counts[slot + _HANDS] += 1
+            if player_id in vpip:
+                counts[slot + _VPIP] += 1
+            if player_id in pfr:
+                counts[slot + _PFR] += 1
+            if reached_flop and player_id not in folded_preflop:
+                counts[slot + _SAW_FLOP] += 1
+            if player_id in showdown:
+                counts[slot + _SHOWDOWNS] += 1
+                if payouts.get(player_id, 0) > 0:
+                    counts[slot + _SHOWDOWN_WINS] += 1
+
+    def record(self, result: ActionResult) -> bool:
+        """`start_game()` / `action()` の結果を取り込み、ハンドが決着していれば集計する。
+
+        Returns:
+            この結果でハンドを1つ集計した場合は True。
+        """
+        for event in result.events:
+            if isinstance(event, ShowdownEvent):
+                state = result.state
+                self.add_hand(
+                    (p.player_id for p in state.players),
+                    state.action_log,
+                    event.hands,
+                    event.payouts,
+                )
+                return True
+        return False
+
+    def add_record(self, record: HandRecord) -> None:
+        """ハンド履歴 (`HandRecord`) の1件を取り込む"""
+        self.add_hand(
+            (player_id for player_id, _ in record.stacks),
+            record.actions,
+            (player_id for player_id, _ in record.shown_cards),
+            dict(record.payouts),
+        )
+
+    def merge(self, other: "PlayerStatsAggregator") -> None:
+        """別の集計結果を足し合わせる"""
+        counts, others = self._counts, other._counts
+        for index, player_id in enumerate(other._player_ids):
+            slot = self._slot(player_id)
+            base = index * _WIDTH
+            for field in range(_WIDTH):
+                counts[slot + field] += others[base + field]
+
+    # ── 取り出し ──
+
+    def __len__(self) -> int:
+        return len(self._player_ids)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._index
+
+    @property
+    def player_ids(self) -> tuple[str, ...]:
+        return tuple(self._player_ids)
+
+    def stats(self, player_id: str) -> PlayerStats:
+        """プレイヤーの統計 (一度も集計していなければ全カウンタ 0)"""
+        index = self._index.get(player_id)
+        if index is None:
+            return PlayerStats(player_id, *([0] * _WIDTH))
+        base = index * _WIDTH
+        return PlayerStats(player_id, *self._counts[base:base + _WIDTH])
+
+    def __iter__(self) -> Iterator[PlayerStats]:
+        for player_id in self._player_ids:
+            yield self.stats(player_id)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"player_ids": self._player_ids, "counts": self._counts}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._player_ids = state["player_ids"]
+        self._index = {player_id: i for i, player_id in enumerate(self._player_ids)}
+        self._counts = state["counts"]
@@ -1,3 +1,13 @@
+import functools
+import random
+from array import array
+from collections.abc import Callable, Iterable
+from dataclasses import replace
+from time import perf_counter_ns
+from typing import Any
+
+from poker_domain.action_log import PHASE_CODES, PHASES, ActionLog, entry_to_action
+from poker_domain.binary import BinaryReader, BinaryWriter
 from poker_domain.deck import Deck
 from poker_domain.exceptions import (
     GameAlreadyStartedError,
@@ -13,24 +23,115 @@ from poker_domain.exceptions import (
 from poker_domain.game_state import (
     ActionLogEntry,
     ActionResult,
-    EventType,
+    CommunityDealtEvent,
     GameEvent,
     GamePhase,
+    GameStartedEvent,
     GameState,
+    HandDealtEvent,
+    HandSetup,
+    LevelUpEvent,
+    PlayerActedEvent,
+    PlayerJoinedEvent,
+    PlayerLeftEvent,
     PlayerState,
     Pot,
+    RoundEndedEvent,
+    ShowdownEvent,
+    TableClosedEvent,
     TableStatus,
+    TurnChangedEvent,
     WaitingFor,
 )
 from poker_domain.hand_evaluator import HandEvaluator
-from poker_domain.interfaces import PokerTableInterface
+from poker_domain.interfaces import PokerTableInterface, TableHook
 from poker_domain.player import Player
+from poker_domain.pots import SidePotLedger
+from poker_domain.seat_registry import SeatRegistry, iter_seats, lowest_seat
+from poker_domain.state_delta import diff_states
 from poker_domain.value_objects.action import Action, Bet, Call, Check, Fold, Raise
+from poker_domain.value_objects.card import Card
 from poker_domain.value_objects.chips import Chips
 from poker_domain.value_objects.community_cards import CommunityCards
 from poker_domain.value_objects.hand import Hand
 from poker_domain.value_objects.hole_cards import HoleCards
 
+# dump() のバイナリ形式の識別子とバージョン (形式を変えたらバージョンを上げる)
+_DUMP_MAGIC = b"PKTB"
+_DUMP_VERSION = 1
+
+# 属性のないイベントは不変なので使い回す
+_GAME_STARTED = GameStartedEvent()
+_HAND_DEALT = HandDealtEvent()
+_ROUND_ENDED = RoundEndedEvent()
+_TABLE_CLOSED = TableClosedEvent()
+
+# フックを登録したテーブルでだけ通知する処理 (メソッド名 → 通知名)
+_HOOK_POINTS = {
+    "start_game": "start_game",
+    "action": "action",
+    "dump": "dump",
+    "_collect_antes": "collect_antes",
+    "_collect_blinds": "collect_blinds",
+    "_deal_hole_cards": "deal_hole_cards",
+    "_validate_action": "validate_action",
+    "_apply_action": "apply_action",
+    "_record_action": "record_action",
+    "_advance_phase": "advance_phase",
+    "_run_out_remaining": "run_out_remaining",
+    "_finish_as_winner": "finish_as_winner",
+    "_showdown": "showdown",
+    "_evaluate": "evaluate",
+    "_side_pots": "pots",
+    "_distribute_pot": "distribute_pot",
+    "_apply_rake": "apply_rake",
+    "_snapshot": "snapshot",
+}
+
+
+def _notifying(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """メソッドの呼び出しを、テーブルに登録したフックに `name` として通知する関数で包む"""
+
+    @functools.wraps(method)
+    def hooked(self: "PokerTable", *args: Any, **kwargs: Any) -> Any:
+        hooks = self._hooks
+        if not hooks:
+            return method(self, *args, **kwargs)
+        for hook in hooks:
+            hook.before_call(self, name)
+        start = perf_counter_ns()
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException as e:
+            end = perf_counter_ns()
+            for hook in hooks:
+                hook.after_call(self, name, args, None, e, start, end)
+            raise
+        end = perf_counter_ns()
+        for hook in hooks:
+            hook.after_call(self, name, args, result, None, start, end)
+        return result
+
+    return hooked
+
+
+@functools.cache
+def _hooked_class(cls: type["PokerTable"]) -> type["PokerTable"]:
+    """`cls` の `_HOOK_POINTS` の処理をフックへの通知で包んだサブクラス。
+
+    フックを登録したテーブルだけをこのクラスに切り替えるため、フックのないテーブルの
+    処理は包まれず、計測のコストがかからない。
+    """
+    namespace: dict[str, Any] = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "_unhooked_class": cls,
+    }
+    for attr, name in _HOOK_POINTS.items():
+        namespace[attr] = _notifying(name, getattr(cls, attr))
+    return type(cls.__name__, (cls,), namespace)
+
 
 class PokerTable(PokerTableInterface):
     """テーブルの集約ルート。全ゲームロジックはここに閉じる。
@@ -40,6 +141,18 @@ class PokerTable(PokerTableInterface):
     スナップショットとして返される。
     """
 
+    # 1プロセスで数万卓を持てるよう、インスタンス辞書を作らない
+    __slots__ = (
+        "_table_id", "_max_players", "_timeout_seconds", "_debug_checks",
+        "_allow_rebuy", "_busted_player_ids", "_fixed_buy_in",
+        "_rake_percent", "_rake_cap", "_rake_min_pot",
+        "_level_schedule", "_level", "_small_blind", "_big_blind", "_ante",
+        "_players", "_seats", "_phase", "_deck", "_pot", "_current_bet", "_community_cards",
+        "_dealer_index", "_current_player_index", "_players_to_act", "_pot_ledger",
+        "_action_log", "_seed", "_seed_draws", "_seed_rng", "_last_hand_setup", "_payouts",
+        "_closed", "_has_had_players", "_delta_base", "_hooks", "__weakref__",
+    )
+
     def __init__(
         self,
         table_id: str,
@@ -54,6 +167,9 @@ class PokerTable(PokerTableInterface):
         rake_min_pot: int | None = None,
         allow_rebuy: bool = True,
         fixed_buy_in: int | None = None,
+        emit_deltas: bool = False,
+        debug_checks: bool = False,
+        seed: int | None = None,
     ) -> None:
         """テーブルを初期化する。
 
@@ -74,10 +190,22 @@ class PokerTable(PokerTableInterface):
                 `add_player()` で再参加できず `RebuyNotAllowedError` になる。
             fixed_buy_in: 指定時は `add_player()` の `chips` がこの額と
                 完全一致する場合のみ参加できる。
+            emit_deltas: `True` の場合、`action()`/`start_game()` の `ActionResult.delta` に
+                直前の `ActionResult.state` からの差分 (`StateDelta`) を付与する。
+            debug_checks: `True` の場合、差分更新している内部状態 (サイドポットなど) を
+                毎回ゼロから計算し直した結果と突き合わせ、チップ量の不変条件も検査する。
+                違反があれば `AssertionError` にする。
+            seed: 指定すると、各ハンドのシャッフル用シードをこの値で初期化した乱数列から
+                決める (同じ `seed` なら同じカードが配られる)。未指定時は `random` モジュールで
+                シャッフルする。
         """
         self._table_id = table_id
         self._max_players = max_players
         self._timeout_seconds = timeout_seconds
+        self._debug_checks = debug_checks
+
+        # 計測・トレース用のフック (add_hook() で登録する。なければ None)
+        self._hooks: tuple[TableHook, ...] | None = None
 
         # リバイ設定: False の場合、一度バスト(チップ0で除外)したプレイヤーは再参加できない
         self._allow_rebuy = allow_rebuy
@@ -101,24 +229,46 @@ class PokerTable(PokerTableInterface):
         self._ante = Chips(self._level_schedule[0][2])
 
         self._players: list[Player] = []
+        # プレイヤーID → 座席インデックスと、アクティブ/ハンド参加中/オールインの座席ビットマスク
+        self._seats = SeatRegistry()
         self._phase: GamePhase = GamePhase.WAITING
-        self._deck: Deck = Deck()
-        self._pot: Chips = Chips(0)
-        self._current_bet: Chips = Chips(0)
+        # 52枚のデッキは start_game() で作る (待機中の卓には持たせない)
+        self._deck: Deck = Deck.from_cards(())
+        # ポット合計/現在のベット額は、アクションのたびに値オブジェクトを作らないよう int で持つ
+        # (Chips にするのは GameState/イベントを作る時だけ)
+        self._pot: int = 0
+        self._current_bet: int = 0
         self._community_cards: CommunityCards = CommunityCards()
         self._dealer_index: int = 0
         self._current_player_index: int = 0
 
-        # 現在のラウンドでまだアクション未済のプレイヤーインデックス
-        self._players_to_act: set[int] = set()
+        # 現在のラウンドでまだアクション未済のプレイヤーの座席ビットマスク
+        self._players_to_act: int = 0
+
+        # サイドポットの階層 (拠出/フォールドのたびに差分更新する)
+        self._pot_ledger = SidePotLedger()
 
         # 進行中のハンド内で各プレイヤーが取ったアクションの履歴 (次ハンド開始時にリセット)
-        self._action_log: list[ActionLogEntry] = []
+        self._action_log = ActionLog()
+
+        # シャッフルの再現用: ハンドごとのシードを決める乱数列 (と、その初期値・引いた回数) と、
+        # 直近のハンドの開始時点の記録
+        self._seed = seed
+        self._seed_draws = 0
+        self._seed_rng: random.Random | None = random.Random(seed) if seed is not None else None
+        self._last_hand_setup: HandSetup | None = None
+
+        # 直近のハンドの獲得額 (プレイヤーID → チップ数)。ハンドが決着するまでは None
+        self._payouts: dict[str, int] | None = None
 
         # テーブルのライフサイクル管理
         self._closed: bool = False
         self._has_had_players: bool = False
 
+        # 差分モード: 直前に返したスナップショットを基準に StateDelta を作る
+        # (最初の差分はテーブル作成直後のスナップショットが基準)
+        self._delta_base: GameState | None = self._snapshot() if emit_deltas else None
+
     # ─── プレイヤー管理 ───
 
     def add_player(self, player_id: str, chips: Chips) -> GameEvent:
@@ -129,7 +279,7 @@ class PokerTable(PokerTableInterface):
             chips: 持ち込みチップ額。
 
         Returns:
-            `EventType.PLAYER_JOINED` の `GameEvent`。
+            `PlayerJoinedEvent`。
 
         Raises:
             TableClosedError: テーブルがクローズしている場合。
@@ -145,7 +295,7 @@ class PokerTable(PokerTableInterface):
             raise TableFullError("テーブルが満席です")
         if self._phase not in (GamePhase.WAITING, GamePhase.SHOWDOWN):
             raise GameAlreadyStartedError("ゲーム進行中にはプレイヤーを追加できません")
-        if any(p.player_id == player_id for p in self._players):
+        if player_id in self._seats:
             raise InvalidPlayerError(f"{player_id} は既に参加しています")
         if not self._allow_rebuy and player_id in self._busted_player_ids:
             raise RebuyNotAllowedError(
@@ -155,11 +305,9 @@ class PokerTable(PokerTableInterface):
             raise InvalidBuyInError(f"バイインは {self._fixed_buy_in} 固定です")
 
         self._players.append(Player(player_id=player_id, chips=chips))
+        self._seats.rebuild(self._players)
         self._has_had_players = True
-        return GameEvent(
-            event_type=EventType.PLAYER_JOINED,
-            payload={"player_id": player_id},
-        )
+        return PlayerJoinedEvent(player_id)
 
     def remove_player(self, player_id: str) -> GameEvent:
         """プレイヤーを離席させる。
@@ -168,7 +316,7 @@ class PokerTable(PokerTableInterface):
             player_id: 離席させるプレイヤーのID。
 
         Returns:
-            `EventType.PLAYER_LEFT` の `GameEvent`。
+            `PlayerLeftEvent`。
 
         Raises:
             GameAlreadyStartedError: ハンド進行中の場合。
@@ -179,42 +327,34 @@ class PokerTable(PokerTableInterface):
         if self._phase not in (GamePhase.WAITING, GamePhase.SHOWDOWN):
             raise GameAlreadyStartedError("ゲーム進行中には離開できません")
 
-        # 除外前に現在のカレントプレイヤー/ディーラーをオブジェクトとして覚えておき、
-        # 縮小後のリストに対してインデックスを引き直す
-        # (該当者自身が離脱した場合は 0 にフォールバック)
-        current_player = self._players[self._current_player_index] if self._players else None
-        dealer_player = self._players[self._dealer_index] if self._players else None
+        seat = self._seats.seat_of(player_id)
+        if seat is not None:
+            del self._players[seat]
+            self._seats.rebuild(self._players)
+            # 縮小後のリストに合わせてカレントプレイヤー/ディーラーのインデックスを詰め直す
+            # (該当者自身が離脱した場合は 0 にフォールバック)
+            self._current_player_index = self._shift_after_removal(self._current_player_index, seat)
+            self._dealer_index = self._shift_after_removal(self._dealer_index, seat)
 
-        self._players = [p for p in self._players if p.player_id != player_id]
         # 一度でもプレイヤーがいた卓が誰もいなくなった場合はクローズ
         if self._has_had_players and len(self._players) == 0:
             self._closed = True
 
-        if self._players:
-            self._current_player_index = (
-                self._players.index(current_player) if current_player in self._players else 0
-            )
-            self._dealer_index = (
-                self._players.index(dealer_player) if dealer_player in self._players else 0
-            )
-        else:
-            self._current_player_index = 0
-            self._dealer_index = 0
-
-        return GameEvent(
-            event_type=EventType.PLAYER_LEFT,
-            payload={"player_id": player_id},
-        )
+        return PlayerLeftEvent(player_id)
 
     # ─── ゲーム開始 ───
 
-    def start_game(self) -> ActionResult:
+    def start_game(self, *, seed: int | None = None) -> ActionResult:
         """ハンドを開始する (アンティ・ブラインド徴収 → ホールカード配布 → PRE_FLOP開始)。
 
         `WAITING` からは初回開始、`SHOWDOWN` からは前のハンド終了後の
         後片付け (ディーラーを回す・チップ0のプレイヤーを除外) を行ってから
         次のハンドを開始する。
 
+        Args:
+            seed: 指定すると、このハンドのデッキをこの値でシャッフルする (リプレイ・検証用)。
+                未指定時はテーブルの `seed` から決めたシード、それもなければ `random` モジュール。
+
         Returns:
             開始直後の状態を含む `ActionResult`。
 
@@ -229,20 +369,44 @@ class PokerTable(PokerTableInterface):
             raise GameAlreadyStartedError("ゲームは進行中です")
 
         events: list[GameEvent] = []
+        self._start_hand(seed, events)
+        return self._build_result(events, self._build_waiting_for())
 
+    def fast_start(self, *, seed: int | None = None) -> None:
+        """`start_game()` と同じくハンドを開始するが、イベントやスナップショットを作らない。
+
+        `fast_forward()` と組み合わせて、リプレイで目的のアクションの直前まで早送りするのに使う。
+
+        Args:
+            seed: `start_game()` と同じ。
+
+        Raises:
+            TableClosedError: テーブルがクローズしている場合。
+            GameAlreadyStartedError: 既にハンドが進行中の場合。
+            NotEnoughPlayersError: 参加人数が2人未満の場合。
+        """
+        if self._closed:
+            raise TableClosedError("テーブルはクローズしています")
+        if self._phase not in (GamePhase.WAITING, GamePhase.SHOWDOWN):
+            raise GameAlreadyStartedError("ゲームは進行中です")
+        self._start_hand(seed, None)
+
+    def _start_hand(self, seed: int | None, events: list[GameEvent] | None) -> None:
+        """ハンド開始の本体。`events` が `None` ならイベントを作らない"""
         # ── 前ハンド終了後の後片付け ──
         if self._phase == GamePhase.SHOWDOWN:
             n = len(self._players)
             # 現ディーラーの次の座席から順に、チップが残っている最初のプレイヤーを
             # 次のディーラーにする
             seating_order = [self._players[(self._dealer_index + 1 + i) % n] for i in range(n)]
-            next_dealer = next((p for p in seating_order if p.chips.amount > 0), None)
+            next_dealer = next((p for p in seating_order if p.chips_amount > 0), None)
 
             # チップが0のプレイヤーは除外 (バスト判定自体はハンド決着時に即時記録済み)
-            self._players = [p for p in self._players if p.chips.amount > 0]
+            self._players = [p for p in self._players if p.chips_amount > 0]
+            self._seats.rebuild(self._players)
 
             if next_dealer is not None:
-                self._dealer_index = self._players.index(next_dealer)
+                self._dealer_index = self._seats.seat_of(next_dealer.player_id) or 0
 
         if len(self._players) < 2:
             raise NotEnoughPlayersError("2人以上必要です")
@@ -250,13 +414,33 @@ class PokerTable(PokerTableInterface):
         # ── 新ハンドの初期化 ──
         for p in self._players:
             p.reset_for_new_hand()
+        self._seats.rebuild(self._players)
 
-        self._deck = Deck()
+        if seed is None and self._seed_rng is not None:
+            seed = self._seed_rng.getrandbits(64)
+            self._seed_draws += 1
+        self._deck = Deck(random.Random(seed)) if seed is not None else Deck()
         self._deck.shuffle()
-        self._pot = Chips(0)
-        self._current_bet = Chips(0)
+        self._last_hand_setup = HandSetup(
+            table_id=self._table_id,
+            seed=seed,
+            stacks=tuple((p.player_id, p.chips_amount) for p in self._players),
+            dealer_id=self._players[self._dealer_index].player_id,
+            level=self._level,
+            small_blind=self._small_blind.amount,
+            big_blind=self._big_blind.amount,
+            ante=self._ante.amount,
+            rake_percent=self._rake_percent,
+            rake_cap=self._rake_cap,
+            rake_min_pot=self._rake_min_pot,
+        )
+        self._pot = 0
+        self._current_bet = 0
+        self._payouts = None
         self._community_cards = CommunityCards()
-        self._action_log = []
+        player_ids = tuple(p.player_id for p in self._players)
+        self._action_log = ActionLog(player_ids)
+        self._pot_ledger.reset(player_ids)
 
         # ── アンティ徴収 ──
         self._collect_antes(events)
@@ -269,8 +453,9 @@ class PokerTable(PokerTableInterface):
 
         # ── フェーズ開始 ──
         self._phase = GamePhase.PRE_FLOP
-        events.append(GameEvent(event_type=EventType.GAME_STARTED, payload={}))
-        events.append(GameEvent(event_type=EventType.HAND_DEALT, payload={}))
+        if events is not None:
+            events.append(_GAME_STARTED)
+            events.append(_HAND_DEALT)
 
         # ── 開始プレイヤー決定 ──
         # PRE_FLOP: BB の次から開始 (heads-up では dealer=SB が先)
@@ -280,20 +465,10 @@ class PokerTable(PokerTableInterface):
             self._current_player_index = (self._dealer_index + 3) % len(self._players)
 
         # PRE_FLOP では BB も to_act に含む (BBオプション)
-        self._players_to_act = {
-            i for i, p in enumerate(self._players) if p.is_active
-        }
+        self._players_to_act = self._seats.active
 
-        events.append(GameEvent(
-            event_type=EventType.TURN_CHANGED,
-            payload={"player_id": self._players[self._current_player_index].player_id},
-        ))
-
-        return ActionResult(
-            state=self._snapshot(),
-            events=tuple(events),
-            waiting_for=self._build_waiting_for(),
-        )
+        if events is not None:
+            events.append(TurnChangedEvent(self._players[self._current_player_index].player_id))
 
     # ─── アクション ───
 
@@ -312,53 +487,78 @@ class PokerTable(PokerTableInterface):
             InvalidPlayerError: 現在の手番と異なる `player_id` の場合。
             InsufficientChipsError: `Bet`/`Raise` でチップが不足する場合。
         """
+        player = self._check_action(player_id, action)
+        events: list[GameEvent] = []
+        self._take_turn(player, action, events)
+        return self._build_result(events, self._build_waiting_for())
+
+    def fast_forward(self, entries: Iterable[ActionLogEntry]) -> None:
+        """記録済みのアクション履歴を、イベントやスナップショットを作らずに順に適用する。
+
+        `action()` と同じルールで検証・適用するが `ActionResult` を返さないため、
+        リプレイで目的のアクションの直前まで早送りするのに使う。
+
+        Args:
+            entries: 適用する `ActionLogEntry` の列 (`GameState.action_log` の形式)。
+
+        Raises:
+            InvalidActionError: 記録のフェーズが現在のフェーズと異なる場合や、
+                ルール上無効なアクションの場合。
+            InvalidPlayerError: 記録のプレイヤーが現在の手番と異なる場合。
+        """
+        for entry in entries:
+            if entry.phase != self._phase:
+                raise InvalidActionError(
+                    f"記録のフェーズ {entry.phase.name} が現在のフェーズ {self._phase.name} と"
+                    "一致しません"
+                )
+            action = entry_to_action(entry)
+            self._take_turn(self._check_action(entry.player_id, action), action, None)
+
+    def _check_action(self, player_id: str, action: Action) -> Player:
+        """手番とアクションの妥当性を検証し、手番のプレイヤーを返す"""
         if self._phase in (GamePhase.WAITING, GamePhase.SHOWDOWN):
             raise InvalidActionError("ゲームが進行中ではありません")
 
         player = self._get_current_player(player_id)
-
         self._validate_action(player, action)
+        return player
+
+    def _take_turn(
+        self, player: Player, action: Action, events: list[GameEvent] | None
+    ) -> None:
+        """検証済みのアクションを適用して進行させる。`events` が `None` ならイベントを作らない"""
         self._apply_action(player, action)
         self._record_action(player, action)
 
-        events: list[GameEvent] = [
-            GameEvent(
-                event_type=EventType.PLAYER_ACTED,
-                payload={"player_id": player_id},
-            )
-        ]
+        if events is not None:
+            events.append(PlayerActedEvent(player.player_id))
 
         # ── 全員フォールド以外1人 → 勝ち ──
-        in_hand = self._get_in_hand_players()
-        if len(in_hand) == 1:
-            return self._finish_as_winner(in_hand[0], events)
+        in_hand = self._seats.in_hand
+        if in_hand.bit_count() == 1:
+            self._finish_as_winner(self._players[lowest_seat(in_hand)], events)
+            return
 
         # ── ラウンド終了チェック ──
         if not self._players_to_act:
-            events.append(GameEvent(event_type=EventType.ROUND_ENDED, payload={}))
+            if events is not None:
+                events.append(_ROUND_ENDED)
 
             # 全員 all-in の場合は残りのコミュニティカードを一気に配る
-            active = [p for p in self._players if p.is_active]
-            if len(active) == 0:
-                return self._run_out_remaining(events)
-
-            if self._phase == GamePhase.RIVER:
-                return self._showdown(events)
+            if not self._seats.active:
+                self._run_out_remaining(events)
+            elif self._phase == GamePhase.RIVER:
+                self._showdown(events)
             else:
                 self._advance_phase(events)
         else:
             # ターンを次へ
             self._advance_turn()
-            events.append(GameEvent(
-                event_type=EventType.TURN_CHANGED,
-                payload={"player_id": self._players[self._current_player_index].player_id},
-            ))
-
-        return ActionResult(
-            state=self._snapshot(),
-            events=tuple(events),
-            waiting_for=self._build_waiting_for(),
-        )
+            if events is not None:
+                events.append(
+                    TurnChangedEvent(self._players[self._current_player_index].player_id)
+                )
 
     # ─── ステート取得 ───
 
@@ -374,6 +574,37 @@ class PokerTable(PokerTableInterface):
         """
         return self._snapshot(viewer_player_id)
 
+    def get_states_for_viewers(
+        self, viewer_ids: Iterable[str | None]
+    ) -> dict[str | None, GameState]:
+        """複数の閲覧者向けスナップショットをまとめて返す。
+
+        公開部分のスナップショットは1回だけ作って全員で共有し、閲覧者ごとには
+        本人の `PlayerState.hole_cards` だけを差し替える。
+
+        Args:
+            viewer_ids: 閲覧者のプレイヤーID (着席していないIDや `None` は観戦者として
+                公開スナップショットをそのまま受け取る)。
+
+        Returns:
+            閲覧者IDごとの `GameState` (各値は `get_state(viewer_id)` と等しい)。
+        """
+        public = self._snapshot()
+        # SHOWDOWN では全員のカードが公開済みなので、全員が同じスナップショットを共有できる
+        if self._phase == GamePhase.SHOWDOWN:
+            return {viewer_id: public for viewer_id in viewer_ids}
+
+        states: dict[str | None, GameState] = {}
+        for viewer_id in viewer_ids:
+            seat = self._seats.seat_of(viewer_id) if viewer_id is not None else None
+            if seat is None:
+                states[viewer_id] = public
+                continue
+            players = list(public.players)
+            players[seat] = replace(players[seat], hole_cards=self._players[seat].hole_cards)
+            states[viewer_id] = replace(public, players=tuple(players))
+        return states
+
     def get_table_status(self) -> TableStatus:
         """テーブルのライフサイクル状態を返す。
 
@@ -388,10 +619,313 @@ class PokerTable(PokerTableInterface):
             return TableStatus.PLAYING
         return TableStatus.OTHER
 
+    @property
+    def table_id(self) -> str:
+        return self._table_id
+
+    @property
+    def max_players(self) -> int:
+        return self._max_players
+
+    @property
+    def player_ids(self) -> tuple[str, ...]:
+        """着席中のプレイヤーID (座席順)。スナップショットを作らずに参照できる"""
+        return tuple(p.player_id for p in self._players)
+
+    @property
+    def last_hand_setup(self) -> HandSetup | None:
+        """直近に開始したハンドの開始時点の記録 (リプレイの起点。まだ開始していなければ `None`)。
+
+        シャッフルのシードを含むため、クライアントには渡さずサーバー側で保存する。
+        """
+        return self._last_hand_setup
+
+    @classmethod
+    def from_hand_setup(cls, setup: HandSetup, **options: Any) -> "PokerTable":
+        """`HandSetup` の開始時点を再現した、ハンド開始前のテーブルを作る。
+
+        返したテーブルで `start_game(seed=setup.seed)` を呼ぶと元のハンドと同じ配札になる。
+
+        Args:
+            setup: `last_hand_setup` で記録したハンドの開始時点。
+            **options: `PokerTable` のその他のコンストラクタ引数 (`timeout_seconds` など)。
+
+        Returns:
+            着席・レベル・ディーラーを `setup` に合わせた `PokerTable`。
+        """
+        options.setdefault("max_players", len(setup.stacks))
+        table = cls(
+            table_id=setup.table_id,
+            # GameState.level も一致させるため、現在レベルまで同じ額を並べたスケジュールにする
+            level_schedule=[(setup.small_blind, setup.big_blind, setup.ante)] * (setup.level + 1),
+            rake_percent=setup.rake_percent,
+            rake_cap=setup.rake_cap,
+            rake_min_pot=setup.rake_min_pot,
+            **options,
+        )
+        table._level = setup.level
+        for player_id, chips in setup.stacks:
+            table.add_player(player_id, Chips(chips))
+        table._dealer_index = table._seats.seat_of(setup.dealer_id) or 0
+        return table
+
+    # ─── フック ───
+
+    def add_hook(self, hook: TableHook) -> None:
+        """このテーブルの主要な処理の呼び出しごとに通知を受けるフックを登録する (計測・トレース用)。
+
+        通知する処理の名前: `start_game` / `action` / `dump` と、その中の `collect_antes` /
+        `collect_blinds` / `deal_hole_cards` / `validate_action` / `apply_action` /
+        `record_action` / `advance_phase` / `run_out_remaining` / `finish_as_winner` /
+        `showdown` / `evaluate` (役の判定) / `pots` (サイドポットの参照) / `apply_rake` /
+        `distribute_pot` / `snapshot` (`GameState` の生成)。
+        フックを登録している間だけ、テーブルをこれらの処理を包んだサブクラスに切り替える
+        (フックのないテーブルのコストはかからない)。登録したフックは `dump()` / `load()` では
+        引き継がない。
+
+        Args:
+            hook: 登録するフック (登録した順に呼ぶ)。
+        """
+        if self._hooks is None:
+            # 通知する処理を包んだサブクラスに切り替える (フックのないテーブルは元のまま)
+            self.__class__ = _hooked_class(type(self))
+        self._hooks = (*(self._hooks or ()), hook)
+
+    def remove_hook(self, hook: TableHook) -> None:
+        """`add_hook()` で登録したフックを外す (登録していなければ何もしない)"""
+        if self._hooks is None:
+            return
+        hooks = tuple(h for h in self._hooks if h is not hook)
+        if hooks:
+            self._hooks = hooks
+            return
+        self._hooks = None
+        self.__class__ = getattr(type(self), "_unhooked_class")
+
+    # ─── 永続化 ───
+
+    def dump(self) -> bytes:
+        """テーブルの全状態をバージョン付きのコンパクトなバイナリ形式に書き出す。
+
+        着席者・チップ・ホールカード・デッキの残り順・フェーズ・ポット・レベル・レーキ設定・
+        アクション履歴・バスト済みID・シードの乱数列の位置・直近のハンドの開始時点の記録
+        (`last_hand_setup`)・獲得額を含み、`load()` で復元したテーブルは進行中のハンドを
+        そのまま続行でき、`seed` 付きのテーブルは以降のハンドも同じシードで配る。
+
+        Returns:
+            `load()` に渡せるバイト列。
+        """
+        w = BinaryWriter()
+        w.raw(_DUMP_MAGIC)
+        w.uint(_DUMP_VERSION)
+
+        # ── 設定 ──
+        w.string(self._table_id)
+        w.uint(self._max_players)
+        w.uint(self._timeout_seconds)
+        w.uint(
+            self._allow_rebuy
+            | self._closed << 1
+            | self._has_had_players << 2
+            | (self._delta_base is not None) << 3
+            | self._debug_checks << 4
+        )
+        w.optional_uint(self._fixed_buy_in)
+        w.float64(self._rake_percent)
+        w.optional_uint(self._rake_cap)
+        w.optional_uint(self._rake_min_pot)
+        w.uint(len(self._level_schedule))
+        for sb, bb, ante in self._level_schedule:
+            w.uint(sb)
+            w.uint(bb)
+            w.uint(ante)
+        w.uint(self._level)
+        w.uint(len(self._busted_player_ids))
+        for player_id in sorted(self._busted_player_ids):
+            w.string(player_id)
+
+        # ── 着席者 ──
+        w.uint(len(self._players))
+        for p in self._players:
+            w.string(p.player_id)
+            w.uint(p.chips_amount)
+            w.uint(p.current_bet_amount)
+            w.uint(p.total_contributed_amount)
+            w.uint(p.folded | p.is_all_in << 1)
+            w.cards(p.hole_cards)
+
+        # ── 進行状態 ──
+        w.uint(PHASE_CODES[self._phase])
+        w.uint(self._pot)
+        w.uint(self._current_bet)
+        w.cards(self._community_cards)
+        w.cards(self._deck.remaining_cards)
+        w.uint(self._dealer_index)
+        w.uint(self._current_player_index)
+        w.uint(self._players_to_act)
+
+        # ── アクション履歴 (座席はハンド開始時の着席順で解決する) ──
+        w.uint(len(self._action_log.player_ids))
+        for player_id in self._action_log.player_ids:
+            w.string(player_id)
+        codes = self._action_log.codes()
+        w.uint(len(codes))
+        for value in codes:
+            w.sint(value)
+
+        # ── シャッフルの再現用 ──
+        # 乱数列の状態そのものではなく、初期値と引いた回数を書く (読み込み時に同じだけ進める)
+        w.uint(self._seed is not None)
+        if self._seed is not None:
+            w.sint(self._seed)
+            w.uint(self._seed_draws)
+        setup = self._last_hand_setup
+        w.uint(setup is not None)
+        if setup is not None:
+            w.string(setup.table_id)
+            w.uint(setup.seed is not None)
+            if setup.seed is not None:
+                w.sint(setup.seed)
+            w.uint(len(setup.stacks))
+            for player_id, chips in setup.stacks:
+                w.string(player_id)
+                w.uint(chips)
+            w.string(setup.dealer_id)
+            w.uint(setup.level)
+            w.uint(setup.small_blind)
+            w.uint(setup.big_blind)
+            w.uint(setup.ante)
+            w.float64(setup.rake_percent)
+            w.optional_uint(setup.rake_cap)
+            w.optional_uint(setup.rake_min_pot)
+        if self._payouts is None:
+            w.uint(0)
+        else:
+            w.uint(len(self._payouts) + 1)
+            for player_id, amount in self._payouts.items():
+                w.string(player_id)
+                w.uint(amount)
+        return w.getvalue()
+
+    @classmethod
+    def load(cls, data: bytes) -> "PokerTable":
+        """`dump()` で書き出したバイト列からテーブルを復元する。
+
+        Args:
+            data: `dump()` の戻り値。
+
+        Returns:
+            書き出し時点の状態を持つ `PokerTable`。
+
+        Raises:
+            ValueError: 形式・バージョンが不正、またはデータが途中で切れている場合。
+        """
+        r = BinaryReader(data)
+        if r.raw(len(_DUMP_MAGIC)) != _DUMP_MAGIC:
+            raise ValueError("PokerTable のダンプ形式ではありません")
+        version = r.uint()
+        if version != _DUMP_VERSION:
+            raise ValueError(f"未対応のダンプ形式バージョンです: {version}")
+
+        table_id = r.string()
+        max_players = r.uint()
+        timeout_seconds = r.uint()
+        flags = r.uint()
+        fixed_buy_in = r.optional_uint()
+        rake_percent = r.float64()
+        rake_cap = r.optional_uint()
+        rake_min_pot = r.optional_uint()
+        level_schedule = [(r.uint(), r.uint(), r.uint()) for _ in range(r.uint())]
+
+        table = cls(
+            table_id=table_id,
+            max_players=max_players,
+            timeout_seconds=timeout_seconds,
+            level_schedule=level_schedule,
+            rake_percent=rake_percent,
+            rake_cap=rake_cap,
+            rake_min_pot=rake_min_pot,
+            allow_rebuy=bool(flags & 1),
+            fixed_buy_in=fixed_buy_in,
+            debug_checks=bool(flags & 1 << 4),
+        )
+        table._closed = bool(flags & 1 << 1)
+        table._has_had_players = bool(flags & 1 << 2)
+        table._level = r.uint()
+        sb, bb, ante = level_schedule[table._level]
+        table._small_blind, table._big_blind, table._ante = Chips(sb), Chips(bb), Chips(ante)
+        table._busted_player_ids = {r.string() for _ in range(r.uint())}
+
+        for _ in range(r.uint()):
+            player = Player(player_id=r.string(), chips=Chips(r.uint()))
+            player.current_bet_amount = r.uint()
+            player.total_contributed_amount = r.uint()
+            player_flags = r.uint()
+            player.folded = bool(player_flags & 1)
+            player.is_all_in = bool(player_flags & 2)
+            player.hole_cards = HoleCards(r.cards())
+            table._players.append(player)
+
+        table._phase = PHASES[r.uint()]
+        table._pot = r.uint()
+        table._current_bet = r.uint()
+        table._community_cards = CommunityCards(r.cards())
+        table._deck = Deck.from_cards(r.cards())
+        table._dealer_index = r.uint()
+        table._current_player_index = r.uint()
+        table._players_to_act = r.uint()
+
+        log_player_ids = tuple(r.string() for _ in range(r.uint()))
+        codes = array("q", (r.sint() for _ in range(r.uint())))
+        table._action_log = ActionLog.from_codes(log_player_ids, codes)
+        table._load_reproduction(r)
+
+        # 索引・サイドポット階層は着席者の状態から作り直す
+        table._seats.rebuild(table._players)
+        table._pot_ledger.reset(tuple(p.player_id for p in table._players))
+        for seat, p in enumerate(table._players):
+            table._pot_ledger.contribute(seat, 0, p.total_contributed_amount)
+            if p.folded:
+                table._pot_ledger.fold(seat)
+        if flags & 1 << 3:
+            table._delta_base = table._snapshot()
+        return table
+
     # ═══════════════════════════════════════════════
     # 以下は内部メソッド
     # ═══════════════════════════════════════════════
 
+    # ── 永続化 ──
+
+    def _load_reproduction(self, r: BinaryReader) -> None:
+        """`dump()` のシャッフルの再現用の部分 (乱数列・ハンド開始時点の記録・獲得額) を読む"""
+        if r.uint():
+            self._seed = r.sint()
+            self._seed_draws = r.uint()
+            self._seed_rng = random.Random(self._seed)
+            for _ in range(self._seed_draws):
+                self._seed_rng.getrandbits(64)
+        if r.uint():
+            table_id = r.string()
+            seed = r.sint() if r.uint() else None
+            stacks = tuple((r.string(), r.uint()) for _ in range(r.uint()))
+            self._last_hand_setup = HandSetup(
+                table_id=table_id,
+                seed=seed,
+                stacks=stacks,
+                dealer_id=r.string(),
+                level=r.uint(),
+                small_blind=r.uint(),
+                big_blind=r.uint(),
+                ante=r.uint(),
+                rake_percent=r.float64(),
+                rake_cap=r.optional_uint(),
+                rake_min_pot=r.optional_uint(),
+            )
+        payouts = r.uint()
+        if payouts:
+            self._payouts = {r.string(): r.uint() for _ in range(payouts - 1)}
+
     # ── バリデーション ──
 
     def _validate_action(self, player: Player, action: Action) -> None:
@@ -399,29 +933,29 @@ class PokerTable(PokerTableInterface):
             case Fold():
                 pass  # いつでも可能
             case Check():
-                if player.current_bet < self._current_bet:
+                if player.current_bet_amount < self._current_bet:
                     raise InvalidActionError("ベット額が足りません。コールが必要です")
             case Call():
                 # チップが足りない場合は保有額全額でのオールインコールとして成立させる。
                 # 一方、既に必要額以上を拠出済み (本来はcallではなくcheckが提示されるべき局面)
                 # での呼び出しは、状態不整合の防衛線として明示的に弾く
-                if player.current_bet.amount > self._current_bet.amount:
+                if player.current_bet_amount > self._current_bet:
                     raise InvalidActionError("既に必要額以上を拠出済みです")
             case Bet(amount=amount):
-                if self._current_bet.amount > 0:
+                if self._current_bet > 0:
                     raise InvalidActionError("既にベットがある場合は Raise を使ってください")
-                is_all_in_bet = amount == player.chips.amount
+                is_all_in_bet = amount == player.chips_amount
                 if amount < self._big_blind.amount and not is_all_in_bet:
                     raise InvalidActionError(f"最小ベットは {self._big_blind.amount} です")
-                if amount > player.chips.amount:
+                if amount > player.chips_amount:
                     raise InsufficientChipsError("チップ不足です")
             case Raise(amount=amount):
-                min_raise = self._current_bet.amount * 2
-                diff = amount - player.current_bet.amount
-                is_all_in_raise = diff == player.chips.amount
+                min_raise = self._current_bet * 2
+                diff = amount - player.current_bet_amount
+                is_all_in_raise = diff == player.chips_amount
                 if amount < min_raise and not is_all_in_raise:
                     raise InvalidActionError(f"最小レイズは {min_raise} です")
-                if diff > player.chips.amount:
+                if diff > player.chips_amount:
                     raise InsufficientChipsError("チップ不足です")
 
     # ── 適用 ──
@@ -430,38 +964,41 @@ class PokerTable(PokerTableInterface):
         match action:
             case Fold():
                 player.folded = True
-                self._players_to_act.discard(self._current_player_index)
+                self._seats.update(self._current_player_index, player)
+                self._pot_ledger.fold(self._current_player_index)
+                self._players_to_act &= ~(1 << self._current_player_index)
 
             case Check():
-                self._players_to_act.discard(self._current_player_index)
+                self._players_to_act &= ~(1 << self._current_player_index)
 
             case Call():
                 # 不足していれば保有チップ全額でのオールインコールとする (サイドポットの発生源)
-                diff = self._current_bet.amount - player.current_bet.amount
-                paid = player._contribute(diff)
-                self._pot = self._pot + Chips(paid)
-                self._players_to_act.discard(self._current_player_index)
+                diff = self._current_bet - player.current_bet_amount
+                self._contribute(self._current_player_index, diff)
+                self._players_to_act &= ~(1 << self._current_player_index)
 
             case Bet(amount=amount):
-                paid = player._contribute(amount)
-                self._current_bet = Chips(amount)
-                self._pot = self._pot + Chips(paid)
+                self._contribute(self._current_player_index, amount)
+                self._current_bet = amount
                 # Bet → 他の全アクティブプレイヤーを to_act に戻す
-                self._players_to_act = {
-                    i for i, p in enumerate(self._players)
-                    if p.is_active and i != self._current_player_index
-                }
+                self._players_to_act = self._seats.active & ~(1 << self._current_player_index)
 
             case Raise(amount=amount):
-                diff = amount - player.current_bet.amount
-                paid = player._contribute(diff)
-                self._current_bet = Chips(amount)
-                self._pot = self._pot + Chips(paid)
+                diff = amount - player.current_bet_amount
+                self._contribute(self._current_player_index, diff)
+                self._current_bet = amount
                 # Raise → 他の全アクティブプレイヤーを to_act に戻す
-                self._players_to_act = {
-                    i for i, p in enumerate(self._players)
-                    if p.is_active and i != self._current_player_index
-                }
+                self._players_to_act = self._seats.active & ~(1 << self._current_player_index)
+
+    def _contribute(self, seat: int, amount: int, *, affects_current_bet: bool = True) -> int:
+        """座席 `seat` のプレイヤーにチップを拠出させ、ポットとサイドポット階層に反映する"""
+        player = self._players[seat]
+        before = player.total_contributed_amount
+        paid = player._contribute(amount, affects_current_bet=affects_current_bet)
+        self._seats.update(seat, player)
+        self._pot += paid
+        self._pot_ledger.contribute(seat, before, before + paid)
+        return paid
 
     # ── アクション履歴記録 ──
 
@@ -478,16 +1015,11 @@ class PokerTable(PokerTableInterface):
             case Raise(amount=amount):
                 action_name = "raise"
 
-        self._action_log.append(ActionLogEntry(
-            player_id=player.player_id,
-            phase=self._phase,
-            action=action_name,
-            amount=amount,
-        ))
+        self._action_log.append(self._current_player_index, self._phase, action_name, amount)
 
     # ── ブラインド徴収 ──
 
-    def _collect_blinds(self, events: list[GameEvent]) -> None:
+    def _collect_blinds(self, events: list[GameEvent] | None) -> None:
         n = len(self._players)
         if n == 2:
             sb_index = self._dealer_index
@@ -498,21 +1030,18 @@ class PokerTable(PokerTableInterface):
 
         self._pay_blind(sb_index, self._small_blind)
         self._pay_blind(bb_index, self._big_blind)
-        self._current_bet = self._big_blind  # 現時点のベット額 = BB
+        self._current_bet = self._big_blind.amount  # 現時点のベット額 = BB
 
     def _pay_blind(self, player_index: int, blind: Chips) -> None:
-        player = self._players[player_index]
-        paid = player._contribute(blind.amount)
-        self._pot = self._pot + Chips(paid)
+        self._contribute(player_index, blind.amount)
 
     # ── アンティ徴収 ──
 
-    def _collect_antes(self, events: list[GameEvent]) -> None:
+    def _collect_antes(self, events: list[GameEvent] | None) -> None:
         if self._ante.amount <= 0:
             return
-        for player in self._players:
-            paid = player._contribute(self._ante.amount, affects_current_bet=False)
-            self._pot = self._pot + Chips(paid)
+        for seat in range(len(self._players)):
+            self._contribute(seat, self._ante.amount, affects_current_bet=False)
 
     # ── レベル ──
 
@@ -522,7 +1051,7 @@ class PokerTable(PokerTableInterface):
         最終レベルに到達している場合は据え置きになる。
 
         Returns:
-            `EventType.LEVEL_UP` の `GameEvent` (現在のレベルとSB/BB/アンティを含む)。
+            `LevelUpEvent` (現在のレベルとSB/BB/アンティを含む)。
         """
         if self._level < len(self._level_schedule) - 1:
             self._level += 1
@@ -530,14 +1059,11 @@ class PokerTable(PokerTableInterface):
             self._small_blind = Chips(sb)
             self._big_blind = Chips(bb)
             self._ante = Chips(ante)
-        return GameEvent(
-            event_type=EventType.LEVEL_UP,
-            payload={
-                "level": self._level,
-                "small_blind": self._small_blind.amount,
-                "big_blind": self._big_blind.amount,
-                "ante": self._ante.amount,
-            },
+        return LevelUpEvent(
+            level=self._level,
+            small_blind=self._small_blind.amount,
+            big_blind=self._big_blind.amount,
+            ante=self._ante.amount,
         )
 
     # ── ホールカード配布 ──
@@ -553,7 +1079,7 @@ class PokerTable(PokerTableInterface):
 
     # ── フェーズ遷移 ──
 
-    def _advance_phase(self, events: list[GameEvent]) -> None:
+    def _advance_phase(self, events: list[GameEvent] | None) -> None:
         next_phase = {
             GamePhase.PRE_FLOP: GamePhase.FLOP,
             GamePhase.FLOP: GamePhase.TURN,
@@ -568,32 +1094,26 @@ class PokerTable(PokerTableInterface):
             case GamePhase.TURN | GamePhase.RIVER:
                 self._community_cards = CommunityCards(self._community_cards + self._deck.deal(1))
 
-        events.append(GameEvent(
-            event_type=EventType.COMMUNITY_DEALT,
-            payload={"community_cards": self._community_cards},
-        ))
+        if events is not None:
+            events.append(CommunityDealtEvent(self._community_cards))
 
         # ラウンドリセット
-        self._current_bet = Chips(0)
+        self._current_bet = 0
         for p in self._players:
             if p.is_in_hand:
-                p.current_bet = Chips(0)
+                p.current_bet_amount = 0
 
         # to_act: アクティブ全員 (all-in は除外)
-        self._players_to_act = {
-            i for i, p in enumerate(self._players) if p.is_active
-        }
+        self._players_to_act = self._seats.active
 
         # ターン: ディーラーの次のアクティブプレイヤーから
         self._current_player_index = self._next_active_index(self._dealer_index)
-        events.append(GameEvent(
-            event_type=EventType.TURN_CHANGED,
-            payload={"player_id": self._players[self._current_player_index].player_id},
-        ))
+        if events is not None:
+            events.append(TurnChangedEvent(self._players[self._current_player_index].player_id))
 
     # ── 全員 all-in の場合: 残りのコミュニティカードを一気に配る ──
 
-    def _run_out_remaining(self, events: list[GameEvent]) -> ActionResult:
+    def _run_out_remaining(self, events: list[GameEvent] | None) -> None:
         while self._phase != GamePhase.RIVER:
             next_phase = {
                 GamePhase.PRE_FLOP: GamePhase.FLOP,
@@ -607,12 +1127,10 @@ class PokerTable(PokerTableInterface):
                 case GamePhase.TURN | GamePhase.RIVER:
                     dealt = self._deck.deal(1)
             self._community_cards = CommunityCards(self._community_cards + dealt)
-            events.append(GameEvent(
-                event_type=EventType.COMMUNITY_DEALT,
-                payload={"community_cards": self._community_cards},
-            ))
+            if events is not None:
+                events.append(CommunityDealtEvent(self._community_cards))
 
-        return self._showdown(events)
+        self._showdown(events)
 
     # ── ターン進行 ──
 
@@ -620,52 +1138,37 @@ class PokerTable(PokerTableInterface):
         self._current_player_index = self._next_active_index(self._current_player_index)
 
     def _next_active_index(self, from_index: int) -> int:
-        """from_index の次のアクティブプレイヤーのインデックス"""
-        n = len(self._players)
-        i = (from_index + 1) % n
-        while i != from_index:
-            if self._players[i].is_active:
-                return i
-            i = (i + 1) % n
-        return from_index  # アクティブが1人だけ
+        """from_index の次のアクティブプレイヤーのインデックス (1人だけなら from_index)"""
+        return self._seats.next_active(from_index)
 
     # ── 勝敗 ──
 
-    def _finish_as_winner(self, winner: Player, events: list[GameEvent]) -> ActionResult:
+    def _finish_as_winner(self, winner: Player, events: list[GameEvent] | None) -> None:
         """全員フォールドで不戦勝。サイドポットの偏りに関わらず残ったポット全額を獲得し、レーキは取らない"""
         payout = self._pot
-        winner.chips = winner.chips + payout
-        self._pot = Chips(0)
+        winner.chips_amount += payout
+        self._payouts = {winner.player_id: payout}
+        self._pot = 0
         self._reset_contributions()
         self._phase = GamePhase.SHOWDOWN
         self._record_busted_players()
-        events.append(GameEvent(
-            event_type=EventType.SHOWDOWN,
-            payload={
-                "winner_id": winner.player_id,
-                "hands": {},
-                "payouts": {winner.player_id: payout.amount},
-                "rake": 0,
-            },
-        ))
+        if events is not None:
+            events.append(ShowdownEvent(
+                winner_id=winner.player_id, hands={}, payouts=self._payouts, rake=0
+            ))
         self._close_if_finished(events)
-        return ActionResult(
-            state=self._snapshot(),
-            events=tuple(events),
-            waiting_for=None,
-        )
 
-    def _showdown(self, events: list[GameEvent]) -> ActionResult:
+    def _showdown(self, events: list[GameEvent] | None) -> None:
         """RIVER後のショーダウン。サイドポットごとに勝者を判定して分配し、レーキを控除する"""
         self._phase = GamePhase.SHOWDOWN
-        in_hand = self._get_in_hand_players()
+        in_hand = [self._players[seat] for seat in iter_seats(self._seats.in_hand)]
 
         hands_log: dict[str, Hand] = {
-            player.player_id: HandEvaluator.evaluate(player.hole_cards + self._community_cards)
+            player.player_id: self._evaluate(player.hole_cards + self._community_cards)
             for player in in_hand
         }
 
-        raw_pots = self._compute_pots()
+        raw_pots = self._side_pots()
         pots, rake = self._apply_rake(raw_pots)
 
         payouts: dict[str, int] = {}
@@ -676,36 +1179,38 @@ class PokerTable(PokerTableInterface):
         for player in self._players:
             won = payouts.get(player.player_id, 0)
             if won:
-                player.chips = player.chips + Chips(won)
+                player.chips_amount += won
 
-        self._pot = Chips(0)
+        self._payouts = payouts
+        self._pot = 0
         self._reset_contributions()
         self._record_busted_players()
 
-        winner_id = max(payouts, key=lambda pid: payouts[pid]) if payouts else None
-        events.append(GameEvent(
-            event_type=EventType.SHOWDOWN,
-            payload={
-                "winner_id": winner_id,
-                "hands": hands_log,
-                "pots": pots,
-                "payouts": payouts,
-                "rake": rake,
-            },
-        ))
+        if events is not None:
+            winner_id = max(payouts, key=lambda pid: payouts[pid]) if payouts else None
+            events.append(ShowdownEvent(
+                winner_id=winner_id, hands=hands_log, payouts=payouts, rake=rake, pots=pots
+            ))
         self._close_if_finished(events)
-        return ActionResult(
-            state=self._snapshot(),
-            events=tuple(events),
-            waiting_for=None,
-        )
+
+    def _evaluate(self, cards: tuple[Card, ...]) -> Hand:
+        return HandEvaluator.evaluate(cards)
 
     # ── サイドポット計算 ──
 
+    def _side_pots(self) -> tuple[Pot, ...]:
+        """差分更新しているサイドポット階層を返す (debug_checks 時は再計算結果と突き合わせる)"""
+        pots = self._pot_ledger.pots()
+        if self._debug_checks:
+            expected = self._compute_pots()
+            if pots != expected:
+                raise AssertionError(f"サイドポットの差分更新が不整合です: {pots} != {expected}")
+        return pots
+
     def _compute_pots(self) -> tuple[Pot, ...]:
-        """各プレイヤーの累計拠出額からメインポット/サイドポットを算出する"""
+        """各プレイヤーの累計拠出額からメインポット/サイドポットをゼロから算出する"""
         contributions = [
-            (p, p.total_contributed.amount) for p in self._players if p.total_contributed.amount > 0
+            (p, p.total_contributed_amount) for p in self._players if p.total_contributed_amount > 0
         ]
         if not contributions:
             return ()
@@ -725,7 +1230,10 @@ class PokerTable(PokerTableInterface):
 
     def _distribute_pot(self, pot: Pot, hands: dict[str, Hand]) -> dict[str, int]:
         """1つのポットについて、対象者内で最強のハンドに (同点なら等分で) 配る"""
-        eligible = [p for p in self._players if p.player_id in pot.eligible_player_ids]
+        seats = sorted(
+            seat for seat in map(self._seats.seat_of, pot.eligible_player_ids) if seat is not None
+        )
+        eligible = [self._players[seat] for seat in seats]
         if not eligible:
             return {}
 
@@ -755,10 +1263,11 @@ class PokerTable(PokerTableInterface):
     def _order_from_dealer(self, players: list[Player]) -> list[Player]:
         """ディーラーの次の座席から時計回りの順に並べ替える"""
         n = len(self._players)
-        seat_index = {id(p): i for i, p in enumerate(self._players)}
 
         def seat_distance(p: Player) -> int:
-            return (seat_index[id(p)] - self._dealer_index - 1) % n
+            seat = self._seats.seat_of(p.player_id)
+            assert seat is not None
+            return (seat - self._dealer_index - 1) % n
 
         return sorted(players, key=seat_distance)
 
@@ -793,20 +1302,37 @@ class PokerTable(PokerTableInterface):
 
     def _reset_contributions(self) -> None:
         for p in self._players:
-            p.total_contributed = Chips(0)
+            p.total_contributed_amount = 0
+        self._pot_ledger.reset()
 
     def _record_busted_players(self) -> None:
         """チップ0が確定した時点で即座にバスト済みとして記録する (リバイ禁止判定用)"""
-        self._busted_player_ids |= {p.player_id for p in self._players if p.chips.amount == 0}
+        self._busted_player_ids |= {p.player_id for p in self._players if p.chips_amount == 0}
+
+    def _check_chip_invariants(self) -> None:
+        """内部の int で持つチップ量の不変条件を検査する (debug_checks 時のみ呼ばれる)"""
+        in_progress = self._phase not in (GamePhase.WAITING, GamePhase.SHOWDOWN)
+        contributed = 0
+        for p in self._players:
+            if p.chips_amount < 0 or p.current_bet_amount < 0:
+                raise AssertionError(f"{p.player_id} のチップ量が負です")
+            if in_progress and p.current_bet_amount > p.total_contributed_amount:
+                raise AssertionError(f"{p.player_id} の current_bet が累計拠出額を超えています")
+            contributed += p.total_contributed_amount
+        if self._pot != contributed:
+            raise AssertionError(f"ポット {self._pot} が累計拠出額 {contributed} と不一致です")
+        if self._current_bet < 0:
+            raise AssertionError("current_bet が負です")
 
     # ── ハンド終了後のクローズ判定 ──
 
-    def _close_if_finished(self, events: list[GameEvent]) -> None:
+    def _close_if_finished(self, events: list[GameEvent] | None) -> None:
         """生存 (チップ>0) プレイヤーが1人以下になったら卓をクローズする"""
-        survivors = [p for p in self._players if p.chips.amount > 0]
+        survivors = [p for p in self._players if p.chips_amount > 0]
         if len(survivors) <= 1 and not self._closed:
             self._closed = True
-            events.append(GameEvent(event_type=EventType.TABLE_CLOSED, payload={}))
+            if events is not None:
+                events.append(_TABLE_CLOSED)
 
     # ── ヘルパー ──
 
@@ -818,9 +1344,12 @@ class PokerTable(PokerTableInterface):
             )
         return current
 
-    def _get_in_hand_players(self) -> list[Player]:
-        """フォールドしていない全プレイヤー (all-in も含む)"""
-        return [p for p in self._players if p.is_in_hand]
+    @staticmethod
+    def _shift_after_removal(index: int, removed_seat: int) -> int:
+        """座席 removed_seat が抜けた後のリストで index が指す座席 (本人が抜けた場合は 0)"""
+        if index == removed_seat:
+            return 0
+        return index - 1 if index > removed_seat else index
 
     # ── スナップショット ──
 
@@ -834,8 +1363,8 @@ class PokerTable(PokerTableInterface):
             )
             player_states.append(PlayerState(
                 player_id=p.player_id,
-                chips=p.chips,
-                current_bet=p.current_bet,
+                chips=Chips.of(p.chips_amount),
+                current_bet=Chips.of(p.current_bet_amount),
                 folded=p.folded,
                 is_all_in=p.is_all_in,
                 hole_cards=p.hole_cards if show_cards else None,
@@ -852,8 +1381,8 @@ class PokerTable(PokerTableInterface):
         return GameState(
             table_id=self._table_id,
             phase=self._phase,
-            pot=self._pot,
-            current_bet=self._current_bet,
+            pot=Chips.of(self._pot),
+            current_bet=Chips.of(self._current_bet),
             community_cards=self._community_cards,
             players=tuple(player_states),
             current_player_id=current_id,
@@ -863,17 +1392,36 @@ class PokerTable(PokerTableInterface):
             ante=self._ante,
             level=self._level,
             status=self.get_table_status(),
-            side_pots=self._compute_pots(),
+            side_pots=self._side_pots(),
             rake_percent=self._rake_percent,
             rake_cap=self._rake_cap,
             rake_min_pot=self._rake_min_pot,
-            action_log=tuple(self._action_log),
+            action_log=self._action_log.view(),
+        )
+
+    # ── ActionResult 生成 ──
+
+    def _build_result(
+        self, events: list[GameEvent], waiting_for: WaitingFor | None
+    ) -> ActionResult:
+        if self._debug_checks:
+            self._check_chip_invariants()
+        state = self._snapshot()
+        delta = None
+        if self._delta_base is not None:
+            delta = diff_states(self._delta_base, state)
+            self._delta_base = state
+        return ActionResult(
+            state=state,
+            events=tuple(events),
+            waiting_for=waiting_for,
+            delta=delta,
         )
 
     # ── WaitingFor 生成 ──
 
     def _build_waiting_for(self) -> WaitingFor | None:
-        if not self._players_to_act:
+        if self._phase == GamePhase.SHOWDOWN or not self._players_to_act:
             return None
         current = self._players[self._current_player_index]
         return WaitingFor(
@@ -884,11 +1432,11 @@ class PokerTable(PokerTableInterface):
 
     def _get_valid_actions(self, player: Player) -> tuple[type, ...]:
         actions: list[type] = [Fold]
-        if player.current_bet == self._current_bet:
+        if player.current_bet_amount == self._current_bet:
             actions.append(Check)
         else:
             actions.append(Call)
-        if self._current_bet.amount == 0:
+        if self._current_bet == 0:
             actions.append(Bet)
         else:
             actions.append(Raise)
@@ -0,0 +1,215 @@
+import math
+import time
+from collections.abc import Callable
+
+from poker_domain.exceptions import PokerError
+from poker_domain.game_state import ActionResult
+from poker_domain.interfaces import PokerTableInterface
+from poker_domain.value_objects.action import Check, Fold
+
+# 1段あたりのスロット数 (2 ** _SLOT_BITS) と段数。
+# tick=0.1秒なら 256 ** 4 tick ≒ 13年先まで予約できる
+_SLOT_BITS = 8
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+_LEVELS = 4
+
+
+class TimerHandle:
+    """`TimerWheel.schedule()` が返す予約。`cancel()` で取り消せる"""
+
+    __slots__ = ("_wheel", "deadline_tick", "callback", "_level", "_slot")
+
+    def __init__(
+        self, wheel: "TimerWheel", deadline_tick: int, callback: Callable[[], None]
+    ) -> None:
+        self._wheel = wheel
+        self.deadline_tick = deadline_tick
+        self.callback = callback
+        self._level = -1  # -1 → どのスロットにも入っていない (発火済み・取り消し済み)
+        self._slot = 0
+
+    @property
+    def active(self) -> bool:
+        return self._level >= 0
+
+    def cancel(self) -> None:
+        self._wheel.cancel(self)
+
+
+class TimerWheel:
+    """多数の期限をまとめて管理する階層型タイマーホイール。
+
+    時間を `tick_seconds` 刻みの tick で数え、256 スロットの輪を4段重ねて持つ。近い期限は
+    下の段に tick 単位で、遠い期限は上の段に粗く入れておき、上の段の区切りを跨いだときに
+    下の段へ振り直す。予約・取り消しはスロット (集合) への追加・削除なので O(1)、
+    `advance()` は経過した tick 数と発火した件数に比例する。
+
+    時刻は `clock` (既定は `time.monotonic`) から取るため、テストでは任意の関数に差し替えられる。
+    スレッドセーフではない。
+    """
+
+    def __init__(
+        self, tick_seconds: float = 0.1, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Args:
+            tick_seconds: 1 tick の長さ (期限の精度)。
+            clock: 現在時刻 (秒) を返す関数。
+        """
+        if tick_seconds <= 0:
+            raise ValueError("tick_seconds は正の値が必要です")
+        self._tick_seconds = tick_seconds
+        self._clock = clock
+        self._origin = clock()
+        self._current_tick = 0
+        self._wheels: list[list[set[TimerHandle]]] = [
+            [set() for _ in range(_SLOTS)] for _ in range(_LEVELS)
+        ]
+        self._count = 0
+
+    def __len__(self) -> int:
+        """予約中のタイマー数"""
+        return self._count
+
+    def schedule(self, delay_seconds: float, callback: Callable[[], None]) -> TimerHandle:
+        """`delay_seconds` 秒後 (tick 単位に切り上げ) に `callback` を呼ぶよう予約する。
+
+        Raises:
+            ValueError: 予約できる範囲 (256 ** 4 tick) を超える場合。
+        """
+        elapsed = self._clock() - self._origin + max(delay_seconds, 0.0)
+        deadline = max(math.ceil(elapsed / self._tick_seconds - 1e-9), self._current_tick + 1)
+        if deadline - self._current_tick >= 1 << (_SLOT_BITS * _LEVELS):
+            raise ValueError("予約できる期限の範囲を超えています")
+        handle = TimerHandle(self, deadline, callback)
+        self._insert(handle)
+        self._count += 1
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> None:
+        """予約を取り消す (発火済み・取り消し済みなら何もしない)"""
+        if handle._level < 0:
+            return
+        self._wheels[handle._level][handle._slot].discard(handle)
+        handle._level = -1
+        self._count -= 1
+
+    def advance(self, now: float | None = None) -> int:
+        """現在時刻までに期限を迎えたタイマーを期限順に発火させる。
+
+        コールバック内で新たに予約・取り消しをしてもよい。コールバックが例外を送出した場合は
+        そこで中断して例外を送出する (残りは次回の `advance()` で発火する)。
+
+        Args:
+            now: 現在時刻 (未指定時は `clock()`)。
+
+        Returns:
+            発火させたタイマーの数。
+        """
+        now = self._clock() if now is None else now
+        target = math.floor((now - self._origin) / self._tick_seconds + 1e-9)
+        fired = 0
+        while self._current_tick < target:
+            if not self._count:
+                self._current_tick = target  # 予約がなければ空の tick を回す必要はない
+                break
+            tick = self._current_tick + 1
+            self._current_tick = tick
+            # 上の段の区切りを跨いだら、その区間のスロットを下の段へ振り直す
+            for level in range(_LEVELS - 1, 0, -1):
+                if tick & ((1 << (_SLOT_BITS * level)) - 1) == 0:
+                    slot = self._wheels[level][(tick >> (_SLOT_BITS * level)) & _SLOT_MASK]
+                    moving = list(slot)
+                    slot.clear()
+                    for handle in moving:
+                        self._insert(handle)
+            due = self._wheels[0][tick & _SLOT_MASK]
+            while due:
+                handle = due.pop()
+                handle._level = -1
+                self._count -= 1
+                fired += 1
+                handle.callback()
+        return fired
+
+    def _insert(self, handle: TimerHandle) -> None:
+        deadline = handle.deadline_tick
+        current = self._current_tick
+        level = 0
+        # 期限と現在が同じ上位区間に入る最も下の段に置く
+        while level < _LEVELS - 1:
+            shift = _SLOT_BITS * (level + 1)
+            if deadline >> shift == current >> shift:
+                break
+            level += 1
+        slot = (deadline >> (_SLOT_BITS * level)) & _SLOT_MASK
+        handle._level = level
+        handle._slot = slot
+        self._wheels[level][slot].add(handle)
+
+
+def default_timeout_action(valid_actions: tuple[type, ...]) -> Check | Fold:
+    """持ち時間切れのときの既定アクション: チェックできればチェック、できなければフォールド"""
+    return Check() if Check in valid_actions else Fold()
+
+
+class ActionTimeouts:
+    """`WaitingFor.timeout_seconds` に基づく手番の持ち時間を、多数のテーブルについて管理する。
+
+    `track()` に `start_game()` / `action()` の結果を渡すと、そのテーブルの手番の期限を
+    (前の期限を取り消して) 予約し直す。期限を過ぎると既定アクション (チェックできれば
+    チェック、できなければフォールド) を `table.action()` で適用し、その結果の次の手番も
+    続けて追跡する。期限は1つの `TimerWheel` で持つため、テーブルごとのタイマーは不要。
+
+    期限切れ以外の経路でアクションを適用した場合は、必ずその結果を `track()` に渡すこと。
+    """
+
+    def __init__(
+        self,
+        wheel: TimerWheel | None = None,
+        *,
+        on_timeout: Callable[[str, ActionResult], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            wheel: 期限を持つタイマーホイール (未指定時は既定の設定で作る)。
+            on_timeout: 期限切れで既定アクションを適用するたびに `(table_id, 結果)` で呼ぶ関数。
+        """
+        self._wheel = wheel if wheel is not None else TimerWheel()
+        self._on_timeout = on_timeout
+        self._timers: dict[str, TimerHandle] = {}
+
+    def __len__(self) -> int:
+        """期限を追跡中のテーブル数"""
+        return len(self._timers)
+
+    def track(self, table_id: str, table: PokerTableInterface, result: ActionResult) -> None:
+        """結果の `waiting_for` に合わせて期限を予約し直す (`None` なら追跡をやめる)"""
+        self.cancel(table_id)
+        waiting = result.waiting_for
+        if waiting is None:
+            return
+        player_id, valid_actions = waiting.player_id, waiting.valid_actions
+
+        def expire() -> None:
+            del self._timers[table_id]
+            try:
+                timed_out = table.action(player_id, default_timeout_action(valid_actions))
+            except PokerError:
+                return  # 既に手番が進んでいた (track されていないアクションがあった)
+            self.track(table_id, table, timed_out)
+            if self._on_timeout is not None:
+                self._on_timeout(table_id, timed_out)
+
+        self._timers[table_id] = self._wheel.schedule(waiting.timeout_seconds, expire)
+
+    def cancel(self, table_id: str) -> None:
+        """テーブルの期限の追跡をやめる"""
+        handle = self._timers.pop(table_id, None)
+        if handle is not None:
+            handle.cancel()
+
+    def advance(self, now: float | None = None) -> int:
+        """期限を過ぎた手番に既定アクションを適用する (定期的に呼ぶ)。適用した件数を返す"""
+        return self._wheel.advance(now)
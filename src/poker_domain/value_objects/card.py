@@ -32,3 +32,42 @@ class Card:
 
     def __str__(self) -> str:
         return f"{self.rank.name} of {self.suit.name}"
+
+    def to_index(self) -> int:
+        """0〜51 のカード番号 (`Suit` の定義順 * 13 + (ランク - 2))。バイナリ形式などで使う"""
+        return _SUIT_OFFSETS[self.suit] + self.rank.value - 2
+
+    @staticmethod
+    def from_index(index: int) -> "Card":
+        """`to_index()` の逆変換"""
+        return _CARDS_BY_INDEX[index]
+
+    @property
+    def code(self) -> str:
+        """ハンド履歴で使う2文字表記 (例: `"Ah"`, `"Td"`, `"2c"`)"""
+        return _RANK_CODES[self.rank] + _SUIT_CODES[self.suit]
+
+    @staticmethod
+    def from_code(code: str) -> "Card":
+        """`code` の逆変換
+
+        Raises:
+            ValueError: 2文字表記として解釈できない場合。
+        """
+        card = _CARDS_BY_CODE.get(code)
+        if card is None:
+            raise ValueError(f"カード表記 {code!r} を解釈できません")
+        return card
+
+
+_CARDS_BY_INDEX: tuple[Card, ...] = tuple(
+    Card(suit=suit, rank=rank) for suit in Suit for rank in Rank
+)
+_SUIT_OFFSETS: dict[Suit, int] = {suit: 13 * i for i, suit in enumerate(Suit)}
+_RANK_CODES: dict[Rank, str] = {
+    rank: "TJQKA"[rank.value - 10] if rank.value >= 10 else str(rank.value) for rank in Rank
+}
+_SUIT_CODES: dict[Suit, str] = {
+    Suit.HEARTS: "h", Suit.DIAMONDS: "d", Suit.CLUBS: "c", Suit.SPADES: "s",
+}
+_CARDS_BY_CODE: dict[str, Card] = {card.code: card for card in _CARDS_BY_INDEX}
@@ -1,16 +1,29 @@
 from dataclasses import dataclass
+from typing import Any
+
+# Chips.of() で使い回す小さい額のインスタンス数 (0 〜 _CACHE_SIZE - 1)
+_CACHE_SIZE = 4096
 
 
 @dataclass(frozen=True)
 class Chips:
+    __slots__ = ("amount",)
+
     amount: int
 
     def __post_init__(self) -> None:
         if self.amount < 0:
             raise ValueError("チップは負にはなれません")
 
+    @classmethod
+    def of(cls, amount: int) -> "Chips":
+        """`Chips(amount)` と等価。小さい額はキャッシュ済みのインスタンスを返す"""
+        if 0 <= amount < _CACHE_SIZE:
+            return _SMALL_CHIPS[amount]
+        return cls(amount)
+
     def __add__(self, other: "Chips") -> "Chips":
-        return Chips(self.amount + other.amount)
+        return Chips.of(self.amount + other.amount)
 
     def __sub__(self, other: "Chips") -> "Chips":
         return Chips(self.amount - other.amount)  # __post_init__ で負チェック
@@ -37,3 +50,10 @@ class Chips:
 
     def __repr__(self) -> str:
         return f"Chips({self.amount})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # frozen + __slots__ のため、pickle/copy はコンストラクタ経由で復元する
+        return (Chips.of, (self.amount,))
+
+
+_SMALL_CHIPS: tuple[Chips, ...] = tuple(Chips(i) for i in range(_CACHE_SIZE))
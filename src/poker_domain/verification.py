@@ -0,0 +1,138 @@
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from poker_domain.action_log import entry_to_action
+from poker_domain.exceptions import PokerError, ReplayError
+from poker_domain.game_state import ShowdownEvent
+from poker_domain.history import HandRecord
+from poker_domain.table import PokerTable
+
+# リプレイ結果と突き合わせる HandRecord の項目
+_FIELDS = ("payouts", "rake", "pots")
+
+
+@dataclass(frozen=True)
+class HandDivergence:
+    """記録したハンドをリプレイした結果が記録と食い違った1項目分"""
+    table_id: str
+    hand_number: int
+    started_at: float
+    field: str          # "payouts" | "rake" | "pots" | "replay" (再生できなかった)
+    recorded: Any
+    replayed: Any       # "replay" の場合は再生できなかった理由
+
+
+def _replay_showdown(record: HandRecord, options: dict[str, Any]) -> ShowdownEvent:
+    """記録どおりにハンドを進め、決着時の `ShowdownEvent` を返す"""
+    if record.seed is None:
+        raise ReplayError("シードが記録されていないハンドは再現できません")
+    actions = record.actions
+    try:
+        table = PokerTable.from_hand_setup(record.to_hand_setup(), **options)
+        result = table.start_game(seed=record.seed)
+        if actions:
+            # 最後のアクション以外はイベントを作らずに早送りする
+            table.fast_forward(actions[:-1])
+            last = actions[-1]
+            result = table.action(last.player_id, entry_to_action(last))
+    except (PokerError, ValueError) as e:
+        raise ReplayError(f"履歴どおりに進められません: {e}") from e
+    for event in result.events:
+        if isinstance(event, ShowdownEvent):
+            return event
+    raise ReplayError("全アクションを適用してもハンドが決着しません")
+
+
+def verify_hand_record(record: HandRecord, **options: Any) -> list[HandDivergence]:
+    """ハンド履歴1件を `PokerTable` でリプレイし、獲得額・レーキ・ポットを記録と突き合わせる。
+
+    Args:
+        record: 検証するハンド (`HandSetup` を渡して記録したシード付きのもの)。
+        **options: `PokerTable` のその他のコンストラクタ引数 (`debug_checks` など)。
+
+    Returns:
+        食い違った項目ごとの `HandDivergence` (一致すれば空)。再生できなかった場合は
+        `field="replay"` の1件。
+    """
+    try:
+        showdown = _replay_showdown(record, options)
+    except ReplayError as e:
+        return [HandDivergence(
+            record.table_id, record.hand_number, record.started_at, "replay", None, str(e)
+        )]
+    recorded = {"payouts": dict(record.payouts), "rake": record.rake, "pots": record.pots}
+    replayed = {
+        "payouts": dict(showdown.payouts),
+        "rake": showdown.rake,
+        "pots": tuple(pot.amount.amount for pot in showdown.pots or ()),
+    }
+    return [
+        HandDivergence(
+            record.table_id, record.hand_number, record.started_at,
+            field, recorded[field], replayed[field],
+        )
+        for field in _FIELDS
+        if recorded[field] != replayed[field]
+    ]
+
+
+def _verify_batch(records: list[HandRecord], options: dict[str, Any]) -> list[HandDivergence]:
+    divergences: list[HandDivergence] = []
+    for record in records:
+        divergences.extend(verify_hand_record(record, **options))
+    return divergences
+
+
+def verify_hand_records(
+    records: Iterable[HandRecord],
+    *,
+    workers: int | None = None,
+    batch_size: int = 500,
+    mp_context: BaseContext | None = None,
+    **options: Any,
+) -> Iterator[HandDivergence]:
+    """ハンド履歴をワーカープロセスでまとめてリプレイし、記録と食い違った項目を返す。
+
+    `records` を `batch_size` 件ずつに区切ってプロセスプールに配る。先読みするのは
+    ワーカー数の数倍のバッチだけなので、`read_hand_records()` と組み合わせれば巨大な
+    履歴でもメモリ使用量は一定のまま流し読みで検証できる。結果は入力順に返す。
+
+    Args:
+        records: 検証するハンド履歴 (`read_hand_records()` の戻り値など)。
+        workers: ワーカープロセス数。未指定時は CPU コア数、0 ならこのプロセス内で順に実行する。
+        batch_size: 1回にワーカーへ渡すハンド数。
+        mp_context: `multiprocessing` のコンテキスト (未指定時は既定の開始方式)。
+        **options: `PokerTable` のその他のコンストラクタ引数。
+
+    Yields:
+        食い違いごとの `HandDivergence` (シードのないハンドは `field="replay"` になる)。
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size は1以上が必要です")
+    workers = workers if workers is not None else os.cpu_count() or 1
+    iterator = iter(records)
+    batches = iter(lambda: list(islice(iterator, batch_size)), [])
+
+    if workers == 0:
+        for batch in batches:
+            yield from _verify_batch(batch, options)
+        return
+
+    with ProcessPoolExecutor(workers, mp_context=mp_context) as pool:
+        pending: deque[Future[list[HandDivergence]]] = deque()
+        try:
+            for batch in batches:
+                pending.append(pool.submit(_verify_batch, batch, options))
+                if len(pending) >= workers * 4:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,405 @@
+from collections.abc import Callable
+from typing import Any
+
+from poker_domain.action_log import ACTION_CODES, ACTION_NAMES, PHASE_CODES, PHASES, shared_entry
+from poker_domain.binary import BinaryReader, BinaryWriter
+from poker_domain.game_state import (
+    ActionLogEntry,
+    ActionResult,
+    CommunityDealtEvent,
+    EventType,
+    GameEvent,
+    GameStartedEvent,
+    GameState,
+    HandDealtEvent,
+    LevelUpEvent,
+    PlayerActedEvent,
+    PlayerJoinedEvent,
+    PlayerLeftEvent,
+    PlayerState,
+    PlayerStateDelta,
+    Pot,
+    RoundEndedEvent,
+    ShowdownEvent,
+    StateDelta,
+    TableClosedEvent,
+    TableStatus,
+    TurnChangedEvent,
+    WaitingFor,
+)
+from poker_domain.value_objects.action import Action, Bet, Call, Check, Fold, Raise
+from poker_domain.value_objects.chips import Chips
+from poker_domain.value_objects.community_cards import CommunityCards
+from poker_domain.value_objects.hand import Hand, HandRank
+from poker_domain.value_objects.hole_cards import HoleCards
+
+# プロセス間で送る値 (`GameState` / `ActionResult` / `GameEvent` / `Action` など) のバイナリ形式。
+# `BinaryWriter` / `BinaryReader` の可変長整数・長さ付き文字列・カード番号で書き、pickle と違って
+# 読み込み側で任意のオブジェクトを作らない。`GameState` と `PlayerState` はフィールドごとの書き方を
+# 表に持ち、`StateDelta` の変化したフィールドも同じ表で (フィールド番号, 値) として書く
+
+_STATUSES: tuple[TableStatus, ...] = tuple(TableStatus)
+_STATUS_CODES: dict[TableStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
+_EVENT_TYPES: tuple[EventType, ...] = tuple(EventType)
+_EVENT_CODES: dict[EventType, int] = {
+    event_type: code for code, event_type in enumerate(_EVENT_TYPES)
+}
+# アクションの種類 (コードは ActionLogEntry.action と同じ)
+_ACTION_TYPES: tuple[type, ...] = (Fold, Check, Call, Bet, Raise)
+_ACTION_TYPE_CODES: dict[type, int] = {cls: code for code, cls in enumerate(_ACTION_TYPES)}
+
+_Writer = Callable[[BinaryWriter, Any], None]
+_Reader = Callable[[BinaryReader], Any]
+
+
+# ─── 小さな値 ───
+
+def _write_chips(w: BinaryWriter, chips: Chips) -> None:
+    w.uint(chips.amount)
+
+
+def _read_chips(r: BinaryReader) -> Chips:
+    return Chips.of(r.uint())
+
+
+def _write_bool(w: BinaryWriter, value: bool) -> None:
+    w.uint(value)
+
+
+def _read_bool(r: BinaryReader) -> bool:
+    return bool(r.uint())
+
+
+def write_optional_string(w: BinaryWriter, value: str | None) -> None:
+    w.uint(value is not None)
+    if value is not None:
+        w.string(value)
+
+
+def read_optional_string(r: BinaryReader) -> str | None:
+    return r.string() if r.uint() else None
+
+
+def _write_pots(w: BinaryWriter, pots: tuple[Pot, ...]) -> None:
+    w.uint(len(pots))
+    for pot in pots:
+        w.uint(pot.amount.amount)
+        w.uint(len(pot.eligible_player_ids))
+        for player_id in pot.eligible_player_ids:
+            w.string(player_id)
+
+
+def _read_pots(r: BinaryReader) -> tuple[Pot, ...]:
+    pots = []
+    for _ in range(r.uint()):
+        amount = Chips.of(r.uint())
+        pots.append(Pot(amount, tuple(r.string() for _ in range(r.uint()))))
+    return tuple(pots)
+
+
+def _write_entries(w: BinaryWriter, entries: Any) -> None:
+    w.uint(len(entries))
+    for entry in entries:
+        w.string(entry.player_id)
+        w.uint(PHASE_CODES[entry.phase] << 4 | ACTION_CODES[entry.action])
+        w.optional_uint(entry.amount)
+
+
+def _read_entries(r: BinaryReader) -> tuple[ActionLogEntry, ...]:
+    entries = []
+    for _ in range(r.uint()):
+        player_id = r.string()
+        code = r.uint()
+        entries.append(
+            shared_entry(player_id, PHASES[code >> 4], ACTION_NAMES[code & 0xF], r.optional_uint())
+        )
+    return tuple(entries)
+
+
+def _write_hole_cards(w: BinaryWriter, cards: HoleCards | None) -> None:
+    w.uint(cards is not None)
+    if cards is not None:
+        w.cards(cards)
+
+
+def _read_hole_cards(r: BinaryReader) -> HoleCards | None:
+    return HoleCards(r.cards()) if r.uint() else None
+
+
+# ─── スナップショット ───
+
+# PlayerState の player_id 以外のフィールドの書き方 (フィールド順)
+_PLAYER_FIELDS: tuple[tuple[str, _Writer, _Reader], ...] = (
+    ("chips", _write_chips, _read_chips),
+    ("current_bet", _write_chips, _read_chips),
+    ("folded", _write_bool, _read_bool),
+    ("is_all_in", _write_bool, _read_bool),
+    ("hole_cards", _write_hole_cards, _read_hole_cards),
+)
+_PLAYER_FIELD_CODES = {name: code for code, (name, _, _) in enumerate(_PLAYER_FIELDS)}
+
+
+def _write_players(w: BinaryWriter, players: tuple[PlayerState, ...]) -> None:
+    w.uint(len(players))
+    for player in players:
+        w.string(player.player_id)
+        for name, write, _ in _PLAYER_FIELDS:
+            write(w, getattr(player, name))
+
+
+def _read_players(r: BinaryReader) -> tuple[PlayerState, ...]:
+    return tuple(
+        PlayerState(r.string(), *(read(r) for _, _, read in _PLAYER_FIELDS))
+        for _ in range(r.uint())
+    )
+
+
+# GameState のフィールドの書き方 (フィールド順)
+_STATE_FIELDS: tuple[tuple[str, _Writer, _Reader], ...] = (
+    ("table_id", BinaryWriter.string, BinaryReader.string),
+    ("phase", lambda w, phase: w.uint(PHASE_CODES[phase]), lambda r: PHASES[r.uint()]),
+    ("pot", _write_chips, _read_chips),
+    ("current_bet", _write_chips, _read_chips),
+    ("community_cards", BinaryWriter.cards, lambda r: CommunityCards(r.cards())),
+    ("players", _write_players, _read_players),
+    ("current_player_id", write_optional_string, read_optional_string),
+    ("dealer_id", BinaryWriter.string, BinaryReader.string),
+    ("small_blind", _write_chips, _read_chips),
+    ("big_blind", _write_chips, _read_chips),
+    ("ante", _write_chips, _read_chips),
+    ("level", BinaryWriter.uint, BinaryReader.uint),
+    ("status", lambda w, status: w.uint(_STATUS_CODES[status]), lambda r: _STATUSES[r.uint()]),
+    ("side_pots", _write_pots, _read_pots),
+    ("rake_percent", BinaryWriter.float64, BinaryReader.float64),
+    ("rake_cap", BinaryWriter.optional_uint, BinaryReader.optional_uint),
+    ("rake_min_pot", BinaryWriter.optional_uint, BinaryReader.optional_uint),
+    ("action_log", _write_entries, _read_entries),
+)
+_STATE_FIELD_CODES = {name: code for code, (name, _, _) in enumerate(_STATE_FIELDS)}
+
+
+def write_state(w: BinaryWriter, state: GameState) -> None:
+    for name, write, _ in _STATE_FIELDS:
+        write(w, getattr(state, name))
+
+
+def read_state(r: BinaryReader) -> GameState:
+    return GameState(*(read(r) for _, _, read in _STATE_FIELDS))
+
+
+def write_delta(w: BinaryWriter, delta: StateDelta) -> None:
+    """変化したフィールドを (フィールド番号, 値) の列として書く"""
+    _write_changes(w, delta.changes, _STATE_FIELDS, _STATE_FIELD_CODES)
+    w.uint(len(delta.players))
+    for player in delta.players:
+        w.string(player.player_id)
+        _write_changes(w, player.changes, _PLAYER_FIELDS, _PLAYER_FIELD_CODES)
+    w.cards(delta.community_cards)
+    _write_entries(w, delta.action_log)
+
+
+def read_delta(r: BinaryReader) -> StateDelta:
+    changes = _read_changes(r, _STATE_FIELDS)
+    players = tuple(
+        PlayerStateDelta(player_id=r.string(), changes=_read_changes(r, _PLAYER_FIELDS))
+        for _ in range(r.uint())
+    )
+    return StateDelta(
+        changes=changes, players=players, community_cards=r.cards(), action_log=_read_entries(r)
+    )
+
+
+def _write_changes(
+    w: BinaryWriter,
+    changes: dict[str, Any],
+    fields: tuple[tuple[str, _Writer, _Reader], ...],
+    codes: dict[str, int],
+) -> None:
+    w.uint(len(changes))
+    for name, value in changes.items():
+        code = codes[name]
+        w.uint(code)
+        fields[code][1](w, value)
+
+
+def _read_changes(
+    r: BinaryReader, fields: tuple[tuple[str, _Writer, _Reader], ...]
+) -> dict[str, Any]:
+    changes = {}
+    for _ in range(r.uint()):
+        name, _, read = fields[r.uint()]
+        changes[name] = read(r)
+    return changes
+
+
+# ─── イベント ───
+
+def write_event(w: BinaryWriter, event: GameEvent) -> None:
+    w.uint(_EVENT_CODES[event.event_type])
+    if isinstance(event, (PlayerJoinedEvent, PlayerLeftEvent, PlayerActedEvent, TurnChangedEvent)):
+        w.string(event.player_id)
+    elif isinstance(event, CommunityDealtEvent):
+        w.cards(event.community_cards)
+    elif isinstance(event, LevelUpEvent):
+        for value in (event.level, event.small_blind, event.big_blind, event.ante):
+            w.uint(value)
+    elif isinstance(event, ShowdownEvent):
+        write_optional_string(w, event.winner_id)
+        w.uint(len(event.hands))
+        for player_id, hand in event.hands.items():
+            w.string(player_id)
+            w.cards(hand.cards)
+            w.uint(hand.rank)
+            w.uint(len(hand.tiebreakers))
+            for value in hand.tiebreakers:
+                w.uint(value)
+        w.uint(len(event.payouts))
+        for player_id, amount in event.payouts.items():
+            w.string(player_id)
+            w.uint(amount)
+        w.uint(event.rake)
+        w.uint(event.pots is not None)
+        if event.pots is not None:
+            _write_pots(w, event.pots)
+
+
+def read_event(r: BinaryReader) -> GameEvent:
+    event_type = _EVENT_TYPES[r.uint()]
+    if event_type == EventType.PLAYER_JOINED:
+        return PlayerJoinedEvent(r.string())
+    if event_type == EventType.PLAYER_LEFT:
+        return PlayerLeftEvent(r.string())
+    if event_type == EventType.PLAYER_ACTED:
+        return PlayerActedEvent(r.string())
+    if event_type == EventType.TURN_CHANGED:
+        return TurnChangedEvent(r.string())
+    if event_type == EventType.COMMUNITY_DEALT:
+        return CommunityDealtEvent(CommunityCards(r.cards()))
+    if event_type == EventType.LEVEL_UP:
+        return LevelUpEvent(r.uint(), r.uint(), r.uint(), r.uint())
+    if event_type == EventType.SHOWDOWN:
+        winner_id = read_optional_string(r)
+        hands = {}
+        for _ in range(r.uint()):
+            player_id = r.string()
+            cards = r.cards()
+            rank = HandRank(r.uint())
+            hands[player_id] = Hand(cards, rank, tuple(r.uint() for _ in range(r.uint())))
+        payouts = {r.string(): r.uint() for _ in range(r.uint())}
+        rake = r.uint()
+        pots = _read_pots(r) if r.uint() else None
+        return ShowdownEvent(
+            winner_id=winner_id, hands=hands, payouts=payouts, rake=rake, pots=pots
+        )
+    if event_type == EventType.GAME_STARTED:
+        return GameStartedEvent()
+    if event_type == EventType.HAND_DEALT:
+        return HandDealtEvent()
+    if event_type == EventType.ROUND_ENDED:
+        return RoundEndedEvent()
+    return TableClosedEvent()
+
+
+# ─── アクションと結果 ───
+
+def write_action(w: BinaryWriter, action: Action) -> None:
+    w.uint(_ACTION_TYPE_CODES[type(action)])
+    if isinstance(action, (Bet, Raise)):
+        w.uint(action.amount)
+
+
+def read_action(r: BinaryReader) -> Action:
+    cls = _ACTION_TYPES[r.uint()]
+    if cls is Bet or cls is Raise:
+        action: Action = cls(r.uint())
+        return action
+    action = cls()
+    return action
+
+
+def write_result(w: BinaryWriter, result: ActionResult) -> None:
+    write_state(w, result.state)
+    w.uint(len(result.events))
+    for event in result.events:
+        write_event(w, event)
+    waiting_for = result.waiting_for
+    w.uint(waiting_for is not None)
+    if waiting_for is not None:
+        w.string(waiting_for.player_id)
+        # 合法手は種類ごとのビットで書く
+        w.uint(sum(1 << _ACTION_TYPE_CODES[cls] for cls in waiting_for.valid_actions))
+        w.uint(waiting_for.timeout_seconds)
+    w.uint(result.delta is not None)
+    if result.delta is not None:
+        write_delta(w, result.delta)
+
+
+def read_result(r: BinaryReader) -> ActionResult:
+    state = read_state(r)
+    events = tuple(read_event(r) for _ in range(r.uint()))
+    waiting_for = None
+    if r.uint():
+        player_id = r.string()
+        mask = r.uint()
+        valid_actions = tuple(cls for code, cls in enumerate(_ACTION_TYPES) if mask >> code & 1)
+        waiting_for = WaitingFor(player_id, valid_actions, r.uint())
+    delta = read_delta(r) if r.uint() else None
+    return ActionResult(state=state, events=events, waiting_for=waiting_for, delta=delta)
+
+
+def write_status(w: BinaryWriter, status: TableStatus) -> None:
+    w.uint(_STATUS_CODES[status])
+
+
+def read_status(r: BinaryReader) -> TableStatus:
+    return _STATUSES[r.uint()]
+
+
+# ─── 設定値 ───
+
+# 型タグ: None / False / True / 整数 / 浮動小数点数 / 文字列 / list / tuple
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _LIST, _TUPLE = range(8)
+
+
+def write_value(w: BinaryWriter, value: Any) -> None:
+    """テーブルの設定などに使う値を型タグ付きで書く。
+
+    Raises:
+        TypeError: None / bool / int / float / str とそれらの list / tuple 以外の値の場合。
+    """
+    if value is None:
+        w.uint(_NONE)
+    elif value is True or value is False:
+        w.uint(_TRUE if value else _FALSE)
+    elif isinstance(value, int):
+        w.uint(_INT)
+        w.sint(value)
+    elif isinstance(value, float):
+        w.uint(_FLOAT)
+        w.float64(value)
+    elif isinstance(value, str):
+        w.uint(_STR)
+        w.string(value)
+    elif isinstance(value, (list, tuple)):
+        w.uint(_LIST if isinstance(value, list) else _TUPLE)
+        w.uint(len(value))
+        for item in value:
+            write_value(w, item)
+    else:
+        raise TypeError(f"バイナリ形式で送れない値です: {value!r}")
+
+
+def read_value(r: BinaryReader) -> Any:
+    tag = r.uint()
+    if tag == _INT:
+        return r.sint()
+    if tag == _FLOAT:
+        return r.float64()
+    if tag == _STR:
+        return r.string()
+    if tag in (_LIST, _TUPLE):
+        items = [read_value(r) for _ in range(r.uint())]
+        return items if tag == _LIST else tuple(items)
+    if tag > _TUPLE:
+        raise ValueError(f"未知の型タグです: {tag}")
+    return (None, False, True)[tag]
@@ -0,0 +1,81 @@
+import pickle
+
+from poker_domain.action_log import ActionLog, ActionLogView
+from poker_domain.game_state import ActionLogEntry, GamePhase
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Bet, Call, Check
+from poker_domain.value_objects.chips import Chips
+
+
+def test_view_behaves_like_tuple_of_entries():
+    log = ActionLog(("a", "b"))
+    log.append(1, GamePhase.PRE_FLOP, "call", None)
+    log.append(0, GamePhase.FLOP, "bet", 40)
+    view = log.view()
+
+    expected = (
+        ActionLogEntry(player_id="b", phase=GamePhase.PRE_FLOP, action="call", amount=None),
+        ActionLogEntry(player_id="a", phase=GamePhase.FLOP, action="bet", amount=40),
+    )
+    assert len(view) == 2
+    assert view == expected
+    assert expected == view
+    assert view[-1] == expected[1]
+    assert view[1:] == expected[1:]
+    assert list(view) == list(expected)
+    assert hash(view) == hash(expected)
+    assert repr(view) == repr(expected)
+    assert view + (expected[0],) == expected + (expected[0],)
+
+
+def test_earlier_views_are_not_affected_by_later_appends():
+    log = ActionLog(("a",))
+    log.append(0, GamePhase.PRE_FLOP, "check", None)
+    first = log.view()
+    log.append(0, GamePhase.FLOP, "check", None)
+    second = log.view()
+
+    assert len(first) == 1
+    assert len(second) == 2
+    assert second.extends(first)
+    assert not first.extends(second)
+
+
+def test_view_pickles_only_its_own_range():
+    log = ActionLog(("a",))
+    log.append(0, GamePhase.PRE_FLOP, "bet", 100)
+    view = log.view()
+    log.append(0, GamePhase.PRE_FLOP, "fold", None)
+
+    restored = pickle.loads(pickle.dumps(view))
+    assert isinstance(restored, ActionLogView)
+    assert restored == view
+    assert len(restored) == 1
+
+
+def test_snapshots_share_action_log_storage_within_a_hand():
+    table = PokerTable(table_id="t1", max_players=3, small_blind=10, big_blind=20)
+    for pid in ("a", "b", "c"):
+        table.add_player(pid, Chips(1000))
+    table.start_game()
+
+    first = table.action("a", Call()).state
+    second = table.action("b", Call()).state
+    table.action("c", Check())
+    third = table.action("b", Bet(amount=20)).state
+
+    assert [e.action for e in first.action_log] == ["call"]
+    assert [e.action for e in second.action_log] == ["call", "call"]
+    assert third.action_log[-1] == ActionLogEntry(
+        player_id="b", phase=GamePhase.FLOP, action="bet", amount=20,
+    )
+    assert third.action_log.extends(second.action_log)
+
+    # 次のハンドでは新しい記憶領域に切り替わり、前のハンドのスナップショットは変化しない
+    for pid in ("c", "a"):
+        table.action(pid, Call())
+    while table.get_state().phase != GamePhase.SHOWDOWN:
+        table.action(table.get_state().current_player_id, Check())
+    table.start_game()
+    assert len(third.action_log) == 4
+    assert table.get_state().action_log == ()
@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from poker_domain.async_table import AsyncPokerTable, AsyncTableManager
+from poker_domain.exceptions import InvalidPlayerError, TableNotFoundError
+from poker_domain.game_state import EventType, TableStatus
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Call, Check
+from poker_domain.value_objects.chips import Chips
+
+
+def test_commands_are_serialized_and_events_streamed():
+    async def scenario():
+        table = AsyncPokerTable(PokerTable("t1", small_blind=5, big_blind=10))
+        stream = table.events()
+        await asyncio.gather(
+            table.add_player("a", Chips(100)),
+            table.add_player("b", Chips(100)),
+        )
+        result = await table.start_game()
+        assert result.waiting_for.player_id == "a"
+
+        # 同時に投げても投入順に1件ずつ適用される
+        first, second = await asyncio.gather(
+            table.action("a", Call()), table.action("b", Check()),
+        )
+        assert first.waiting_for.player_id == "b"
+        assert second.state.community_cards
+
+        with pytest.raises(InvalidPlayerError):
+            await table.action("zzz", Check())
+
+        await table.close()
+        return [event.event_type async for event in stream]
+
+    event_types = asyncio.run(scenario())
+    assert event_types[:3] == [
+        EventType.PLAYER_JOINED, EventType.PLAYER_JOINED, EventType.GAME_STARTED,
+    ]
+    assert EventType.COMMUNITY_DEALT in event_types
+
+
+def test_bounded_queues_apply_backpressure():
+    async def scenario():
+        table = AsyncPokerTable(PokerTable("t1"), max_pending=2)
+        stream = table.events(maxsize=1)
+        tasks = [
+            asyncio.ensure_future(table.add_player(f"p{i}", Chips(100))) for i in range(4)
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # 読み手がいないので、最初のイベントを積んだところで処理が止まる
+        assert len(table._pending) <= 2
+        assert not all(task.done() for task in tasks)
+
+        received = [await stream.__anext__() for _ in range(4)]
+        await asyncio.gather(*tasks)
+        stream.close()
+        return [event.payload["player_id"] for event in received]
+
+    assert asyncio.run(scenario()) == ["p0", "p1", "p2", "p3"]
+
+
+def test_async_manager_keeps_lobby_indexes_current():
+    async def scenario():
+        manager = AsyncTableManager()
+        tables = [manager.create_table(f"t{i}", small_blind=5, big_blind=10) for i in range(3)]
+        await asyncio.gather(*(
+            table.add_player(player_id, Chips(100))
+            for table in tables[:2]
+            for player_id in ("a", "b")
+        ))
+        await tables[0].start_game()
+
+        assert sorted(manager.manager.tables_of_player("a")) == ["t0", "t1"]
+        assert manager.manager.tables_by_status(TableStatus.PLAYING) == ["t0"]
+
+        await manager.remove_table("t2")
+        with pytest.raises(TableNotFoundError):
+            manager.get_table("t2")
+        assert len(manager) == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,159 @@
+import io
+import random
+from dataclasses import replace
+
+import pytest
+
+from poker_domain.agents import RandomAgent
+from poker_domain.columnar import ColumnarHandStore
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.game_state import GamePhase
+from poker_domain.history import HandRecorder
+from poker_domain.replay import replay_hand
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Fold
+from poker_domain.value_objects.chips import Chips
+
+
+def _records(tables=3, hands=20):
+    """チップ量の異なる4人のテーブルでハンドを進め、決着したハンドの記録を集める"""
+    agent = RandomAgent(random.Random(7))
+    recorder = HandRecorder(clock=lambda: 1234.5)
+    records = []
+    for i in range(tables):
+        table = PokerTable(
+            table_id=f"t{i}", max_players=4, small_blind=5, big_blind=10, ante=2,
+            rake_percent=0.05, rake_cap=30, seed=40 + i,
+        )
+        for j in range(4):
+            table.add_player(f"p{j}", Chips(200 + 150 * j))
+        for _ in range(hands):
+            if any(p.chips.amount == 0 for p in table.get_state().players):
+                break
+            result = table.start_game()
+            recorder.record(table.table_id, result, setup=table.last_hand_setup)
+            while result.waiting_for is not None:
+                waiting = result.waiting_for
+                try:
+                    result = table.action(waiting.player_id, agent.act(result.state, waiting))
+                except InvalidActionError:
+                    result = table.action(waiting.player_id, Fold())
+                record = recorder.record(table.table_id, result)
+                if record is not None:
+                    records.append(record)
+    return records
+
+
+def _same(stored, record):
+    assert dict(stored.payouts) == dict(record.payouts)
+    assert stored == type(record)(**{**record.__dict__, "payouts": stored.payouts})
+
+
+def test_round_trip_and_reopen(tmp_path):
+    records = _records()
+    with ColumnarHandStore(tmp_path, max_seats=6, batch_size=16) as store:
+        indices = [store.append(record) for record in records]
+    assert indices == list(range(len(records)))
+
+    store = ColumnarHandStore(tmp_path)
+    assert len(store) == len(records)
+    assert store.max_seats == 6
+    for stored, record in zip(store.records(range(len(store))), records):
+        _same(stored, record)
+    assert sum(store.column("rake")) == sum(r.rake for r in records)
+    with pytest.raises(ValueError):
+        ColumnarHandStore(tmp_path, max_seats=9)
+
+
+def test_queries_match_a_full_scan(tmp_path):
+    records = _records()
+    store = ColumnarHandStore(tmp_path)
+    store.extend(records)
+    store.flush()
+
+    def scan(predicate):
+        return [i for i, r in enumerate(records) if any(predicate(e) for e in r.actions)]
+
+    raises = store.hands_with_action(phase=GamePhase.PRE_FLOP, action="raise")
+    assert list(raises) == scan(lambda e: e.phase == GamePhase.PRE_FLOP and e.action == "raise")
+    for player_id in ("p0", "p3"):
+        assert list(store.hands_with_action(player_id=player_id)) == scan(
+            lambda e, p=player_id: e.player_id == p
+        )
+        assert list(store.hands_with_action(player_id=player_id, action="fold")) == scan(
+            lambda e, p=player_id: e.player_id == p and e.action == "fold"
+        )
+    assert list(store.hands_with_player("p1")) == list(range(len(records)))
+    assert list(store.hands_with_player("nobody")) == []
+
+    # オールイン: 各アクションの直前の状態をリプレイで求め、残りのチップを出し切ったかを調べる
+    def all_in(record, index):
+        entry = record.actions[index]
+        state = replay_hand(record.to_hand_setup(), record.actions[:index]).get_state()
+        me = next(p for p in state.players if p.player_id == entry.player_id)
+        if entry.action == "call":
+            return me.chips.amount <= state.current_bet.amount - me.current_bet.amount
+        if entry.action in ("bet", "raise"):
+            return entry.amount - me.current_bet.amount == me.chips.amount
+        return False
+
+    expected = [
+        i for i, r in enumerate(records)
+        if any(
+            e.player_id == "p0" and e.phase == GamePhase.PRE_FLOP and all_in(r, k)
+            for k, e in enumerate(r.actions)
+        )
+    ]
+    found = store.hands_with_action(player_id="p0", phase=GamePhase.PRE_FLOP, all_in=True)
+    assert list(found) == expected != []
+
+
+def test_unflushed_hands_are_dropped_and_readers_refresh(tmp_path):
+    records = _records(tables=1, hands=10)
+    writer = ColumnarHandStore(tmp_path, batch_size=1000)
+    writer.extend(records[:5])
+    writer.flush()
+    reader = ColumnarHandStore(tmp_path, readonly=True)
+    assert len(reader) == 5
+
+    writer.extend(records[5:])  # flush() するまでは他から見えない
+    assert len(ColumnarHandStore(tmp_path, readonly=True)) == 5
+    writer.close()
+    reader.refresh()
+    assert len(reader) == len(records)
+    _same(reader.record(len(records) - 1), records[-1])
+    with pytest.raises(io.UnsupportedOperation):
+        reader.append(records[0])
+
+    # meta.json を書き換える前に異常終了した分は、次に書き込み用に開いたときに切り捨てる
+    with open(tmp_path / "action_code.col", "ab") as f:
+        f.write(b"\xff" * 3)
+    with open(tmp_path / "players.txt", "a", encoding="utf-8") as f:
+        f.write('"ghost"\n')
+    with ColumnarHandStore(tmp_path) as store:
+        store.append(records[0])
+    store = ColumnarHandStore(tmp_path, readonly=True)
+    assert "ghost" not in store.player_ids
+    _same(store.record(len(records)), records[0])
+
+
+def test_failed_append_leaves_no_partial_hand(tmp_path):
+    first, second, third = _records(tables=1, hands=3)[:3]
+    store = ColumnarHandStore(tmp_path)
+    assert store.append(replace(first, seed=-5)) == 0
+    with pytest.raises(ValueError):
+        store.append(replace(second, seed=2**64))
+    with pytest.raises(OverflowError):
+        # 新しいテーブルID・プレイヤーIDを辞書に登録した後で失敗する
+        store.append(replace(
+            second, table_id="new", stacks=(("ghost", 2**63),) + second.stacks[1:],
+        ))
+    assert store.append(third) == 1
+    store.close()
+
+    store = ColumnarHandStore(tmp_path, readonly=True)
+    assert len(store) == 2
+    assert store.record(0).seed == -5
+    _same(store.record(1), third)
+    assert "new" not in store.table_ids
+    assert "ghost" not in store.player_ids
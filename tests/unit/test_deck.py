@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from poker_domain.deck import Deck
@@ -18,6 +20,14 @@ def test_deck_shuffle():
     assert len(deck._cards) == 52
     assert set(deck._cards) == set(original_order)
 
+def test_seeded_deck_shuffle_matches_random_shuffle():
+    for seed in range(500):
+        expected = list(Deck()._cards)
+        random.Random(seed).shuffle(expected)
+        deck = Deck(random.Random(seed))
+        deck.shuffle()
+        assert deck._cards == expected
+
 def test_deck_deal():
     deck = Deck()
     cards = deck.deal(2)
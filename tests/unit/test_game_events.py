@@ -0,0 +1,75 @@
+import pickle
+
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.game_state import (
+    EventType,
+    GameEvent,
+    GamePhase,
+    GameStartedEvent,
+    LevelUpEvent,
+    PlayerActedEvent,
+    ShowdownEvent,
+    TurnChangedEvent,
+)
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Call, Check, Fold
+from poker_domain.value_objects.chips import Chips
+
+
+def _table():
+    table = PokerTable(table_id="t", max_players=3, small_blind=5, big_blind=10, seed=1)
+    for player_id in ("a", "b", "c"):
+        table.add_player(player_id, Chips(1000))
+    return table
+
+
+def test_events_are_typed_and_keep_the_payload_view():
+    table = _table()
+    started = table.start_game().events
+    assert isinstance(started[0], GameStartedEvent)
+    turn = started[-1]
+    assert isinstance(turn, TurnChangedEvent)
+    assert turn.event_type == EventType.TURN_CHANGED
+    assert turn.payload == {"player_id": turn.player_id}
+    assert not hasattr(turn, "__dict__")
+
+    acted = table.action(turn.player_id, Fold()).events[0]
+    assert acted == PlayerActedEvent(turn.player_id)
+    assert acted.payload == {"player_id": turn.player_id}
+
+    events = []
+    while (state := table.get_state()).phase != GamePhase.SHOWDOWN:
+        try:
+            events += table.action(state.current_player_id, Check()).events
+        except InvalidActionError:
+            events += table.action(state.current_player_id, Call()).events
+    (showdown,) = [event for event in events if isinstance(event, ShowdownEvent)]
+    assert showdown.event_type == EventType.SHOWDOWN
+    assert showdown.payload == {
+        "winner_id": showdown.winner_id,
+        "hands": showdown.hands,
+        "pots": showdown.pots,
+        "payouts": showdown.payouts,
+        "rake": showdown.rake,
+    }
+    assert sum(showdown.payouts.values()) == sum(pot.amount.amount for pot in showdown.pots)
+    assert pickle.loads(pickle.dumps(showdown)) == showdown
+
+
+def test_uncontested_showdown_payload_and_from_payload():
+    table = _table()
+    table.start_game()
+    events = []
+    while (state := table.get_state()).phase != GamePhase.SHOWDOWN:
+        events += table.action(state.current_player_id, Fold()).events
+    showdown = events[-1]
+    assert isinstance(showdown, ShowdownEvent)
+    # 全員フォールドで決着した場合は従来どおり "pots" を含まない
+    assert showdown.payload == {
+        "winner_id": showdown.winner_id, "hands": {}, "payouts": showdown.payouts, "rake": 0,
+    }
+
+    level_up = table.level_up()
+    assert isinstance(level_up, LevelUpEvent)
+    assert GameEvent.from_payload(EventType.LEVEL_UP, level_up.payload) == level_up
+    assert GameEvent.from_payload(EventType.GAME_STARTED, {}) == GameStartedEvent()
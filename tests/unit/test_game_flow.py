@@ -77,3 +77,24 @@ def test_full_game_flow():
             winner_id = event.payload.get("winner_id")
             
     assert winner_id is not None
+
+
+def test_get_states_for_viewers_matches_get_state_for_each_viewer():
+    table = PokerTable(table_id="test_table", max_players=3, small_blind=10, big_blind=20)
+    for pid in ["player_a", "player_b", "player_c"]:
+        table.add_player(player_id=pid, chips=Chips(1000))
+    table.start_game()
+    table.action("player_a", Call())
+
+    viewers = ["player_a", "player_b", "player_c", "spectator", None]
+    states = table.get_states_for_viewers(viewers)
+
+    assert list(states) == viewers
+    for viewer_id in viewers:
+        assert states[viewer_id] == table.get_state(viewer_id)
+
+    # 観戦者には誰のホールカードも見えず、公開スナップショットが共有される
+    assert states["spectator"] is states[None]
+    assert all(p.hole_cards is None for p in states["spectator"].players)
+    visible = [p.player_id for p in states["player_b"].players if p.hole_cards is not None]
+    assert visible == ["player_b"]
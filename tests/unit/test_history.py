@@ -0,0 +1,178 @@
+import gzip
+import io
+import itertools
+import json
+import random
+from collections.abc import Iterator
+
+import pytest
+
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.history import HandHistoryWriter, read_hand_records
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Bet, Call, Check, Fold, Raise
+from poker_domain.value_objects.chips import Chips
+
+
+def _random_action(rng, state, waiting_for):
+    me = next(p for p in state.players if p.player_id == waiting_for.player_id)
+    stack = me.chips.amount
+    choice = rng.choice(waiting_for.valid_actions)
+    if choice is Bet:
+        return Bet(min(stack, state.big_blind.amount))
+    if choice is Raise:
+        max_raise = me.current_bet.amount + stack
+        if max_raise <= state.current_bet.amount:
+            return Fold()
+        return Raise(min(state.current_bet.amount * 2, max_raise))
+    return choice()
+
+
+def _play(writer, tables, hands, seed, *, with_setup=True):
+    """複数テーブルのハンドを交互に1アクションずつ進め、結果を writer に渡す"""
+    rng = random.Random(seed)
+    results = {}
+    completed = []
+    setups = []
+    played = dict.fromkeys(tables, 0)
+    while True:
+        active = False
+        for table_id, table in tables.items():
+            result = results.get(table_id)
+            if result is None or result.waiting_for is None:
+                if played[table_id] >= hands or len(table.player_ids) < 2:
+                    continue
+                if any(p.chips.amount == 0 for p in table.get_state().players):
+                    continue
+                result = table.start_game()
+                played[table_id] += 1
+                setups.append(table.last_hand_setup)
+                setup = table.last_hand_setup if with_setup else None
+            else:
+                waiting = result.waiting_for
+                try:
+                    result = table.action(
+                        waiting.player_id, _random_action(rng, result.state, waiting)
+                    )
+                except InvalidActionError:
+                    result = table.action(waiting.player_id, Fold())
+                setup = None
+            active = True
+            results[table_id] = result
+            record = writer.record(table_id, result, setup=setup)
+            assert writer.open_hands <= len(tables)
+            if record is not None:
+                completed.append((record, result.state))
+        if not active:
+            return completed, setups
+
+
+def _tables(count, seed):
+    tables = {}
+    for i in range(count):
+        table = PokerTable(
+            table_id=f"t{i}", max_players=4, small_blind=5, big_blind=10, ante=2,
+            rake_percent=0.05, seed=seed + i,
+        )
+        for j in range(4):
+            table.add_player(f"p{j}", Chips(300 + 100 * j))
+        tables[f"t{i}"] = table
+    return tables
+
+
+def test_jsonl_records_each_hand_once_with_full_action_log():
+    out = io.StringIO()
+    writer = HandHistoryWriter(out, batch_size=4)
+    completed, setups = _play(writer, _tables(3, seed=1), hands=5, seed=2)
+    writer.close()
+
+    lines = out.getvalue().splitlines()
+    assert len(lines) == len(completed) > 0
+    for line, (record, final) in zip(lines, completed):
+        data = json.loads(line)
+        assert data["table_id"] == record.table_id
+        assert data["hand"] == record.hand_number
+        assert len(data["actions"]) == len(final.action_log)
+        assert data["board"] == [c.code for c in final.community_cards]
+        # 開始時のチップ合計 = 終了時のチップ合計 + レーキ
+        final_chips = sum(p.chips.amount for p in final.players)
+        assert sum(stack for _, stack in data["stacks"]) == final_chips + data["rake"]
+    # start_game() のたびに渡した HandSetup と一致する
+    by_key = {(r.table_id, r.hand_number): r for r, _ in completed}
+    for record, _ in completed:
+        assert record.to_hand_setup() in setups
+    assert len(by_key) == len(completed)
+
+
+def test_starting_stacks_are_derived_without_hand_setup():
+    with_setup, _ = _play(HandHistoryWriter(io.StringIO()), _tables(2, seed=5), hands=4, seed=6)
+    derived, _ = _play(
+        HandHistoryWriter(io.StringIO()), _tables(2, seed=5), hands=4, seed=6, with_setup=False,
+    )
+    assert [r.stacks for r, _ in derived] == [r.stacks for r, _ in with_setup]
+    assert all(r.seed is None for r, _ in derived)
+
+
+def test_batches_are_written_together(tmp_path):
+    path = tmp_path / "history.jsonl.gz"
+    writer = HandHistoryWriter(path, batch_size=1000)
+    completed, _ = _play(writer, _tables(2, seed=3), hands=3, seed=4)
+    assert path.stat().st_size == 0 or gzip.decompress(path.read_bytes()) == b""
+    writer.close()
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == len(completed)
+
+
+def test_text_format():
+    table = PokerTable(table_id="t1", small_blind=5, big_blind=10, seed=8)
+    table.add_player("alice", Chips(100))
+    table.add_player("bob", Chips(100))
+    out = io.StringIO()
+    with HandHistoryWriter(out, format="text", clock=lambda: 0.0) as writer:
+        writer.record("t1", table.start_game(), setup=table.last_hand_setup)
+        seed = table.last_hand_setup.seed
+        writer.record("t1", table.action("alice", Raise(30)))
+        writer.record("t1", table.action("bob", Call()))
+        for _ in range(3):
+            writer.record("t1", table.action("bob", Check()))
+            result = table.action("alice", Check())
+            writer.record("t1", result)
+
+    text = out.getvalue()
+    board = " ".join(c.code for c in result.state.community_cards)
+    assert text.startswith(
+        "PokerDomain Hand #t1-1: Hold'em No Limit (5/10) - 1970/01/01 00:00:00 UTC\n"
+        "Table 't1' 2-max Seat #1 is the button\n"
+        f"Level 0 | Ante 0 | Seed {seed} | Rake 0.0 cap - min pot -\n"
+        "Seat 1: alice (100 in chips)\n"
+        "Seat 2: bob (100 in chips)\n"
+        "alice: posts small blind 5\n"
+        "bob: posts big blind 10\n"
+        "*** HOLE CARDS ***\n"
+        "alice: raises 20 to 30\n"
+        "bob: calls 20\n"
+        f"*** FLOP *** [{board[:8]}]\n"
+        "bob: checks\n"
+    )
+    assert "*** SHOW DOWN ***\nalice: shows [" in text
+    assert f"*** SUMMARY ***\nTotal pot 60 | Rake 0\nBoard [{board}]\n\n" in text
+
+
+@pytest.mark.parametrize("format", ["jsonl", "text"])
+def test_read_hand_records_round_trip(tmp_path, format):
+    path = tmp_path / f"history.{format}.gz"
+    clock = itertools.count()
+    writer = HandHistoryWriter(path, format=format, clock=lambda: float(next(clock)))
+    completed, _ = _play(writer, _tables(3, seed=11), hands=20, seed=3)
+    writer.close()
+
+    records = read_hand_records(path)
+    assert isinstance(records, Iterator)
+    parsed = list(records)
+    assert parsed == [record for record, _ in completed]
+    assert any(len(record.pots) > 1 for record in parsed)  # サイドポットのあるハンドを含む
+
+
+def test_read_hand_records_rejects_broken_lines():
+    with pytest.raises(ValueError):
+        list(read_hand_records(io.StringIO('{"table_id": "t1"}\n')))
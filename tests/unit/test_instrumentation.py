@@ -0,0 +1,186 @@
+import gc
+import json
+import weakref
+
+import pytest
+
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.game_state import GamePhase
+from poker_domain.hand_evaluator import HandEvaluator
+from poker_domain.instrumentation import HandTracer, Instrumentation
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Call, Check, Fold
+from poker_domain.value_objects.card import Card
+from poker_domain.value_objects.chips import Chips
+from poker_domain.value_objects.community_cards import CommunityCards
+from poker_domain.value_objects.hole_cards import HoleCards
+
+
+def _play_hand(table):
+    """全員チェック・コールでショーダウンまで進め、チェックできずに失敗した回数を返す"""
+    table.start_game()
+    failures = 0
+    while (state := table.get_state()).phase != GamePhase.SHOWDOWN:
+        try:
+            table.action(state.current_player_id, Check())
+        except InvalidActionError:
+            failures += 1
+            table.action(state.current_player_id, Call())
+    return failures
+
+
+def _table():
+    table = PokerTable(table_id="t", max_players=3, small_blind=5, big_blind=10, seed=1)
+    for player_id in ("a", "b", "c"):
+        table.add_player(player_id, Chips(1000))
+    return table
+
+
+def test_records_latencies_and_hand_metrics_only_for_hooked_tables():
+    original_action = PokerTable.action
+    table = _table()
+    other = _table()
+    instrumentation = Instrumentation()
+    table.add_hook(instrumentation)
+    # 登録したテーブルだけを処理を包んだサブクラスに切り替え、クラス自体は書き換えない
+    assert isinstance(table, PokerTable) and type(table) is not PokerTable
+    assert type(other) is PokerTable
+    assert PokerTable.action is original_action
+    failures = _play_hand(table)
+    with pytest.raises(InvalidActionError):
+        table.action("a", Fold())   # ハンド終了後のアクションは失敗する
+    table.dump()
+    _play_hand(other)   # 登録していないテーブルは集計されない
+    table.remove_hook(instrumentation)
+    assert type(table) is PokerTable
+    _play_hand(table)   # 外した後も集計されない
+
+    histograms = instrumentation.histograms
+    assert histograms["start_game_seconds"].count == 1
+    assert histograms["action_seconds"].count >= 6
+    assert histograms["showdown_seconds"].count == 1
+    assert histograms["evaluate_seconds"].count == 0   # HandEvaluator には登録していない
+    assert histograms["pots_seconds"].count >= histograms["action_seconds"].count
+    assert histograms["snapshot_seconds"].count >= histograms["action_seconds"].count
+    assert histograms["events_per_hand"].count == 1
+    assert histograms["snapshot_bytes"].count == 1
+    assert instrumentation.counters == {"action_errors": failures + 1, "hands": 1}
+
+    exported = instrumentation.to_dict()
+    buckets = exported["histograms"]["action_seconds"]["buckets"]
+    assert buckets[-1] == ["+Inf", histograms["action_seconds"].count]
+    assert [count for _, count in buckets] == sorted(count for _, count in buckets)
+
+
+def test_tables_can_be_instrumented_independently():
+    tables = [_table(), _table()]
+    instrumentations = [Instrumentation(), Instrumentation()]
+    for table, instrumentation in zip(tables, instrumentations):
+        table.add_hook(instrumentation)
+    _play_hand(tables[0])
+    _play_hand(tables[0])
+    _play_hand(tables[1])
+    assert [i.counters["hands"] for i in instrumentations] == [2, 1]
+
+
+def test_hand_evaluator_hook_measures_direct_calls():
+    original = HandEvaluator.evaluate
+    instrumentation = Instrumentation()
+    table = _table()
+    table.add_hook(instrumentation)
+    HandEvaluator.add_hook(instrumentation)
+    try:
+        _play_hand(table)
+        hole = HoleCards((Card.from_code("As"), Card.from_code("Kd")))
+        board = CommunityCards(tuple(Card.from_code(c) for c in ("2c", "7h", "9s", "Jd")))
+        HandEvaluator.evaluate_hand(hole, board)
+        HandEvaluator.river_probabilities(hole, board)
+        with pytest.raises(ValueError):
+            HandEvaluator.river_probabilities(hole, CommunityCards(()))
+    finally:
+        HandEvaluator.remove_hook(instrumentation)
+    assert HandEvaluator.evaluate is original   # 外すと元のメソッドに戻る
+
+    histograms = instrumentation.histograms
+    assert histograms["evaluate_seconds"].count == 3 + 1   # ショーダウンの3人分 + 直接の呼び出し
+    assert histograms["river_probabilities_seconds"].count == 2
+    assert instrumentation.counters["river_probabilities_errors"] == 1
+    assert instrumentation.counters["hands"] == 1
+
+
+def test_prometheus_text_and_reset():
+    instrumentation = Instrumentation()
+    instrumentation.histogram("river_seconds", (0.5, 1.0)).observe(0.75)
+    instrumentation.increment("hands", 2)
+    text = instrumentation.to_prometheus()
+    assert text.startswith("# TYPE poker_hands_total counter\npoker_hands_total 2\n")
+    assert (
+        "# TYPE poker_river_seconds histogram\n"
+        'poker_river_seconds_bucket{le="0.5"} 0\n'
+        'poker_river_seconds_bucket{le="1.0"} 1\n'
+        'poker_river_seconds_bucket{le="+Inf"} 1\n'
+        "poker_river_seconds_sum 0.75\n"
+        "poker_river_seconds_count 1\n"
+    ) in text
+    # 計測する処理のヒストグラムは記録がなくても出力する
+    assert "poker_evaluate_seconds_count 0\n" in text
+
+    instrumentation.reset()
+    assert instrumentation.counters == {}
+    assert instrumentation.histograms["river_seconds"].count == 0
+
+
+def test_sampled_hands_are_written_as_chrome_traces(tmp_path):
+    table = PokerTable(table_id="t/1", max_players=3, small_blind=5, big_blind=10, seed=1)
+    for player_id in ("a", "b", "c"):
+        table.add_player(player_id, Chips(1000))
+    original_showdown = PokerTable.__dict__["_showdown"]
+    with HandTracer(tmp_path, sample_rate=1.0) as tracer:
+        table.add_hook(tracer)
+        _play_hand(table)
+        assert PokerTable.__dict__["_showdown"] is original_showdown   # クラスは差し替えない
+        tracer.flush()
+        assert tracer.hands_traced == 1
+
+    (path,) = (tmp_path / "t%2F1").iterdir()
+    document = json.loads(path.read_text(encoding="utf-8"))
+    assert document["otherData"] == {"table_id": "t/1", "seed": table.last_hand_setup.seed}
+    spans = [event for event in document["traceEvents"] if event["ph"] == "X"]
+    names = {span["name"] for span in spans}
+    assert {
+        "start_game", "collect_blinds", "deal_hole_cards",
+        "action", "validate_action", "apply_action", "record_action",
+        "advance_phase", "pots", "apply_rake", "showdown", "evaluate",
+    } <= names
+    # 内側のスパンはいずれかの start_game / action のスパンに収まる (get_state() の分は記録しない)
+    outer = [span for span in spans if span["name"] in ("start_game", "action")]
+    for span in spans:
+        assert any(
+            o["ts"] <= span["ts"] and span["ts"] + span["dur"] <= o["ts"] + o["dur"]
+            for o in outer
+        )
+
+
+def test_unsampled_and_abandoned_hands_are_not_written(tmp_path):
+    instrumentation = Instrumentation()
+    with HandTracer(tmp_path, sample_rate=0.0) as tracer:
+        table = _table()
+        table.add_hook(instrumentation)
+        table.add_hook(tracer)
+        _play_hand(table)
+    assert tracer.hands_traced == 0
+    assert list(tmp_path.iterdir()) == []
+    assert instrumentation.counters["hands"] == 1
+
+    with HandTracer(tmp_path, sample_rate=1.0) as tracer:
+        table = _table()
+        table.add_hook(tracer)
+        table.start_game()
+        # ハンドの途中で捨てたテーブルをトレーサーが持ち続けない
+        abandoned = weakref.ref(table)
+        del table
+        gc.collect()
+        assert abandoned() is None
+    assert tracer.hands_traced == 0
+    with pytest.raises(ValueError):
+        tracer.flush()   # 書き込みスレッドは止まっているので待ち続けない
@@ -0,0 +1,188 @@
+import os
+import random
+
+import pytest
+
+from poker_domain.agents import RandomAgent
+from poker_domain.exceptions import InvalidActionError, NotEnoughPlayersError
+from poker_domain.game_state import GamePhase, TableStatus, WaitingFor
+from poker_domain.journal import JournaledTableManager
+from poker_domain.value_objects.action import Bet, Call, Check, Fold, Raise
+from poker_domain.value_objects.chips import Chips
+
+
+def _play(manager, table_ids, actions, seed=3):
+    """テーブルを順に回り、手番のプレイヤーにランダムなアクションを取らせる"""
+    agent = RandomAgent(random.Random(seed))
+    every_action = (Fold, Check, Call, Bet, Raise)
+    for i in range(actions):
+        table_id = table_ids[i % len(table_ids)]
+        state = manager.get_table(table_id).get_state()
+        if state.phase in (GamePhase.WAITING, GamePhase.SHOWDOWN):
+            if state.status != TableStatus.CLOSED and len(state.players) >= 2:
+                manager.start_game(table_id)
+            continue
+        player_id = state.current_player_id
+        try:
+            manager.action(
+                table_id, player_id, agent.act(state, WaitingFor(player_id, every_action, 30))
+            )
+        except InvalidActionError:
+            manager.action(table_id, player_id, Fold())
+
+
+def _setup(manager, tables=4):
+    table_ids = [f"t{i}" for i in range(tables)]
+    for i, table_id in enumerate(table_ids):
+        # 偶数番はテーブル自身のシード、奇数番はマネージャーが決めたシードで配る
+        options = {"seed": 40 + i} if i % 2 == 0 else {}
+        manager.create_table(table_id, max_players=4, small_blind=5, big_blind=10, **options)
+        for j in range(4):
+            manager.add_player(table_id, f"p{j}", Chips(2000))
+    return table_ids
+
+
+def _dumps(manager, table_ids):
+    return {table_id: manager.get_table(table_id).dump() for table_id in table_ids}
+
+
+def test_recovers_tables_from_checkpoint_and_journal(tmp_path):
+    manager = JournaledTableManager(tmp_path)
+    table_ids = _setup(manager)
+    _play(manager, table_ids, 300)
+    manager.checkpoint()
+    _play(manager, table_ids, 300, seed=4)
+    manager.level_up("t1")
+    manager.remove_table("t2")
+    manager.create_table("t2", max_players=2)
+    manager.add_player("t2", "p0", Chips(100))
+    manager.add_player("t2", "p9", Chips(100))
+    manager.remove_player("t2", "p9")
+    expected = _dumps(manager, table_ids)
+    last_seq = manager.last_seq
+    manager.sync()
+    # close() せずに捨てる (プロセスが落ちた場合と同じ)
+
+    recovered = JournaledTableManager(tmp_path)
+    assert recovered.last_seq == last_seq
+    assert _dumps(recovered, table_ids) == expected
+    assert sorted(recovered.tables_of_player("p0")) == sorted(
+        t for t in table_ids if "p0" in recovered.get_table(t).player_ids
+    )
+    assert recovered.drain_events() == []
+    # 続けて操作したものも次の復元に含まれる
+    _play(recovered, table_ids, 50, seed=5)
+    expected = _dumps(recovered, table_ids)
+    recovered.close()
+    assert _dumps(JournaledTableManager(tmp_path), table_ids) == expected
+
+
+def test_seeded_tables_continue_the_same_deals_after_recovery(tmp_path):
+    a = JournaledTableManager(tmp_path / "a")
+    b = JournaledTableManager(tmp_path / "b")
+    for manager in (a, b):
+        _setup(manager, tables=1)
+        _play(manager, ["t0"], 100)
+    recovered = JournaledTableManager(tmp_path / "a")
+    for manager in (b, recovered):
+        while manager.get_table("t0").get_state().phase != GamePhase.SHOWDOWN:
+            _play(manager, ["t0"], 1)
+        manager.start_game("t0")
+    assert recovered.get_table("t0").last_hand_setup == b.get_table("t0").last_hand_setup
+
+
+def test_seeded_tables_keep_their_deals_after_checkpoint_and_restore(tmp_path):
+    a = JournaledTableManager(tmp_path / "a")
+    b = JournaledTableManager(tmp_path / "b")
+    for manager in (a, b):
+        _setup(manager, tables=1)
+        _play(manager, ["t0"], 100)
+    a.checkpoint()
+    _play(a, ["t0"], 100, seed=4)
+    a.sync()
+    recovered = JournaledTableManager(tmp_path / "a")
+    restored = JournaledTableManager(tmp_path / "c")
+    restored.restore(b.snapshot())
+    for manager in (b, restored):
+        _play(manager, ["t0"], 100, seed=4)
+    # チェックポイント・スナップショットの後もテーブル自身のシードの続きで配る
+    for manager in (b, recovered, restored):
+        _play(manager, ["t0"], 200, seed=5)
+    expected = b.get_table("t0").dump()
+    assert recovered.get_table("t0").dump() == expected
+    assert restored.get_table("t0").dump() == expected
+
+
+def test_negative_and_wide_explicit_seeds_are_journaled(tmp_path):
+    manager = JournaledTableManager(tmp_path)
+    table_ids = _setup(manager, tables=2)
+    for seed in (-5, 2**70):
+        for table_id in table_ids:
+            manager.start_game(table_id, seed=seed)
+            table = manager.get_table(table_id)
+            assert table.last_hand_setup.seed == seed
+            while (state := table.get_state()).phase != GamePhase.SHOWDOWN:
+                manager.action(table_id, state.current_player_id, Fold())
+    expected = _dumps(manager, table_ids)
+    manager.sync()
+    assert _dumps(JournaledTableManager(tmp_path), table_ids) == expected
+
+
+def test_failed_start_after_bust_is_replayed(tmp_path):
+    manager = JournaledTableManager(tmp_path)
+    table = manager.create_table("t", max_players=3, small_blind=5, big_blind=10, seed=1)
+    manager.add_player("t", "a", Chips(10))
+    manager.add_player("t", "b", Chips(1000))
+    manager.add_player("t", "c", Chips(1000))
+    # a がバストするまで全員チェック・コールで進める
+    while "a" in table.player_ids and table.get_state().players[0].chips.amount > 0:
+        manager.start_game("t")
+        while (state := table.get_state()).phase != GamePhase.SHOWDOWN:
+            try:
+                manager.action("t", state.current_player_id, Check())
+            except InvalidActionError:
+                manager.action("t", state.current_player_id, Call())
+    manager.remove_player("t", "c")
+    # バストした a の除外とディーラーの移動を済ませてから人数不足で失敗する
+    with pytest.raises(NotEnoughPlayersError):
+        manager.start_game("t")
+    manager.add_player("t", "d", Chips(500))
+    manager.start_game("t")
+    expected = table.dump()
+    manager.close()
+    assert JournaledTableManager(tmp_path).get_table("t").dump() == expected
+
+
+def test_torn_tail_is_discarded_and_corruption_elsewhere_is_rejected(tmp_path):
+    manager = JournaledTableManager(tmp_path, sync_interval=0)
+    table_ids = _setup(manager, tables=2)
+    _play(manager, table_ids, 40)
+    expected = _dumps(manager, table_ids)
+    manager.close()
+    (segment,) = [name for name in os.listdir(tmp_path) if name.startswith("journal-")]
+    path = tmp_path / segment
+    size = path.stat().st_size
+    with open(path, "ab") as f:
+        f.write(b"\x20\x00\x00\x00\x01\x02")  # 書きかけのレコード
+
+    recovered = JournaledTableManager(tmp_path)
+    assert _dumps(recovered, table_ids) == expected
+    assert path.stat().st_size == size
+    recovered.level_up("t0")
+    recovered.close()
+    assert JournaledTableManager(tmp_path).last_seq == recovered.last_seq
+
+    # 最後のセグメント以外の破損は復元できない
+    manager = JournaledTableManager(tmp_path)
+    manager.checkpoint()
+    manager.level_up("t1")
+    manager.close()
+    assert not path.exists()  # チェックポイントより前のセグメントは消える
+    segments = sorted(name for name in os.listdir(tmp_path) if name.startswith("journal-"))
+    first = tmp_path / segments[0]
+    corrupted = bytearray(first.read_bytes())
+    corrupted[10] ^= 0xFF
+    first.write_bytes(bytes(corrupted))
+    (tmp_path / "journal-99999999999999999999.log").write_bytes(b"")
+    with pytest.raises(ValueError):
+        JournaledTableManager(tmp_path)
@@ -0,0 +1,139 @@
+import pytest
+
+from poker_domain.exceptions import TableNotFoundError
+from poker_domain.level_clock import LevelClock
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Fold
+from poker_domain.value_objects.chips import Chips
+
+SCHEDULE = [(5, 10, 0), (10, 20, 0), (25, 50, 5), (50, 100, 10)]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _table(table_id: str) -> PokerTable:
+    table = PokerTable(table_id=table_id, level_schedule=SCHEDULE)
+    table.add_player("a", Chips(1000))
+    table.add_player("b", Chips(1000))
+    return table
+
+
+def test_levels_rise_on_every_table_in_one_tick():
+    clock = FakeClock()
+    levels = LevelClock(clock)
+    tables = {f"t{i}": _table(f"t{i}") for i in range(3000)}
+    levels.start("event", [600, 600, 300], tables.items())
+
+    clock.now = 599.0
+    assert levels.advance() == []
+    clock.now = 600.0
+    fired = levels.advance()
+    assert len(fired) == 3000
+    assert {event.payload["level"] for _, _, event in fired} == {1}
+    assert levels.level("event") == 1
+    assert levels.seconds_to_next_level("event") == 600.0
+
+
+def test_late_advance_catches_up_without_drift_and_stops_at_last_duration():
+    clock = FakeClock()
+    levels = LevelClock(clock)
+    table = _table("t1")
+    levels.start("event", [10, 20, 30], [("t1", table)])
+
+    clock.now = 35.0  # レベル1 (10秒) と レベル2 (30秒) の期限を過ぎている
+    fired = levels.advance()
+    assert [event.payload["level"] for _, _, event in fired] == [1, 2]
+    assert levels.seconds_to_next_level("event") == 25.0  # 30 + 30 - 35
+
+    clock.now = 1000.0
+    levels.advance()
+    assert levels.level("event") == 3
+    assert levels.seconds_to_next_level("event") is None
+    assert levels.advance(now=5000.0) == []
+
+
+def test_level_up_takes_effect_at_next_start_game():
+    clock = FakeClock()
+    levels = LevelClock(clock)
+    table = _table("t1")
+    levels.start("event", [60], [("t1", table)])
+
+    result = table.start_game()
+    assert result.state.big_blind.amount == 10
+    clock.now = 60.0
+    levels.advance()
+    # 進行中のハンドのポット (ブラインド) は変わらない
+    assert table.get_state().pot.amount == 15
+    table.action(result.waiting_for.player_id, Fold())
+    assert table.start_game().state.big_blind.amount == 20
+
+
+def test_pause_and_resume_keep_remaining_time():
+    clock = FakeClock()
+    levels = LevelClock(clock)
+    table = _table("t1")
+    levels.start("event", [100, 100], [("t1", table)])
+
+    clock.now = 40.0
+    levels.pause("event")
+    levels.pause("event")  # 2回目は何もしない
+    assert levels.is_paused("event")
+    clock.now = 500.0
+    assert levels.advance() == []
+    assert levels.seconds_to_next_level("event") == 60.0
+
+    levels.resume("event")
+    clock.now = 559.0
+    assert levels.advance() == []
+    clock.now = 560.0
+    assert len(levels.advance()) == 1
+    assert levels.seconds_to_next_level("event") == 100.0
+
+
+def test_tables_join_at_current_level_and_can_leave():
+    clock = FakeClock()
+    levels = LevelClock(clock)
+    levels.start("event", [10, 10, 10])
+    clock.now = 20.0
+    levels.advance()
+
+    late = _table("late")
+    levels.add_table("event", "late", late)
+    assert late.level_up().payload["level"] == 3  # 追いついた後の次のレベル
+
+    levels.remove_table("event", "late")
+    with pytest.raises(TableNotFoundError):
+        levels.remove_table("event", "late")
+    clock.now = 30.0
+    assert levels.advance() == []
+
+
+def test_restarted_event_ignores_stale_deadlines():
+    clock = FakeClock()
+    levels = LevelClock(clock)
+    levels.start("event", [10], [("t1", _table("t1"))])
+    levels.stop("event")
+    clock.now = 5.0
+    levels.start("event", [10], [("t1", _table("t1"))])
+
+    clock.now = 10.0
+    assert levels.advance() == []
+    clock.now = 15.0
+    assert len(levels.advance()) == 1
+
+
+def test_invalid_usage():
+    levels = LevelClock(FakeClock())
+    levels.start("event", [10])
+    with pytest.raises(ValueError):
+        levels.start("event", [10])
+    with pytest.raises(ValueError):
+        levels.start("other", [10, 0])
+    with pytest.raises(ValueError):
+        levels.level("missing")
@@ -0,0 +1,99 @@
+import pytest
+
+from poker_domain.exceptions import (
+    DuplicateTableError,
+    InvalidPlayerError,
+    NotEnoughPlayersError,
+    TableNotFoundError,
+)
+from poker_domain.game_state import EventType, TableStatus
+from poker_domain.manager import TableManager
+from poker_domain.value_objects.action import Call, Check, Fold
+from poker_domain.value_objects.chips import Chips
+
+
+def _manager_with_tables(n: int) -> TableManager:
+    manager = TableManager()
+    for i in range(n):
+        manager.create_table(f"t{i}", max_players=3, small_blind=5, big_blind=10)
+    return manager
+
+
+def test_create_and_lookup_tables():
+    manager = _manager_with_tables(2)
+    assert len(manager) == 2 and "t1" in manager
+    assert manager.get_table("t0").table_id == "t0"
+
+    with pytest.raises(DuplicateTableError):
+        manager.create_table("t0")
+    with pytest.raises(TableNotFoundError):
+        manager.get_table("nope")
+
+    manager.remove_table("t1")
+    assert "t1" not in manager
+    assert manager.tables_by_status(TableStatus.RECRUITING) == ["t0"]
+    assert manager.tables_with_open_seats(3) == ["t0"]
+
+
+def test_indexes_follow_routed_operations():
+    manager = _manager_with_tables(3)
+    manager.add_player("t0", "alice", Chips(100))
+    manager.add_player("t0", "bob", Chips(100))
+    manager.add_player("t1", "alice", Chips(100))
+
+    assert sorted(manager.tables_of_player("alice")) == ["t0", "t1"]
+    assert manager.tables_of_player("carol") == []
+    assert sorted(manager.tables_with_open_seats(2)) == ["t1", "t2"]
+    assert manager.tables_with_open_seats(3) == ["t2"]
+
+    result = manager.start_game("t0")
+    assert manager.tables_by_status(TableStatus.PLAYING) == ["t0"]
+    assert sorted(manager.tables_by_status(TableStatus.RECRUITING)) == ["t1", "t2"]
+
+    # ヘッズアップでディーラー (SB) がフォールド → ハンド終了で募集中に戻る
+    waiting = result.waiting_for
+    manager.action("t0", waiting.player_id, Fold())
+    assert sorted(manager.tables_by_status(TableStatus.RECRUITING)) == ["t0", "t1", "t2"]
+
+    # 全員離席したテーブルはクローズし、空席の検索対象から外れる
+    manager.remove_player("t1", "alice")
+    assert manager.tables_of_player("alice") == ["t0"]
+    assert manager.tables_by_status(TableStatus.CLOSED) == ["t1"]
+    assert "t1" not in manager.tables_with_open_seats()
+
+    # テーブル側の失敗は索引を壊さない
+    with pytest.raises(InvalidPlayerError):
+        manager.add_player("t0", "bob", Chips(100))
+    with pytest.raises(NotEnoughPlayersError):
+        manager.start_game("t2")
+    assert manager.tables_of_player("bob") == ["t0"]
+
+
+def test_bulk_actions_collect_events_and_errors():
+    manager = _manager_with_tables(2)
+    for table_id in ("t0", "t1"):
+        manager.add_player(table_id, "a", Chips(100))
+        manager.add_player(table_id, "b", Chips(100))
+        manager.start_game(table_id)
+    manager.drain_events()
+
+    results = manager.apply_actions([
+        ("t0", "a", Call()),
+        ("t1", "b", Check()),      # 手番ではない
+        ("t1", "a", Call()),
+    ])
+    assert isinstance(results[1], InvalidPlayerError)
+    assert results[0].waiting_for.player_id == "b"
+
+    events = manager.drain_events()
+    assert [table_id for table_id, _ in events] == ["t0", "t0", "t1", "t1"]
+    assert events[0][1].event_type == EventType.PLAYER_ACTED
+    assert manager.drain_events() == []
+
+
+def test_refresh_after_direct_table_operation():
+    manager = _manager_with_tables(1)
+    manager.get_table("t0").add_player("dave", Chips(50))
+    assert manager.tables_of_player("dave") == []
+    manager.refresh("t0")
+    assert manager.tables_of_player("dave") == ["t0"]
@@ -0,0 +1,7 @@
+import poker_domain
+
+
+def test_star_import_exports_every_public_name():
+    namespace = {}
+    exec("from poker_domain import *", namespace)
+    assert set(poker_domain.__all__) <= namespace.keys()
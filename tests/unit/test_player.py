@@ -0,0 +1,17 @@
+from poker_domain.player import Player
+from poker_domain.value_objects.chips import Chips
+
+
+def test_player_keeps_int_amounts_behind_chips_properties():
+    player = Player(player_id="a", chips=Chips(30))
+    paid = player._contribute(50)
+
+    assert paid == 30
+    assert player.chips_amount == 0
+    assert player.chips == Chips(0)
+    assert player.current_bet == Chips(30)
+    assert player.total_contributed == Chips(30)
+    assert player.is_all_in is True
+
+    player.chips = Chips(100)
+    assert player.chips_amount == 100
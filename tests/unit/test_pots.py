@@ -0,0 +1,102 @@
+import random
+
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.game_state import GamePhase, Pot
+from poker_domain.pots import SidePotLedger
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Bet, Fold, Raise
+from poker_domain.value_objects.chips import Chips
+
+
+def test_ledger_splits_and_merges_tiers_like_full_recomputation():
+    ledger = SidePotLedger()
+    ledger.reset(("a", "b", "c"))
+
+    ledger.contribute(0, 0, 15)   # a: 15 (オールイン)
+    ledger.contribute(1, 0, 10)   # b: 10
+    ledger.contribute(2, 0, 20)   # c: 20
+    assert ledger.pots() == (
+        Pot(amount=Chips(30), eligible_player_ids=("a", "b", "c")),
+        Pot(amount=Chips(10), eligible_player_ids=("a", "c")),
+        Pot(amount=Chips(5), eligible_player_ids=("c",)),
+    )
+
+    # b が 100 まで上げると、10 ちょうどの拠出者がいなくなり階層が統合される
+    ledger.contribute(1, 10, 100)
+    ledger.fold(2)
+    assert ledger.pots() == (
+        Pot(amount=Chips(45), eligible_player_ids=("a", "b")),
+        Pot(amount=Chips(10), eligible_player_ids=("b",)),
+        Pot(amount=Chips(80), eligible_player_ids=("b",)),
+    )
+
+
+def _random_action(rng: random.Random, table: PokerTable, waiting_for):
+    state = table.get_state()
+    me = next(p for p in state.players if p.player_id == waiting_for.player_id)
+    stack = me.chips.amount
+    choice = rng.choice(waiting_for.valid_actions)
+    if choice is Bet:
+        if stack <= state.big_blind.amount or rng.random() < 0.3:
+            return Bet(amount=stack)
+        return Bet(amount=rng.randint(state.big_blind.amount, stack))
+    if choice is Raise:
+        min_raise = state.current_bet.amount * 2
+        max_raise = me.current_bet.amount + stack
+        if max_raise <= state.current_bet.amount:
+            return Fold()
+        if max_raise <= min_raise or rng.random() < 0.3:
+            return Raise(amount=max_raise)
+        return Raise(amount=rng.randint(min_raise, max_raise))
+    return choice()
+
+
+def test_incremental_side_pots_match_full_recomputation_over_random_hands():
+    """debug_checks=True で毎スナップショット/ショーダウン時にゼロからの再計算と突き合わせる"""
+    rng = random.Random(1234)
+    for _ in range(150):
+        table = PokerTable(
+            table_id="t1", max_players=5, small_blind=5, big_blind=10,
+            ante=rng.choice([0, 0, 3]), debug_checks=True,
+        )
+        for i in range(rng.randint(2, 5)):
+            table.add_player(f"p{i}", Chips(rng.choice([4, 12, 30, 80, 200])))
+
+        result = table.start_game()
+        while result.waiting_for is not None:
+            action = _random_action(rng, table, result.waiting_for)
+            try:
+                result = table.action(result.waiting_for.player_id, action)
+            except InvalidActionError:
+                result = table.action(result.waiting_for.player_id, Fold())
+            assert result.state.side_pots == table._compute_pots()
+        if result.state.phase == GamePhase.SHOWDOWN:
+            assert result.state.side_pots == ()
+        else:
+            assert sum(p.amount.amount for p in result.state.side_pots) == result.state.pot.amount
+
+
+def test_short_ante_creates_main_pot_with_folded_contributor():
+    table = PokerTable(
+        table_id="t1", max_players=3, small_blind=10, big_blind=20, ante=5, debug_checks=True,
+    )
+    table.add_player("a", Chips(1000))
+    table.add_player("b", Chips(3))      # アンティも満額払えない
+    table.add_player("c", Chips(1000))
+
+    # dealer=a, SB=b (アンティ3でオールイン済み), BB=c
+    state = table.start_game().state
+    assert state.side_pots == (
+        Pot(amount=Chips(9), eligible_player_ids=("a", "b", "c")),
+        Pot(amount=Chips(4), eligible_player_ids=("a", "c")),
+        Pot(amount=Chips(20), eligible_player_ids=("c",)),
+    )
+
+    # フォールドした a の拠出分はポットに残るが、獲得資格からは外れる
+    result = table.action("a", Fold())
+    assert result.state.side_pots == (
+        Pot(amount=Chips(9), eligible_player_ids=("b", "c")),
+        Pot(amount=Chips(4), eligible_player_ids=("c",)),
+        Pot(amount=Chips(20), eligible_player_ids=("c",)),
+    )
+    assert result.state.side_pots == table._compute_pots()
@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from poker_domain.action_log import entry_to_action
+from poker_domain.exceptions import GameAlreadyStartedError, InvalidActionError, ReplayError
+from poker_domain.game_state import ActionLogEntry, GamePhase
+from poker_domain.replay import iter_replay, replay_hand
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Bet, Fold, Raise
+from poker_domain.value_objects.chips import Chips
+
+
+def _random_action(rng: random.Random, table: PokerTable, waiting_for):
+    state = table.get_state()
+    me = next(p for p in state.players if p.player_id == waiting_for.player_id)
+    stack = me.chips.amount
+    choice = rng.choice(waiting_for.valid_actions)
+    if choice is Bet:
+        return Bet(amount=stack if stack <= state.big_blind.amount else state.big_blind.amount)
+    if choice is Raise:
+        max_raise = me.current_bet.amount + stack
+        if max_raise <= state.current_bet.amount:
+            return Fold()
+        return Raise(amount=min(state.current_bet.amount * 2, max_raise))
+    return choice()
+
+
+def _play_hands(seed: int, hands: int):
+    """seed 付きテーブルで数ハンド進め、ハンドごとに (開始記録, 各 ActionResult) を返す"""
+    rng = random.Random(seed)
+    table = PokerTable(
+        table_id="t1", max_players=4, small_blind=5, big_blind=10, ante=1,
+        level_schedule=[(5, 10, 1), (10, 20, 2)], rake_percent=0.05, seed=seed,
+    )
+    for i in range(4):
+        table.add_player(f"p{i}", Chips(rng.choice([30, 80, 200])))
+
+    played = []
+    for hand in range(hands):
+        if table.get_table_status().name == "CLOSED":
+            break
+        if hand == 2:
+            table.level_up()
+        result = table.start_game()
+        results = []
+        while result.waiting_for is not None:
+            action = _random_action(rng, table, result.waiting_for)
+            try:
+                result = table.action(result.waiting_for.player_id, action)
+            except InvalidActionError:
+                result = table.action(result.waiting_for.player_id, Fold())
+            results.append(result)
+        played.append((table.last_hand_setup, results))
+    return played
+
+
+def test_replay_reproduces_every_hand_from_seed_and_action_log():
+    for setup, results in _play_hands(seed=42, hands=6):
+        final = results[-1].state
+        table = replay_hand(setup, final.action_log)
+        assert table.get_state() == final
+
+
+def test_iter_replay_fast_forwards_then_matches_each_action_result():
+    setup, results = _play_hands(seed=7, hands=1)[0]
+    log = tuple(results[-1].state.action_log)
+    start = len(log) // 2
+
+    assert list(iter_replay(setup, log, start=start)) == results[start:]
+
+
+def test_replay_stops_midway_and_can_continue():
+    setup, results = _play_hands(seed=3, hands=1)[0]
+    log = tuple(results[-1].state.action_log)
+
+    table = replay_hand(setup, log[:2])
+    assert table.get_state() == results[1].state
+    entry = log[2]
+    assert table.action(entry.player_id, entry_to_action(entry)) == results[2]
+
+
+def test_same_table_seed_deals_same_cards():
+    first = _play_hands(seed=11, hands=2)
+    second = _play_hands(seed=11, hands=2)
+    assert [setup for setup, _ in first] == [setup for setup, _ in second]
+    assert [r[-1].state for _, r in first] == [r[-1].state for _, r in second]
+
+
+def test_fast_start_deals_like_start_game():
+    setup, _ = _play_hands(seed=7, hands=1)[0]
+    started = PokerTable.from_hand_setup(setup)
+    state = started.start_game(seed=setup.seed).state
+    fast = PokerTable.from_hand_setup(setup)
+    fast.fast_start(seed=setup.seed)
+    assert fast.get_state() == state
+    assert fast.last_hand_setup == started.last_hand_setup == setup
+    with pytest.raises(GameAlreadyStartedError):
+        fast.fast_start()
+
+
+def test_replay_rejects_unseeded_hand_and_diverging_log():
+    table = PokerTable(table_id="t1", small_blind=5, big_blind=10)
+    table.add_player("a", Chips(100))
+    table.add_player("b", Chips(100))
+    table.start_game()
+    with pytest.raises(ReplayError):
+        replay_hand(table.last_hand_setup, ())
+
+    setup, results = _play_hands(seed=5, hands=1)[0]
+    first = results[-1].state.action_log[0]
+    wrong_player = ActionLogEntry(
+        player_id="nobody", phase=first.phase, action=first.action, amount=first.amount,
+    )
+    with pytest.raises(ReplayError):
+        replay_hand(setup, (wrong_player,))
+    wrong_phase = ActionLogEntry(
+        player_id=first.player_id, phase=GamePhase.RIVER, action="check", amount=None,
+    )
+    with pytest.raises(ReplayError):
+        replay_hand(setup, (wrong_phase,))
@@ -0,0 +1,143 @@
+import multiprocessing
+import random
+import threading
+from multiprocessing.connection import Client, Listener
+
+import pytest
+
+from poker_domain.agents import RandomAgent
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.game_state import GamePhase, TableStatus, WaitingFor
+from poker_domain.journal import JournaledTableManager
+from poker_domain.replication import ReplicationFollower, ReplicationPublisher
+from poker_domain.value_objects.action import Bet, Call, Check, Fold, Raise
+from poker_domain.value_objects.chips import Chips
+
+_TABLE_IDS = ("t0", "t1", "t2")
+
+
+def _play(manager, actions, seed=3):
+    """テーブルを順に回り、手番のプレイヤーにランダムなアクションを取らせる"""
+    agent = RandomAgent(random.Random(seed))
+    every_action = (Fold, Check, Call, Bet, Raise)
+    for i in range(actions):
+        table_id = _TABLE_IDS[i % len(_TABLE_IDS)]
+        state = manager.get_table(table_id).get_state()
+        if state.phase in (GamePhase.WAITING, GamePhase.SHOWDOWN):
+            if state.status != TableStatus.CLOSED:
+                manager.start_game(table_id)
+            continue
+        player_id = state.current_player_id
+        try:
+            manager.action(
+                table_id, player_id, agent.act(state, WaitingFor(player_id, every_action, 30))
+            )
+        except InvalidActionError:
+            manager.action(table_id, player_id, Fold())
+
+
+def _primary(directory):
+    manager = JournaledTableManager(directory)
+    for i, table_id in enumerate(_TABLE_IDS):
+        options = {"seed": 70 + i} if i % 2 == 0 else {}
+        manager.create_table(table_id, max_players=4, small_blind=5, big_blind=10, **options)
+        for j in range(4):
+            manager.add_player(table_id, f"p{j}", Chips(3000))
+    return manager
+
+
+def _dumps(manager):
+    return {table_id: manager.get_table(table_id).dump() for table_id in _TABLE_IDS}
+
+
+def _run_standby(directory, address, results):
+    """別プロセスのスタンバイ: プライマリが切断するまで追従し、昇格して1操作してから結果を返す"""
+    follower = ReplicationFollower(JournaledTableManager(directory))
+    follower.follow(Client(address))
+    dumps = _dumps(follower.manager)
+    manager = follower.promote()
+    manager.level_up("t0")
+    results.send((dumps, manager.last_seq))
+    manager.close()
+
+
+@pytest.mark.parametrize("backlog", [100_000, 10])
+def test_standby_process_follows_primary_and_takes_over(tmp_path, backlog):
+    primary = _primary(tmp_path / "primary")
+    _play(primary, 200)
+    publisher = ReplicationPublisher(primary, backlog=backlog)
+
+    ctx = multiprocessing.get_context()
+    reader, writer = ctx.Pipe(duplex=False)
+    with Listener() as listener:
+        process = ctx.Process(
+            target=_run_standby, args=(tmp_path / "standby", listener.address, writer)
+        )
+        process.start()
+        writer.close()
+        # 接続時点までの分は、backlog に残っていればレコードで、なければスナップショットで送られる
+        publisher.attach(listener.accept())
+    _play(primary, 300, seed=4)
+    expected = _dumps(primary)
+    publisher.close()   # プライマリの停止
+
+    dumps, last_seq = reader.recv()
+    process.join(10)
+    assert dumps == expected
+    assert last_seq == primary.last_seq + 1   # 昇格後の操作は続きの連番になる
+    primary.close()
+
+
+class _StalledConnection:
+    """`release` が立つまで送信を止める接続 (受信の遅いフォロワーの代わり)"""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.release = threading.Event()
+
+    def recv_bytes(self):
+        return self._connection.recv_bytes()
+
+    def send_bytes(self, data):
+        self.release.wait()
+        self._connection.send_bytes(data)
+
+    def close(self):
+        self._connection.close()
+
+
+def test_lagging_follower_is_dropped_and_catches_up_from_snapshot(tmp_path):
+    primary = _primary(tmp_path / "primary")
+    publisher = ReplicationPublisher(primary, backlog=50, max_lag=50)
+    follower = ReplicationFollower(JournaledTableManager(tmp_path / "standby"))
+
+    def connect():
+        primary_end, standby_end = multiprocessing.Pipe()
+        thread = threading.Thread(target=follower.follow, args=(standby_end,))
+        thread.start()
+        return primary_end, thread
+
+    primary_end, thread = connect()
+    stalled = _StalledConnection(primary_end)
+    publisher.attach(stalled)
+    _play(primary, 100)
+    assert publisher.follower_count == 0   # max_lag を超えたので切り離された
+    stalled.release.set()
+    thread.join(10)
+    assert not thread.is_alive()
+
+    # 再接続すると続きは backlog にないため、スナップショットから追いつく
+    primary_end, thread = connect()
+    publisher.attach(primary_end)
+    _play(primary, 40, seed=5)   # max_lag 未満なので送り終えるまで切り離されない
+    publisher.close()
+    thread.join(10)
+    assert follower.manager.last_seq == primary.last_seq
+    assert _dumps(follower.manager) == _dumps(primary)
+
+    # スタンバイも自分のジャーナルから同じ状態に復元できる
+    follower.manager.close()
+    restarted = JournaledTableManager(tmp_path / "standby")
+    assert _dumps(restarted) == _dumps(primary)
+    restarted.close()
+    primary.close()
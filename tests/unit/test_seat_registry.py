@@ -0,0 +1,56 @@
+from poker_domain.player import Player
+from poker_domain.seat_registry import SeatRegistry, iter_seats, lowest_seat
+from poker_domain.value_objects.chips import Chips
+
+
+def _players(*ids: str) -> list[Player]:
+    return [Player(player_id=pid, chips=Chips(100)) for pid in ids]
+
+
+def test_rebuild_indexes_seats_and_masks():
+    players = _players("a", "b", "c", "d")
+    players[1].folded = True
+    players[2].is_all_in = True
+
+    seats = SeatRegistry()
+    seats.rebuild(players)
+
+    assert seats.seat_of("c") == 2
+    assert seats.seat_of("zzz") is None
+    assert "d" in seats
+    assert iter_seats(seats.active) == [0, 3]
+    assert iter_seats(seats.in_hand) == [0, 2, 3]
+    assert iter_seats(seats.all_in) == [2]
+
+
+def test_update_follows_fold_and_all_in():
+    players = _players("a", "b", "c")
+    seats = SeatRegistry()
+    seats.rebuild(players)
+
+    players[0].folded = True
+    seats.update(0, players[0])
+    players[2].is_all_in = True
+    seats.update(2, players[2])
+
+    assert iter_seats(seats.active) == [1]
+    assert iter_seats(seats.in_hand) == [1, 2]
+    assert lowest_seat(seats.all_in) == 2
+
+
+def test_next_active_wraps_around_and_skips_inactive_seats():
+    players = _players("a", "b", "c", "d", "e")
+    players[1].folded = True
+    players[4].is_all_in = True
+    seats = SeatRegistry()
+    seats.rebuild(players)
+
+    assert seats.next_active(0) == 2
+    assert seats.next_active(3) == 0   # 4 はオールインなので一周して 0
+    assert seats.next_active(1) == 2   # 非アクティブな座席からでも次を探せる
+
+    # 自分以外にアクティブがいなければ自分自身
+    for p in players[1:]:
+        p.folded = True
+    seats.rebuild(players)
+    assert seats.next_active(0) == 0
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from poker_domain.agents import Agent, CallingAgent, RandomAgent
+from poker_domain.selfplay import SelfPlayRunner
+from poker_domain.value_objects.action import Bet, Raise
+
+
+class OverBettingAgent:
+    """持っていない額をベット/レイズしようとする (無効なアクションの扱いの確認用)"""
+
+    def __init__(self, rng: random.Random) -> None:
+        pass
+
+    def act(self, state, waiting_for):
+        if Bet in waiting_for.valid_actions:
+            return Bet(10**9)
+        return Raise(10**9)
+
+
+AGENTS = {"random": RandomAgent, "caller": CallingAgent, "random2": RandomAgent}
+
+
+def test_agents_satisfy_protocol():
+    assert isinstance(RandomAgent(), Agent)
+    assert isinstance(CallingAgent(), Agent)
+
+
+def test_reports_stream_per_session_and_sum_up():
+    runner = SelfPlayRunner(AGENTS, hands=300, hands_per_session=100, workers=0, seed=3)
+    reports = list(runner.run())
+
+    assert [r.sessions for r in reports] == [1, 2, 3]
+    assert [r.done for r in reports] == [False, False, True]
+    hands = [r.hands for r in reports]
+    assert hands == sorted(hands)
+    final = reports[-1]
+    assert 0 < final.hands <= 300
+    assert 0 < final.showdown_frequency < 1
+    assert set(final.agents) == set(AGENTS)
+    # チップの移動はゼロサム (レーキなし)
+    total = sum(s.bb_per_100 * s.hands for s in final.agents.values())
+    assert total == pytest.approx(0, abs=1e-6)
+    for stats in final.agents.values():
+        assert stats.hands == final.hands
+        assert stats.bb_per_100_ci95 > 0
+        assert stats.decisions > 0
+        assert stats.mean_decision_seconds > 0
+        assert stats.showdown_wins <= stats.showdowns
+
+
+def test_results_do_not_depend_on_worker_count():
+    def counts(report):
+        return {
+            name: (s.hands, round(s.bb_per_100, 6), s.showdowns, s.decisions)
+            for name, s in report.agents.items()
+        }
+
+    inline = SelfPlayRunner(AGENTS, hands=120, hands_per_session=40, workers=0, seed=9).run_all()
+    pooled = SelfPlayRunner(AGENTS, hands=120, hands_per_session=40, workers=2, seed=9).run_all()
+    assert counts(inline) == counts(pooled)
+    assert inline.showdown_hands == pooled.showdown_hands
+
+    other = SelfPlayRunner(AGENTS, hands=120, hands_per_session=40, workers=0, seed=10).run_all()
+    assert counts(other) != counts(inline)
+
+
+def test_invalid_actions_are_replaced_by_fold():
+    agents = {"bad": OverBettingAgent, "caller": CallingAgent}
+    report = SelfPlayRunner(agents, hands=20, workers=0).run_all()
+    assert report.agents["bad"].invalid_actions == report.agents["bad"].decisions > 0
+
+
+def test_runner_validates_arguments():
+    with pytest.raises(ValueError):
+        SelfPlayRunner({"only": RandomAgent}, hands=10)
+    with pytest.raises(ValueError):
+        SelfPlayRunner(AGENTS, hands=0)
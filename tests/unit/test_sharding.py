@@ -0,0 +1,81 @@
+import pytest
+
+from poker_domain.exceptions import DuplicateTableError, InvalidPlayerError, TableNotFoundError
+from poker_domain.game_state import GamePhase, TableStatus
+from poker_domain.interfaces import PokerTableInterface
+from poker_domain.sharding import HashRing, ShardedTableHost
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Call, Check
+from poker_domain.value_objects.chips import Chips
+
+
+def test_hash_ring_is_stable_and_moves_few_tables_when_growing():
+    table_ids = [f"table-{i}" for i in range(2000)]
+    four = HashRing(4)
+    assert [four.shard_for(t) for t in table_ids] == [HashRing(4).shard_for(t) for t in table_ids]
+    assert {four.shard_for(t) for t in table_ids} == {0, 1, 2, 3}
+
+    five = HashRing(5)
+    moved = sum(four.shard_for(t) != five.shard_for(t) for t in table_ids)
+    assert moved < len(table_ids) * 0.35   # 理想は 1/5
+
+
+@pytest.fixture
+def host():
+    with ShardedTableHost(workers=2) as host:
+        yield host
+
+
+def test_remote_table_behaves_like_local_table(host):
+    remote = host.create_table("t1", small_blind=5, big_blind=10)
+    local = PokerTable("t1", small_blind=5, big_blind=10)
+    assert isinstance(remote, PokerTableInterface)
+
+    for table in (remote, local):
+        table.add_player("a", Chips(100))
+        table.add_player("b", Chips(100))
+    assert remote.start_game().state.players == local.start_game().state.players
+
+    with pytest.raises(InvalidPlayerError):
+        remote.action("b", Call())
+
+    remote_result = remote.action("a", Call())
+    local.action("a", Call())
+    assert remote_result.state.phase == GamePhase.PRE_FLOP
+    assert remote_result.waiting_for.player_id == "b"
+    assert remote.get_table_status() == TableStatus.PLAYING
+    states = remote.get_states_for_viewers(["a", None])
+    assert states["a"].players[0].hole_cards is not None
+    assert states[None].players[0].hole_cards is None
+    assert remote.level_up().payload["level"] == 0
+
+
+def test_batched_actions_across_shards(host):
+    table_ids = [f"t{i}" for i in range(8)]
+    for table_id in table_ids:
+        table = host.create_table(table_id)
+        table.add_player("a", Chips(1000))
+        table.add_player("b", Chips(1000))
+        table.start_game()
+    assert len({host.shard_for(t) for t in table_ids}) == 2
+
+    results = host.apply_actions(
+        [(t, "a", Call()) for t in table_ids] + [("t0", "a", Check()), ("missing", "a", Call())]
+    )
+    assert all(r.waiting_for.player_id == "b" for r in results[:8])
+    assert isinstance(results[8], InvalidPlayerError)
+    assert isinstance(results[9], TableNotFoundError)
+
+    states = host.get_states(table_ids)
+    assert [s.table_id for s in states] == table_ids
+
+    with pytest.raises(DuplicateTableError):
+        host.create_table("t0")
+    host.remove_table("t0")
+    with pytest.raises(TableNotFoundError):
+        host.table("t0").get_state()
+
+    # 設定はバイナリ形式の値として送り、ワーカーで同じ設定のテーブルを作る
+    table = host.create_table("t9", level_schedule=[(5, 10, 0), (10, 20, 2)], rake_percent=0.05)
+    assert table.level_up().payload == {"level": 1, "small_blind": 10, "big_blind": 20, "ante": 2}
+    assert table.get_state().rake_percent == 0.05
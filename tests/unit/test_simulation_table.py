@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from poker_domain.exceptions import InvalidActionError, InvalidPlayerError
+from poker_domain.game_state import EventType, TableStatus
+from poker_domain.simulation import SimulationTable
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Bet, Check, Fold, Raise
+from poker_domain.value_objects.chips import Chips
+
+OPTIONS = dict(
+    table_id="t1", max_players=6, small_blind=5, big_blind=10, ante=1,
+    level_schedule=[(5, 10, 1), (10, 20, 2)], rake_percent=0.05, rake_cap=30, seed=99,
+)
+
+
+def _choose(rng, valid, stack, current_bet, my_bet):
+    choice = rng.choice(valid)
+    if choice is Bet:
+        return Bet(min(stack, 10))
+    if choice is Raise:
+        max_raise = my_bet + stack
+        if max_raise <= current_bet:
+            return Fold()
+        return Raise(min(current_bet * 2, max_raise))
+    return choice()
+
+
+def test_simulation_matches_full_engine_hand_for_hand():
+    full, sim = PokerTable(**OPTIONS), SimulationTable(**OPTIONS)
+    stacks_rng = random.Random(1)
+    for i in range(6):
+        chips = Chips(stacks_rng.choice([40, 150, 500]))
+        full.add_player(f"p{i}", chips)
+        sim.add_player(f"p{i}", chips)
+    rng = random.Random(2)
+
+    for hand in range(150):
+        if full.get_table_status() == TableStatus.CLOSED:
+            break
+        if hand == 40:
+            full.level_up()
+            sim.level_up()
+        result = full.start_game()
+        next_player = sim.deal()
+        while result.waiting_for is not None:
+            waiting = result.waiting_for
+            player_id = waiting.player_id
+            assert next_player == player_id
+            assert sim.legal_actions() == waiting.valid_actions
+            assert sim.payouts is None
+            state = result.state
+            me = next(p for p in state.players if p.player_id == player_id)
+            stack, my_bet = me.chips.amount, me.current_bet.amount
+            assert (sim.stack(player_id), sim.bet_of(player_id)) == (stack, my_bet)
+            assert sim.current_bet == state.current_bet.amount
+
+            action = _choose(rng, waiting.valid_actions, stack, state.current_bet.amount, my_bet)
+            try:
+                result = full.action(player_id, action)
+            except InvalidActionError:
+                with pytest.raises(InvalidActionError):
+                    sim.act(player_id, action)
+                action = Fold()
+                result = full.action(player_id, action)
+            next_player = sim.act(player_id, action)
+        assert next_player is None
+        showdown = [e for e in result.events if e.event_type == EventType.SHOWDOWN]
+        if showdown:
+            assert sim.payouts == showdown[0].payload["payouts"]
+        assert sim.get_state() == full.get_state()
+
+
+def test_simulation_accessors_and_errors():
+    table = SimulationTable(table_id="t1", small_blind=5, big_blind=10, seed=1)
+    table.add_player("a", Chips(100))
+    table.add_player("b", Chips(100))
+    first = table.deal()
+    assert table.pot == 15
+    assert table.current_bet == 10
+    assert table.stack(first) == 95
+    assert table.bet_of(first) == 5
+    with pytest.raises(InvalidPlayerError):
+        table.stack("nobody")
+
+    assert table.act(first, Fold()) is None
+    assert table.payouts == {next(p for p in ("a", "b") if p != first): 15}
+    with pytest.raises(InvalidActionError):
+        table.legal_actions()
+    with pytest.raises(InvalidActionError):
+        table.act(first, Check())
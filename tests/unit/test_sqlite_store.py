@@ -0,0 +1,122 @@
+import random
+import sqlite3
+import time
+from dataclasses import replace
+
+import pytest
+
+from poker_domain.agents import RandomAgent
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.manager import TableManager
+from poker_domain.sqlite_store import SQLiteHandStore
+from poker_domain.value_objects.action import Fold
+from poker_domain.value_objects.chips import Chips
+
+
+def _play(store, tables=3, hands=10):
+    """TableManager の複数テーブルでハンドを進め、結果を store に渡す"""
+    agent = RandomAgent(random.Random(5))
+    manager = TableManager()
+    completed = []
+    for i in range(tables):
+        table = manager.create_table(
+            f"t{i}", max_players=4, small_blind=5, big_blind=10, ante=1, seed=60 + i,
+        )
+        for j in range(4):
+            manager.add_player(f"t{i}", f"p{j}", Chips(300 + 200 * j))
+        for _ in range(hands):
+            if any(p.chips.amount == 0 for p in table.get_state().players):
+                break
+            result = manager.start_game(f"t{i}")
+            store.record(f"t{i}", result, setup=table.last_hand_setup)
+            while result.waiting_for is not None:
+                waiting = result.waiting_for
+                try:
+                    action = agent.act(result.state, waiting)
+                    result = manager.action(f"t{i}", waiting.player_id, action)
+                except InvalidActionError:
+                    result = manager.action(f"t{i}", waiting.player_id, Fold())
+                record = store.record(f"t{i}", result)
+                if record is not None:
+                    completed.append(record)
+    return completed
+
+
+def test_hands_round_trip_through_sqlite(tmp_path):
+    path = tmp_path / "hands.db"
+    with SQLiteHandStore(path, batch_size=7) as store:
+        completed = _play(store)
+        store.flush()
+        assert store.written_hands == len(completed) > 0
+
+    with SQLiteHandStore(path) as store:
+        stored = list(store.records())
+        assert [(r.table_id, r.hand_number) for r in stored] == [
+            (r.table_id, r.hand_number) for r in sorted(completed, key=lambda r: r.started_at)
+        ]
+        by_key = {(r.table_id, r.hand_number): r for r in completed}
+        for record in stored:
+            original = by_key[(record.table_id, record.hand_number)]
+            assert dict(record.payouts) == dict(original.payouts)
+            assert record.to_hand_setup() == original.to_hand_setup()
+            assert (record.actions, record.board, record.pots, record.rake) == (
+                tuple(original.actions), original.board, original.pots, original.rake
+            )
+            assert dict(record.shown_cards) == dict(original.shown_cards)
+
+        assert [r.table_id for r in store.records(table_id="t1")] == ["t1"] * sum(
+            r.table_id == "t1" for r in completed
+        )
+        assert len(list(store.records(player_id="p2"))) == len(completed)
+        assert list(store.records(player_id="nobody")) == []
+        middle = sorted(r.started_at for r in completed)[len(completed) // 2]
+        assert all(r.started_at >= middle for r in store.records(since=middle))
+
+    connection = sqlite3.connect(path)
+    assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master")}
+    assert {"hands_by_table", "hands_by_time", "hand_players_by_player"} <= indexes
+
+
+def test_batches_are_written_after_the_time_window(tmp_path):
+    with SQLiteHandStore(tmp_path / "hands.db", batch_size=10_000, flush_interval=0.05) as store:
+        completed = _play(store, tables=1, hands=3)
+        deadline = time.monotonic() + 5
+        while store.written_hands < len(completed) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert store.written_hands == len(completed)
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    with SQLiteHandStore(tmp_path / "source.db") as source:
+        records = _play(source, tables=1, hands=6)
+    path = tmp_path / "hands.db"
+    store = SQLiteHandStore(path, batch_size=1, queue_size=1)
+    # 別の接続で書き込みロックを取り、書き込みスレッドを最初のトランザクションで待たせる
+    lock = sqlite3.connect(path, isolation_level=None)
+    lock.execute("BEGIN EXCLUSIVE")
+    started = time.monotonic()
+    accepted = [store.add(record) for record in records]
+    assert time.monotonic() - started < 1.0
+    lock.execute("ROLLBACK")
+    store.close()
+    assert store.dropped_hands == accepted.count(False) > 0
+    assert store.written_hands == accepted.count(True)
+
+
+def test_seeds_keep_their_sign_and_closed_store_rejects_calls(tmp_path):
+    with SQLiteHandStore(tmp_path / "source.db") as source:
+        record = _play(source, tables=1, hands=1)[0]
+    seeds = [-5, -(2**63), 3, 2**63 - 1, 2**63, 2**64 - 1, None]
+    store = SQLiteHandStore(tmp_path / "hands.db")
+    for hand_number, seed in enumerate(seeds, start=1):
+        store.add(replace(record, hand_number=hand_number, seed=seed))
+    for seed in (2**64, -(2**63) - 1):
+        with pytest.raises(ValueError):
+            store.add(replace(record, seed=seed))
+    store.close()
+    assert [r.seed for r in store.records()] == seeds
+    with pytest.raises(ValueError):
+        store.flush()
+    with pytest.raises(ValueError):
+        store.add(record)
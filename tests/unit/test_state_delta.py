@@ -0,0 +1,89 @@
+from poker_domain.game_state import GamePhase
+from poker_domain.state_delta import apply_delta, diff_states
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Bet, Call, Check, Fold
+from poker_domain.value_objects.chips import Chips
+
+
+def _table(**kwargs) -> PokerTable:
+    table = PokerTable(
+        table_id="t1", max_players=3, small_blind=10, big_blind=20, emit_deltas=True, **kwargs,
+    )
+    for pid in ("a", "b", "c"):
+        table.add_player(pid, Chips(1000))
+    return table
+
+
+def test_delta_is_none_by_default():
+    table = PokerTable(table_id="t1", max_players=2)
+    table.add_player("a", Chips(1000))
+    table.add_player("b", Chips(1000))
+    assert table.start_game().delta is None
+
+
+def test_applying_deltas_rebuilds_every_state_of_a_hand():
+    """テーブル作成直後の状態から差分を順に適用すると、毎回の ActionResult.state と一致する"""
+    table = PokerTable(
+        table_id="t1", max_players=3, small_blind=10, big_blind=20, emit_deltas=True,
+    )
+    client_state = table.get_state()
+    for pid in ("a", "b", "c"):
+        table.add_player(pid, Chips(1000))
+
+    result = table.start_game()
+    client_state = apply_delta(client_state, result.delta)
+    assert client_state == result.state
+
+    script = [
+        ("a", Call()), ("b", Call()), ("c", Check()),   # PRE_FLOP
+        ("b", Bet(amount=40)), ("c", Call()), ("a", Fold()),  # FLOP
+        ("b", Check()), ("c", Check()),                 # TURN
+        ("b", Check()), ("c", Check()),                 # RIVER → SHOWDOWN
+    ]
+    for pid, action in script:
+        result = table.action(pid, action)
+        client_state = apply_delta(client_state, result.delta)
+        assert client_state == result.state
+    assert client_state.phase == GamePhase.SHOWDOWN
+
+    # 次のハンドではコミュニティカード/履歴が置き換え扱いになる
+    result = table.start_game()
+    assert "community_cards" in result.delta.changes
+    assert "action_log" in result.delta.changes
+    assert apply_delta(client_state, result.delta) == result.state
+
+
+def test_delta_contains_only_changed_fields():
+    table = _table()
+    table.start_game()
+
+    result = table.action("a", Call())
+    delta = result.delta
+
+    assert set(delta.changes) == {"pot", "side_pots", "current_player_id"}
+    assert delta.changes["pot"] == Chips(50)
+    assert [d.player_id for d in delta.players] == ["a"]
+    assert delta.players[0].changes == {"chips": Chips(980), "current_bet": Chips(20)}
+    assert delta.community_cards == ()
+    assert [e.action for e in delta.action_log] == ["call"]
+
+
+def test_new_community_cards_are_sent_as_appended_cards():
+    table = _table()
+    table.start_game()
+    table.action("a", Call())
+    table.action("b", Call())
+    result = table.action("c", Check())
+
+    assert result.delta.changes["phase"] == GamePhase.FLOP
+    assert "community_cards" not in result.delta.changes
+    assert result.delta.community_cards == tuple(result.state.community_cards)
+
+
+def test_diff_of_identical_states_is_empty():
+    table = _table()
+    state = table.start_game().state
+    delta = diff_states(state, state)
+    assert delta.changes == {}
+    assert delta.players == ()
+    assert apply_delta(state, delta) is state
@@ -0,0 +1,110 @@
+import pickle
+import random
+
+from poker_domain.agents import RandomAgent
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.game_state import ActionLogEntry, GamePhase
+from poker_domain.history import HandRecorder
+from poker_domain.stats import PlayerStatsAggregator
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Fold
+from poker_domain.value_objects.chips import Chips
+
+PF, FLOP, TURN = GamePhase.PRE_FLOP, GamePhase.FLOP, GamePhase.TURN
+
+
+def _entries(*rows):
+    return [ActionLogEntry(*row) for row in rows]
+
+
+def test_counters_for_a_hand():
+    stats = PlayerStatsAggregator()
+    # a: オープンレイズ → b: 3ベット → c: フォールド → a: コール。
+    # フロップで b がベット、a がコール。ターンで a のベットに b がチェックレイズ、a がコール。
+    # ショーダウンで a が勝つ
+    stats.add_hand(
+        ["a", "b", "c"],
+        _entries(
+            ("a", PF, "raise", 30), ("b", PF, "raise", 90), ("c", PF, "fold", None),
+            ("a", PF, "call", None),
+            ("b", FLOP, "bet", 100), ("a", FLOP, "call", None),
+            ("b", TURN, "check", None), ("a", TURN, "bet", 200), ("b", TURN, "raise", 600),
+            ("a", TURN, "call", None),
+        ),
+        showdown_player_ids=["a", "b"],
+        payouts={"a": 1800},
+    )
+    # 全員フォールドで c が勝つ (フロップを見ていない)
+    stats.add_hand(
+        ["a", "b", "c"],
+        _entries(("a", PF, "fold", None), ("b", PF, "fold", None)),
+        payouts={"c": 15},
+    )
+
+    a, b, c = stats.stats("a"), stats.stats("b"), stats.stats("c")
+    assert (a.hands, a.vpip_hands, a.pfr_hands) == (2, 1, 1)
+    assert (b.three_bet_opportunities, b.three_bets) == (1, 1)
+    # a・c が手番で直面したのは b の3ベット後 (レイズ2回) なので3ベットの機会ではない
+    assert a.three_bet_opportunities == c.three_bet_opportunities == 0
+    assert (a.aggressive_actions, a.calls, a.aggression_factor) == (1, 2, 0.5)
+    assert (b.aggressive_actions, b.calls) == (2, 0)
+    assert b.aggression_factor == float("inf")
+    assert (a.saw_flop, a.showdowns, a.showdown_wins) == (1, 1, 1)
+    assert a.wtsd == a.won_at_showdown == 1.0
+    assert (b.won_at_showdown, c.saw_flop, c.wtsd) == (0.0, 0, 0.0)
+    assert a.vpip == a.pfr == 0.5
+    assert stats.stats("nobody").hands == 0
+
+
+def _play(seed, hands):
+    """ランダムなエージェントでハンドを進め、結果とハンド履歴を返す"""
+    agent = RandomAgent(random.Random(seed))
+    table = PokerTable(table_id="t", max_players=6, small_blind=5, big_blind=10, seed=seed)
+    for i in range(6):
+        table.add_player(f"p{i}", Chips(1000))
+    recorder = HandRecorder()
+    results, records = [], []
+    for _ in range(hands):
+        if any(p.chips.amount == 0 for p in table.get_state().players):
+            break
+        result = table.start_game()
+        recorder.record("t", result)
+        while result.waiting_for is not None:
+            waiting = result.waiting_for
+            try:
+                result = table.action(waiting.player_id, agent.act(result.state, waiting))
+            except InvalidActionError:
+                result = table.action(waiting.player_id, Fold())
+            record = recorder.record("t", result)
+            if record is not None:
+                records.append(record)
+        results.append(result)
+    return results, records
+
+
+def test_live_results_history_records_and_merge_agree():
+    first_results, first_records = _play(1, 30)
+    second_results, second_records = _play(2, 30)
+
+    live = PlayerStatsAggregator()
+    assert sum(live.record(result) for result in first_results + second_results) == len(
+        first_records + second_records
+    )
+    from_history = PlayerStatsAggregator()
+    for record in first_records + second_records:
+        from_history.add_record(record)
+
+    first, second = PlayerStatsAggregator(), PlayerStatsAggregator()
+    for record in first_records:
+        first.add_record(record)
+    for record in reversed(second_records):  # 登録順が違っても合算できる
+        second.add_record(record)
+    merged = pickle.loads(pickle.dumps(first))
+    merged.merge(pickle.loads(pickle.dumps(second)))
+
+    assert len(live) == 6
+    for player_id in live.player_ids:
+        assert live.stats(player_id) == from_history.stats(player_id) == merged.stats(player_id)
+    totals = {s.player_id: s for s in live}
+    assert sum(s.showdown_wins for s in totals.values()) >= 1
+    assert all(s.hands == len(first_records) + len(second_records) for s in totals.values())
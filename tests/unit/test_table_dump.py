@@ -0,0 +1,135 @@
+import pytest
+
+from poker_domain.game_state import GamePhase
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Bet, Call, Check, Fold
+from poker_domain.value_objects.chips import Chips
+
+
+def _table_in_flop() -> PokerTable:
+    table = PokerTable(
+        table_id="t1",
+        max_players=6,
+        small_blind=10,
+        big_blind=20,
+        ante=2,
+        level_schedule=[(10, 20, 2), (20, 40, 5)],
+        rake_percent=0.05,
+        rake_cap=30,
+        allow_rebuy=False,
+    )
+    table.add_player("a", Chips(1000))
+    table.add_player("b", Chips(500))
+    table.add_player("c", Chips(80))
+    waiting = table.start_game().waiting_for
+    while waiting is not None and table.get_state().phase == GamePhase.PRE_FLOP:
+        action = Call() if Call in waiting.valid_actions else Check()
+        waiting = table.action(waiting.player_id, action).waiting_for
+    assert table.get_state().phase == GamePhase.FLOP
+    return table
+
+
+def _play_out(table: PokerTable) -> list:
+    """手番のプレイヤーに決まった順でアクションさせ、結果の列を返す"""
+    results = []
+    waiting = table._build_waiting_for()
+    while waiting is not None:
+        if Bet in waiting.valid_actions:
+            action = Bet(40)
+        elif Call in waiting.valid_actions:
+            action = Call()
+        elif Check in waiting.valid_actions:
+            action = Check()
+        else:
+            action = Fold()
+        result = table.action(waiting.player_id, action)
+        results.append(result)
+        waiting = result.waiting_for
+    return results
+
+
+def test_load_restores_mid_hand_state_and_continues_identically():
+    table = _table_in_flop()
+    data = table.dump()
+    restored = PokerTable.load(data)
+
+    for viewer in (None, "a", "b", "c"):
+        assert restored.get_state(viewer) == table.get_state(viewer)
+    assert restored.get_table_status() == table.get_table_status()
+    assert restored.dump() == data
+
+    # デッキの残り順も復元されるので、以降の進行 (配られるカード・決着) も一致する
+    assert _play_out(restored) == _play_out(table)
+    assert restored.get_state() == table.get_state()
+
+
+def test_dump_keeps_level_rake_and_busted_players():
+    table = _table_in_flop()
+    _play_out(table)
+    table.level_up()
+    restored = PokerTable.load(table.dump())
+
+    state = restored.get_state()
+    assert state == table.get_state()
+    assert (state.small_blind, state.big_blind, state.ante) == (Chips(20), Chips(40), Chips(5))
+    assert state.rake_percent == 0.05 and state.rake_cap == 30
+    assert restored._busted_player_ids == table._busted_player_ids
+
+
+def test_dump_is_compact():
+    assert len(_table_in_flop().dump()) < 400
+
+
+def test_load_rejects_invalid_data():
+    data = _table_in_flop().dump()
+
+    with pytest.raises(ValueError):
+        PokerTable.load(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        PokerTable.load(data[:4] + b"\x7f" + data[5:])  # 未対応のバージョン
+    with pytest.raises(ValueError):
+        PokerTable.load(data[: len(data) // 2])
+
+
+def _seeded_table() -> PokerTable:
+    table = PokerTable(table_id="s", max_players=3, small_blind=5, big_blind=10, seed=7)
+    for player_id in ("a", "b", "c"):
+        table.add_player(player_id, Chips(1000))
+    return table
+
+
+def _play_hands(table: PokerTable, hands: int) -> list:
+    """次のハンドから `hands` ハンドを最後まで進め、各ハンドの開始時点の記録と結果を返す"""
+    played = []
+    for _ in range(hands):
+        if table._build_waiting_for() is None:
+            table.start_game()
+        results = _play_out(table)
+        played.append((table.last_hand_setup, results, table._payouts))
+    return played
+
+
+def test_seeded_table_continues_the_same_deals_after_mid_hand_load():
+    table = _seeded_table()
+    _play_hands(table, 2)
+    table.start_game()
+    waiting = table._build_waiting_for()
+    table.action(waiting.player_id, Call())
+    restored = PokerTable.load(table.dump())
+
+    assert restored.last_hand_setup == table.last_hand_setup
+    assert restored.dump() == table.dump()
+    # 乱数列は状態そのものではなくシードと引いた回数で持つ
+    assert len(table.dump()) < 300
+    # 進行中のハンドも、その後に配られるハンドも元のテーブルと一致する
+    assert _play_hands(restored, 3) == _play_hands(table, 3)
+    assert restored.get_state() == table.get_state()
+
+
+def test_load_keeps_payouts_after_showdown():
+    table = _seeded_table()
+    _play_hands(table, 1)
+    restored = PokerTable.load(table.dump())
+    assert table._payouts is not None
+    assert restored._payouts == table._payouts
+    assert restored.last_hand_setup == table.last_hand_setup
@@ -0,0 +1,169 @@
+import random
+
+import pytest
+
+from poker_domain.game_state import GamePhase
+from poker_domain.table import PokerTable
+from poker_domain.timers import ActionTimeouts, TimerWheel
+from poker_domain.value_objects.action import Call, Check, Fold
+from poker_domain.value_objects.chips import Chips
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_timers_fire_in_deadline_order_across_wheel_levels():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=1.0, clock=clock)
+    fired = []
+    # 1段目 (256 tick 未満) から3段目 (65536 tick 以上) まで
+    delays = [3, 1, 255, 256, 300, 70000, 65536, 2]
+    for delay in delays:
+        wheel.schedule(delay, lambda d=delay: fired.append((d, clock.now)))
+
+    for second in range(1, 70001):
+        clock.now = float(second)
+        wheel.advance()
+    assert fired == [(d, float(d)) for d in sorted(delays)]
+    assert len(wheel) == 0
+
+
+def test_advance_with_large_jump_fires_everything_due():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=0.5, clock=clock)
+    fired = []
+    for delay in (0.2, 10.0, 500.0, 40000.0):
+        wheel.schedule(delay, lambda d=delay: fired.append(d))
+
+    assert wheel.advance(now=499.9) == 2
+    assert fired == [0.2, 10.0]
+    assert wheel.advance(now=50000.0) == 2
+    assert fired == [0.2, 10.0, 500.0, 40000.0]
+
+
+def test_cancel_and_reschedule_from_callback():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=1.0, clock=clock)
+    fired = []
+    cancelled = wheel.schedule(5, lambda: fired.append("cancelled"))
+    wheel.schedule(2, lambda: wheel.schedule(3, lambda: fired.append("chained")))
+    cancelled.cancel()
+    cancelled.cancel()  # 2回目は何もしない
+    assert not cancelled.active
+    assert len(wheel) == 1
+
+    clock.now = 2.0
+    wheel.advance()
+    clock.now = 4.0
+    wheel.advance()
+    assert fired == []
+    clock.now = 5.0
+    wheel.advance()
+    assert fired == ["chained"]
+
+
+def test_many_pending_timers_sweep():
+    clock = FakeClock()
+    wheel = TimerWheel(tick_seconds=0.1, clock=clock)
+    rng = random.Random(1)
+    fired = [0]
+
+    def fire() -> None:
+        fired[0] += 1
+
+    handles = [wheel.schedule(rng.uniform(1, 60), fire) for _ in range(100_000)]
+    for handle in handles[::2]:
+        handle.cancel()
+    assert len(wheel) == 50_000
+    for step in range(1, 601):
+        clock.now = step * 0.1
+        wheel.advance()
+    assert fired[0] == 50_000
+    assert len(wheel) == 0
+
+
+def test_tick_seconds_must_be_positive():
+    with pytest.raises(ValueError):
+        TimerWheel(tick_seconds=0)
+
+
+def _heads_up_table() -> PokerTable:
+    table = PokerTable(table_id="t1", small_blind=5, big_blind=10, timeout_seconds=30)
+    table.add_player("a", Chips(100))
+    table.add_player("b", Chips(100))
+    return table
+
+
+def test_action_timeouts_apply_check_or_fold_and_keep_tracking():
+    clock = FakeClock()
+    applied = []
+    timeouts = ActionTimeouts(
+        TimerWheel(tick_seconds=1.0, clock=clock),
+        on_timeout=lambda table_id, result: applied.append(
+            (table_id, result.state.action_log[-1].player_id, result.state.action_log[-1].action)
+        ),
+    )
+    table = _heads_up_table()
+    result = table.start_game()
+    timeouts.track("t1", table, result)
+    first = result.waiting_for.player_id
+
+    # 持ち時間内に応答すれば、新しい手番の期限に置き換わる
+    clock.now = 20.0
+    timeouts.advance()
+    assert applied == []
+    result = table.action(first, Call())
+    timeouts.track("t1", table, result)
+    second = result.waiting_for.player_id
+    assert Check in result.waiting_for.valid_actions
+
+    clock.now = 49.0
+    timeouts.advance()
+    assert applied == []
+    clock.now = 50.0
+    assert timeouts.advance() == 1
+    assert applied == [("t1", second, "check")]
+    assert table.get_state().phase == GamePhase.FLOP
+
+    # 次の手番も自動で追跡されている
+    clock.now = 80.0
+    timeouts.advance()
+    assert len(applied) == 2
+
+
+def test_action_timeouts_fold_when_check_is_not_legal():
+    clock = FakeClock()
+    timeouts = ActionTimeouts(TimerWheel(tick_seconds=1.0, clock=clock))
+    table = _heads_up_table()
+    result = table.start_game()
+    timeouts.track("t1", table, result)
+    assert Check not in result.waiting_for.valid_actions
+
+    clock.now = 30.0
+    timeouts.advance()
+    last = table.get_state().action_log[-1]
+    assert (last.player_id, last.action) == (result.waiting_for.player_id, "fold")
+    assert len(timeouts) == 0  # ハンドが終わり手番はない
+
+
+def test_action_timeouts_cancel_and_stale_timer_is_ignored():
+    clock = FakeClock()
+    timeouts = ActionTimeouts(TimerWheel(tick_seconds=1.0, clock=clock))
+    table = _heads_up_table()
+    result = table.start_game()
+    timeouts.track("t1", table, result)
+    timeouts.cancel("t1")
+    clock.now = 100.0
+    assert timeouts.advance() == 0
+
+    timeouts.track("t1", table, result)
+    # track せずに手番を進めてしまった場合、古い期限は何もしない
+    table.action(result.waiting_for.player_id, Fold())
+    clock.now = 200.0
+    timeouts.advance()
+    assert len(table.get_state().action_log) == 1
@@ -0,0 +1,72 @@
+import dataclasses
+import io
+import random
+
+from poker_domain.agents import RandomAgent
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.history import HandHistoryWriter, read_hand_records
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Fold
+from poker_domain.value_objects.chips import Chips
+from poker_domain.verification import verify_hand_record, verify_hand_records
+
+
+def _records(tables, hands, *, with_setup=True):
+    """チップ量の異なる4人のテーブルでハンドを進め、書き出した履歴を読み戻す"""
+    agent = RandomAgent(random.Random(22))
+    out = io.StringIO()
+    with HandHistoryWriter(out) as writer:
+        for i in range(tables):
+            table = PokerTable(
+                table_id=f"t{i}", max_players=4, small_blind=5, big_blind=10, ante=2,
+                rake_percent=0.05, seed=21 + i,
+            )
+            for j in range(4):
+                table.add_player(f"p{j}", Chips(300 + 100 * j))
+            for _ in range(hands):
+                if any(p.chips.amount == 0 for p in table.get_state().players):
+                    break
+                result = table.start_game()
+                setup = table.last_hand_setup if with_setup else None
+                writer.record(table.table_id, result, setup=setup)
+                while result.waiting_for is not None:
+                    waiting = result.waiting_for
+                    try:
+                        result = table.action(waiting.player_id, agent.act(result.state, waiting))
+                    except InvalidActionError:
+                        result = table.action(waiting.player_id, Fold())
+                    writer.record(table.table_id, result)
+    return list(read_hand_records(io.StringIO(out.getvalue())))
+
+
+def test_recorded_hands_replay_without_divergence():
+    records = _records(3, 15)
+    assert records
+    assert all(verify_hand_record(record) == [] for record in records)
+    assert list(verify_hand_records(records, workers=0, batch_size=7)) == []
+
+
+def test_divergences_are_reported_in_input_order():
+    records = _records(2, 10)
+    side_pot = next(r for r in records if len(r.pots) > 1)
+    tampered = [
+        dataclasses.replace(records[0], rake=records[0].rake + 1),
+        dataclasses.replace(side_pot, pots=side_pot.pots[::-1]),
+        dataclasses.replace(records[1], payouts=()),
+    ]
+    divergences = list(verify_hand_records(records + tampered, workers=0, batch_size=4))
+    assert [d.field for d in divergences] == ["rake", "pots", "payouts"]
+    assert divergences[0].recorded == records[0].rake + 1
+    assert divergences[0].replayed == records[0].rake
+    assert divergences[1].replayed == side_pot.pots
+
+
+def test_worker_processes_and_unreplayable_hands():
+    records = _records(2, 5)
+    truncated = dataclasses.replace(records[0], actions=records[0].actions[:1])
+    divergences = list(verify_hand_records(records + [truncated], workers=2, batch_size=3))
+    assert len(divergences) == 1
+    assert divergences[0].field == "replay"
+
+    seedless = _records(1, 2, with_setup=False)
+    assert [d.field for d in verify_hand_records(seedless, workers=0)] == ["replay"] * 2
@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from poker_domain.binary import BinaryReader, BinaryWriter
+from poker_domain.exceptions import InvalidActionError
+from poker_domain.game_state import GamePhase
+from poker_domain.table import PokerTable
+from poker_domain.value_objects.action import Bet, Call, Check, Fold, Raise
+from poker_domain.value_objects.chips import Chips
+from poker_domain.wire import (
+    read_action,
+    read_event,
+    read_result,
+    read_value,
+    write_action,
+    write_event,
+    write_result,
+    write_value,
+)
+
+
+def _round_trip(write, read, value):
+    w = BinaryWriter()
+    write(w, value)
+    r = BinaryReader(w.getvalue())
+    decoded = read(r)
+    assert r.at_end()
+    return decoded
+
+
+def _results():
+    """差分モードのテーブルで1ハンドをショーダウンまで進めた `ActionResult` の列"""
+    table = PokerTable("t", max_players=3, small_blind=5, big_blind=10, emit_deltas=True, seed=3)
+    for player_id in ("a", "b", "c"):
+        table.add_player(player_id, Chips(1000))
+    results = [table.start_game()]
+    while (state := results[-1].state).phase != GamePhase.SHOWDOWN:
+        try:
+            results.append(table.action(state.current_player_id, Check()))
+        except InvalidActionError:
+            results.append(table.action(state.current_player_id, Call()))
+    return results
+
+
+def test_action_results_round_trip():
+    results = _results()
+    for result in results:
+        assert _round_trip(write_result, read_result, result) == result
+    # 中身を詰めて書くため pickle より小さい (ショーダウンの結果で比べる)
+    w = BinaryWriter()
+    write_result(w, results[-1])
+    assert len(w.getvalue()) * 3 < len(pickle.dumps(results[-1], pickle.HIGHEST_PROTOCOL))
+
+
+def test_actions_events_and_values_round_trip():
+    for action in (Fold(), Check(), Call(), Bet(30), Raise(120)):
+        assert _round_trip(write_action, read_action, action) == action
+    level_up = PokerTable("t", level_schedule=[(5, 10, 0), (10, 20, 2)]).level_up()
+    assert _round_trip(write_event, read_event, level_up) == level_up
+    options = {
+        "max_players": 9, "rake_percent": 0.05, "rake_cap": None, "allow_rebuy": False,
+        "level_schedule": [(5, 10, 0), (10, 20, 2)], "table_id": "t", "offset": -3,
+    }
+    for value in options.values():
+        assert _round_trip(write_value, read_value, value) == value
+    with pytest.raises(TypeError):
+        write_value(BinaryWriter(), {"not": "supported"})
@@ -1,3 +1,5 @@
+import pytest
+
 from poker_domain.value_objects.card import Card, Rank, Suit
 
 
@@ -14,3 +16,13 @@ def test_card_string_representation():
 def test_enums():
     assert Suit.HEARTS.value == "hearts"
     assert Rank.TWO.value == 2
+
+def test_card_code_round_trip():
+    assert Card(Suit.HEARTS, Rank.ACE).code == "Ah"
+    assert Card(Suit.DIAMONDS, Rank.TEN).code == "Td"
+    assert Card(Suit.CLUBS, Rank.TWO).code == "2c"
+    for index in range(52):
+        card = Card.from_index(index)
+        assert Card.from_code(card.code) == card
+    with pytest.raises(ValueError):
+        Card.from_code("1x")
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from poker_domain.value_objects.chips import Chips
@@ -43,3 +45,16 @@ def test_chips_comparison():
 def test_chips_repr():
     c = Chips(500)
     assert repr(c) == "Chips(500)"
+
+def test_chips_of_reuses_cached_small_values():
+    assert Chips.of(20) is Chips.of(20)
+    assert Chips.of(20) == Chips(20)
+    assert Chips.of(10**9) == Chips(10**9)
+    with pytest.raises(ValueError):
+        Chips.of(-1)
+
+def test_chips_has_no_instance_dict():
+    assert not hasattr(Chips(1), "__dict__")
+
+def test_chips_pickle_roundtrip():
+    assert pickle.loads(pickle.dumps(Chips(123456))) == Chips(123456)